@@ -59,6 +59,20 @@ DEPTH_PROFILES = {
     2: {"max_results_per_source": 20, "max_sources": 40, "max_domain_results": 3, "query_variants": 2, "include_brave_news": False},
     3: {"max_results_per_source": 20, "max_sources": 60, "max_domain_results": 4, "query_variants": 3, "include_brave_news": True},
 }
+DEEP_RESEARCH = {
+    "variant_concurrency": 6, "channel_concurrency": 32, "channel_pool_share": 8, "channel_timeout_default": 30,
+    "http_pool": {"max_connections": 64, "max_keepalive_connections": 20, "keepalive_expiry": 30, "blocking_workers": 16, "blocking_share": 8},
+    "channel_timeouts": {
+        "academic": 25, "web": 15, "newsroom": 30, "world_bank": 20,
+        "brave_news": 12, "policy": 20, "sec_edgar": 20, "local_sme": 60,
+    },
+    "channel_cache": {"enabled": False, "db_path": "", "max_entries": 5000, "default_ttl_seconds": 21600, "ttl_seconds": {}},
+    "cross_encoder_batch_size": 32,
+    "rerank_cache": {"enabled": False, "db_path": "", "max_entries": 200000, "ttl_seconds": 2592000},
+    "coalescing": {"enabled": True, "reuse_window_seconds": 0},
+    "near_duplicates": {"enabled": True, "jaccard_threshold": 0.7, "min_features": 8},
+    "early_stop": {"enabled": True, "target_ratio": 1.0, "min_channels": 3, "min_variants": 1},
+}
 RESEARCH_TYPES = {
     "trend_analysis": {"label": "Trend Analysis", "description": "Historical trends over time"},
     "comparative": {"label": "Comparative", "description": "Compare two subjects", "requires_subjects": True},
@@ -71,6 +85,8 @@ QUERY_DECOMPOSITION = {
 CONTENT_FETCH = {
     "enabled": True, "max_sources": 20, "timeout_per_url": 10,
     "skip_types": ["academic"], "max_workers": 8, "prompt_content_budget": 15000,
+    "max_bytes": 2000000, "per_host_limit": 2, "pool_maxsize": 32, "extraction_backend": "auto",
+    "cache": {"enabled": False, "db_path": "", "fresh_seconds": 86400, "ttl_seconds": 2592000, "max_entries": 20000},
 }
 MODEL_BUDGETS = {
     "subtopic_decomposition": {"max_input_chars": 1750, "max_output_tokens": 1024},
@@ -83,7 +99,7 @@ SYNTHESIS = {
     "min_chars_per_source": 500, "max_credibility_sources": 10, "max_alternatives": 3,
     "outline_sections": [4, 6], "max_sources_per_section": 4, "max_findings_per_section": 3,
     "relevance_min_score": 0.15, "clustering_char_budget": 8000,
-    "clustering_max_sources": 25, "clustering_snippet_chars": 300,
+    "clustering_max_sources": 25, "clustering_snippet_chars": 300, "section_concurrency": 4,
 }
 ACADEMIC_SEARCH = {"default_max_results": 10, "core_api_key": "", "scihub_mirrors": []}
 OPENALEX = {"enabled": True, "endpoint": "https://api.openalex.org/works", "timeout": 15, "polite_email": ""}
@@ -161,6 +177,25 @@ MODEL_ENDPOINTS = {
     "search": "local", "intent_detector": "local", "vision": "local",
     "image_generation": "local",
 }
+LLM_HTTP = {"pool_maxsize": 16, "pool_block": False}
+LLM_ADMISSION = {
+    "enabled": True, "max_in_flight": 5, "interactive_reserve": 1, "max_queue": 32,
+    "queue_timeout": 300, "default_priority": "research", "endpoints": {},
+}
+LLM_HEALTH = {
+    "enabled": False, "failure_threshold": 3, "open_seconds": 30, "max_open_seconds": 300,
+    "latency_window": 100, "min_samples": 20, "timeout_multiplier": 3.0, "min_timeout": 30,
+    "cold_start_seconds": 65, "retry_seconds": 8,
+}
+KEEP_WARM = {
+    "enabled": False, "roles": ["reasoning"], "interval_seconds": 600, "active_hours": [7, 19],
+    "active_weekdays": [0, 1, 2, 3, 4], "warm_on_enqueue": False, "min_interval_seconds": 60,
+}
+LLM_CACHE = {
+    "enabled": False, "db_path": "", "mode": "read_write",
+    "ttl_seconds": 604800, "role_ttl_seconds": {"intent_detector": 3600}, "max_entries": 50000,
+    "roles": ["reasoning", "search", "intent_detector"],
+}
 MAX_CONTEXT_MESSAGES = 50
 ENABLE_CONTEXT_SUMMARIZATION = True
 CONTEXT_KEEP_RECENT = 15
@@ -250,6 +250,67 @@ DEPTH_PROFILES = {
     3: {"max_results_per_source": 20, "max_sources": 60, "max_domain_results": 4, "query_variants": 3, "include_brave_news": True},
 }
 
+# Deep Research Execution Configuration
+DEEP_RESEARCH = {
+    "variant_concurrency": 6,         # Shared pool size for intent/variant aggregation fan-out
+    "channel_concurrency": 32,        # Shared pool size for blocking (non-async) channel fetches
+    "channel_pool_share": 8,          # Most of that pool one channel may hold (abandoned calls included)
+    "http_pool": {                    # Shared async HTTP client used by the search channels
+        "max_connections": 64,        # Total concurrent upstream connections across all jobs
+        "max_keepalive_connections": 20,
+        "keepalive_expiry": 30,       # Seconds an idle pooled connection is kept open
+        "blocking_workers": 16,       # Workers for blocking client libraries (DuckDuckGo)
+        "blocking_share": 8,          # Most of those workers one library may hold (hung calls included)
+    },
+    "channel_timeout_default": 30,    # Latency budget (s) for channels without an explicit entry
+    "channel_timeouts": {             # Per-channel latency budgets (s); late channels are dropped
+        "academic": 25,
+        "web": 15,
+        "newsroom": 30,
+        "world_bank": 20,
+        "brave_news": 12,
+        "policy": 20,
+        "sec_edgar": 20,
+        "local_sme": 60,
+    },
+    "channel_cache": {                # Persistent cross-run cache of channel results (SQLite)
+        "enabled": True,
+        "db_path": "",                # Default: ~/.zorora/channel_cache.db
+        "max_entries": 5000,          # LRU-evicted beyond this many cached queries
+        "default_ttl_seconds": 21600,
+        "ttl_seconds": {
+            "academic": 604800,
+            "web": 21600,
+            "world_bank": 604800,
+            "brave_news": 3600,
+            "policy": 86400,
+            "sec_edgar": 86400,
+        },
+    },
+    "cross_encoder_batch_size": 32,   # (query, passage) pairs per cross-encoder predict() batch
+    "rerank_cache": {                 # Persistent cross-encoder score cache (SQLite)
+        "enabled": True,
+        "db_path": "",                # Default: ~/.zorora/rerank_cache.db
+        "max_entries": 200000,
+        "ttl_seconds": 2592000,       # 30 days
+    },
+    "coalescing": {                   # /api/research duplicate handling
+        "enabled": True,              # Identical in-flight requests attach to the running job
+        "reuse_window_seconds": 900,  # Serve identical research completed this recently (0 disables)
+    },
+    "near_duplicates": {              # MinHash collapse of the same story/preprint across channels
+        "enabled": True,
+        "jaccard_threshold": 0.7,     # Min word-set Jaccard similarity of title+snippet to collapse
+        "min_features": 8,            # Shorter title+snippet texts are never collapsed
+    },
+    "early_stop": {                   # Cancel an intent's remaining query variants once yield is met
+        "enabled": True,
+        "target_ratio": 1.0,          # Target relevant sources per intent = ratio * max_sources / intents
+        "min_channels": 3,            # ...drawn from at least this many source types
+        "min_variants": 1,            # Variants per intent that always run
+    },
+}
+
 # Research Type Configuration (SEP-027)
 RESEARCH_TYPES = {
     "trend_analysis": {
@@ -287,6 +348,17 @@ CONTENT_FETCH = {
     "skip_types": ["academic"],
     "max_workers": 8,
     "prompt_content_budget": 15000,
+    "max_bytes": 2000000,             # Stop streaming a page body after this many bytes
+    "per_host_limit": 2,              # Concurrent requests to any one host
+    "pool_maxsize": 32,               # Keep-alive connections in the shared session pool
+    "extraction_backend": "auto",     # "readability" (streaming; lxml if installed), "bs4", or "auto"
+    "cache": {                        # Persistent extracted-text cache keyed by normalized URL (SQLite)
+        "enabled": True,
+        "db_path": "",                # Default: ~/.zorora/page_cache.db
+        "fresh_seconds": 86400,       # Serve without revalidating for this long
+        "ttl_seconds": 2592000,       # Then revalidate via ETag/Last-Modified until this age (30 days)
+        "max_entries": 20000,
+    },
 }
 
 # Model Token Budgets (SEP-019: max ~3000 input tokens per reasoning call)
@@ -313,6 +385,7 @@ SYNTHESIS = {
     "clustering_char_budget": 8000,   # Char budget for clustering prompt
     "clustering_max_sources": 25,     # Max sources fed to clustering
     "clustering_snippet_chars": 300,  # Per-source snippet cap in clustering
+    "section_concurrency": 4,         # Outline sections expanded in parallel (1 = sequential)
 }
 
 # Academic Search Configuration
@@ -572,6 +645,78 @@ MODEL_ENDPOINTS = {
     "image_generation": "local",  # Set to HF endpoint key via /models
 }
 
+# LLM provider HTTP connection pooling (one keep-alive session per endpoint, shared by all adapters)
+LLM_HTTP = {
+    "pool_maxsize": 16,               # Keep-alive connections kept per endpoint
+    "pool_block": False,              # True: wait for a free pooled connection instead of opening extras
+}
+
+# Per-endpoint admission control for LLM calls. Once max_in_flight calls are running,
+# further calls queue by priority (interactive > research > background); the last
+# interactive_reserve slots only go to interactive turns so chat stays fast under load.
+LLM_ADMISSION = {
+    "enabled": True,
+    "max_in_flight": 5,               # Concurrent calls per endpoint (scheme://host:port)
+    "interactive_reserve": 1,         # Slots held back for interactive calls
+    "max_queue": 32,                  # Queued research/background calls before new ones are rejected
+    "queue_timeout": 300,             # Seconds a call may wait for a slot
+    "default_priority": "research",   # Priority of calls made outside an llm_priority() block
+    "endpoints": {                    # Per-endpoint max_in_flight overrides
+        "https://api.openai.com:443": 16,
+        "https://api.anthropic.com:443": 16,
+    },
+}
+
+# Per-endpoint health tracking and circuit breakers for LLM calls. After failure_threshold
+# consecutive endpoint failures (timeouts, connection errors, 5xx) calls fail fast to their
+# fallback while a background probe re-tests the endpoint with backoff. Once min_samples
+# calls at least as large (by max_tokens) have succeeded, a blocking call's read timeout
+# shrinks to timeout_multiplier x their p95 latency.
+LLM_HEALTH = {
+    "enabled": True,
+    "failure_threshold": 3,           # Consecutive failures that open the circuit
+    "open_seconds": 30,               # First probe after opening; doubles per failed probe
+    "max_open_seconds": 300,          # Probe backoff cap
+    "latency_window": 100,            # Recent successful calls kept for percentiles
+    "min_samples": 20,                # Successes needed before timeouts adapt
+    "timeout_multiplier": 3.0,        # Adaptive read timeout = multiplier x p95 latency ...
+    "min_timeout": 30,                # ... but never below this (or above the configured timeout)
+    "cold_start_seconds": 65,         # First synthesis retry wait on 503 until a recovery is observed
+    "retry_seconds": 8,               # Wait before later synthesis retries
+}
+
+# Keep scale-to-zero HF endpoints warm for research synthesis. The scheduled pinger is
+# optional (it keeps paid endpoints running); warm_on_enqueue pings the endpoint when a
+# research run starts so the model boots while sources are aggregated.
+KEEP_WARM = {
+    "enabled": False,                 # Scheduled pings during active hours
+    "roles": ["reasoning"],           # Roles whose HF endpoints (via MODEL_ENDPOINTS) are pinged
+    "interval_seconds": 600,          # Scheduled ping interval (stay under the endpoint's idle scale-down)
+    "active_hours": [7, 19],          # Local [start, end) hours; start > end wraps past midnight
+    "active_weekdays": [0, 1, 2, 3, 4],  # Monday=0; None for every day
+    "warm_on_enqueue": True,          # Ping when a research run starts
+    "min_interval_seconds": 60,       # Skip pings to an endpoint pinged more recently than this
+}
+
+# Persistent LLM response cache for specialist clients (content-addressed SQLite).
+# Keyed by endpoint, model, messages and sampling params; tool-calling requests bypass it.
+# Set ZORORA_LLM_CACHE_MODE=record, then =replay, to record a run and replay it offline.
+LLM_CACHE = {
+    "enabled": True,
+    "db_path": "",                    # Default: ~/.zorora/llm_cache.db
+    "mode": "read_write",             # read_write | record (always call, overwrite) | replay (cache only)
+    "ttl_seconds": 7 * 86400,         # Entries older than this are ignored (except in replay)
+    "role_ttl_seconds": {             # Per-role TTL overrides
+        "intent_detector": 3600,
+    },
+    "max_entries": 50000,             # LRU eviction beyond this
+    "roles": [                        # Roles served from the cache in read_write mode (record/replay cover all)
+        "reasoning",
+        "search",
+        "intent_detector",
+    ],
+}
+
 # Context Management
 MAX_CONTEXT_MESSAGES = 50  # Changed from None (unlimited) to prevent context overflow
 ENABLE_CONTEXT_SUMMARIZATION = True  # Summarize old messages instead of deleting them
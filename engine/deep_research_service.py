@@ -3,20 +3,32 @@
 from __future__ import annotations
 
 import logging
+import math
 import re
 import threading
 import time
 import inspect
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import config
 from engine.models import ResearchState, Source, Finding
 from engine.query_refiner import SearchIntent, decompose_query, decompose_diligence_query, detect_market_intent
+from engine.research_timing import current_trace, stage, traced_research
+from providers.admission import with_llm_priority
 from workflows.deep_research.aggregator import aggregate_sources
 from workflows.deep_research.credibility import score_source_credibility
-from workflows.deep_research.reranker import score_relevance, filter_relevant, _count_cross_references
-from workflows.deep_research.synthesizer import synthesize, synthesize_direct
+from workflows.deep_research.dedupe import collapse_near_duplicates
+from workflows.deep_research.reranker import (
+    score_relevance,
+    filter_relevant,
+    keyword_relevance,
+    relevance_keywords,
+    _count_cross_references_batch,
+)
+from workflows.deep_research.synthesizer import refresh_synthesis, synthesize, synthesize_direct
+from workflows.keep_warm import warm_synthesis_endpoints
 from workflows.market_workflow import MarketWorkflow
 from tools.market.context import build_market_context
 
@@ -24,6 +36,7 @@ from tools.market.context import build_market_context
 logger = logging.getLogger(__name__)
 
 ProgressCallback = Callable[[str, str, str], None]
+SourceEventCallback = Callable[[str, dict], None]
 
 _CLUSTERING_SYSTEM_PROMPT = (
     "You are a senior energy and electricity market intelligence analyst. "
@@ -47,12 +60,40 @@ _QUERY_STOPWORDS = frozenset({
 })
 
 
+_AGGREGATION_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_AGGREGATION_EXECUTOR_LOCK = threading.Lock()
+
+
 def _emit(progress_callback: Optional[ProgressCallback], phase: str, message: str, status: str = "running") -> None:
     """Emit progress update if callback is provided."""
     if progress_callback:
         progress_callback(status, phase, message)
 
 
+def _emit_source_event(source_callback: Optional[SourceEventCallback], event: str, payload: dict) -> None:
+    """Emit an incremental source event if callback is provided.
+
+    Events are best-effort: a failing consumer must never break the pipeline.
+    """
+    if source_callback:
+        try:
+            source_callback(event, payload)
+        except Exception as e:
+            logger.warning("Source event '%s' callback failed: %s", event, e)
+
+
+def _source_preview(source: Source) -> dict:
+    """Lightweight source dict for incremental streaming (no full text)."""
+    return {
+        "source_id": source.source_id,
+        "title": source.title or "Untitled Source",
+        "url": source.url or "",
+        "source_type": source.source_type or "unknown",
+        "publication_date": source.publication_date or "",
+        "content_snippet": source.content_snippet or "",
+    }
+
+
 def _build_diligence_context(asset_metadata: dict) -> tuple:
     """Build diligence context from local regulatory/imaging databases.
 
@@ -144,9 +185,15 @@ class _MarketContextResult(tuple):
 
     This allows callers that unpack the tuple (``context_text, summaries = result``)
     and callers that compare the result directly to a string (``result == ""``)
-    to both work correctly without any change to their code.
+    to both work correctly without any change to their code. ``snapshot`` holds
+    the market snapshot's staleness metadata (None when no market data was used).
     """
 
+    def __new__(cls, items, snapshot: Optional[dict] = None):
+        result = super().__new__(cls, items)
+        result.snapshot = snapshot
+        return result
+
     def __eq__(self, other):
         if isinstance(other, str):
             return self[0] == other
@@ -170,17 +217,23 @@ def _build_market_context_for_query(query: str, force: bool = False) -> "_Market
         The return value compares equal to its string component so that existing
         callers that do ``result == ""`` continue to work, while new callers that
         unpack ``context_text, summaries = result`` also work correctly.
+
+    Reads the summary snapshot the background market refresh maintains; it
+    never fetches from market data providers inline.
     """
     try:
         if not force and not detect_market_intent(query):
             return _MarketContextResult(("", {}))
 
         logger.info("Market intent detected — injecting FRED context")
-        workflow = MarketWorkflow()
-        workflow.update_all()
-        summaries = workflow.compute_summary()
-        if summaries:
-            return _MarketContextResult((build_market_context(summaries), summaries))
+        snapshot = MarketWorkflow().read_summary_snapshot()
+        if snapshot.stale:
+            logger.info("Market snapshot is stale (data fetched %s)", snapshot.data_fetched_at or "never")
+        if snapshot.summaries:
+            return _MarketContextResult(
+                (build_market_context(snapshot.summaries), snapshot.summaries),
+                snapshot=snapshot.metadata(),
+            )
     except Exception as exc:
         logger.warning("Market context build failed (non-fatal): %s", exc)
 
@@ -768,15 +821,36 @@ def _fallback_findings(sources: List[Source]) -> List[Finding]:
     return findings
 
 
+def _source_key(source: Source) -> str:
+    """Identity used for deduplication: URL, falling back to title."""
+    return source.url if source.url else source.title
+
+
 def _deduplicate_sources(sources: List[Source]) -> List[Source]:
-    """Deduplicate sources by URL, fallback to title when URL is absent."""
+    """Deduplicate sources by URL, fallback to title when URL is absent.
+
+    When ``DEEP_RESEARCH["near_duplicates"]`` is enabled, copies of the same
+    story under different URLs are then collapsed into one canonical source
+    that lists the other URLs in ``alternate_urls``.
+    """
     seen_keys: set = set()
     unique: List[Source] = []
     for source in sources:
-        key = source.url if source.url else source.title
+        key = _source_key(source)
         if key and key not in seen_keys:
             seen_keys.add(key)
             unique.append(source)
+
+    settings = getattr(config, "DEEP_RESEARCH", {}).get("near_duplicates", {})
+    if settings.get("enabled", False) and len(unique) > 1:
+        collapsed = collapse_near_duplicates(
+            unique,
+            threshold=float(settings.get("jaccard_threshold", 0.7)),
+            min_features=int(settings.get("min_features", 8)),
+        )
+        if len(collapsed) < len(unique):
+            logger.info("Near-duplicate collapse: %d -> %d sources", len(unique), len(collapsed))
+        unique = collapsed
     return unique
 
 
@@ -872,51 +946,291 @@ def _score_and_filter_intent_sources(
     return topical[:max_sources]
 
 
-def run_deep_research(
-    query: str,
-    depth: int = 1,
-    max_results_per_source: int = 10,
+def _get_aggregation_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool shared by every intent/variant aggregation.
+
+    A single bounded pool caps upstream fan-out across concurrent research
+    jobs instead of letting each run spawn its own variant threads.
+    """
+    global _AGGREGATION_EXECUTOR
+    with _AGGREGATION_EXECUTOR_LOCK:
+        if _AGGREGATION_EXECUTOR is None:
+            settings = getattr(config, "DEEP_RESEARCH", {})
+            max_workers = max(1, int(settings.get("variant_concurrency", 6)))
+            _AGGREGATION_EXECUTOR = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="deep-research-agg",
+            )
+        return _AGGREGATION_EXECUTOR
+
+
+class _IntentYield:
+    """Running estimate of one intent's relevance-passing source yield.
+
+    Sources are scored with the same keyword overlap ``score_relevance`` uses
+    (without mutating them) as each variant's aggregation finishes. The intent
+    is satisfied once ``target`` distinct passing sources from at least
+    ``min_channels`` source types have been seen.
+    """
+
+    def __init__(
+        self,
+        intent_query: str,
+        variants: List[str],
+        target: int,
+        min_channels: int,
+        min_score: float,
+        min_variants: int = 1,
+        known_source_keys: Optional[set] = None,
+    ):
+        self.keywords = relevance_keywords(intent_query, _extract_extra_keywords(intent_query, variants))
+        self.target = max(1, int(target))
+        self.min_channels = max(1, int(min_channels))
+        self.min_score = min_score
+        self.min_variants = max(1, int(min_variants))
+        self.known_source_keys = known_source_keys or set()
+        self.passing = 0
+        self.channels: set = set()
+        self.stopped = False
+        self._seen: set = set()
+
+    def add(self, sources: List[Source]) -> None:
+        for source in sources:
+            key = _source_key(source)
+            if not key or key in self._seen or key in self.known_source_keys:
+                continue
+            self._seen.add(key)
+            if keyword_relevance(self.keywords, source) >= self.min_score:
+                self.passing += 1
+                self.channels.add(source.source_type or "unknown")
+
+    @property
+    def satisfied(self) -> bool:
+        return self.passing >= self.target and len(self.channels) >= self.min_channels
+
+
+def _early_stop_settings() -> Optional[dict]:
+    """``DEEP_RESEARCH["early_stop"]`` when enabled, else None."""
+    settings = getattr(config, "DEEP_RESEARCH", {}).get("early_stop", {})
+    return settings if settings.get("enabled", False) else None
+
+
+def _aggregate_variants(
+    jobs: List[Tuple[int, int, str, dict]],
+    total_intents: int,
+    variants_per_intent: Dict[int, int],
     progress_callback: Optional[ProgressCallback] = None,
-    refined_query: Optional[str] = None,
-    research_type: Optional[str] = None,
-    compare_subjects: Optional[List[str]] = None,
-    asset_metadata: Optional[dict] = None,
-) -> ResearchState:
-    """Execute the shared deep-research pipeline and return populated state."""
-    # Use refined query for search/analysis when available
-    search_query = refined_query or query
+    source_callback: Optional[SourceEventCallback] = None,
+    yield_trackers: Optional[Dict[int, _IntentYield]] = None,
+) -> Dict[Tuple[int, int], List[Source]]:
+    """Run aggregate_sources for every (intent, variant) job concurrently.
 
-    # Look up depth profile
-    profile = config.DEPTH_PROFILES.get(depth, config.DEPTH_PROFILES[1])
-    effective_max_per_source = profile["max_results_per_source"]
-    include_brave_news = profile["include_brave_news"]
-    num_variants = profile["query_variants"]
+    Args:
+        jobs: ``(intent_idx, variant_idx, variant_query, aggregate_kwargs)`` tuples
+        total_intents: Intent count, for progress messages
+        variants_per_intent: Variant count per intent index, for progress messages
+        progress_callback: Optional progress callback (invoked on the calling thread)
+        source_callback: Optional source event callback, invoked from worker threads
+            with a ``"sources"`` event as each channel of each variant finishes
+        yield_trackers: Optional per-intent yield trackers. When given, every
+            intent's first variants are submitted first, and once an intent's
+            tracker is satisfied its remaining variants are cancelled (queued
+            ones never start; running ones return what they have so far).
 
-    state = _init_research_state(
-        original_query=query,
-        depth=depth,
-        refined_query=refined_query,
-        research_type=research_type,
-        compare_subjects=compare_subjects,
-    )
-    if asset_metadata:
-        state.asset_metadata = asset_metadata
+    Returns:
+        Mapping of ``(intent_idx, variant_idx)`` to the aggregated sources, so the
+        caller can merge results in the original sequential order. Cancelled
+        variants that never started have no entry.
+    """
+    def channel_hook(intent_idx: int, variant_idx: int):
+        def on_channel_complete(channel: str, sources: List[Source]) -> None:
+            _emit_source_event(
+                source_callback,
+                "sources",
+                {
+                    "intent": intent_idx,
+                    "variant": variant_idx,
+                    "channel": channel,
+                    "sources": [_source_preview(s) for s in sources],
+                },
+            )
 
-    is_diligence = research_type == "diligence" and asset_metadata
-    if is_diligence:
-        tech = (asset_metadata.get("technology") or "").lower()
-        if tech in ("storage", "bess", "battery"):
-            from engine.query_refiner import decompose_bess_diligence_query
-            intents = decompose_bess_diligence_query(search_query, asset_metadata)
-        else:
-            intents = decompose_diligence_query(search_query, asset_metadata)
-    else:
-        intents = decompose_query(search_query)
-    if not intents:
-        intents = [SearchIntent(intent_query=search_query, parent_query=search_query, is_primary=True)]
+        return on_channel_complete
+
+    yield_trackers = yield_trackers or {}
+    if yield_trackers:
+        # Breadth first: every intent's first variant before anyone's second.
+        jobs = sorted(jobs, key=lambda job: (job[1], job[0]))
+
+    executor = _get_aggregation_executor()
+    futures = {}
+    cancel_events: Dict[Tuple[int, int], threading.Event] = {}
+    for intent_idx, variant_idx, variant, kwargs in jobs:
+        if source_callback:
+            kwargs = {**kwargs, "on_channel_complete": channel_hook(intent_idx, variant_idx)}
+        tracker = yield_trackers.get(intent_idx)
+        if tracker is not None and variant_idx > tracker.min_variants:
+            cancel_events[(intent_idx, variant_idx)] = threading.Event()
+            kwargs = {**kwargs, "cancel_event": cancel_events[(intent_idx, variant_idx)]}
+        future = executor.submit(aggregate_sources, variant, **kwargs)
+        futures[future] = (intent_idx, variant_idx, variant)
+
+    def stop_intent(intent_idx: int) -> int:
+        stoppable = [
+            (future, cancel_events[(job_intent, job_variant)])
+            for future, (job_intent, job_variant, _variant) in futures.items()
+            if job_intent == intent_idx and (job_intent, job_variant) in cancel_events
+        ]
+        # Dequeue everything first so a worker freed by a cancelled run cannot pick up a sibling.
+        skipped = sum(1 for future, _event in stoppable if future.cancel())
+        for _future, event in stoppable:
+            event.set()
+        return skipped
 
-    logger.info("Deep research depth=%d: %d intent(s) detected", depth, len(intents))
+    results: Dict[Tuple[int, int], List[Source]] = {}
+    try:
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            intent_idx, variant_idx, variant = futures[future]
+            variant_sources = future.result()
+            results[(intent_idx, variant_idx)] = variant_sources
+            _record_channel_spans(intent_idx, variant_idx, variant_sources)
+            tracker = yield_trackers.get(intent_idx)
+            if tracker is not None and not tracker.stopped:
+                tracker.add(variant_sources)
+                if tracker.satisfied:
+                    tracker.stopped = True
+                    skipped = stop_intent(intent_idx)
+                    logger.info(
+                        "Intent %d: yield target met (%d relevant sources across %d channels); "
+                        "cancelled remaining variants (%d not started)",
+                        intent_idx,
+                        tracker.passing,
+                        len(tracker.channels),
+                        skipped,
+                    )
+                    if skipped:
+                        _emit(
+                            progress_callback,
+                            "aggregation",
+                            f"Intent {intent_idx}/{total_intents}: enough relevant sources found, "
+                            f"skipping {skipped} remaining query variant(s).",
+                        )
+            timed_out = getattr(variant_sources, "timed_out_channels", None) or []
+            if timed_out:
+                logger.warning(
+                    "Intent %d variant %d: channels timed out: %s",
+                    intent_idx,
+                    variant_idx,
+                    ", ".join(timed_out),
+                )
+            _emit(
+                progress_callback,
+                "aggregation",
+                f"Intent {intent_idx}/{total_intents} query {variant_idx}/"
+                f"{variants_per_intent.get(intent_idx, 1)}: {variant[:60]}..."
+                + (f" (timed out: {', '.join(timed_out)})" if timed_out else ""),
+            )
+    except Exception:
+        for pending in futures:
+            pending.cancel()
+        raise
+    return results
+
+
+def _record_channel_spans(intent_idx: int, variant_idx: int, variant_sources: List[Source]) -> None:
+    """Add per-channel aggregation spans measured in aggregator worker threads."""
+    trace = current_trace()
+    durations = getattr(variant_sources, "channel_durations", None)
+    if trace is None or not durations:
+        return
+    timed_out = set(getattr(variant_sources, "timed_out_channels", None) or [])
+    counts = getattr(variant_sources, "channel_counts", None) or {}
+    for channel, duration_ms in durations.items():
+        trace.record(
+            "aggregation.channel",
+            duration_ms,
+            items=counts.get(channel, 0),
+            channel=channel,
+            intent=intent_idx,
+            variant=variant_idx,
+            timed_out=channel in timed_out,
+        )
+
+
+def _score_credibility(
+    sources: List[Source],
+    progress_callback: Optional[ProgressCallback] = None,
+    reference_sources: Optional[List[Source]] = None,
+) -> None:
+    """Score credibility in place; cross-references also count ``reference_sources``."""
+    reference_sources = list(reference_sources or [])
+    with stage("credibility", items=len(sources)):
+        cross_ref_counts = _count_cross_references_batch(reference_sources + sources)[len(reference_sources):]
+        for i, source in enumerate(sources):
+            cross_ref_count = cross_ref_counts[i]
+
+            if not source.title or source.title.strip() == "":
+                source.title = source.url if source.url else f"Source {i + 1}"
+
+            cred_result = score_source_credibility(
+                url=source.url or source.title,
+                citation_count=source.cited_by_count or 0,
+                cross_reference_count=cross_ref_count,
+                source_title=source.title,
+            )
 
+            source.credibility_score = cred_result["score"]
+            source.credibility_category = cred_result["category"]
+
+            if (i + 1) % 5 == 0 or (i + 1) == len(sources):
+                _emit(progress_callback, "credibility", f"Scored {i + 1}/{len(sources)} sources...")
+
+
+def _fetch_source_content(sources: List[Source], progress_callback: Optional[ProgressCallback] = None) -> int:
+    """Fetch full article text for ``sources`` when CONTENT_FETCH is enabled (non-fatal)."""
+    fetched = 0
+    try:
+        cf = config.CONTENT_FETCH
+        if cf.get("enabled", False) and sources:
+            _emit(progress_callback, "content_fetch", "Fetching full article text...")
+            from tools.utils._content_extractor import ContentExtractor
+            extractor = ContentExtractor(enabled=True)
+            with stage("content_fetch") as span:
+                fetched = extractor.fetch_content_for_sources(
+                    sources,
+                    max_sources=cf.get("max_sources", 20),
+                    timeout_per_url=cf.get("timeout_per_url", 10),
+                    skip_types=cf.get("skip_types", ["academic"]),
+                    max_workers=cf.get("max_workers", 8),
+                )
+                span.items = fetched
+            _emit(progress_callback, "content_fetch", f"Fetched full text for {fetched} sources.")
+    except Exception as e:
+        logger.warning(f"Content fetch phase failed (non-fatal): {e}")
+    return fetched
+
+
+def _gather_relevant_sources(
+    search_query: str,
+    intents: List[SearchIntent],
+    profile: dict,
+    is_diligence: bool,
+    asset_metadata: Optional[dict] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    source_callback: Optional[SourceEventCallback] = None,
+    known_source_keys: Optional[set] = None,
+) -> List[Source]:
+    """Aggregate every intent's query variants and keep the relevant sources.
+
+    Sources whose ``_source_key`` is in ``known_source_keys`` are dropped
+    before relevance scoring (used by incremental refresh). Returns the merged
+    per-intent relevant sources, not yet deduplicated across intents.
+    """
+    effective_max_per_source = profile["max_results_per_source"]
+    include_brave_news = profile["include_brave_news"]
+    num_variants = profile["query_variants"]
     max_sources = profile.get("max_sources", 25)
     relevance_min = config.SYNTHESIS.get("relevance_min_score", 0.15)
     merged_relevant_sources: List[Source] = []
@@ -926,10 +1240,15 @@ def run_deep_research(
     force_policy_flag = bool(is_diligence and is_us_asset)
     suppress_policy_flag = bool(is_diligence and not is_us_asset)
 
+    # Plan every intent's variants first, then fan all aggregation out at once.
+    intent_plans = []
+    aggregation_jobs: List[Tuple[int, int, str, dict]] = []
     for intent_idx, intent in enumerate(intents, 1):
         intent_query = intent.intent_query.strip() or search_query
         effective_variants = 1 if is_diligence else num_variants
-        variants = _generate_query_variants(intent_query, effective_variants)
+        with stage("query_variants", intent=intent_idx) as span:
+            variants = _generate_query_variants(intent_query, effective_variants)
+            span.items = len(variants)
         logger.info(
             "Intent %d/%d query variants: %d (%s)",
             intent_idx,
@@ -937,48 +1256,90 @@ def run_deep_research(
             len(variants),
             intent_query[:80],
         )
+        intent_plans.append((intent, intent_query, variants))
+
+        aggregate_kwargs = {
+            "max_results_per_source": effective_max_per_source,
+            "include_brave_news": include_brave_news,
+            "force_policy": force_policy_flag,
+            "suppress_policy": suppress_policy_flag,
+            "include_local_sme": bool(is_diligence),
+            "sme_intent_domain": (intent.domain or "") if is_diligence else "",
+            "asset_metadata": asset_metadata if is_diligence else None,
+        }
+        for variant_idx, variant in enumerate(variants, 1):
+            aggregation_jobs.append((intent_idx, variant_idx, variant, aggregate_kwargs))
 
-        _emit(
-            progress_callback,
-            "aggregation",
-            f"Intent {intent_idx}/{len(intents)}: searching with {len(variants)} query variant(s)...",
+    _emit(
+        progress_callback,
+        "aggregation",
+        f"Searching {len(aggregation_jobs)} query variant(s) across {len(intents)} intent(s)...",
+    )
+    yield_trackers: Dict[int, _IntentYield] = {}
+    early_stop = _early_stop_settings()
+    if early_stop:
+        strict_min = max(relevance_min, float(config.SYNTHESIS.get("service_topical_min_score", 0.25)))
+        target = math.ceil(float(early_stop.get("target_ratio", 1.0)) * max_sources / max(1, len(intents)))
+        for intent_idx, (_intent, intent_query, variants) in enumerate(intent_plans, 1):
+            if len(variants) > int(early_stop.get("min_variants", 1)):
+                yield_trackers[intent_idx] = _IntentYield(
+                    intent_query,
+                    variants,
+                    target=target,
+                    min_channels=int(early_stop.get("min_channels", 3)),
+                    min_score=strict_min,
+                    min_variants=int(early_stop.get("min_variants", 1)),
+                    known_source_keys=known_source_keys,
+                )
+
+    with stage("aggregation") as span:
+        aggregated = _aggregate_variants(
+            aggregation_jobs,
+            total_intents=len(intents),
+            variants_per_intent={idx: len(plan[2]) for idx, plan in enumerate(intent_plans, 1)},
+            progress_callback=progress_callback,
+            source_callback=source_callback,
+            yield_trackers=yield_trackers,
         )
+        span.items = sum(len(v) for v in aggregated.values())
+        stopped = [idx for idx, tracker in yield_trackers.items() if tracker.stopped]
+        if stopped:
+            span.meta["early_stopped_intents"] = stopped
+            span.meta["skipped_variants"] = len(aggregation_jobs) - len(aggregated)
 
+    for intent_idx, (intent, intent_query, variants) in enumerate(intent_plans, 1):
         intent_raw_sources: List[Source] = []
-        for variant_idx, variant in enumerate(variants, 1):
-            _emit(
-                progress_callback,
-                "aggregation",
-                f"Intent {intent_idx}/{len(intents)} query {variant_idx}/{len(variants)}: {variant[:60]}...",
-            )
-            variant_sources = aggregate_sources(
-                variant,
-                max_results_per_source=effective_max_per_source,
-                include_brave_news=include_brave_news,
-                force_policy=force_policy_flag,
-                suppress_policy=suppress_policy_flag,
-                include_local_sme=bool(is_diligence),
-                sme_intent_domain=(intent.domain or "") if is_diligence else "",
-                asset_metadata=asset_metadata if is_diligence else None,
-            )
-            intent_raw_sources.extend(variant_sources)
+        for variant_idx in range(1, len(variants) + 1):
+            intent_raw_sources.extend(aggregated.get((intent_idx, variant_idx), []))
 
-        deduped_intent_sources = _deduplicate_sources(intent_raw_sources)
+        with stage("dedupe", intent=intent_idx) as span:
+            deduped_intent_sources = _deduplicate_sources(intent_raw_sources)
+            span.items = len(deduped_intent_sources)
         logger.info(
             "Funnel: intent[%d] aggregation %d -> %d (dedup)",
             intent_idx,
             len(intent_raw_sources),
             len(deduped_intent_sources),
         )
+        if known_source_keys:
+            unseen = [s for s in deduped_intent_sources if _source_key(s) not in known_source_keys]
+            logger.info(
+                "Funnel: intent[%d] refresh %d -> %d (skipped known sources)",
+                intent_idx,
+                len(deduped_intent_sources),
+                len(unseen),
+            )
+            deduped_intent_sources = unseen
 
         _emit(progress_callback, "relevance", f"Scoring relevance for intent {intent_idx}/{len(intents)}...")
-        intent_relevant_sources = _score_and_filter_intent_sources(
-            intent_query=intent_query,
-            sources=deduped_intent_sources,
-            variants=variants,
-            max_sources=max_sources,
-            relevance_min=relevance_min,
-        )
+        with stage("relevance", items=len(deduped_intent_sources), intent=intent_idx):
+            intent_relevant_sources = _score_and_filter_intent_sources(
+                intent_query=intent_query,
+                sources=deduped_intent_sources,
+                variants=variants,
+                max_sources=max_sources,
+                relevance_min=relevance_min,
+            )
         logger.info(
             "Funnel: intent[%d] relevance %d -> %d (min=%.2f)",
             intent_idx,
@@ -986,6 +1347,19 @@ def run_deep_research(
             len(intent_relevant_sources),
             relevance_min,
         )
+        _emit_source_event(
+            source_callback,
+            "scores",
+            {
+                "stage": "relevance",
+                "intent": intent_idx,
+                "scores": {
+                    s.source_id: {"relevance_score": s.relevance_score or 0.0}
+                    for s in deduped_intent_sources
+                },
+                "kept": [s.source_id for s in intent_relevant_sources],
+            },
+        )
 
         if is_diligence and intent.domain:
             for src in intent_relevant_sources:
@@ -994,8 +1368,84 @@ def run_deep_research(
 
         merged_relevant_sources.extend(intent_relevant_sources)
 
+    return merged_relevant_sources
+
+
+@with_llm_priority("research")
+@traced_research
+def run_deep_research(
+    query: str,
+    depth: int = 1,
+    max_results_per_source: int = 10,
+    progress_callback: Optional[ProgressCallback] = None,
+    refined_query: Optional[str] = None,
+    research_type: Optional[str] = None,
+    compare_subjects: Optional[List[str]] = None,
+    asset_metadata: Optional[dict] = None,
+    source_callback: Optional[SourceEventCallback] = None,
+) -> ResearchState:
+    """Execute the shared deep-research pipeline and return populated state.
+
+    ``source_callback`` receives incremental ``(event, payload)`` updates so
+    clients can render sources before synthesis finishes: a ``"sources"``
+    event per channel as aggregation completes, then ``"scores"`` events as
+    the relevance and credibility stages patch scores in. During synthesis it
+    also receives the outline, streamed ``"section_delta"`` text and a final
+    quality-gated ``"section"`` event per section (see ``synthesize``).
+
+    Per-stage timing spans are attached to the returned state as
+    ``state.timings`` (a ``ResearchTrace``) and persisted with the run.
+    """
+    # Use refined query for search/analysis when available
+    search_query = refined_query or query
+
+    # Look up depth profile
+    profile = config.DEPTH_PROFILES.get(depth, config.DEPTH_PROFILES[1])
+
+    state = _init_research_state(
+        original_query=query,
+        depth=depth,
+        refined_query=refined_query,
+        research_type=research_type,
+        compare_subjects=compare_subjects,
+    )
+    if asset_metadata:
+        state.asset_metadata = asset_metadata
+
+    # Boot scale-to-zero synthesis endpoints while sources are aggregated.
+    warm_synthesis_endpoints()
+
+    is_diligence = research_type == "diligence" and asset_metadata
+    with stage("decomposition") as span:
+        if is_diligence:
+            tech = (asset_metadata.get("technology") or "").lower()
+            if tech in ("storage", "bess", "battery"):
+                from engine.query_refiner import decompose_bess_diligence_query
+                intents = decompose_bess_diligence_query(search_query, asset_metadata)
+            else:
+                intents = decompose_diligence_query(search_query, asset_metadata)
+        else:
+            intents = decompose_query(search_query)
+        if not intents:
+            intents = [SearchIntent(intent_query=search_query, parent_query=search_query, is_primary=True)]
+        span.items = len(intents)
+
+    logger.info("Deep research depth=%d: %d intent(s) detected", depth, len(intents))
+
+    max_sources = profile.get("max_sources", 25)
+    merged_relevant_sources = _gather_relevant_sources(
+        search_query,
+        intents,
+        profile,
+        is_diligence=bool(is_diligence),
+        asset_metadata=asset_metadata,
+        progress_callback=progress_callback,
+        source_callback=source_callback,
+    )
+
     # Deduplicate across intents and apply final source budget.
-    unique_sources = _deduplicate_sources(merged_relevant_sources)
+    with stage("dedupe", items=len(merged_relevant_sources), scope="merged"):
+        unique_sources = _deduplicate_sources(merged_relevant_sources)
     unique_sources.sort(
         key=lambda s: (
             s.relevance_score or 0.0,
@@ -1013,43 +1463,29 @@ def run_deep_research(
 
     _emit(progress_callback, "credibility", f"Found {len(unique_sources)} relevant sources. Scoring credibility...")
 
-    for i, source in enumerate(unique_sources):
-        cross_ref_count = _count_cross_references(source, unique_sources)
-
-        if not source.title or source.title.strip() == "":
-            source.title = source.url if source.url else f"Source {i + 1}"
-
-        cred_result = score_source_credibility(
-            url=source.url or source.title,
-            citation_count=source.cited_by_count or 0,
-            cross_reference_count=cross_ref_count,
-            source_title=source.title,
-        )
-
-        source.credibility_score = cred_result["score"]
-        source.credibility_category = cred_result["category"]
+    _score_credibility(unique_sources, progress_callback)
+    for source in unique_sources:
         state.add_source(source)
 
-        if (i + 1) % 5 == 0 or (i + 1) == len(unique_sources):
-            _emit(progress_callback, "credibility", f"Scored {i + 1}/{len(unique_sources)} sources...")
+    _emit_source_event(
+        source_callback,
+        "scores",
+        {
+            "stage": "credibility",
+            "scores": {
+                s.source_id: {
+                    "relevance_score": s.relevance_score or 0.0,
+                    "credibility_score": s.credibility_score or 0.0,
+                    "credibility_category": s.credibility_category or "Unknown",
+                }
+                for s in unique_sources
+            },
+            "kept": [s.source_id for s in unique_sources],
+        },
+    )
 
     # Content fetching phase (SEP-005)
-    try:
-        cf = config.CONTENT_FETCH
-        if cf.get("enabled", False):
-            _emit(progress_callback, "content_fetch", "Fetching full article text...")
-            from tools.utils._content_extractor import ContentExtractor
-            extractor = ContentExtractor(enabled=True)
-            fetched = extractor.fetch_content_for_sources(
-                state.sources_checked,
-                max_sources=cf.get("max_sources", 20),
-                timeout_per_url=cf.get("timeout_per_url", 10),
-                skip_types=cf.get("skip_types", ["academic"]),
-                max_workers=cf.get("max_workers", 8),
-            )
-            _emit(progress_callback, "content_fetch", f"Fetched full text for {fetched} sources.")
-    except Exception as e:
-        logger.warning(f"Content fetch phase failed (non-fatal): {e}")
+    _fetch_source_content(state.sources_checked, progress_callback)
 
     # Final deterministic ordering: relevance first, credibility second.
     state.sources_checked.sort(
@@ -1069,21 +1505,25 @@ def run_deep_research(
         diligence_context, diligence_data = _build_diligence_context(asset_metadata)
         market_context = ""
     else:
-        market_context, market_summaries = _build_market_context_for_query(query)
+        with stage("market_context"):
+            market = _build_market_context_for_query(query)
+            market_context, market_summaries = market
+            state.market_snapshot = getattr(market, "snapshot", None)
         _emit(
             progress_callback,
             "cross_reference",
             f"Clustering findings across {len(state.sources_checked)} ranked sources...",
         )
-        try:
-            clustered = _cluster_findings(query, state.sources_checked)
-            if clustered:
-                state.findings = clustered
-            else:
+        with stage("clustering", items=len(state.sources_checked)):
+            try:
+                clustered = _cluster_findings(query, state.sources_checked)
+                if clustered:
+                    state.findings = clustered
+                else:
+                    state.findings = _fallback_findings(state.sources_checked)
+            except Exception as _cluster_err:
+                logger.warning("Finding clustering failed (non-fatal), using fallback: %s", _cluster_err)
                 state.findings = _fallback_findings(state.sources_checked)
-        except Exception as _cluster_err:
-            logger.warning("Finding clustering failed (non-fatal), using fallback: %s", _cluster_err)
-            state.findings = _fallback_findings(state.sources_checked)
         _emit(
             progress_callback,
             "cross_reference",
@@ -1119,21 +1559,23 @@ def run_deep_research(
     heartbeat_thread.start()
 
     try:
-        if is_diligence:
-            state.synthesis = synthesize_direct(
-                state,
-                market_context=market_context or diligence_context,
-                progress_callback=progress_callback,
-                asset_metadata=asset_metadata,
-                diligence_context=diligence_context,
-            )
-        else:
-            state.synthesis = synthesize(
-                state,
-                market_context=market_context,
-                progress_callback=progress_callback,
-                market_summaries=market_summaries,
-            )
+        with stage("synthesis", items=len(state.sources_checked)):
+            if is_diligence:
+                state.synthesis = synthesize_direct(
+                    state,
+                    market_context=market_context or diligence_context,
+                    progress_callback=progress_callback,
+                    asset_metadata=asset_metadata,
+                    diligence_context=diligence_context,
+                )
+            else:
+                state.synthesis = synthesize(
+                    state,
+                    market_context=market_context,
+                    progress_callback=progress_callback,
+                    market_summaries=market_summaries,
+                    section_callback=source_callback,
+                )
         state.completed_at = datetime.now()
         state.current_iteration = 1
     finally:
@@ -1144,6 +1586,155 @@ def run_deep_research(
     return state
 
 
+@with_llm_priority("research")
+@traced_research
+def refresh_deep_research(
+    prior: ResearchState,
+    depth: Optional[int] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    source_callback: Optional[SourceEventCallback] = None,
+) -> Tuple[ResearchState, dict]:
+    """Incrementally refresh a stored research run.
+
+    Re-aggregates the query and diffs results against ``prior.sources_checked``:
+    only unseen URLs are relevance/credibility scored, content-fetched and
+    clustered into new findings. Prior sources keep their stored scores and
+    text. Synthesis re-expands only the sections whose routed evidence changed
+    (see ``refresh_synthesis``).
+
+    Returns:
+        ``(state, summary)`` where summary reports ``new_sources`` and
+        ``regenerated_sections``.
+    """
+    if prior.research_type == "diligence":
+        raise ValueError("Diligence research cannot be refreshed incrementally")
+
+    depth = depth or prior.max_depth or 1
+    profile = config.DEPTH_PROFILES.get(depth, config.DEPTH_PROFILES[1])
+    max_sources = profile.get("max_sources", 25)
+    search_query = prior.refined_query or prior.original_query
+
+    state = _init_research_state(
+        original_query=prior.original_query,
+        depth=depth,
+        refined_query=prior.refined_query,
+        research_type=prior.research_type,
+        compare_subjects=prior.compare_subjects,
+    )
+    summary = {"new_sources": 0, "regenerated_sections": [], "full_synthesis": False}
+
+    # Boot scale-to-zero synthesis endpoints while sources are re-aggregated.
+    warm_synthesis_endpoints()
+
+    with stage("decomposition") as span:
+        intents = decompose_query(search_query) or [
+            SearchIntent(intent_query=search_query, parent_query=search_query, is_primary=True)
+        ]
+        span.items = len(intents)
+    known_keys = {_source_key(s) for s in prior.sources_checked}
+    known_keys.update(url for s in prior.sources_checked for url in s.alternate_urls)
+    _emit(progress_callback, "aggregation", f"Refreshing sources ({len(known_keys)} already known)...")
+    candidates = _deduplicate_sources(
+        _gather_relevant_sources(
+            search_query,
+            intents,
+            profile,
+            is_diligence=False,
+            progress_callback=progress_callback,
+            source_callback=source_callback,
+            known_source_keys=known_keys,
+        )
+    )
+
+    if candidates:
+        _emit(progress_callback, "credibility", f"Found {len(candidates)} new relevant sources. Scoring credibility...")
+        _score_credibility(candidates, progress_callback, reference_sources=prior.sources_checked)
+
+    merged = sorted(
+        list(prior.sources_checked) + candidates,
+        key=lambda s: (s.relevance_score or 0.0, s.credibility_score or 0.0),
+        reverse=True,
+    )[:max_sources]
+    merged_ids = {s.source_id for s in merged}
+    new_sources = [s for s in candidates if s.source_id in merged_ids]
+    summary["new_sources"] = len(new_sources)
+    logger.info(
+        "Refresh funnel: %d candidates -> %d new sources within budget=%d",
+        len(candidates),
+        len(new_sources),
+        max_sources,
+    )
+
+    _fetch_source_content(new_sources, progress_callback)
+    for source in merged:
+        state.add_source(source)
+    state.total_sources = len(state.sources_checked)
+
+    if not new_sources:
+        state.findings = list(prior.findings)
+        state.synthesis = prior.synthesis
+        state.synthesis_model = prior.synthesis_model
+        state.completed_at = datetime.now()
+        state.current_iteration = 1
+        _emit(progress_callback, "complete", "Refresh complete: no new sources found.")
+        return state, summary
+
+    # Keep prior findings that still have supporting sources; add findings for new sources only.
+    prior_findings = []
+    for finding in prior.findings:
+        supported = [sid for sid in finding.sources if sid in merged_ids]
+        if supported:
+            prior_findings.append(Finding(
+                claim=finding.claim,
+                sources=supported,
+                confidence=finding.confidence,
+                average_credibility=finding.average_credibility,
+            ))
+    _emit(progress_callback, "cross_reference", f"Clustering findings across {len(new_sources)} new sources...")
+    with stage("clustering", items=len(new_sources)):
+        try:
+            new_findings = _cluster_findings(prior.original_query, new_sources) or _fallback_findings(new_sources)
+        except Exception as _cluster_err:
+            logger.warning("Refresh clustering failed (non-fatal), using fallback: %s", _cluster_err)
+            new_findings = _fallback_findings(new_sources)
+    state.findings = prior_findings + new_findings
+
+    with stage("market_context"):
+        market = _build_market_context_for_query(prior.original_query)
+        market_context, market_summaries = market
+        state.market_snapshot = getattr(market, "snapshot", None)
+    _emit(progress_callback, "synthesis", "Updating sections affected by new evidence...")
+    with stage("synthesis", items=len(state.sources_checked), incremental=True):
+        refreshed = refresh_synthesis(
+            prior,
+            state,
+            progress_callback=progress_callback,
+            market_context=market_context,
+            section_callback=source_callback,
+        )
+        if refreshed is None:
+            summary["full_synthesis"] = True
+            state.synthesis = synthesize(
+                state,
+                market_context=market_context,
+                progress_callback=progress_callback,
+                market_summaries=market_summaries,
+                section_callback=source_callback,
+            )
+    if refreshed is not None:
+        state.synthesis, summary["regenerated_sections"], state.synthesis_model = refreshed
+    state.completed_at = datetime.now()
+    state.current_iteration = 1
+
+    _emit(
+        progress_callback,
+        "complete",
+        f"Refresh complete! {len(new_sources)} new sources, "
+        f"{len(summary['regenerated_sections'])} section(s) updated.",
+    )
+    return state, summary
+
+
 def build_results_payload(state: ResearchState, query: str, research_id: Optional[str] = None, max_sources: int = 25) -> dict:
     """Build API payload for web result rendering."""
     return {
@@ -1167,8 +1758,10 @@ def build_results_payload(state: ResearchState, query: str, research_id: Optiona
                 "publication_date": s.publication_date or "",
                 "content_snippet": s.content_snippet or "",
                 "content_full": s.content_full or "",
+                "alternate_urls": list(s.alternate_urls),
             }
             for s in state.sources_checked[:max_sources]
         ],
+        "market_snapshot": state.market_snapshot,
         "completed_at": state.completed_at.isoformat() if state.completed_at else None,
     }
@@ -24,6 +24,7 @@ class Source:
     cited_by_count: int = 0
     cites: List[str] = field(default_factory=list)
     intent_domain: str = ""
+    alternate_urls: List[str] = field(default_factory=list)  # URLs of collapsed near-duplicate copies
 
     @staticmethod
     def generate_id(url: str) -> str:
@@ -73,6 +74,7 @@ class ResearchState:
     # Metadata
     completed_at: Optional[datetime] = None
     total_sources: int = 0
+    market_snapshot: Optional[dict] = None   # staleness of the market data used in synthesis
 
     def add_source(self, source: Source):
         """Add source and update citation graph"""
@@ -130,7 +132,8 @@ class ResearchState:
                     "content_snippet": s.content_snippet or "",
                     "content_full": s.content_full or "",
                     "cited_by_count": s.cited_by_count,
-                    "cites": s.cites
+                    "cites": s.cites,
+                    "alternate_urls": s.alternate_urls
                 }
                 for s in self.sources_checked
             ],
@@ -146,5 +149,60 @@ class ResearchState:
             "citation_graph": self.citation_graph,
             "synthesis": self.synthesis,
             "synthesis_model": self.synthesis_model,
-            "total_sources": self.total_sources
+            "total_sources": self.total_sources,
+            "market_snapshot": self.market_snapshot
         }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ResearchState":
+        """Rebuild state from a ``to_dict()`` payload (e.g. a stored research JSON)"""
+        config = data.get("config") or {}
+        progress = data.get("progress") or {}
+        state = cls(
+            original_query=data.get("original_query") or data.get("query") or "",
+            refined_query=data.get("refined_query"),
+            research_type=data.get("research_type"),
+            compare_subjects=list(data.get("compare_subjects") or []),
+            max_depth=config.get("max_depth", 3),
+            max_iterations=config.get("max_iterations", 5),
+        )
+        if data.get("started_at"):
+            state.started_at = datetime.fromisoformat(data["started_at"])
+        if data.get("completed_at"):
+            state.completed_at = datetime.fromisoformat(data["completed_at"])
+        state.current_depth = progress.get("current_depth", 0)
+        state.current_iteration = progress.get("current_iteration", 0)
+        state.sources_checked = [
+            Source(
+                source_id=s.get("source_id", ""),
+                url=s.get("url", ""),
+                title=s.get("title", ""),
+                authors=list(s.get("authors") or []),
+                publication_date=s.get("publication_date") or "",
+                source_type=s.get("source_type") or "",
+                credibility_score=s.get("credibility_score") or 0.0,
+                relevance_score=s.get("relevance_score") or 0.0,
+                credibility_category=s.get("credibility_category") or "",
+                content_snippet=s.get("content_snippet") or "",
+                content_full=s.get("content_full") or "",
+                cited_by_count=s.get("cited_by_count") or 0,
+                cites=list(s.get("cites") or []),
+                alternate_urls=list(s.get("alternate_urls") or []),
+            )
+            for s in data.get("sources") or []
+        ]
+        state.findings = [
+            Finding(
+                claim=f.get("claim", ""),
+                sources=list(f.get("sources") or []),
+                confidence=f.get("confidence", "low"),
+                average_credibility=f.get("average_credibility") or 0.0,
+            )
+            for f in data.get("findings") or []
+        ]
+        state.citation_graph = dict(data.get("citation_graph") or {})
+        state.synthesis = data.get("synthesis")
+        state.synthesis_model = data.get("synthesis_model")
+        state.total_sources = data.get("total_sources", len(state.sources_checked))
+        state.market_snapshot = data.get("market_snapshot")
+        return state
@@ -0,0 +1,113 @@
+"""Single-flight coalescing for identical deep research jobs.
+
+Two members of a team (or one user clicking twice) can start the same
+research while a first run is still in flight. ``ResearchJobRegistry`` lets
+duplicates attach to the running job instead of running the full pipeline
+again; the key is built by ``research_job_key`` from the normalized query,
+depth and mode, and the users who may see the result, so runs are never
+shared across tenants.
+"""
+
+import hashlib
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+
+def normalize_research_query(query: Optional[str]) -> str:
+    """Lowercase, collapse whitespace and drop trailing punctuation."""
+    text = re.sub(r"\s+", " ", (query or "").strip().lower())
+    return text.rstrip(" ?!.")
+
+
+def research_job_key(
+    query: str,
+    depth: int,
+    research_type: Optional[str] = None,
+    refined_query: Optional[str] = None,
+    asset_metadata: Optional[dict] = None,
+    owner_ids: Optional[Iterable[str]] = None,
+) -> str:
+    """Stable key identifying research runs that would produce the same result.
+
+    ``owner_ids`` are the users allowed to see the run (the requester's
+    ``get_accessible_user_ids``); None is the anonymous scope.
+    """
+    payload = json.dumps(
+        {
+            "query": normalize_research_query(query),
+            "refined_query": normalize_research_query(refined_query),
+            "depth": int(depth),
+            "mode": (research_type or "").strip().lower(),
+            "asset": asset_metadata or None,
+            "owners": sorted(owner_ids) if owner_ids else None,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class ResearchParticipant:
+    """A research request attached to an in-flight job"""
+    research_id: str
+    user_id: Optional[str] = None
+
+
+@dataclass
+class _InFlightJob:
+    leader_id: str
+    participants: List[ResearchParticipant] = field(default_factory=list)
+
+
+class ResearchJobRegistry:
+    """Thread-safe registry of in-flight research jobs keyed by job key."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, _InFlightJob] = {}
+        self._coalesced = 0
+
+    def attach(self, job_key: str, research_id: str, user_id: Optional[str] = None) -> Optional[str]:
+        """Register a request for ``job_key``.
+
+        Returns:
+            The leader's research_id if an identical job is already running (the
+            caller should not start one), or None if the caller is now the leader.
+        """
+        participant = ResearchParticipant(research_id=research_id, user_id=user_id)
+        with self._lock:
+            job = self._jobs.get(job_key)
+            if job is None:
+                self._jobs[job_key] = _InFlightJob(leader_id=research_id, participants=[participant])
+                return None
+            job.participants.append(participant)
+            self._coalesced += 1
+            return job.leader_id
+
+    def participants(self, job_key: str) -> List[ResearchParticipant]:
+        """Snapshot of every request currently attached to ``job_key``."""
+        with self._lock:
+            job = self._jobs.get(job_key)
+            return list(job.participants) if job else []
+
+    def finish(self, job_key: str) -> List[ResearchParticipant]:
+        """Close ``job_key`` and return its participants.
+
+        Requests arriving afterwards start (or reuse) a new job rather than
+        attaching to one whose results have already been delivered.
+        """
+        with self._lock:
+            job = self._jobs.pop(job_key, None)
+            return list(job.participants) if job else []
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "in_flight": len(self._jobs),
+                "attached": sum(len(j.participants) for j in self._jobs.values()),
+                "coalesced_total": self._coalesced,
+            }
@@ -0,0 +1,149 @@
+"""Per-stage timing spans for the deep research pipeline.
+
+``run_deep_research`` activates a ``ResearchTrace`` for the duration of a
+run; pipeline code records spans with ``stage("relevance", items=n)``
+without having the trace passed through every signature. Outside an
+active trace ``stage`` is a no-op, so instrumented helpers stay cheap when
+called directly (tests, CLI paths).
+"""
+
+import functools
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+_CURRENT_TRACE: ContextVar[Optional["ResearchTrace"]] = ContextVar("research_trace", default=None)
+
+
+@dataclass
+class StageSpan:
+    """One timed pipeline stage"""
+    stage: str
+    start_ms: float                    # Offset from trace start
+    duration_ms: float = 0.0
+    items: Optional[int] = None        # Sources/sections/etc. processed by the stage
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ResearchTrace:
+    """Thread-safe collection of stage spans for one research run.
+
+    With ``track_memory=True`` and ``tracemalloc`` tracing, ``span`` also
+    records the net allocation of the block as ``meta["mem_delta_kb"]``.
+    """
+
+    def __init__(self, track_memory: bool = False):
+        self.track_memory = track_memory
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self.spans: List[StageSpan] = []
+
+    def _offset_ms(self, at: float) -> float:
+        return round((at - self._t0) * 1000.0, 3)
+
+    def record(
+        self,
+        stage: str,
+        duration_ms: float,
+        items: Optional[int] = None,
+        start_ms: Optional[float] = None,
+        **meta: Any,
+    ) -> StageSpan:
+        """Record an already-measured span (e.g. channel timings from worker threads)."""
+        if start_ms is None:
+            start_ms = max(0.0, self._offset_ms(time.perf_counter()) - duration_ms)
+        span = StageSpan(
+            stage=stage,
+            start_ms=round(start_ms, 3),
+            duration_ms=round(duration_ms, 3),
+            items=items,
+            meta=meta,
+        )
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    @contextmanager
+    def span(self, stage: str, items: Optional[int] = None, **meta: Any) -> Iterator[StageSpan]:
+        """Time the enclosed block; callers may set ``span.items``/``span.meta`` inside it."""
+        mem_start = tracemalloc.get_traced_memory()[0] if self.track_memory and tracemalloc.is_tracing() else None
+        started = time.perf_counter()
+        span = StageSpan(stage=stage, start_ms=self._offset_ms(started), items=items, meta=dict(meta))
+        try:
+            yield span
+        except BaseException:
+            span.meta["error"] = True
+            raise
+        finally:
+            span.duration_ms = round((time.perf_counter() - started) * 1000.0, 3)
+            if mem_start is not None and tracemalloc.is_tracing():
+                span.meta["mem_delta_kb"] = round((tracemalloc.get_traced_memory()[0] - mem_start) / 1024.0, 1)
+            with self._lock:
+                self.spans.append(span)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start_ms)
+        return [s.to_dict() for s in spans]
+
+    def totals(self) -> Dict[str, float]:
+        """Summed duration per stage name (ms)."""
+        totals: Dict[str, float] = {}
+        with self._lock:
+            for span in self.spans:
+                totals[span.stage] = round(totals.get(span.stage, 0.0) + span.duration_ms, 3)
+        return totals
+
+
+def current_trace() -> Optional[ResearchTrace]:
+    """Return the trace active in this context, if any."""
+    return _CURRENT_TRACE.get()
+
+
+@contextmanager
+def activate(trace: ResearchTrace) -> Iterator[ResearchTrace]:
+    """Make ``trace`` the active trace for the enclosed block."""
+    token = _CURRENT_TRACE.set(trace)
+    try:
+        yield trace
+    finally:
+        _CURRENT_TRACE.reset(token)
+
+
+@contextmanager
+def stage(name: str, items: Optional[int] = None, **meta: Any) -> Iterator[StageSpan]:
+    """Time a pipeline stage on the active trace (no-op span when none is active)."""
+    trace = current_trace()
+    if trace is None:
+        yield StageSpan(stage=name, start_ms=0.0, items=items, meta=dict(meta))
+        return
+    with trace.span(name, items=items, **meta) as span:
+        yield span
+
+
+def traced_research(fn: Callable) -> Callable:
+    """Run ``fn`` under a trace and attach it to the returned state.
+
+    ``fn`` returns a ``ResearchState`` or a tuple whose first element is one;
+    the trace is set as ``state.timings`` for persistence by storage. A trace
+    already active in the caller (e.g. the benchmark harness) is reused,
+    otherwise a fresh one is started.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        trace = current_trace() or ResearchTrace()
+        with activate(trace):
+            result = fn(*args, **kwargs)
+        state = result[0] if isinstance(result, tuple) else result
+        if state is not None:
+            state.timings = trace
+        return result
+
+    return wrapper
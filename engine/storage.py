@@ -4,6 +4,7 @@ import sqlite3
 import json
 import logging
 import threading
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 
@@ -71,10 +72,14 @@ class LocalStorage:
         existing_columns = {row[1] for row in cursor.execute("PRAGMA table_info(research_findings)")}
         if "user_id" not in existing_columns:
             cursor.execute("ALTER TABLE research_findings ADD COLUMN user_id TEXT")
+        # Normalized (query, depth, mode) key used to reuse recent identical research.
+        if "job_key" not in existing_columns:
+            cursor.execute("ALTER TABLE research_findings ADD COLUMN job_key TEXT")
 
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_query ON research_findings(query)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_created_at ON research_findings(created_at DESC)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_user_id ON research_findings(user_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_job_key ON research_findings(job_key, completed_at DESC)")
 
         # Sources index
         cursor.execute("""
@@ -135,6 +140,20 @@ class LocalStorage:
             "CREATE INDEX IF NOT EXISTS idx_chat_thread ON research_chat_history(thread_key)"
         )
 
+        # Per-stage pipeline timing spans (one row per span)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS research_timings (
+                research_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                stage TEXT NOT NULL,
+                start_ms REAL NOT NULL,
+                duration_ms REAL NOT NULL,
+                items INTEGER,
+                meta_json TEXT,
+                PRIMARY KEY (research_id, seq)
+            )
+        """)
+
         # User settings store
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS user_settings (
@@ -168,6 +187,14 @@ class LocalStorage:
         timestamp = state.started_at.strftime("%Y%m%d_%H%M%S")
         topic_slug = state.original_query[:50].replace(' ', '_').lower().replace('/', '_')
         research_id = f"{topic_slug}_{timestamp}"
+        # Identical queries saved within the same second (e.g. coalesced jobs
+        # saved once per user) would otherwise collide on the primary key.
+        suffix = 1
+        while self.conn.execute(
+            "SELECT 1 FROM research_findings WHERE research_id = ?", (research_id,)
+        ).fetchone():
+            suffix += 1
+            research_id = f"{topic_slug}_{timestamp}_{suffix}"
 
         findings_dir = self.db_path.parent / 'research' / 'findings'
         findings_dir.mkdir(parents=True, exist_ok=True)
@@ -181,14 +208,16 @@ class LocalStorage:
         cursor = self.conn.cursor()
         # Get user_id from state metadata if available
         user_id = getattr(state, 'user_id', None)
+        job_key = getattr(state, 'job_key', None)
 
         cursor.execute("""
             INSERT INTO research_findings
-            (research_id, user_id, query, created_at, completed_at, synthesis, file_path, total_sources, max_depth)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            (research_id, user_id, job_key, query, created_at, completed_at, synthesis, file_path, total_sources, max_depth)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             research_id,
             user_id,
+            job_key,
             state.original_query,
             state.started_at,
             state.completed_at,
@@ -214,6 +243,18 @@ class LocalStorage:
                     VALUES (?, ?, ?)
                 """, (source_id, cited_id, research_id))
 
+        timings = getattr(state, 'timings', None)
+        if timings is not None:
+            cursor.executemany("""
+                INSERT INTO research_timings
+                (research_id, seq, stage, start_ms, duration_ms, items, meta_json)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (research_id, seq, span["stage"], span["start_ms"], span["duration_ms"],
+                 span["items"], json.dumps(span["meta"], default=str) if span["meta"] else None)
+                for seq, span in enumerate(timings.to_list())
+            ])
+
         self.conn.commit()
         logger.info(f"Saved research: {research_id} ({state.total_sources} sources)")
         return research_id
@@ -258,6 +299,28 @@ class LocalStorage:
         )
         return [dict(row) for row in cursor.fetchall()]
 
+    def get_timings(self, research_id: str, user_id: Optional[str] = None, user_ids: Optional[List[str]] = None) -> Optional[List[Dict[str, Any]]]:
+        """Return the stage timing spans of a research run in start order, with ownership check.
+
+        Returns None when the research is missing or not owned by the caller,
+        and an empty list for runs saved without timings.
+        """
+        if not self.load_research(research_id, user_id=user_id, user_ids=user_ids):
+            return None
+
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT stage, start_ms, duration_ms, items, meta_json FROM research_timings "
+            "WHERE research_id = ? ORDER BY seq",
+            (research_id,),
+        )
+        spans = []
+        for row in cursor.fetchall():
+            span = dict(row)
+            span["meta"] = json.loads(span.pop("meta_json") or "{}")
+            spans.append(span)
+        return spans
+
     # ------------------------------------------------------------------
     # SEP-059: chat history persistence
     # ------------------------------------------------------------------
@@ -345,6 +408,37 @@ class LocalStorage:
 
         return [dict(row) for row in cursor.fetchall()]
 
+    def find_recent_research(
+        self, job_key: str, max_age_seconds: float, user_ids: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the newest research row for ``job_key`` completed within the window.
+
+        Used to reuse a just-finished identical research run instead of
+        recomputing it. Only rows owned by ``user_ids`` are considered (rows
+        with NULL user_id when None, as in ``search_research``). Returns the
+        index row (research_id, user_id, file_path, ...).
+        """
+        if not job_key or max_age_seconds <= 0:
+            return None
+        cutoff = datetime.now() - timedelta(seconds=max_age_seconds)
+        cursor = self.conn.cursor()
+        if user_ids:
+            placeholders = ','.join(['?' for _ in user_ids])
+            cursor.execute(f"""
+                SELECT * FROM research_findings
+                WHERE job_key = ? AND user_id IN ({placeholders})
+                    AND completed_at IS NOT NULL AND completed_at >= ?
+                ORDER BY completed_at DESC LIMIT 1
+            """, (job_key, *user_ids, cutoff))
+        else:
+            cursor.execute("""
+                SELECT * FROM research_findings
+                WHERE job_key = ? AND user_id IS NULL AND completed_at IS NOT NULL AND completed_at >= ?
+                ORDER BY completed_at DESC LIMIT 1
+            """, (job_key, cutoff))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
     def load_research(self, research_id: str, user_id: Optional[str] = None, user_ids: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
         """Load full research from JSON file, with optional ownership check.
         
@@ -1,14 +1,29 @@
 """LLM client for OpenAI-compatible chat completions API."""
 
-from typing import List, Dict, Any, Optional
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional
 
 from config import API_URL, MODEL, MAX_TOKENS, TIMEOUT, TEMPERATURE, TOOL_CHOICE, PARALLEL_TOOL_CALLS
+from providers.admission import admit
+from providers.endpoint_health import get_endpoint_health, is_endpoint_failure
 from providers.openai_compatible_adapter import OpenAICompatibleAdapter
 
+# Sampling temperature for pings when the client has none configured; HF/TGI
+# endpoints reject a temperature of 0.
+_PING_TEMPERATURE = 0.1
+
 
 class LLMClient:
     """Client for interacting with LM Studio API or HuggingFace endpoints (OpenAI-compatible)."""
 
+    # Specialist role whose tool-free completions go through the persistent
+    # response cache (set by create_specialist_client); None bypasses it.
+    cache_role: Optional[str] = None
+    # Latency recorder shared through the specialist client registry; None
+    # skips timing.
+    call_stats: Optional[Any] = None
+
     def __init__(
         self,
         api_url: str = API_URL,
@@ -41,6 +56,37 @@ class LLMClient:
         self.parallel_tool_calls = parallel_tool_calls
         self.auth_token = auth_token
 
+    @contextmanager
+    def _endpoint_call(self) -> Iterator[None]:
+        """Guard the enclosed endpoint call: circuit check, admission slot, latency/health recording."""
+        health = get_endpoint_health(self.api_url)
+        if health is not None:
+            health.check()
+        with admit(self.api_url):
+            started = time.monotonic()
+            try:
+                yield
+            except Exception as exc:
+                if self.call_stats is not None:
+                    self.call_stats.record(time.monotonic() - started, False)
+                if health is not None and is_endpoint_failure(exc):
+                    health.record_failure(exc, probe=self.ping)
+                raise
+            elapsed = time.monotonic() - started
+            if self.call_stats is not None:
+                self.call_stats.record(elapsed, True)
+            if health is not None:
+                health.record_success(elapsed, self.max_tokens)
+
+    def ping(self) -> None:
+        """Send a one-token completion straight to the adapter; raises if the endpoint fails.
+
+        Bypasses the response cache, admission control and health tracking;
+        used to probe an endpoint whose circuit is open and to keep endpoints warm.
+        """
+        temperature = self.temperature or _PING_TEMPERATURE
+        self.adapter.chat_complete([{"role": "user", "content": "ping"}], None, temperature, 1)
+
     def chat_complete(
         self,
         messages: List[Dict[str, Any]],
@@ -57,9 +103,30 @@ class LLMClient:
             Full API response as dict
 
         Raises:
-            RuntimeError: If API call fails
+            RuntimeError: If API call fails (or, in cache replay mode, on an
+                unrecorded request). ``AdmissionRejected`` when the endpoint's
+                admission queue is full or the call waits past its timeout;
+                ``EndpointCircuitOpen`` while the endpoint's circuit is open.
         """
-        return self.adapter.chat_complete(messages, tools, self.temperature, self.max_tokens)
+        def call():
+            with self._endpoint_call():
+                return self.adapter.chat_complete(messages, tools, self.temperature, self.max_tokens)
+
+        if tools or not self.cache_role:
+            return call()
+        from tools.utils._llm_cache import get_llm_cache
+
+        cache = get_llm_cache()
+        if cache is None or not cache.caches(self.cache_role):
+            return call()
+        return cache.complete(
+            call,
+            endpoint=self.api_url,
+            model=self.model,
+            messages=messages,
+            params={"temperature": self.temperature, "max_tokens": self.max_tokens},
+            role=self.cache_role,
+        )
 
     def extract_tool_calls(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -136,7 +203,27 @@ class LLMClient:
         Raises:
             RuntimeError: If API call fails
         """
-        yield from self.adapter.chat_complete_stream(messages, tools)
+        def call():
+            with self._endpoint_call():
+                yield from self.adapter.chat_complete_stream(messages, tools)
+
+        if tools or not self.cache_role:
+            yield from call()
+            return
+        from tools.utils._llm_cache import get_llm_cache
+
+        cache = get_llm_cache()
+        if cache is None or not cache.caches(self.cache_role):
+            yield from call()
+            return
+        yield from cache.stream(
+            call,
+            endpoint=self.api_url,
+            model=self.model,
+            messages=messages,
+            params={"temperature": self.temperature, "max_tokens": self.max_tokens},
+            role=self.cache_role,
+        )
 
     def list_models(self) -> List[str]:
         """
@@ -0,0 +1,239 @@
+"""Priority-aware admission control for calls to shared LLM endpoints.
+
+Each endpoint (``scheme://host:port``, as pooled by ``http_pool``) admits at
+most ``LLM_ADMISSION["max_in_flight"]`` concurrent calls. Further calls wait
+in a bounded queue ordered by priority class, FIFO within a class:
+
+    interactive > research > background
+
+The last ``interactive_reserve`` slots are only ever granted to interactive
+calls, so a chat turn never waits behind a burst of research or alert
+synthesis. The priority of a call comes from the enclosing
+``llm_priority(...)`` block (a context variable, so it follows
+``contextvars.copy_context`` into worker threads).
+"""
+
+import functools
+import heapq
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from providers.http_pool import endpoint_key
+
+logger = logging.getLogger(__name__)
+
+PRIORITIES = ("interactive", "research", "background")
+
+_CURRENT_PRIORITY: ContextVar[Optional[str]] = ContextVar("llm_priority", default=None)
+
+
+class AdmissionRejected(RuntimeError):
+    """Raised when an LLM call is refused (queue full) or waits past the queue timeout."""
+
+
+def _settings() -> Dict[str, Any]:
+    import config
+
+    return getattr(config, "LLM_ADMISSION", {})
+
+
+def current_priority() -> str:
+    """Return the priority class for LLM calls made from the current context."""
+    priority = _CURRENT_PRIORITY.get() or _settings().get("default_priority", "research")
+    return priority if priority in PRIORITIES else "research"
+
+
+@contextmanager
+def llm_priority(priority: str) -> Iterator[str]:
+    """Run the enclosed block's LLM calls under ``priority``."""
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown LLM priority '{priority}' (expected one of {', '.join(PRIORITIES)})")
+    token = _CURRENT_PRIORITY.set(priority)
+    try:
+        yield priority
+    finally:
+        _CURRENT_PRIORITY.reset(token)
+
+
+def with_llm_priority(priority: str) -> Callable[[Callable], Callable]:
+    """Decorator form of ``llm_priority``."""
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with llm_priority(priority):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class EndpointAdmission:
+    """In-flight limiter with a priority queue for one endpoint.
+
+    ``max_queue`` bounds research and background waiters; calls beyond it
+    fail fast with ``AdmissionRejected`` instead of piling onto an
+    overloaded server. Interactive calls are always queued.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        max_in_flight: int = 5,
+        interactive_reserve: int = 1,
+        max_queue: int = 32,
+        queue_timeout: float = 300.0,
+    ):
+        self.endpoint = endpoint
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.interactive_reserve = max(0, min(int(interactive_reserve), self.max_in_flight - 1))
+        self.max_queue = max(0, int(max_queue))
+        self.queue_timeout = float(queue_timeout)
+        self.in_flight = 0
+        self._cond = threading.Condition()
+        self._waiting: List[Tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._metrics = {
+            priority: {"admitted": 0, "queued": 0, "rejected": 0, "timeouts": 0, "wait_total": 0.0, "wait_max": 0.0}
+            for priority in PRIORITIES
+        }
+
+    def _limit(self, rank: int) -> int:
+        return self.max_in_flight if rank == 0 else self.max_in_flight - self.interactive_reserve
+
+    def _runnable(self, rank: int) -> bool:
+        return self.in_flight < self._limit(rank)
+
+    def acquire(self, priority: str) -> float:
+        """Take a slot for a ``priority`` call, waiting if needed; return seconds queued."""
+        rank = PRIORITIES.index(priority)
+        metrics = self._metrics[priority]
+        started = time.monotonic()
+        with self._cond:
+            if (not self._waiting or self._waiting[0][0] > rank) and self._runnable(rank):
+                self.in_flight += 1
+                metrics["admitted"] += 1
+                return 0.0
+
+            if rank > 0 and sum(1 for r, _ in self._waiting if r > 0) >= self.max_queue:
+                metrics["rejected"] += 1
+                raise AdmissionRejected(
+                    f"LLM endpoint {self.endpoint} is saturated ({self.in_flight} in flight, "
+                    f"{len(self._waiting)} queued); {priority} call rejected"
+                )
+
+            ticket = (rank, next(self._seq))
+            heapq.heappush(self._waiting, ticket)
+            metrics["queued"] += 1
+            deadline = started + self.queue_timeout
+            try:
+                while not (self._waiting[0] == ticket and self._runnable(rank)):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        metrics["timeouts"] += 1
+                        raise AdmissionRejected(
+                            f"{priority} call to LLM endpoint {self.endpoint} waited "
+                            f"{self.queue_timeout:.0f}s without a free slot"
+                        )
+                    self._cond.wait(remaining)
+            except BaseException:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+                raise
+
+            heapq.heappop(self._waiting)
+            self.in_flight += 1
+            waited = time.monotonic() - started
+            metrics["admitted"] += 1
+            metrics["wait_total"] += waited
+            metrics["wait_max"] = max(metrics["wait_max"], waited)
+            # The next waiter may fit in a slot that is still free.
+            self._cond.notify_all()
+        if waited > 1.0:
+            logger.debug(f"{priority} LLM call to {self.endpoint} queued {waited:.1f}s")
+        return waited
+
+    def release(self) -> None:
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return in-flight/queued counts and per-priority admission and queue-time metrics."""
+        with self._cond:
+            queued_now = {priority: 0 for priority in PRIORITIES}
+            for rank, _ in self._waiting:
+                queued_now[PRIORITIES[rank]] += 1
+            priorities = {}
+            for priority, m in self._metrics.items():
+                priorities[priority] = {
+                    "admitted": m["admitted"],
+                    "queued": m["queued"],
+                    "queued_now": queued_now[priority],
+                    "rejected": m["rejected"],
+                    "timeouts": m["timeouts"],
+                    "avg_queue_ms": round(m["wait_total"] / m["queued"] * 1000, 1) if m["queued"] else 0.0,
+                    "max_queue_ms": round(m["wait_max"] * 1000, 1),
+                }
+            return {
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+                "interactive_reserve": self.interactive_reserve,
+                "max_queue": self.max_queue,
+                "priorities": priorities,
+            }
+
+
+_LIMITERS: Dict[str, EndpointAdmission] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_admission(url: str) -> Optional[EndpointAdmission]:
+    """Return the limiter for ``url``'s endpoint, or None when admission control is disabled."""
+    settings = _settings()
+    if not settings.get("enabled", False):
+        return None
+    key = endpoint_key(url)
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = EndpointAdmission(
+                key,
+                max_in_flight=(settings.get("endpoints") or {}).get(key, settings.get("max_in_flight", 5)),
+                interactive_reserve=settings.get("interactive_reserve", 1),
+                max_queue=settings.get("max_queue", 32),
+                queue_timeout=settings.get("queue_timeout", 300),
+            )
+            _LIMITERS[key] = limiter
+        return limiter
+
+
+@contextmanager
+def admit(url: str, priority: Optional[str] = None) -> Iterator[None]:
+    """Hold an admission slot on ``url``'s endpoint for the enclosed call."""
+    limiter = get_admission(url)
+    if limiter is None:
+        yield
+        return
+    limiter.acquire(priority or current_priority())
+    try:
+        yield
+    finally:
+        limiter.release()
+
+
+def reset_admission() -> None:
+    """Forget all limiters (settings are re-read on next use)."""
+    with _LIMITERS_LOCK:
+        _LIMITERS.clear()
+
+
+def admission_stats() -> Dict[str, Dict[str, Any]]:
+    """Return ``stats()`` for every endpoint limiter, keyed by endpoint."""
+    with _LIMITERS_LOCK:
+        limiters = list(_LIMITERS.items())
+    return {key: limiter.stats() for key, limiter in limiters}
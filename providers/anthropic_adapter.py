@@ -6,6 +6,8 @@ import json
 import os
 from typing import List, Dict, Any, Optional, Tuple
 from providers.base import BaseAdapter
+from providers.endpoint_health import adaptive_timeout
+from providers.http_pool import get_session
 
 
 class AnthropicAdapter(BaseAdapter):
@@ -206,13 +208,14 @@ class AnthropicAdapter(BaseAdapter):
         max_retries = 3
         base_delay = 0.5  # Start at 500ms
         
+        timeout = adaptive_timeout(self.messages_url, self.timeout, max_tokens)
         for attempt in range(max_retries + 1):
             try:
-                response = requests.post(
+                response = get_session(self.messages_url).post(
                     self.messages_url,
                     json=payload,
                     headers=headers,
-                    timeout=self.timeout,
+                    timeout=timeout,
                 )
                 response.raise_for_status()
                 anthropic_data = response.json()
@@ -226,7 +229,7 @@ class AnthropicAdapter(BaseAdapter):
                     jitter = delay * 0.2 * (2 * (time.time() % 1) - 1)
                     time.sleep(delay + jitter)
                     continue
-                raise RuntimeError(f"Anthropic API call timed out after {self.timeout}s (tried {max_retries + 1} times)")
+                raise RuntimeError(f"Anthropic API call timed out after {timeout}s (tried {max_retries + 1} times)")
                 
             except requests.ConnectionError:
                 if attempt < max_retries:
@@ -294,43 +297,46 @@ class AnthropicAdapter(BaseAdapter):
             payload["system"] = system_content
         
         try:
-            response = requests.post(
+            response = get_session(self.messages_url).post(
                 self.messages_url,
                 json=payload,
                 headers=headers,
                 timeout=self.timeout,
                 stream=True,
             )
-            response.raise_for_status()
+            try:
+                response.raise_for_status()
             
-            # Process Anthropic SSE stream
-            for line in response.iter_lines():
-                if not line:
-                    continue
+                # Process Anthropic SSE stream
+                for line in response.iter_lines():
+                    if not line:
+                        continue
                 
-                line = line.decode('utf-8')
+                    line = line.decode('utf-8')
                 
-                # Skip SSE prefix
-                if line.startswith('data: '):
-                    line = line[6:]
+                    # Skip SSE prefix
+                    if line.startswith('data: '):
+                        line = line[6:]
                 
-                # Check for stream end
-                if line == '[DONE]':
-                    break
+                    # Check for stream end
+                    if line == '[DONE]':
+                        break
                 
-                try:
-                    chunk = json.loads(line)
+                    try:
+                        chunk = json.loads(line)
                     
-                    # Extract text content from Anthropic stream format
-                    if chunk.get("type") == "content_block_delta":
-                        delta = chunk.get("delta", {})
-                        if delta.get("type") == "text_delta":
-                            text = delta.get("text", "")
-                            if text:
-                                yield text
+                        # Extract text content from Anthropic stream format
+                        if chunk.get("type") == "content_block_delta":
+                            delta = chunk.get("delta", {})
+                            if delta.get("type") == "text_delta":
+                                text = delta.get("text", "")
+                                if text:
+                                    yield text
                                 
-                except json.JSONDecodeError:
-                    continue
+                    except json.JSONDecodeError:
+                        continue
+            finally:
+                response.close()
                     
         except requests.Timeout:
             raise RuntimeError(f"Anthropic API streaming timed out after {self.timeout}s")
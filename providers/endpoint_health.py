@@ -0,0 +1,294 @@
+"""Shared health tracking and circuit breakers for LLM endpoints.
+
+``LLMClient`` reports every endpoint call here (keyed ``scheme://host:port``
+like the pooled sessions). Each tracker keeps a window of recent latencies,
+tagged with the call's requested ``max_tokens``, for percentile-based
+timeouts and counts consecutive failures. After
+``LLM_HEALTH["failure_threshold"]`` failures in a row the circuit opens:
+calls fail fast with ``EndpointCircuitOpen`` so callers go straight to their
+fallback, while a background thread probes the endpoint (with growing
+backoff) and closes the circuit once a probe gets an answer: a probe error
+that ``is_endpoint_failure`` does not recognise (e.g. a 4xx for the probe
+request) still means the endpoint is up.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+from providers.http_pool import endpoint_key
+
+logger = logging.getLogger(__name__)
+
+# Error text that means the endpoint itself is unhealthy (as opposed to a bad
+# request); adapters surface HTTP failures as RuntimeError messages.
+_UNHEALTHY_MARKERS = (
+    "TIMED OUT",
+    "TIMEOUT",
+    "COULD NOT CONNECT",
+    "CONNECTION",
+    "SERVICE_UNAVAILABLE",
+    "SERVICE UNAVAILABLE",
+    "BAD GATEWAY",
+)
+_UNHEALTHY_STATUS = re.compile(r"\b(500|502|503|504)\b")
+
+
+class EndpointCircuitOpen(RuntimeError):
+    """Raised instead of calling an endpoint whose circuit is open."""
+
+
+def is_endpoint_failure(exc: BaseException) -> bool:
+    """Return True when ``exc`` indicates an unhealthy endpoint rather than a bad request."""
+    if isinstance(exc, EndpointCircuitOpen):
+        return False
+    upper = str(exc or "").upper()
+    return any(marker in upper for marker in _UNHEALTHY_MARKERS) or bool(_UNHEALTHY_STATUS.search(upper))
+
+
+def _settings() -> Dict[str, Any]:
+    import config
+
+    return getattr(config, "LLM_HEALTH", {})
+
+
+class EndpointHealth:
+    """Latency percentiles, error counts and circuit state for one endpoint."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        failure_threshold: int = 3,
+        open_seconds: float = 30.0,
+        max_open_seconds: float = 300.0,
+        latency_window: int = 100,
+        min_samples: int = 20,
+        timeout_multiplier: float = 3.0,
+        min_timeout: float = 30.0,
+        cold_start_seconds: float = 65.0,
+        retry_seconds: float = 8.0,
+    ):
+        self.endpoint = endpoint
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.open_seconds = float(open_seconds)
+        self.max_open_seconds = max(float(max_open_seconds), self.open_seconds)
+        self.min_samples = max(1, int(min_samples))
+        self.timeout_multiplier = float(timeout_multiplier)
+        self.min_timeout = float(min_timeout)
+        self.cold_start_seconds = float(cold_start_seconds)
+        self.retry_seconds = float(retry_seconds)
+        self.state = "closed"
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self.last_error = ""
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=max(1, int(latency_window)))
+        self._recoveries = deque(maxlen=20)
+        self._failing_since: Optional[float] = None
+        self._probe: Optional[Callable[[], Any]] = None
+        self._probe_thread: Optional[threading.Thread] = None
+
+    # -- recording -------------------------------------------------------
+
+    def record_success(self, seconds: float, max_tokens: Optional[int] = None) -> None:
+        """Count a successful call that took ``seconds`` and asked for up to ``max_tokens``."""
+        with self._lock:
+            self.successes += 1
+            self._latencies.append((seconds, max_tokens))
+            self.consecutive_failures = 0
+            if self._failing_since is not None:
+                self._recoveries.append(time.monotonic() - self._failing_since)
+                self._failing_since = None
+            if self.state != "closed":
+                self.state = "closed"
+                logger.info(f"LLM endpoint {self.endpoint} recovered; circuit closed")
+
+    def record_failure(self, exc: BaseException, probe: Optional[Callable[[], Any]] = None) -> None:
+        """Count a failed call; ``probe`` is how the background thread re-tests the endpoint."""
+        with self._lock:
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.last_error = str(exc)[:300]
+            if self._failing_since is None:
+                self._failing_since = time.monotonic()
+            if probe is not None:
+                self._probe = probe
+            if self.state == "closed" and self.consecutive_failures >= self.failure_threshold:
+                self.state = "open"
+                self.times_opened += 1
+                logger.warning(
+                    f"LLM endpoint {self.endpoint} failed {self.consecutive_failures} times in a row; "
+                    f"circuit open ({self.last_error})"
+                )
+                self._start_probe_locked()
+
+    # -- circuit -----------------------------------------------------------
+
+    def allow_request(self) -> bool:
+        return self.state == "closed"
+
+    def check(self) -> None:
+        """Raise ``EndpointCircuitOpen`` while the circuit is open."""
+        if self.state != "closed":
+            raise EndpointCircuitOpen(
+                f"LLM endpoint {self.endpoint} circuit open after {self.consecutive_failures} "
+                f"consecutive failures ({self.last_error})"
+            )
+
+    def _start_probe_locked(self) -> None:
+        if self._probe_thread is not None and self._probe_thread.is_alive():
+            return
+        self._probe_thread = threading.Thread(
+            target=self._probe_loop,
+            daemon=True,
+            name=f"llm-health-probe-{self.endpoint}",
+        )
+        self._probe_thread.start()
+
+    def _probe_loop(self) -> None:
+        delay = self.open_seconds
+        while True:
+            time.sleep(delay)
+            with self._lock:
+                if self.state == "closed":
+                    return
+                probe = self._probe
+            if probe is None:
+                # Nothing to probe with: let real traffic test the endpoint again.
+                with self._lock:
+                    self.state = "closed"
+                    self.consecutive_failures = 0
+                return
+            started = time.monotonic()
+            try:
+                probe()
+            except Exception as exc:
+                if is_endpoint_failure(exc):
+                    with self._lock:
+                        self.last_error = str(exc)[:300]
+                    delay = min(delay * 2, self.max_open_seconds)
+                    logger.debug(f"LLM endpoint {self.endpoint} probe failed; next in {delay:.0f}s: {exc}")
+                    continue
+                # The endpoint answered, it just rejected the probe request itself.
+                logger.debug(f"LLM endpoint {self.endpoint} probe rejected but endpoint is up: {exc}")
+            self.record_success(time.monotonic() - started)
+            return
+
+    # -- adaptive timing ---------------------------------------------------
+
+    def _samples(self, max_tokens: Optional[int] = None) -> List[float]:
+        """Recent latencies of calls at least as large as ``max_tokens`` (all calls when None)."""
+        with self._lock:
+            latencies = list(self._latencies)
+        if max_tokens is None:
+            return [seconds for seconds, _ in latencies]
+        return [seconds for seconds, size in latencies if size is not None and size >= max_tokens]
+
+    def percentile(self, pct: float, max_tokens: Optional[int] = None) -> Optional[float]:
+        """Return the ``pct`` percentile of recent successful call latency, in seconds.
+
+        With ``max_tokens`` only calls that asked for at least that many tokens count.
+        """
+        samples = sorted(self._samples(max_tokens))
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, int(round(pct / 100.0 * (len(samples) - 1)))))
+        return samples[index]
+
+    def timeout_for(self, configured: float, max_tokens: Optional[int] = None) -> float:
+        """Return a read timeout: ``timeout_multiplier`` x p95 latency, within [min_timeout, configured].
+
+        Only calls that asked for at least ``max_tokens`` are sampled, so short
+        completions on a shared endpoint never shorten the timeout of a longer
+        one; until ``min_samples`` such calls have succeeded the configured
+        timeout is used.
+        """
+        if not configured:
+            return configured
+        samples = self._samples(max_tokens)
+        if len(samples) < self.min_samples:
+            return configured
+        adaptive = max(self.min_timeout, self.percentile(95, max_tokens) * self.timeout_multiplier)
+        return min(float(configured), adaptive)
+
+    def retry_delay(self, attempt: int) -> float:
+        """Seconds to wait before retry ``attempt`` (1-based) of an unavailable endpoint.
+
+        The first retry waits for a cold start: the median observed time from
+        the start of a failure streak to recovery, or ``cold_start_seconds``
+        before any recovery has been seen. Later retries wait ``retry_seconds``.
+        """
+        if attempt > 1:
+            return self.retry_seconds
+        with self._lock:
+            recoveries = sorted(self._recoveries)
+        if not recoveries:
+            return self.cold_start_seconds
+        return min(self.cold_start_seconds, max(1.0, recoveries[len(recoveries) // 2]))
+
+    def stats(self) -> Dict[str, Any]:
+        p50, p95 = self.percentile(50), self.percentile(95)
+        with self._lock:
+            return {
+                "state": self.state,
+                "successes": self.successes,
+                "failures": self.failures,
+                "consecutive_failures": self.consecutive_failures,
+                "times_opened": self.times_opened,
+                "last_error": self.last_error,
+                "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+                "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            }
+
+
+_TRACKERS: Dict[str, EndpointHealth] = {}
+_TRACKERS_LOCK = threading.Lock()
+
+
+def get_endpoint_health(url: str) -> Optional[EndpointHealth]:
+    """Return the tracker for ``url``'s endpoint, or None when health tracking is disabled."""
+    settings = _settings()
+    if not settings.get("enabled", False) or not isinstance(url, str) or not url:
+        return None
+    key = endpoint_key(url)
+    with _TRACKERS_LOCK:
+        tracker = _TRACKERS.get(key)
+        if tracker is None:
+            tracker = EndpointHealth(
+                key,
+                failure_threshold=settings.get("failure_threshold", 3),
+                open_seconds=settings.get("open_seconds", 30),
+                max_open_seconds=settings.get("max_open_seconds", 300),
+                latency_window=settings.get("latency_window", 100),
+                min_samples=settings.get("min_samples", 20),
+                timeout_multiplier=settings.get("timeout_multiplier", 3.0),
+                min_timeout=settings.get("min_timeout", 30),
+                cold_start_seconds=settings.get("cold_start_seconds", 65),
+                retry_seconds=settings.get("retry_seconds", 8),
+            )
+            _TRACKERS[key] = tracker
+        return tracker
+
+
+def adaptive_timeout(url: str, configured: float, max_tokens: Optional[int] = None) -> float:
+    """Return the read timeout for a blocking call to ``url`` (see ``EndpointHealth.timeout_for``)."""
+    tracker = get_endpoint_health(url)
+    return tracker.timeout_for(configured, max_tokens) if tracker is not None else configured
+
+
+def reset_endpoint_health() -> None:
+    """Forget all trackers (settings are re-read on next use)."""
+    with _TRACKERS_LOCK:
+        _TRACKERS.clear()
+
+
+def endpoint_health_stats() -> Dict[str, Dict[str, Any]]:
+    """Return ``stats()`` for every tracked endpoint, keyed by endpoint."""
+    with _TRACKERS_LOCK:
+        trackers = list(_TRACKERS.items())
+    return {key: tracker.stats() for key, tracker in trackers}
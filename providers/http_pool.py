@@ -0,0 +1,71 @@
+"""Shared keep-alive HTTP sessions for LLM provider adapters."""
+
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+_SESSIONS: Dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def endpoint_key(url: str) -> str:
+    """Return ``scheme://host:port`` for ``url``; adapters on one origin share a pool."""
+    parts = urlsplit((url or "").strip())
+    scheme = (parts.scheme or "http").lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port or _DEFAULT_PORTS.get(scheme, 80)
+    return f"{scheme}://{host}:{port}"
+
+
+def _pool_settings() -> Dict[str, object]:
+    import config
+
+    settings = getattr(config, "LLM_HTTP", {})
+    return {
+        "pool_maxsize": max(1, int(settings.get("pool_maxsize", 16))),
+        "pool_block": bool(settings.get("pool_block", False)),
+    }
+
+
+def get_session(url: str) -> requests.Session:
+    """Return the pooled session for ``url``'s endpoint, creating it on first use.
+
+    Each endpoint gets one ``requests.Session`` whose urllib3 pool keeps up to
+    ``LLM_HTTP["pool_maxsize"]`` connections alive for reuse across calls and
+    threads (the pool itself is thread-safe). With ``pool_block`` set, callers
+    wait for a free connection instead of opening extra, unpooled ones.
+    """
+    key = endpoint_key(url)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            settings = _pool_settings()
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=settings["pool_maxsize"],
+                pool_block=settings["pool_block"],
+            )
+            session.mount(f"{key.split('://', 1)[0]}://", adapter)
+            _SESSIONS[key] = session
+        return session
+
+
+def close_sessions(url: Optional[str] = None) -> None:
+    """Close pooled sessions (all of them, or only ``url``'s endpoint)."""
+    with _SESSIONS_LOCK:
+        keys = [endpoint_key(url)] if url else list(_SESSIONS)
+        sessions = [_SESSIONS.pop(key) for key in keys if key in _SESSIONS]
+    for session in sessions:
+        session.close()
+
+
+def pool_stats() -> Dict[str, int]:
+    """Return the number of pooled sessions, keyed ``{"endpoints": n}``."""
+    with _SESSIONS_LOCK:
+        return {"endpoints": len(_SESSIONS)}
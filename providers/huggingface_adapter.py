@@ -7,6 +7,8 @@ import time
 from typing import List, Dict, Any, Optional
 
 from providers.base import BaseAdapter
+from providers.endpoint_health import adaptive_timeout
+from providers.http_pool import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -131,13 +133,14 @@ class HuggingFaceAdapter(BaseAdapter):
         max_retries = 3
         base_delay = 0.5
 
+        timeout = adaptive_timeout(self.api_url, self.timeout, max_tokens)
         for attempt in range(max_retries + 1):
             try:
-                response = requests.post(
+                response = get_session(self.api_url).post(
                     self.api_url,
                     json=payload,
                     headers=headers,
-                    timeout=self.timeout,
+                    timeout=timeout,
                 )
                 response.raise_for_status()
                 hf_data = response.json()
@@ -151,7 +154,7 @@ class HuggingFaceAdapter(BaseAdapter):
                     time.sleep(delay + jitter)
                     continue
                 raise RuntimeError(
-                    f"HF Inference API timed out after {self.timeout}s (tried {max_retries + 1} times)"
+                    f"HF Inference API timed out after {timeout}s (tried {max_retries + 1} times)"
                 )
 
             except requests.ConnectionError:
@@ -245,60 +248,63 @@ class HuggingFaceAdapter(BaseAdapter):
         }
 
         try:
-            response = requests.post(
+            response = get_session(self.api_url).post(
                 self.api_url,
                 json=payload,
                 headers=headers,
                 timeout=self.timeout,
                 stream=True,
             )
-            response.raise_for_status()
-
-            for line in response.iter_lines():
-                if not line:
-                    continue
+            try:
+                response.raise_for_status()
 
-                line = line.decode("utf-8")
+                for line in response.iter_lines():
+                    if not line:
+                        continue
 
-                if line.startswith("data:"):
-                    line = line[5:].strip()
+                    line = line.decode("utf-8")
 
-                if not line or line == "[DONE]":
-                    continue
+                    if line.startswith("data:"):
+                        line = line[5:].strip()
 
-                try:
-                    chunk = json.loads(line)
-                    # HF streaming format is usually {"token": {"text": "..."}},
-                    # but some endpoints send list-wrapped chunks.
-                    if isinstance(chunk, list):
-                        for item in chunk:
-                            if isinstance(item, dict):
-                                generated_text = item.get("generated_text", "")
-                                if isinstance(generated_text, str) and generated_text:
-                                    yield generated_text
-                                    continue
-
-                                token = item.get("token", {})
-                                if isinstance(token, dict):
-                                    text = token.get("text", "")
-                                    if text:
-                                        yield text
-                            elif isinstance(item, str) and item:
-                                yield item
+                    if not line or line == "[DONE]":
                         continue
 
-                    if isinstance(chunk, dict):
-                        generated_text = chunk.get("generated_text", "")
-                        if isinstance(generated_text, str) and generated_text:
-                            yield generated_text
+                    try:
+                        chunk = json.loads(line)
+                        # HF streaming format is usually {"token": {"text": "..."}},
+                        # but some endpoints send list-wrapped chunks.
+                        if isinstance(chunk, list):
+                            for item in chunk:
+                                if isinstance(item, dict):
+                                    generated_text = item.get("generated_text", "")
+                                    if isinstance(generated_text, str) and generated_text:
+                                        yield generated_text
+                                        continue
+
+                                    token = item.get("token", {})
+                                    if isinstance(token, dict):
+                                        text = token.get("text", "")
+                                        if text:
+                                            yield text
+                                elif isinstance(item, str) and item:
+                                    yield item
                             continue
 
-                        token = chunk.get("token", {})
-                        text = token.get("text", "") if isinstance(token, dict) else ""
-                        if text:
-                            yield text
-                except json.JSONDecodeError:
-                    continue
+                        if isinstance(chunk, dict):
+                            generated_text = chunk.get("generated_text", "")
+                            if isinstance(generated_text, str) and generated_text:
+                                yield generated_text
+                                continue
+
+                            token = chunk.get("token", {})
+                            text = token.get("text", "") if isinstance(token, dict) else ""
+                            if text:
+                                yield text
+                    except json.JSONDecodeError:
+                        continue
+            finally:
+                response.close()
 
         except requests.Timeout:
             raise RuntimeError(f"HF Inference API streaming timed out after {self.timeout}s")
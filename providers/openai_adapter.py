@@ -5,6 +5,8 @@ import time
 import os
 from typing import List, Dict, Any, Optional
 from providers.base import BaseAdapter
+from providers.endpoint_health import adaptive_timeout
+from providers.http_pool import get_session
 
 
 class OpenAIAdapter(BaseAdapter):
@@ -53,13 +55,14 @@ class OpenAIAdapter(BaseAdapter):
         max_retries = 3
         base_delay = 0.5  # Start at 500ms
         
+        timeout = adaptive_timeout(self.chat_url, self.timeout, max_tokens)
         for attempt in range(max_retries + 1):
             try:
-                response = requests.post(
+                response = get_session(self.chat_url).post(
                     self.chat_url,
                     json=payload,
                     headers=headers,
-                    timeout=self.timeout,
+                    timeout=timeout,
                 )
                 response.raise_for_status()
                 return response.json()
@@ -70,7 +73,7 @@ class OpenAIAdapter(BaseAdapter):
                     jitter = delay * 0.2 * (2 * (time.time() % 1) - 1)
                     time.sleep(delay + jitter)
                     continue
-                raise RuntimeError(f"OpenAI API call timed out after {self.timeout}s (tried {max_retries + 1} times)")
+                raise RuntimeError(f"OpenAI API call timed out after {timeout}s (tried {max_retries + 1} times)")
                 
             except requests.ConnectionError:
                 if attempt < max_retries:
@@ -132,43 +135,46 @@ class OpenAIAdapter(BaseAdapter):
         }
         
         try:
-            response = requests.post(
+            response = get_session(self.chat_url).post(
                 self.chat_url,
                 json=payload,
                 headers=headers,
                 timeout=self.timeout,
                 stream=True,
             )
-            response.raise_for_status()
+            try:
+                response.raise_for_status()
             
-            # Process SSE stream
-            for line in response.iter_lines():
-                if not line:
-                    continue
+                # Process SSE stream
+                for line in response.iter_lines():
+                    if not line:
+                        continue
                 
-                line = line.decode('utf-8')
+                    line = line.decode('utf-8')
                 
-                # Skip SSE prefix
-                if line.startswith('data: '):
-                    line = line[6:]
+                    # Skip SSE prefix
+                    if line.startswith('data: '):
+                        line = line[6:]
                 
-                # Check for stream end
-                if line == '[DONE]':
-                    break
+                    # Check for stream end
+                    if line == '[DONE]':
+                        break
                 
-                try:
-                    import json
-                    chunk = json.loads(line)
+                    try:
+                        import json
+                        chunk = json.loads(line)
                     
-                    # Extract content delta from chunk
-                    if 'choices' in chunk and len(chunk['choices']) > 0:
-                        delta = chunk['choices'][0].get('delta', {})
-                        content = delta.get('content', '')
-                        if content:
-                            yield content
+                        # Extract content delta from chunk
+                        if 'choices' in chunk and len(chunk['choices']) > 0:
+                            delta = chunk['choices'][0].get('delta', {})
+                            content = delta.get('content', '')
+                            if content:
+                                yield content
                             
-                except json.JSONDecodeError:
-                    continue
+                    except json.JSONDecodeError:
+                        continue
+            finally:
+                response.close()
                     
         except requests.Timeout:
             raise RuntimeError(f"OpenAI API streaming timed out after {self.timeout}s")
@@ -4,6 +4,8 @@ import requests
 import time
 from typing import List, Dict, Any, Optional
 from providers.base import BaseAdapter
+from providers.endpoint_health import adaptive_timeout
+from providers.http_pool import get_session
 
 
 class OpenAICompatibleAdapter(BaseAdapter):
@@ -64,13 +66,14 @@ class OpenAICompatibleAdapter(BaseAdapter):
         if self.auth_token:
             headers["Authorization"] = f"Bearer {self.auth_token}"
 
+        timeout = adaptive_timeout(self.api_url, self.timeout, payload["max_tokens"])
         for attempt in range(max_retries + 1):
             try:
-                response = requests.post(
+                response = get_session(self.api_url).post(
                     self.api_url,
                     json=payload,
                     headers=headers,
-                    timeout=self.timeout,
+                    timeout=timeout,
                 )
                 response.raise_for_status()
                 response_data = response.json()
@@ -88,7 +91,7 @@ class OpenAICompatibleAdapter(BaseAdapter):
                     jitter = delay * 0.2 * (2 * (time.time() % 1) - 1)  # ±20% random
                     time.sleep(delay + jitter)
                     continue
-                raise RuntimeError(f"LLM API call timed out after {self.timeout}s (tried {max_retries + 1} times).")
+                raise RuntimeError(f"LLM API call timed out after {timeout}s (tried {max_retries + 1} times).")
 
             except requests.ConnectionError:
                 if attempt < max_retries:
@@ -130,7 +133,7 @@ class OpenAICompatibleAdapter(BaseAdapter):
             headers["Authorization"] = f"Bearer {self.auth_token}"
 
         try:
-            response = requests.get(models_url, headers=headers, timeout=10)
+            response = get_session(models_url).get(models_url, headers=headers, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -171,43 +174,46 @@ class OpenAICompatibleAdapter(BaseAdapter):
             headers["Authorization"] = f"Bearer {self.auth_token}"
 
         try:
-            response = requests.post(
+            response = get_session(self.api_url).post(
                 self.api_url,
                 json=payload,
                 headers=headers,
                 timeout=self.timeout,
                 stream=True,
             )
-            response.raise_for_status()
+            try:
+                response.raise_for_status()
 
-            # Process SSE stream
-            for line in response.iter_lines():
-                if not line:
-                    continue
+                # Process SSE stream
+                for line in response.iter_lines():
+                    if not line:
+                        continue
 
-                line = line.decode('utf-8')
+                    line = line.decode('utf-8')
 
-                # Skip SSE prefix
-                if line.startswith('data: '):
-                    line = line[6:]  # Remove 'data: ' prefix
+                    # Skip SSE prefix
+                    if line.startswith('data: '):
+                        line = line[6:]  # Remove 'data: ' prefix
 
-                # Check for stream end
-                if line == '[DONE]':
-                    break
+                    # Check for stream end
+                    if line == '[DONE]':
+                        break
 
-                try:
-                    import json
-                    chunk = json.loads(line)
+                    try:
+                        import json
+                        chunk = json.loads(line)
 
-                    # Extract content delta from chunk
-                    if 'choices' in chunk and len(chunk['choices']) > 0:
-                        delta = chunk['choices'][0].get('delta', {})
-                        content = delta.get('content', '')
-                        if content:
-                            yield content
+                        # Extract content delta from chunk
+                        if 'choices' in chunk and len(chunk['choices']) > 0:
+                            delta = chunk['choices'][0].get('delta', {})
+                            content = delta.get('content', '')
+                            if content:
+                                yield content
 
-                except json.JSONDecodeError:
-                    continue
+                    except json.JSONDecodeError:
+                        continue
+            finally:
+                response.close()
 
         except requests.Timeout:
             raise RuntimeError(f"LLM API streaming timed out after {self.timeout}s")
@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+"""Offline benchmark for the deep research pipeline.
+
+Replays recorded channel responses and stubbed LLM replies through
+``run_deep_research`` and reports per-stage wall time and memory at each
+depth (1=quick, 2=balanced, 3=thorough). Nothing touches the network, so
+regressions in reranking, dedupe, cross-referencing, clustering prompt
+assembly, synthesis routing or payload building show up as stage deltas.
+
+Usage:
+    python scripts/benchmark_deep_research.py run [--depths 1 2 3] [--repeat 3] [--output PATH]
+    python scripts/benchmark_deep_research.py compare BASE HEAD [--threshold 10]
+    python scripts/benchmark_deep_research.py record [--query "..."] [--depth 3]
+    python scripts/benchmark_deep_research.py extraction [--rounds 5] [--repeat 10]
+
+``run`` writes JSON results to ~/.zorora/benchmarks/<commit>.json by default.
+``compare`` accepts result paths or commit ids (resolved against that
+directory) and exits 1 when a stage regressed beyond the threshold.
+``record`` runs the live pipeline once and captures channel results, fetched
+page text and model replies into a replay fixture. ``extraction`` times
+the HTML-to-text backends over the extraction test fixtures.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+DEFAULT_FIXTURE = PROJECT_ROOT / "scripts" / "benchmark_fixtures" / "deep_research_replay.json"
+DEFAULT_RESULTS_DIR = Path.home() / ".zorora" / "benchmarks"
+DEFAULT_HTML_DIR = PROJECT_ROOT / "tests" / "fixtures" / "html"
+DEPTH_LABELS = {1: "quick", 2: "balanced", 3: "thorough"}
+SCHEMA_VERSION = 1
+
+
+# ---------------------------------------------------------------------------
+# Replay
+# ---------------------------------------------------------------------------
+
+class Replay:
+    """Stand-ins for the network-bound pipeline calls, fed from a fixture."""
+
+    def __init__(self, fixture: Dict[str, Any]):
+        self.fixture = fixture
+        self.query = fixture["query"]
+        self.channels: Dict[str, List[dict]] = fixture["channels"]
+        self.pages: Dict[str, str] = fixture.get("pages", {})
+        self.llm: Dict[str, str] = fixture.get("llm", {})
+
+    def aggregate_sources(
+        self,
+        query: str,
+        max_results_per_source: int = 10,
+        include_brave_news: bool = False,
+        on_channel_complete=None,
+        **_kwargs,
+    ):
+        """Return recorded channel results.
+
+        Queries other than the recorded one (variants, intents) get each
+        channel's list rotated by a hash of the query, so variants overlap
+        the way live results do and dedupe has work to do.
+        """
+        from engine.models import Source
+        from workflows.deep_research.aggregator import AggregatedSources
+
+        shift = int(hashlib.md5(query.encode()).hexdigest(), 16)
+        sources, counts = [], {}
+        for channel, items in self.channels.items():
+            if channel == "brave_news" and not include_brave_news:
+                continue
+            if not items:
+                continue
+            offset = 0 if query == self.query else shift % len(items)
+            picked = (items[offset:] + items[:offset])[:max_results_per_source]
+            channel_sources = [
+                Source(
+                    source_id=Source.generate_id(item["url"]),
+                    url=item["url"],
+                    title=item.get("title", ""),
+                    authors=list(item.get("authors") or []),
+                    publication_date=item.get("publication_date", ""),
+                    source_type=item.get("source_type", channel),
+                    content_snippet=item.get("content_snippet", ""),
+                    cited_by_count=item.get("cited_by_count", 0),
+                )
+                for item in picked
+            ]
+            counts[channel] = len(channel_sources)
+            sources.extend(channel_sources)
+            if on_channel_complete:
+                on_channel_complete(channel, channel_sources)
+        return AggregatedSources(sources, channel_counts=counts)
+
+    def page_text(self, url: str) -> Optional[str]:
+        return self.pages.get(url)
+
+    def reasoning_tool(self, prompt: str) -> str:
+        return self.llm.get("variants", "")
+
+    def clustering_model(self, prompt: str) -> Optional[str]:
+        return self.llm.get("clustering")
+
+    def synthesis_model(self, prompt: str, system_prompt: Optional[str] = None) -> Optional[str]:
+        if "Create an outline" in prompt:
+            return self.llm.get("outline")
+        return _section_reply(prompt)
+
+
+def _section_reply(prompt: str) -> Optional[str]:
+    """Deterministic section paragraph citing the prompt's top evidence records."""
+    block = prompt.split("**Evidence records (prioritized facts):**", 1)[-1].split("**Source notes:**", 1)[0]
+    records = re.findall(r"^- (.+?) \[([^\]]+)\]\s*$", block, flags=re.MULTILINE)
+    if not records:
+        return None
+    sentences = []
+    for i, (fact, title) in enumerate(records[:3]):
+        fact = fact.rstrip(". ")
+        lead = "The strongest evidence shows that" if i == 0 else "In addition,"
+        sentences.append(f"{lead} {fact[0].lower() + fact[1:]} [{title}].")
+    sentences.append("However, evidence on payment risk remains uncertain because sources disagree on timing.")
+    return " ".join(sentences)
+
+
+def _replay_patches(replay: Replay) -> List:
+    import config
+    import tools.registry
+
+    return [
+        patch("engine.deep_research_service.aggregate_sources", side_effect=replay.aggregate_sources),
+        patch("engine.deep_research_service._call_clustering_model", side_effect=replay.clustering_model),
+        # Market data is live-only: skip both the service-level and synthesize() fallback builds.
+        patch("engine.deep_research_service._build_market_context_for_query", return_value=("", {})),
+        patch("engine.query_refiner.detect_market_intent", return_value=False),
+        patch("workflows.deep_research.synthesizer._call_research_synthesis_model", side_effect=replay.synthesis_model),
+        patch(
+            "tools.utils._content_extractor.ContentExtractor._extract_from_url",
+            new=lambda _extractor, url, query="": replay.page_text(url),
+        ),
+        patch.dict(tools.registry.TOOL_FUNCTIONS, {"use_reasoning_model": replay.reasoning_tool}),
+        patch.dict(config.CONTENT_FETCH, {"enabled": True}),
+        patch.dict(config.WEB_SEARCH, {"relevance_cross_encoder_enabled": False}),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Run
+# ---------------------------------------------------------------------------
+
+def _run_once(query: str, depth: int, track_memory: bool = False) -> Dict[str, Any]:
+    from engine.deep_research_service import build_results_payload, run_deep_research
+    from engine.research_timing import ResearchTrace, activate, stage
+
+    trace = ResearchTrace(track_memory=track_memory)
+    if track_memory:
+        tracemalloc.reset_peak()
+    started = time.perf_counter()
+    with activate(trace):
+        state = run_deep_research(query, depth=depth)
+        with stage("payload", items=len(state.sources_checked)):
+            build_results_payload(state, query)
+    wall_ms = (time.perf_counter() - started) * 1000.0
+    run = {
+        "wall_ms": wall_ms,
+        "sources": len(state.sources_checked),
+        "findings": len(state.findings),
+        "synthesis_model": state.synthesis_model,
+        "spans": trace.to_list(),
+    }
+    if track_memory:
+        run["peak_kb"] = tracemalloc.get_traced_memory()[1] / 1024.0
+    return run
+
+
+def _stage_summary(runs: List[Dict[str, Any]], memory_run: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Median summed duration per stage across runs, plus memory from the traced run."""
+    per_run = []
+    for run in runs:
+        totals: Dict[str, Dict[str, float]] = {}
+        for span in run["spans"]:
+            entry = totals.setdefault(span["stage"], {"duration_ms": 0.0, "count": 0, "items": 0})
+            entry["duration_ms"] += span["duration_ms"]
+            entry["count"] += 1
+            entry["items"] += span["items"] or 0
+        per_run.append(totals)
+
+    stages: Dict[str, Dict[str, Any]] = {}
+    for name in sorted({name for totals in per_run for name in totals}):
+        samples = [totals[name] for totals in per_run if name in totals]
+        stages[name] = {
+            "duration_ms": round(statistics.median(s["duration_ms"] for s in samples), 3),
+            "count": samples[-1]["count"],
+            "items": samples[-1]["items"],
+        }
+    if memory_run:
+        for span in memory_run["spans"]:
+            if span["stage"] in stages and "mem_delta_kb" in span["meta"]:
+                entry = stages[span["stage"]]
+                entry["mem_delta_kb"] = round(entry.get("mem_delta_kb", 0.0) + span["meta"]["mem_delta_kb"], 1)
+    return stages
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run_benchmark(fixture_path: Path, depths: List[int], repeat: int, warmup: bool = True) -> Dict[str, Any]:
+    fixture = json.loads(fixture_path.read_text())
+    replay = Replay(fixture)
+    results: Dict[str, Any] = {
+        "schema": SCHEMA_VERSION,
+        "commit": _git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fixture": str(fixture_path),
+        "query": replay.query,
+        "repeat": repeat,
+        "depths": {},
+    }
+    with ExitStack() as stack:
+        for p in _replay_patches(replay):
+            stack.enter_context(p)
+        if warmup:
+            _run_once(replay.query, min(depths))
+        for depth in depths:
+            runs = [_run_once(replay.query, depth) for _ in range(repeat)]
+            tracemalloc.start()
+            try:
+                memory_run = _run_once(replay.query, depth, track_memory=True)
+            finally:
+                tracemalloc.stop()
+            results["depths"][str(depth)] = {
+                "label": DEPTH_LABELS.get(depth, str(depth)),
+                "wall_ms": round(statistics.median(r["wall_ms"] for r in runs), 3),
+                "peak_kb": round(memory_run["peak_kb"], 1),
+                "sources": runs[-1]["sources"],
+                "findings": runs[-1]["findings"],
+                "synthesis_model": runs[-1]["synthesis_model"],
+                "stages": _stage_summary(runs, memory_run),
+            }
+    return results
+
+
+def _print_results(results: Dict[str, Any]) -> None:
+    print(f"commit {results['commit'] or '?'}{' (dirty)' if results['dirty'] else ''}, repeat={results['repeat']}")
+    for depth, entry in results["depths"].items():
+        print(
+            f"\ndepth {depth} ({entry['label']}): {entry['wall_ms']:.1f} ms wall, "
+            f"{entry['peak_kb']:.0f} KiB peak, {entry['sources']} sources, {entry['findings']} findings"
+        )
+        print(f"  {'stage':<22}{'ms':>10}{'count':>7}{'items':>7}{'mem KiB':>10}")
+        for name, stage in entry["stages"].items():
+            mem = stage.get("mem_delta_kb")
+            print(
+                f"  {name:<22}{stage['duration_ms']:>10.2f}{stage['count']:>7}{stage['items']:>7}"
+                f"{'' if mem is None else format(mem, '.1f'):>10}"
+            )
+
+
+# ---------------------------------------------------------------------------
+# Compare
+# ---------------------------------------------------------------------------
+
+def _resolve_results(ref: str, results_dir: Path) -> Path:
+    path = Path(ref)
+    if path.exists():
+        return path
+    candidates = [ref, _git("rev-parse", "--short", ref)]
+    for name in filter(None, candidates):
+        candidate = results_dir / f"{name}.json"
+        if candidate.exists():
+            return candidate
+    raise FileNotFoundError(f"No benchmark results for {ref!r} (looked in {results_dir})")
+
+
+def compare_results(
+    base: Dict[str, Any],
+    head: Dict[str, Any],
+    threshold_pct: float = 10.0,
+    min_delta_ms: float = 5.0,
+) -> List[Dict[str, Any]]:
+    """Per-depth, per-stage comparison rows; ``regressed`` marks slowdowns past both limits."""
+    rows = []
+    for depth in sorted(set(base["depths"]) & set(head["depths"]), key=int):
+        b, h = base["depths"][depth], head["depths"][depth]
+        metrics = [("wall", b["wall_ms"], h["wall_ms"]), ("peak_kb", b["peak_kb"], h["peak_kb"])]
+        for name in sorted(set(b["stages"]) | set(h["stages"])):
+            metrics.append((
+                name,
+                b["stages"].get(name, {}).get("duration_ms"),
+                h["stages"].get(name, {}).get("duration_ms"),
+            ))
+        for name, before, after in metrics:
+            delta_pct = None
+            if before and after is not None:
+                delta_pct = round((after - before) / before * 100.0, 1)
+            is_ms = name != "peak_kb"
+            regressed = bool(
+                delta_pct is not None
+                and delta_pct > threshold_pct
+                and (not is_ms or after - before > min_delta_ms)
+            )
+            rows.append({
+                "depth": int(depth),
+                "metric": name,
+                "base": before,
+                "head": after,
+                "delta_pct": delta_pct,
+                "regressed": regressed,
+            })
+    return rows
+
+
+def _print_comparison(base: Dict[str, Any], head: Dict[str, Any], rows: List[Dict[str, Any]]) -> None:
+    print(f"base {base.get('commit') or '?'} -> head {head.get('commit') or '?'}")
+    depth = None
+    for row in rows:
+        if row["depth"] != depth:
+            depth = row["depth"]
+            print(f"\ndepth {depth} ({DEPTH_LABELS.get(depth, depth)})")
+            print(f"  {'metric':<22}{'base':>12}{'head':>12}{'delta':>9}")
+        fmt = lambda v: "-" if v is None else f"{v:.2f}"  # noqa: E731
+        delta = "-" if row["delta_pct"] is None else f"{row['delta_pct']:+.1f}%"
+        flag = "  REGRESSED" if row["regressed"] else ""
+        print(f"  {row['metric']:<22}{fmt(row['base']):>12}{fmt(row['head']):>12}{delta:>9}{flag}")
+
+
+# ---------------------------------------------------------------------------
+# Record
+# ---------------------------------------------------------------------------
+
+def record_fixture(query: str, depth: int) -> Dict[str, Any]:
+    """Run the live pipeline once and capture everything replay needs."""
+    import engine.deep_research_service as service
+    import tools.registry
+    import workflows.deep_research.synthesizer as synthesizer
+    from tools.utils._content_extractor import ContentExtractor
+
+    fixture: Dict[str, Any] = {"schema": SCHEMA_VERSION, "query": query, "channels": {}, "pages": {}, "llm": {}}
+    seen_urls: Dict[str, set] = {}
+
+    def on_channel(channel: str, sources) -> None:
+        bucket = fixture["channels"].setdefault(channel, [])
+        seen = seen_urls.setdefault(channel, set())
+        for s in sources:
+            if s.url and s.url not in seen:
+                seen.add(s.url)
+                bucket.append({
+                    "url": s.url,
+                    "title": s.title,
+                    "source_type": s.source_type,
+                    "publication_date": s.publication_date,
+                    "content_snippet": s.content_snippet,
+                    "authors": list(s.authors or []),
+                    "cited_by_count": s.cited_by_count,
+                })
+
+    real_aggregate = service.aggregate_sources
+    real_extract = ContentExtractor._extract_from_url
+    real_clustering = service._call_clustering_model
+    real_synthesis = synthesizer._call_research_synthesis_model
+    real_reasoning = tools.registry.TOOL_FUNCTIONS.get("use_reasoning_model")
+
+    def aggregate(query_text, **kwargs):
+        kwargs["on_channel_complete"] = on_channel
+        return real_aggregate(query_text, **kwargs)
+
+    def extract(self, url, query=""):
+        text = real_extract(self, url, query)
+        if text:
+            fixture["pages"][url] = text
+        return text
+
+    def clustering(prompt):
+        reply = real_clustering(prompt)
+        fixture["llm"].setdefault("clustering", reply)
+        return reply
+
+    def synthesis(prompt, system_prompt=None):
+        reply = real_synthesis(prompt, system_prompt=system_prompt)
+        if "Create an outline" in prompt:
+            fixture["llm"].setdefault("outline", reply)
+        return reply
+
+    def reasoning(prompt):
+        reply = real_reasoning(prompt) if real_reasoning else ""
+        if prompt.startswith("Decompose this research query"):
+            fixture["llm"].setdefault("variants", reply)
+        return reply
+
+    with patch.object(service, "aggregate_sources", side_effect=aggregate), \
+            patch.object(ContentExtractor, "_extract_from_url", new=extract), \
+            patch.object(service, "_call_clustering_model", side_effect=clustering), \
+            patch.object(synthesizer, "_call_research_synthesis_model", side_effect=synthesis), \
+            patch.dict(tools.registry.TOOL_FUNCTIONS, {"use_reasoning_model": reasoning}):
+        service.run_deep_research(query, depth=depth)
+    return fixture
+
+
+# ---------------------------------------------------------------------------
+# HTML extraction backends
+# ---------------------------------------------------------------------------
+
+def benchmark_extraction(html_dir: Path, rounds: int, repeat: int) -> Dict[str, float]:
+    """Return the best-of-``rounds`` time in ms for each backend to extract every page ``repeat`` times."""
+    from tools.utils._html_text import html_to_text
+
+    documents = [path.read_bytes() for path in sorted(html_dir.glob("*.html"))]
+    timings = {}
+    for backend in ("bs4", "readability"):
+        best = float("inf")
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for _ in range(repeat):
+                for html in documents:
+                    html_to_text(html, backend=backend)
+            best = min(best, time.perf_counter() - started)
+        timings[backend] = round(best * 1000, 2)
+    return timings
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline deep research pipeline benchmark.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show pipeline logging")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="Replay the fixture and record per-stage timings")
+    run_p.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE)
+    run_p.add_argument("--depths", type=int, nargs="+", default=[1, 2, 3], choices=[1, 2, 3])
+    run_p.add_argument("--repeat", type=int, default=3, help="Timed runs per depth (median is reported)")
+    run_p.add_argument("--no-warmup", action="store_true", help="Skip the untimed warm-up run")
+    run_p.add_argument("--output", type=Path, help="Results JSON path (default: ~/.zorora/benchmarks/<commit>.json)")
+
+    cmp_p = sub.add_parser("compare", help="Compare two result files or commits")
+    cmp_p.add_argument("base")
+    cmp_p.add_argument("head")
+    cmp_p.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent")
+    cmp_p.add_argument("--min-delta-ms", type=float, default=5.0, help="Ignore slowdowns smaller than this")
+    cmp_p.add_argument("--results-dir", type=Path, default=DEFAULT_RESULTS_DIR)
+
+    rec_p = sub.add_parser("record", help="Capture a replay fixture from a live pipeline run")
+    rec_p.add_argument("--query", default=None, help="Query to record (default: the current fixture's)")
+    rec_p.add_argument("--depth", type=int, default=3, choices=[1, 2, 3])
+    rec_p.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE)
+
+    ext_p = sub.add_parser("extraction", help="Time the HTML-to-text extraction backends")
+    ext_p.add_argument("--html-dir", type=Path, default=DEFAULT_HTML_DIR)
+    ext_p.add_argument("--rounds", type=int, default=5, help="Timed rounds per backend (best is reported)")
+    ext_p.add_argument("--repeat", type=int, default=10, help="Passes over the pages per round")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+
+    if args.command == "run":
+        results = run_benchmark(args.fixture, args.depths, max(1, args.repeat), warmup=not args.no_warmup)
+        output = args.output or DEFAULT_RESULTS_DIR / f"{results['commit'] or 'unknown'}.json"
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2))
+        _print_results(results)
+        print(f"\nwrote {output}")
+        return 0
+
+    if args.command == "extraction":
+        timings = benchmark_extraction(args.html_dir, max(1, args.rounds), max(1, args.repeat))
+        for backend, ms in timings.items():
+            print(f"{backend:<12} {ms:>9.2f} ms")
+        return 0
+
+    if args.command == "compare":
+        try:
+            base = json.loads(_resolve_results(args.base, args.results_dir).read_text())
+            head = json.loads(_resolve_results(args.head, args.results_dir).read_text())
+        except FileNotFoundError as exc:
+            print(exc, file=sys.stderr)
+            return 2
+        rows = compare_results(base, head, threshold_pct=args.threshold, min_delta_ms=args.min_delta_ms)
+        _print_comparison(base, head, rows)
+        return 1 if any(row["regressed"] for row in rows) else 0
+
+    query = args.query
+    if query is None:
+        query = json.loads(args.fixture.read_text())["query"]
+    fixture = record_fixture(query, args.depth)
+    args.fixture.parent.mkdir(parents=True, exist_ok=True)
+    args.fixture.write_text(json.dumps(fixture, indent=1))
+    print(f"recorded {sum(len(v) for v in fixture['channels'].values())} sources, "
+          f"{len(fixture['pages'])} pages into {args.fixture}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -82,11 +82,19 @@ setup(
         "data": [
             "odse>=0.1.0",
         ],
+        "async": [
+            "httpx>=0.24.0",
+        ],
+        "html": [
+            "lxml>=4.9.0",
+        ],
         "full": [
             "odse>=0.1.0",
             "sentence-transformers>=2.2.0",
             "faiss-cpu>=1.7.4",
             "openpyxl>=3.0.0",
+            "httpx>=0.24.0",
+            "lxml>=4.9.0",
         ],
     },
     python_requires=">=3.8",
@@ -0,0 +1,374 @@
+"""Tests for the shared async I/O core used by the search channels."""
+
+import asyncio
+import contextvars
+import importlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from engine.models import Source
+from tools.utils import _async_http
+from tools.utils._async_http import (
+    BoundedLane,
+    HTTPRequest,
+    Pause,
+    async_counterpart,
+    async_variant,
+    call_channel,
+    drive_async,
+    drive_sync,
+    get_async_http,
+    run_sync,
+)
+from workflows.deep_research import aggregator
+
+_request_var = contextvars.ContextVar("request_var", default=None)
+
+
+def _json_plan(url, events):
+    """A plan that pauses, fetches JSON, and survives transport errors."""
+    yield Pause(0)
+    events.append("paused")
+    try:
+        response = yield HTTPRequest(url, params={"q": "solar"}, timeout=5)
+        response.raise_for_status()
+        return response.json()["items"]
+    except Exception as e:
+        events.append(type(e).__name__)
+        return []
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith("/missing"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = json.dumps({"items": [self.path]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_same_plan_runs_sync_and_async(local_server):
+    sync_events, async_events = [], []
+    sync_items = drive_sync(_json_plan(f"{local_server}/works", sync_events))
+    async_items = run_sync(drive_async(_json_plan(f"{local_server}/works", async_events)))
+
+    assert sync_items == async_items == ["/works?q=solar"]
+    assert sync_events == async_events == ["paused"]
+
+
+def test_http_errors_are_thrown_into_the_plan(local_server):
+    events = []
+    assert run_sync(drive_async(_json_plan(f"{local_server}/missing", events))) == []
+    assert events == ["paused", "HTTPError"]
+
+    events = []
+    assert run_sync(drive_async(_json_plan("http://127.0.0.1:9/unreachable", events))) == []
+    assert events[-1] in {"ConnectionError", "Timeout"}
+
+
+def test_sync_driver_uses_requests_get():
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"items": ["patched"]}
+    with patch("requests.get", return_value=response) as mock_get:
+        assert drive_sync(_json_plan("https://api.example.com/works", [])) == ["patched"]
+    assert mock_get.call_args.kwargs["params"] == {"q": "solar"}
+
+
+def test_concurrent_requests_share_one_pooled_client(local_server):
+    async def fan_out():
+        return await asyncio.gather(*(drive_async(_json_plan(f"{local_server}/p{i}", [])) for i in range(20)))
+
+    results = run_sync(fan_out())
+    assert [r[0].split("?")[0] for r in results] == [f"/p{i}" for i in range(20)]
+    assert get_async_http() is get_async_http()
+    assert get_async_http().max_connections >= 1
+
+
+def test_run_sync_propagates_context_and_errors():
+    async def read_var():
+        return _request_var.get()
+
+    async def fail():
+        raise ValueError("boom")
+
+    token = _request_var.set("job-1")
+    try:
+        assert run_sync(read_var()) == "job-1"
+    finally:
+        _request_var.reset(token)
+    with pytest.raises(ValueError):
+        run_sync(fail())
+
+
+def test_run_sync_refuses_to_block_the_io_loop():
+    async def nested():
+        inner = asyncio.sleep(0)
+        with pytest.raises(RuntimeError):
+            run_sync(inner)
+        return True
+
+    assert run_sync(nested()) is True
+
+
+def test_call_channel_prefers_registered_async_form():
+    calls = []
+
+    def channel(query, max_results=5):
+        calls.append(("sync", threading.current_thread().name))
+        return []
+
+    @async_variant(channel)
+    async def channel_async(query, max_results=5):
+        calls.append(("async", query, max_results))
+        return []
+
+    assert async_counterpart(channel) is channel_async
+    assert async_counterpart(MagicMock()) is None
+    run_sync(call_channel(channel, "solar", max_results=3))
+    run_sync(call_channel(lambda: calls.append(("blocking", threading.current_thread().name))))
+
+    assert calls[0] == ("async", "solar", 3)
+    assert calls[1][0] == "blocking" and calls[1][1].startswith("research-blocking")
+
+
+def test_aggregator_cancels_async_channel_at_deadline():
+    state = {"cancelled": False}
+
+    def slow_web(query, max_results=10):
+        raise AssertionError("blocking path should not be used")
+
+    @async_variant(slow_web)
+    async def slow_web_async(query, max_results=10):
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+        return []
+
+    fast = [Source(source_id="a", url="https://example.com/a", title="A", source_type="academic")]
+    with patch.object(aggregator, "academic_search_sources", return_value=fast), \
+         patch.object(aggregator, "web_search_sources", slow_web), \
+         patch.object(aggregator, "fetch_newsroom_api", return_value=[]), \
+         patch.object(aggregator, "worldbank_search_sources", return_value=[]), \
+         patch.object(aggregator, "get_channel_cache", return_value=None):
+        started = time.monotonic()
+        result = aggregator.aggregate_sources("solar irradiance", channel_timeouts={"web": 0.2})
+        elapsed = time.monotonic() - started
+
+    assert [s.source_id for s in result] == ["a"]
+    assert result.timed_out_channels == ["web"]
+    assert result.channel_durations["web"] == 200.0
+    assert elapsed < 5
+    deadline = time.monotonic() + 2
+    while not state["cancelled"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert state["cancelled"]
+
+
+def test_aggregator_returns_partial_results_when_cancelled():
+    cancel = threading.Event()
+
+    async def slow_web_async(query, max_results=10):
+        await asyncio.sleep(30)
+        return []
+
+    def slow_web(query, max_results=10):
+        raise AssertionError("blocking path should not be used")
+
+    async_variant(slow_web)(slow_web_async)
+
+    def academic(query, max_results=10):
+        threading.Timer(0.1, cancel.set).start()
+        return [Source(source_id="a", url="https://example.com/a", title="A", source_type="academic")]
+
+    with patch.object(aggregator, "academic_search_sources", academic), \
+         patch.object(aggregator, "web_search_sources", slow_web), \
+         patch.object(aggregator, "fetch_newsroom_api", return_value=[]), \
+         patch.object(aggregator, "worldbank_search_sources", return_value=[]), \
+         patch.object(aggregator, "get_channel_cache", return_value=None):
+        started = time.monotonic()
+        result = aggregator.aggregate_sources("solar irradiance", cancel_event=cancel)
+        elapsed = time.monotonic() - started
+        assert aggregator.aggregate_sources("solar irradiance", cancel_event=cancel) == []
+
+    assert [s.source_id for s in result] == ["a"]
+    assert result.cancelled_channels == ["web"]
+    assert not result.timed_out_channels
+    assert elapsed < 5
+
+
+def test_bounded_lane_caps_workers_held_by_one_caller():
+    pool = ThreadPoolExecutor(max_workers=4)
+    lane = BoundedLane(pool, slots=2)
+    release = threading.Event()
+    hung = [lane.submit(release.wait, 5) for _ in range(3)]
+    try:
+        time.sleep(0.05)
+        assert lane.stats() == {"slots": 2, "running": 2, "queued": 1}
+        # The rest of the pool is still free for other callers.
+        assert pool.submit(lambda: "free").result(1) == "free"
+        # Work cancelled while waiting in the lane never takes a worker.
+        assert hung[2].cancel()
+    finally:
+        release.set()
+    assert [f.result(1) for f in hung[:2]] == [True, True]
+    assert lane.submit(lambda: "next").result(1) == "next"
+    assert lane.stats()["running"] == 0
+    pool.shutdown()
+
+
+def test_blocking_channel_deadline_starts_when_a_worker_picks_it_up(monkeypatch):
+    monkeypatch.setattr(aggregator, "_CHANNEL_LANES", {})
+    busy = aggregator._channel_lane("newsroom")
+    monkeypatch.setattr(busy, "slots", 1)
+    release = threading.Event()
+    hog = busy.submit(release.wait, 5)
+    threading.Timer(0.3, release.set).start()
+
+    def newsroom(query, **kwargs):
+        time.sleep(0.2)
+        return [{"title": "Solar irradiance", "url": "https://news.example/a"}]
+
+    with patch.object(aggregator, "academic_search_sources", return_value=[]), \
+         patch.object(aggregator, "web_search_sources", return_value=[]), \
+         patch.object(aggregator, "fetch_newsroom_api", side_effect=newsroom), \
+         patch.object(aggregator, "parse_newsroom_results", side_effect=lambda articles, q: articles), \
+         patch.object(aggregator, "worldbank_search_sources", return_value=[]), \
+         patch.object(aggregator, "get_channel_cache", return_value=None):
+        # Queued 0.3s behind the hung call, then 0.2s of work: over budget from
+        # creation, within budget from pickup.
+        result = aggregator.aggregate_sources("solar irradiance", channel_timeouts={"newsroom": 0.4})
+
+    assert hog.result(1) is True
+    assert not result.timed_out_channels
+    assert result.channel_counts["newsroom"] == 1
+
+
+def test_queued_blocking_channel_is_dropped_after_a_full_budget(monkeypatch):
+    monkeypatch.setattr(aggregator, "_CHANNEL_LANES", {})
+    busy = aggregator._channel_lane("newsroom")
+    monkeypatch.setattr(busy, "slots", 1)
+    release = threading.Event()
+    busy.submit(release.wait, 5)
+    newsroom = MagicMock(return_value=[])
+
+    try:
+        with patch.object(aggregator, "academic_search_sources", return_value=[]), \
+             patch.object(aggregator, "web_search_sources", return_value=[]), \
+             patch.object(aggregator, "fetch_newsroom_api", newsroom), \
+             patch.object(aggregator, "worldbank_search_sources", return_value=[]), \
+             patch.object(aggregator, "get_channel_cache", return_value=None):
+            result = aggregator.aggregate_sources("solar irradiance", channel_timeouts={"newsroom": 0.2})
+    finally:
+        release.set()
+
+    assert result.timed_out_channels == ["newsroom"]
+    time.sleep(0.05)
+    newsroom.assert_not_called()
+    assert busy.stats()["queued"] == 0
+
+
+def test_academic_ddg_providers_run_on_the_capped_duckduckgo_lane(monkeypatch):
+    academic_search = importlib.import_module("tools.research.academic_search")
+
+    pool = ThreadPoolExecutor(max_workers=8)
+    monkeypatch.setattr(_async_http, "_BLOCKING_LANES", {"duckduckgo": BoundedLane(pool, slots=2)})
+    state = {"running": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def ddg_provider(query, max_results=5):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.05)
+        with lock:
+            state["running"] -= 1
+        return []
+
+    def empty_plan(query, max_results=5):
+        return []
+        yield
+
+    for name in ("_scholar_search_raw", "_pubmed_search_raw", "_biorxiv_search_raw", "_medrxiv_search_raw", "_pmc_search_raw"):
+        monkeypatch.setattr(academic_search, name, ddg_provider)
+    for name in ("_core_api_search_plan", "_arxiv_search_plan", "_openalex_search_plan",
+                 "_semantic_scholar_search_plan", "_crossref_search_plan"):
+        monkeypatch.setattr(academic_search, name, empty_plan)
+
+    assert run_sync(academic_search.academic_search_sources_async("solar irradiance")) == []
+    assert state["peak"] == 2
+    pool.shutdown()
+
+
+def test_academic_scihub_checks_are_capped_like_the_sync_pool(monkeypatch):
+    academic_search = importlib.import_module("tools.research.academic_search")
+    state = {"running": 0, "peak": 0}
+    papers = [{"title": f"Paper {i}", "doi": f"10.1/{i}", "url": f"https://example.org/{i}"} for i in range(25)]
+
+    def one_provider(query, max_results=5):
+        return list(papers)
+
+    def empty_plan(query, max_results=5):
+        return []
+        yield
+
+    def scihub_plan(doi=None, title=None):
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        yield Pause(0.01)
+        state["running"] -= 1
+        return None
+
+    monkeypatch.setattr(academic_search, "_scholar_search_raw", one_provider)
+    for name in ("_pubmed_search_raw", "_biorxiv_search_raw", "_medrxiv_search_raw", "_pmc_search_raw"):
+        monkeypatch.setattr(academic_search, name, lambda query, max_results=5: [])
+    for name in ("_core_api_search_plan", "_arxiv_search_plan", "_openalex_search_plan",
+                 "_semantic_scholar_search_plan", "_crossref_search_plan"):
+        monkeypatch.setattr(academic_search, name, empty_plan)
+    monkeypatch.setattr(academic_search, "_check_scihub_availability_plan", scihub_plan)
+
+    run_sync(academic_search.academic_search_sources_async("solar irradiance", 40))
+    assert state["peak"] == 10
+
+
+def test_channel_modules_register_async_forms():
+    from tools.research.academic_search import academic_search_sources
+    from tools.research.policy_search import policy_search_sources
+    from tools.research.sec_search import sec_search_sources
+    from tools.research.web_search import web_search_sources
+    from tools.research.worldbank_search import worldbank_search_sources
+
+    for fn in (
+        academic_search_sources,
+        web_search_sources,
+        worldbank_search_sources,
+        policy_search_sources,
+        sec_search_sources,
+        aggregator.brave_news_sources,
+    ):
+        assert async_counterpart(fn) is not None, fn.__name__
+    assert _async_http.async_counterpart(aggregator.fetch_newsroom_api) is None
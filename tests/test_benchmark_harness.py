@@ -0,0 +1,71 @@
+"""Tests for scripts/benchmark_deep_research.py (offline pipeline benchmark).
+
+The harness is invoked as a subprocess, like the other scripts/ tools, and
+its JSON results are checked for per-stage timings and the compare exit code.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parent.parent
+HARNESS = PROJECT_ROOT / "scripts" / "benchmark_deep_research.py"
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(HARNESS), *args],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        timeout=300,
+    )
+
+
+@pytest.fixture(scope="module")
+def quick_results(tmp_path_factory) -> pathlib.Path:
+    output = tmp_path_factory.mktemp("bench") / "base.json"
+    result = _run("run", "--depths", "1", "--repeat", "1", "--no-warmup", "--output", str(output))
+    assert result.returncode == 0, result.stderr
+    return output
+
+
+def test_run_reports_pipeline_stages_offline(quick_results):
+    results = json.loads(quick_results.read_text())
+    depth = results["depths"]["1"]
+
+    assert depth["label"] == "quick"
+    assert depth["sources"] > 0 and depth["findings"] > 0
+    assert depth["peak_kb"] > 0
+    for stage in ("aggregation", "dedupe", "relevance", "credibility", "content_fetch",
+                  "clustering", "outline", "section_expansion", "payload"):
+        assert stage in depth["stages"], stage
+        assert depth["stages"][stage]["duration_ms"] >= 0
+    assert "mem_delta_kb" in depth["stages"]["relevance"]
+    assert depth["stages"]["content_fetch"]["items"] > 0
+
+
+def test_compare_flags_stage_regressions(quick_results, tmp_path):
+    base = json.loads(quick_results.read_text())
+    head = copy.deepcopy(base)
+    head["depths"]["1"]["stages"]["relevance"]["duration_ms"] = base["depths"]["1"]["stages"]["relevance"]["duration_ms"] + 50.0
+    head_path = tmp_path / "head.json"
+    head_path.write_text(json.dumps(head))
+
+    same = _run("compare", str(quick_results), str(quick_results))
+    assert same.returncode == 0, same.stdout
+    regressed = _run("compare", str(quick_results), str(head_path))
+    assert regressed.returncode == 1
+    assert "relevance" in regressed.stdout and "REGRESSED" in regressed.stdout
+
+
+def test_compare_unknown_results_fails(tmp_path):
+    result = _run("compare", "no-such-commit", "other", "--results-dir", str(tmp_path))
+    assert result.returncode != 0
+    assert "No benchmark results" in result.stderr
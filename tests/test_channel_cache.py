@@ -0,0 +1,123 @@
+"""Tests for the persistent deep research channel result cache."""
+
+import time
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from engine.models import Source
+from tools.utils._channel_cache import ChannelResultCache, normalize_query
+
+
+def _source(n: int) -> Source:
+    url = f"https://example.com/{n}"
+    return Source(
+        source_id=Source.generate_id(url),
+        url=url,
+        title=f"Result {n}",
+        authors=["A. Author"],
+        source_type="web",
+        content_snippet=f"snippet {n}",
+    )
+
+
+class TestChannelResultCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.db_path = str(Path(self._tmp.name) / "channel_cache.db")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_normalize_query_collapses_near_repeats(self):
+        self.assertEqual(
+            normalize_query("Zambia  solar tariffs?"),
+            normalize_query("solar tariffs zambia"),
+        )
+        self.assertNotEqual(normalize_query("solar tariffs"), normalize_query("wind tariffs"))
+
+    def test_roundtrip_restores_sources_and_counts_hits(self):
+        cache = ChannelResultCache(db_path=self.db_path)
+        self.assertIsNone(cache.get("web", "solar tariffs zambia", 10))
+        cache.set("web", "solar tariffs zambia", 10, [_source(1), _source(2)])
+
+        cached = cache.get("web", "Zambia solar tariffs", 10)
+        self.assertEqual([s.url for s in cached], ["https://example.com/1", "https://example.com/2"])
+        self.assertEqual(cached[0].authors, ["A. Author"])
+
+        stats = cache.stats()
+        self.assertEqual(stats["entries"], 1)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["per_channel"]["web"], {"hits": 1, "misses": 1})
+
+    def test_key_includes_channel_and_max_results(self):
+        cache = ChannelResultCache(db_path=self.db_path)
+        cache.set("web", "lithium price", 10, [_source(1)])
+        self.assertIsNone(cache.get("academic", "lithium price", 10))
+        self.assertIsNone(cache.get("web", "lithium price", 20))
+
+    def test_entries_expire_after_channel_ttl(self):
+        cache = ChannelResultCache(db_path=self.db_path, ttl_seconds={"brave_news": 60})
+        cache.set("brave_news", "eskom tariffs", 10, [_source(1)])
+        with patch("tools.utils._channel_cache.time.time", return_value=time.time() + 120):
+            self.assertIsNone(cache.get("brave_news", "eskom tariffs", 10))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_lru_eviction_respects_max_entries(self):
+        cache = ChannelResultCache(db_path=self.db_path, max_entries=2)
+        cache.set("web", "query one", 10, [_source(1)])
+        time.sleep(0.01)
+        cache.set("web", "query two", 10, [_source(2)])
+        time.sleep(0.01)
+        cache.get("web", "query one", 10)  # refresh recency
+        time.sleep(0.01)
+        cache.set("web", "query three", 10, [_source(3)])
+
+        self.assertEqual(cache.stats()["entries"], 2)
+        self.assertIsNotNone(cache.get("web", "query one", 10))
+        self.assertIsNone(cache.get("web", "query two", 10))
+
+    def test_shared_across_instances(self):
+        ChannelResultCache(db_path=self.db_path).set("policy", "grid code", 5, [_source(1)])
+        self.assertIsNotNone(ChannelResultCache(db_path=self.db_path).get("policy", "grid code", 5))
+
+    def test_get_or_fetch_skips_network_on_hit_and_never_caches_empty(self):
+        cache = ChannelResultCache(db_path=self.db_path)
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return []
+
+        cache.get_or_fetch("web", "empty query", 10, fetch)
+        cache.get_or_fetch("web", "empty query", 10, fetch)
+        self.assertEqual(len(calls), 2)
+
+        cache.get_or_fetch("web", "full query", 10, lambda: [_source(1)])
+        result = cache.get_or_fetch("web", "full query", 10, lambda: self.fail("fetched on hit"))
+        self.assertEqual(len(result), 1)
+
+
+class TestAggregatorUsesChannelCache(unittest.TestCase):
+    @patch("workflows.deep_research.aggregator.worldbank_search_sources", return_value=[])
+    @patch("workflows.deep_research.aggregator.web_search_sources")
+    @patch("workflows.deep_research.aggregator.academic_search_sources", return_value=[])
+    @patch("workflows.deep_research.aggregator.fetch_newsroom_api", return_value=[])
+    def test_repeated_query_served_from_cache(self, _newsroom, _academic, mock_web, _wb):
+        from workflows.deep_research.aggregator import aggregate_sources
+
+        mock_web.return_value = [_source(1)]
+        with TemporaryDirectory() as tmp:
+            cache = ChannelResultCache(db_path=str(Path(tmp) / "cache.db"))
+            with patch("workflows.deep_research.aggregator.get_channel_cache", return_value=cache):
+                first = aggregate_sources("solar energy efficiency", max_results_per_source=5)
+                second = aggregate_sources("Solar efficiency energy", max_results_per_source=5)
+
+        mock_web.assert_called_once()
+        self.assertEqual([s.url for s in first], [s.url for s in second])
+
+
+if __name__ == "__main__":
+    unittest.main()
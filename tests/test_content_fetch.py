@@ -0,0 +1,146 @@
+"""Tests for pooled, size-capped and cached page fetching in ContentExtractor."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+import config
+from engine.models import Source
+from tools.utils import _content_extractor, _page_cache
+from tools.utils._content_extractor import ContentExtractor
+from tools.utils._page_cache import PageTextCache, normalize_url
+
+ARTICLE = (
+    b"<html><body><nav>Home | About</nav><article><h1>Zambia solar tariffs</h1>"
+    b"<p>The regulator approved a new feed-in tariff for utility-scale solar plants.</p>"
+    b"</article><footer>Copyright</footer></body></html>"
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits = []
+    in_flight = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def do_GET(self):
+        _Handler.hits.append((self.path, dict(self.headers)))
+        if self.path.startswith("/article"):
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self._send(ARTICLE, etag='"v1"')
+        elif self.path.startswith("/huge"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.end_headers()
+            try:
+                self.wfile.write(b"<html><body><article>")
+                for _ in range(200):
+                    self.wfile.write(b"<p>" + b"solar " * 10000 + b"</p>")
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+        elif self.path.startswith("/slow"):
+            with _Handler.lock:
+                _Handler.in_flight["now"] += 1
+                _Handler.in_flight["peak"] = max(_Handler.in_flight["peak"], _Handler.in_flight["now"])
+            time.sleep(0.15)
+            with _Handler.lock:
+                _Handler.in_flight["now"] -= 1
+            self._send(ARTICLE)
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+    def _send(self, body, etag=None):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def fresh_state():
+    _Handler.hits.clear()
+    _Handler.in_flight.update(now=0, peak=0)
+    with patch.dict(_content_extractor._HOST_SLOTS, clear=True):
+        yield
+
+
+@pytest.fixture
+def page_cache(tmp_path):
+    cache = PageTextCache(db_path=str(tmp_path / "page_cache.db"), fresh_seconds=0)
+    with patch.object(_page_cache, "get_page_cache", return_value=cache):
+        yield cache
+    cache.close()
+
+
+def test_normalize_url_drops_tracking_and_ordering_noise():
+    assert normalize_url("HTTPS://Example.com:443/news/story/?utm_source=x&b=2&a=1#top") == (
+        "https://example.com/news/story?a=1&b=2"
+    )
+    assert normalize_url("http://example.com:8080") == "http://example.com:8080/"
+
+
+def test_extraction_is_cached_and_revalidated_with_etag(server, page_cache):
+    extractor = ContentExtractor(enabled=True, max_content_length=0)
+    first = extractor._extract_from_url(f"{server}/article", query="")
+    second = extractor._extract_from_url(f"{server}/article?utm_medium=email", query="")
+
+    assert "feed-in tariff" in first and "Home | About" not in first
+    assert second == first
+    assert [path for path, _ in _Handler.hits] == ["/article", "/article?utm_medium=email"]
+    assert _Handler.hits[1][1].get("If-None-Match") == '"v1"'
+    assert page_cache.stats()["revalidated"] == 1
+
+
+def test_fresh_cache_entry_skips_the_network(server, page_cache):
+    page_cache.fresh_seconds = 3600
+    page_cache.set(f"{server}/article", "Cached solar tariff text")
+    extractor = ContentExtractor(enabled=True, max_content_length=10)
+
+    assert extractor._extract_from_url(f"{server}/article/", query="") == "Cached sol..."
+    assert _Handler.hits == []
+
+
+def test_download_stops_at_byte_cap(server):
+    extractor = ContentExtractor(enabled=True, max_content_length=0)
+    extractor.max_bytes = 50_000
+    with patch.object(_page_cache, "get_page_cache", return_value=None):
+        text = extractor._extract_from_url(f"{server}/huge", query="")
+
+    assert text.startswith("solar solar")
+    assert len(text) <= 50_000
+
+
+def test_fetches_respect_per_host_limit(server):
+    sources = [
+        Source(source_id=f"s{i}", url=f"{server}/slow/{i}", title=f"S{i}", source_type="web", credibility_score=0.5)
+        for i in range(6)
+    ]
+    settings = {**config.CONTENT_FETCH, "per_host_limit": 2}
+    with patch.object(config, "CONTENT_FETCH", settings), \
+         patch.object(_page_cache, "get_page_cache", return_value=None):
+        fetched = ContentExtractor(enabled=True).fetch_content_for_sources(sources, max_workers=6)
+
+    assert fetched == 6
+    assert all("feed-in tariff" in s.content_full for s in sources)
+    assert _Handler.in_flight["peak"] == 2
@@ -378,7 +378,7 @@ class TestFunnelLogging(unittest.TestCase):
     @patch("engine.deep_research_service.filter_relevant")
     @patch("engine.deep_research_service.score_relevance")
     @patch("engine.deep_research_service.score_source_credibility")
-    @patch("engine.deep_research_service._count_cross_references", return_value=1)
+    @patch("engine.deep_research_service._count_cross_references_batch", side_effect=lambda srcs: [1] * len(srcs))
     @patch("engine.deep_research_service.aggregate_sources")
     def test_funnel_logs_emitted(self, mock_agg, mock_xref, mock_cred,
                                   mock_score, mock_filter, mock_cluster,
@@ -413,7 +413,7 @@ class TestPerIntentPipeline(unittest.TestCase):
     @patch("engine.deep_research_service.filter_relevant")
     @patch("engine.deep_research_service.score_relevance")
     @patch("engine.deep_research_service.score_source_credibility")
-    @patch("engine.deep_research_service._count_cross_references", return_value=1)
+    @patch("engine.deep_research_service._count_cross_references_batch", side_effect=lambda srcs: [1] * len(srcs))
     @patch("engine.deep_research_service.aggregate_sources")
     @patch("engine.deep_research_service.decompose_query")
     def test_compound_query_per_intent_scoring(self, mock_decompose, mock_agg,
@@ -451,7 +451,7 @@ class TestPerIntentPipeline(unittest.TestCase):
     @patch("engine.deep_research_service.filter_relevant")
     @patch("engine.deep_research_service.score_relevance")
     @patch("engine.deep_research_service.score_source_credibility")
-    @patch("engine.deep_research_service._count_cross_references", return_value=1)
+    @patch("engine.deep_research_service._count_cross_references_batch", side_effect=lambda srcs: [1] * len(srcs))
     @patch("engine.deep_research_service.aggregate_sources")
     @patch("engine.deep_research_service.decompose_query")
     def test_single_intent_uses_existing_path(self, mock_decompose, mock_agg,
@@ -488,7 +488,7 @@ class TestResearchTypePassthrough(unittest.TestCase):
     @patch("engine.deep_research_service.filter_relevant")
     @patch("engine.deep_research_service.score_relevance")
     @patch("engine.deep_research_service.score_source_credibility")
-    @patch("engine.deep_research_service._count_cross_references", return_value=1)
+    @patch("engine.deep_research_service._count_cross_references_batch", side_effect=lambda srcs: [1] * len(srcs))
     @patch("engine.deep_research_service.aggregate_sources")
     @patch("engine.deep_research_service.decompose_query")
     def test_research_type_passed_to_pipeline(self, mock_decompose, mock_agg,
@@ -518,7 +518,7 @@ class TestResearchTypePassthrough(unittest.TestCase):
     @patch("engine.deep_research_service.filter_relevant")
     @patch("engine.deep_research_service.score_relevance")
     @patch("engine.deep_research_service.score_source_credibility")
-    @patch("engine.deep_research_service._count_cross_references", return_value=1)
+    @patch("engine.deep_research_service._count_cross_references_batch", side_effect=lambda srcs: [1] * len(srcs))
     @patch("engine.deep_research_service.aggregate_sources")
     @patch("engine.deep_research_service.decompose_query")
     def test_research_type_defaults_none(self, mock_decompose, mock_agg,
@@ -549,7 +549,7 @@ class TestResearchTypePassthrough(unittest.TestCase):
     @patch("engine.deep_research_service.filter_relevant")
     @patch("engine.deep_research_service.score_relevance")
     @patch("engine.deep_research_service.score_source_credibility")
-    @patch("engine.deep_research_service._count_cross_references", return_value=1)
+    @patch("engine.deep_research_service._count_cross_references_batch", side_effect=lambda srcs: [1] * len(srcs))
     @patch("engine.deep_research_service.aggregate_sources")
     @patch("engine.deep_research_service.decompose_query")
     def test_comparative_type_with_subjects(self, mock_decompose, mock_agg,
@@ -957,7 +957,7 @@ class TestNoCompletedStatusFromPipeline(unittest.TestCase):
     @patch("engine.deep_research_service.filter_relevant")
     @patch("engine.deep_research_service.score_relevance")
     @patch("engine.deep_research_service.score_source_credibility")
-    @patch("engine.deep_research_service._count_cross_references", return_value=1)
+    @patch("engine.deep_research_service._count_cross_references_batch", side_effect=lambda srcs: [1] * len(srcs))
     @patch("engine.deep_research_service.aggregate_sources")
     @patch("engine.deep_research_service.decompose_query")
     def test_progress_callback_never_emits_completed(self, mock_decompose, mock_agg,
@@ -1007,7 +1007,7 @@ class TestTopicalGateInService(unittest.TestCase):
     @patch("engine.deep_research_service.filter_relevant")
     @patch("engine.deep_research_service.score_relevance")
     @patch("engine.deep_research_service.score_source_credibility")
-    @patch("engine.deep_research_service._count_cross_references", return_value=1)
+    @patch("engine.deep_research_service._count_cross_references_batch", side_effect=lambda srcs: [1] * len(srcs))
     @patch("engine.deep_research_service.aggregate_sources")
     @patch("engine.deep_research_service.decompose_query")
     def test_zero_relevance_sources_are_dropped_even_if_filter_fallback_keeps_them(
@@ -2251,5 +2251,792 @@ class TestResearchTypeSynthesisLens(unittest.TestCase):
         self.assertEqual(result.sections[0].title, "Fuel and Freight Transmission")
 
 
+# ---------------------------------------------------------------------------
+# Concurrent intent / query-variant aggregation
+# ---------------------------------------------------------------------------
+class TestConcurrentVariantAggregation(unittest.TestCase):
+    @patch("engine.deep_research_service.synthesize")
+    @patch("engine.deep_research_service._cluster_findings")
+    @patch("engine.deep_research_service.filter_relevant")
+    @patch("engine.deep_research_service.score_relevance")
+    @patch("engine.deep_research_service.score_source_credibility")
+    @patch("engine.deep_research_service._count_cross_references_batch", side_effect=lambda srcs: [1] * len(srcs))
+    @patch("engine.deep_research_service.aggregate_sources")
+    @patch("engine.deep_research_service._generate_query_variants")
+    @patch("engine.deep_research_service.decompose_query")
+    def test_variants_run_concurrently_and_merge_in_order(
+        self, mock_decompose, mock_variants, mock_agg, mock_xref, mock_cred,
+        mock_score, mock_filter, mock_cluster, mock_synth,
+    ):
+        """All variants of all intents aggregate in parallel; merge order is unchanged."""
+        import threading
+        import time
+        from engine.deep_research_service import run_deep_research
+        from engine.query_refiner import SearchIntent
+
+        mock_decompose.return_value = [
+            SearchIntent(intent_query="lithium price trends", parent_query="q", is_primary=True),
+            SearchIntent(intent_query="lithium supply Zimbabwe", parent_query="q", is_primary=False),
+        ]
+        mock_variants.side_effect = lambda q, n: [f"{q} v{i}" for i in range(1, 4)]
+
+        in_flight = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def slow_aggregate(variant, **kwargs):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            # Later variants finish first so completion order differs from merge order.
+            time.sleep(0.05 * (4 - int(variant[-1])))
+            with lock:
+                in_flight["now"] -= 1
+            return [_make_source(variant, relevance=0.5, url=f"https://ex.com/{variant}")]
+
+        mock_agg.side_effect = slow_aggregate
+        mock_cred.return_value = {"score": 0.6, "category": "Standard"}
+        mock_score.side_effect = lambda q, srcs, **kw: srcs
+        mock_filter.side_effect = lambda srcs, **kw: srcs
+        mock_cluster.return_value = []
+        mock_synth.return_value = "Test synthesis"
+
+        run_deep_research("q", depth=3)
+
+        self.assertEqual(mock_agg.call_count, 6)
+        self.assertGreater(in_flight["peak"], 1)
+        first_intent_titles = [s.title for s in mock_score.call_args_list[0][0][1]]
+        self.assertEqual(
+            first_intent_titles,
+            ["lithium price trends v1", "lithium price trends v2", "lithium price trends v3"],
+        )
+
+
+class TestProgressiveSourceEvents(unittest.TestCase):
+    @patch("engine.deep_research_service.synthesize")
+    @patch("engine.deep_research_service._cluster_findings")
+    @patch("engine.deep_research_service.filter_relevant")
+    @patch("engine.deep_research_service.score_relevance")
+    @patch("engine.deep_research_service.score_source_credibility")
+    @patch("engine.deep_research_service._count_cross_references_batch", side_effect=lambda srcs: [1] * len(srcs))
+    @patch("engine.deep_research_service.aggregate_sources")
+    @patch("engine.deep_research_service._generate_query_variants")
+    @patch("engine.deep_research_service.decompose_query")
+    def test_channel_sources_then_score_patches(
+        self, mock_decompose, mock_variants, mock_agg, mock_xref, mock_cred,
+        mock_score, mock_filter, mock_cluster, mock_synth,
+    ):
+        from engine.deep_research_service import run_deep_research
+        from engine.query_refiner import SearchIntent
+
+        mock_decompose.return_value = [
+            SearchIntent(intent_query="solar tariffs", parent_query="q", is_primary=True),
+        ]
+        mock_variants.side_effect = lambda q, n: [q]
+        keep = _make_source("Kept", relevance=0.8, url="https://ex.com/keep")
+        drop = _make_source("Dropped", relevance=0.1, url="https://ex.com/drop")
+
+        def fake_aggregate(variant, on_channel_complete=None, **kwargs):
+            on_channel_complete("academic", [keep])
+            on_channel_complete("web", [drop])
+            return [keep, drop]
+
+        mock_agg.side_effect = fake_aggregate
+        mock_cred.return_value = {"score": 0.6, "category": "Standard"}
+        mock_score.side_effect = lambda q, srcs, **kw: srcs
+        mock_filter.side_effect = lambda srcs, **kw: [s for s in srcs if s.relevance_score >= 0.5]
+        mock_cluster.return_value = []
+        mock_synth.return_value = "Test synthesis"
+
+        events = []
+        run_deep_research("q", depth=1, source_callback=lambda e, p: events.append((e, p)))
+
+        names = [name for name, _ in events]
+        self.assertEqual(names, ["sources", "sources", "scores", "scores"])
+        self.assertEqual(events[0][1]["channel"], "academic")
+        self.assertEqual(events[0][1]["sources"][0]["source_id"], keep.source_id)
+        self.assertNotIn("content_full", events[0][1]["sources"][0])
+
+        relevance = events[2][1]
+        self.assertEqual(relevance["stage"], "relevance")
+        self.assertEqual(relevance["kept"], [keep.source_id])
+        self.assertEqual(relevance["scores"][drop.source_id]["relevance_score"], 0.1)
+
+        credibility = events[3][1]
+        self.assertEqual(credibility["stage"], "credibility")
+        self.assertEqual(credibility["scores"][keep.source_id]["credibility_score"], 0.6)
+
+    @patch("engine.deep_research_service.aggregate_sources", return_value=[])
+    def test_no_hook_passed_without_source_callback(self, mock_agg):
+        from engine.deep_research_service import _aggregate_variants
+
+        _aggregate_variants([(1, 1, "q", {"max_results_per_source": 5})], 1, {1: 1})
+        self.assertNotIn("on_channel_complete", mock_agg.call_args.kwargs)
+
+    def test_failing_source_callback_is_non_fatal(self):
+        from engine.deep_research_service import _emit_source_event
+
+        def boom(event, payload):
+            raise RuntimeError("client went away")
+
+        _emit_source_event(boom, "sources", {})
+
+
+    def test_progress_stream_emits_named_source_events(self):
+        import json
+        import ui.web.app as web_app
+
+        research_id = "stream-test"
+        web_app.research_progress[research_id] = {
+            "status": "completed", "message": "done", "phase": "complete",
+        }
+        web_app.research_events[research_id] = [
+            {"event": "sources", "data": {"channel": "web", "sources": [{"source_id": "s1"}]}},
+            {"event": "scores", "data": {"stage": "relevance", "scores": {}, "kept": ["s1"]}},
+        ]
+        try:
+            body = web_app.app.test_client().get(f"/api/research/{research_id}/progress").get_data(as_text=True)
+        finally:
+            web_app.research_progress.pop(research_id, None)
+
+        chunks = [c for c in body.split("\n\n") if c]
+        self.assertTrue(chunks[0].startswith("event: sources\ndata: "))
+        self.assertEqual(json.loads(chunks[0].split("data: ", 1)[1])["channel"], "web")
+        self.assertTrue(chunks[1].startswith("event: scores\n"))
+        self.assertEqual(json.loads(chunks[2].split("data: ", 1)[1])["status"], "completed")
+        self.assertNotIn(research_id, web_app.research_events)
+
+    def test_unread_section_deltas_are_merged_in_the_buffer(self):
+        import ui.web.app as web_app
+
+        research_id = "delta-merge-test"
+
+        def delta(index, text, attempt=1):
+            return {"index": index, "title": f"S{index}", "attempt": attempt, "delta": text}
+
+        try:
+            with web_app.research_events_lock:
+                for chunk in ("Ta", "ri", "ffs"):
+                    web_app._buffer_research_event(research_id, "section_delta", delta(0, chunk))
+                web_app._buffer_research_event(research_id, "section_delta", delta(1, "Gr"))
+                web_app._buffer_research_event(research_id, "section_delta", delta(0, " rose"))
+                web_app._buffer_research_event(research_id, "section_delta", delta(1, "id"))
+            events = web_app.research_events[research_id]
+            self.assertEqual([e["data"]["delta"] for e in events], ["Tariffs rose", "Grid"])
+
+            # Text a reader has already drained is never touched again.
+            web_app.research_events_read[research_id] = len(events)
+            with web_app.research_events_lock:
+                web_app._buffer_research_event(research_id, "section_delta", delta(0, "!"))
+                web_app._buffer_research_event(research_id, "section_delta", delta(1, " lines", attempt=2))
+                web_app._buffer_research_event(research_id, "section_delta", delta(0, "!"))
+            self.assertEqual([e["data"]["delta"] for e in events], ["Tariffs rose", "Grid", "!!", " lines"])
+
+            # A final section supersedes its unread drafts; a retry supersedes the old attempt.
+            with web_app.research_events_lock:
+                web_app._buffer_research_event(research_id, "section", {"index": 0, "title": "S0", "text": "Final."})
+                web_app._buffer_research_event(research_id, "section_delta", delta(1, "Redo", attempt=3))
+            self.assertEqual(
+                [(e["event"], e["data"].get("delta")) for e in events[2:]],
+                [("section", None), ("section_delta", "Redo")],
+            )
+        finally:
+            web_app.research_events.pop(research_id, None)
+            web_app.research_events_read.pop(research_id, None)
+
+    def test_finished_run_events_are_evicted_without_a_reader(self):
+        import ui.web.app as web_app
+        from engine.models import ResearchState
+
+        def fake_pipeline(**kwargs):
+            kwargs["source_callback"]("sources", {"channel": "web", "sources": []})
+            return ResearchState(original_query=kwargs["query"])
+
+        try:
+            with patch.object(web_app, "run_deep_research", side_effect=fake_pipeline), \
+                    patch.object(web_app.research_engine, "save_research", return_value="saved"):
+                web_app._run_research_with_progress("evict-done", "Evict me", 1)
+            self.assertEqual(web_app.research_progress["evict-done"]["status"], "completed")
+            # Kept for late readers during the grace period...
+            self.assertEqual(len(web_app.research_events["evict-done"]), 1)
+
+            with patch.object(web_app, "_RESEARCH_EVENTS_GRACE_SECONDS", 0), \
+                    patch.object(web_app, "run_deep_research", side_effect=RuntimeError("boom")):
+                web_app.research_events["evict-error"] = [{"event": "sources", "data": {}}]
+                web_app._run_research_with_progress("evict-error", "Evict me", 1)
+            self.assertEqual(web_app.research_progress["evict-error"]["status"], "error")
+            self.assertNotIn("evict-error", web_app.research_events)
+            self.assertIn("evict-done", web_app.research_events)
+
+            # ...and swept once it is over.
+            web_app.research_events_expiry["evict-done"] = 0
+            web_app._expire_research_events()
+            self.assertNotIn("evict-done", web_app.research_events)
+            self.assertNotIn("evict-done", web_app.research_events_expiry)
+        finally:
+            for research_id in ("evict-done", "evict-error"):
+                web_app.research_progress.pop(research_id, None)
+                web_app.research_events.pop(research_id, None)
+                web_app.research_events_expiry.pop(research_id, None)
+
+
+# ---------------------------------------------------------------------------
+# Incremental refresh of stored research
+# ---------------------------------------------------------------------------
+class TestIncrementalRefresh(unittest.TestCase):
+    def _prior_state(self):
+        from engine.models import Finding, ResearchState
+
+        tariffs = _make_source("Zambia grid tariffs reform", snippet="grid tariffs", relevance=0.6, url="https://ex.com/a")
+        storage = _make_source("Battery storage buildout", snippet="battery storage", relevance=0.5, url="https://ex.com/b")
+        tariffs.credibility_score = storage.credibility_score = 0.6
+        prior = ResearchState(original_query="Zambia power sector", max_depth=1)
+        prior.sources_checked = [tariffs, storage]
+        prior.total_sources = 2
+        prior.findings = [
+            Finding(claim="Grid tariffs rose after reform", sources=[tariffs.source_id], confidence="medium", average_credibility=0.6),
+            Finding(claim="Battery storage buildout accelerated", sources=[storage.source_id], confidence="medium", average_credibility=0.6),
+        ]
+        prior.synthesis = (
+            "## Executive Summary\nPrior summary.\n\n"
+            "## Grid tariffs\nPrior tariffs paragraph.\n\n"
+            "## Battery storage\nPrior storage paragraph.\n\n"
+            "**Gaps:** Further investigation needed on dimensions not covered by available sources."
+        )
+        prior.synthesis_model = "reasoning"
+        return prior
+
+    def _patches(self, aggregated):
+        from engine.query_refiner import SearchIntent
+
+        settings = {**__import__("config").SYNTHESIS, "max_sources_per_section": 1, "max_findings_per_section": 1}
+        return [
+            patch("engine.deep_research_service.decompose_query", return_value=[
+                SearchIntent(intent_query="Zambia power sector", parent_query="q", is_primary=True)
+            ]),
+            patch("engine.deep_research_service._generate_query_variants", side_effect=lambda q, n: [q]),
+            patch("engine.deep_research_service.aggregate_sources", return_value=aggregated),
+            patch("engine.deep_research_service.score_relevance", side_effect=lambda q, srcs, **kw: srcs),
+            patch("engine.deep_research_service.filter_relevant", side_effect=lambda srcs, **kw: srcs),
+            patch("engine.deep_research_service.score_source_credibility", return_value={"score": 0.7, "category": "Standard"}),
+            patch("engine.deep_research_service._build_market_context_for_query", return_value=("", {})),
+            patch("engine.deep_research_service._fetch_source_content", return_value=0),
+            patch("engine.deep_research_service.warm_synthesis_endpoints", return_value=[]),
+            patch("workflows.deep_research.synthesizer.config.SYNTHESIS", settings),
+        ]
+
+    def _run(self, prior, aggregated, **extra):
+        from engine.deep_research_service import refresh_deep_research
+
+        patches = self._patches(aggregated)
+        mocks = {}
+        for p in patches:
+            mocks[p.attribute] = p.start()
+            self.addCleanup(p.stop)
+        for name, value in extra.items():
+            p = patch(name, **value)
+            mocks[name] = p.start()
+            self.addCleanup(p.stop)
+        state, summary = refresh_deep_research(prior)
+        return state, summary, mocks
+
+    def test_no_new_sources_keeps_prior_synthesis(self):
+        prior = self._prior_state()
+        known = [_make_source(s.title, url=s.url) for s in prior.sources_checked]
+        state, summary, mocks = self._run(
+            prior, known,
+            **{"engine.deep_research_service._cluster_findings": {"return_value": []}},
+        )
+
+        self.assertEqual(summary["new_sources"], 0)
+        self.assertEqual(state.synthesis, prior.synthesis)
+        mocks["warm_synthesis_endpoints"].assert_called_once_with()
+        self.assertEqual(len(state.findings), 2)
+        for call in mocks["score_relevance"].call_args_list:
+            self.assertEqual(call[0][1], [])
+        mocks["engine.deep_research_service._cluster_findings"].assert_not_called()
+
+    def test_only_sections_with_changed_evidence_are_regenerated(self):
+        from engine.models import Finding
+
+        prior = self._prior_state()
+        new = _make_source("Battery storage tender", snippet="battery storage tender", relevance=0.9, url="https://ex.com/c")
+        aggregated = [_make_source(s.title, url=s.url) for s in prior.sources_checked] + [new]
+        state, summary, mocks = self._run(
+            prior, aggregated,
+            **{
+                "engine.deep_research_service._cluster_findings": {"return_value": [
+                    Finding(claim="Battery storage tender launched", sources=[new.source_id], confidence="medium", average_credibility=0.7),
+                ]},
+                "workflows.deep_research.synthesizer.synthesize_section": {"return_value": "Fresh storage paragraph."},
+            },
+        )
+
+        self.assertEqual(summary["new_sources"], 1)
+        self.assertEqual(summary["regenerated_sections"], ["Battery storage"])
+        # Only the new source was relevance scored, and only one section re-expanded.
+        scored = mocks["score_relevance"].call_args[0][1]
+        self.assertEqual([s.url for s in scored], ["https://ex.com/c"])
+        mocks["workflows.deep_research.synthesizer.synthesize_section"].assert_called_once()
+        self.assertIn("Prior tariffs paragraph.", state.synthesis)
+        self.assertIn("Fresh storage paragraph.", state.synthesis)
+        self.assertNotIn("Prior storage paragraph.", state.synthesis)
+        self.assertIn("Prior summary.", state.synthesis)
+        self.assertEqual(state.synthesis.count("**Gaps:**"), 1)
+        self.assertEqual(state.synthesis_model, "reasoning")
+        self.assertEqual(state.total_sources, 3)
+        self.assertEqual(len(state.findings), 3)
+
+    def test_regenerated_section_model_failure_relabels_synthesis(self):
+        from engine.models import Finding
+
+        prior = self._prior_state()
+        new = _make_source("Battery storage tender", snippet="battery storage tender", relevance=0.9, url="https://ex.com/c")
+        aggregated = [_make_source(s.title, url=s.url) for s in prior.sources_checked] + [new]
+        state, summary, mocks = self._run(
+            prior, aggregated,
+            **{
+                "engine.deep_research_service._cluster_findings": {"return_value": [
+                    Finding(claim="Battery storage tender launched", sources=[new.source_id], confidence="medium", average_credibility=0.7),
+                ]},
+                "workflows.deep_research.synthesizer.synthesize_section": {"side_effect": RuntimeError("model down")},
+            },
+        )
+
+        self.assertEqual(summary["regenerated_sections"], ["Battery storage"])
+        self.assertIn("Prior tariffs paragraph.", state.synthesis)
+        self.assertNotIn("Prior storage paragraph.", state.synthesis)
+        # The kept section came from the model; the regenerated one did not.
+        self.assertEqual(state.synthesis_model, "mixed")
+
+    def test_non_outline_synthesis_falls_back_to_full_synthesis(self):
+        prior = self._prior_state()
+        prior.synthesis = "Direct answer without outline sections."
+        new = _make_source("Battery storage tender", snippet="battery storage", relevance=0.9, url="https://ex.com/c")
+        state, summary, mocks = self._run(
+            prior, [new],
+            **{
+                "engine.deep_research_service._cluster_findings": {"return_value": []},
+                "engine.deep_research_service.synthesize": {"return_value": "Full synthesis"},
+            },
+        )
+        self.assertTrue(summary["full_synthesis"])
+        self.assertEqual(state.synthesis, "Full synthesis")
+
+    def test_diligence_research_is_rejected(self):
+        from engine.deep_research_service import refresh_deep_research
+
+        prior = self._prior_state()
+        prior.research_type = "diligence"
+        with self.assertRaises(ValueError):
+            refresh_deep_research(prior)
+
+
+# ---------------------------------------------------------------------------
+# Inverted-index cross-reference counting
+# ---------------------------------------------------------------------------
+class TestCrossReferenceBatch(unittest.TestCase):
+    def test_batch_matches_pairwise_counts(self):
+        import random
+        from workflows.deep_research.reranker import (
+            _count_cross_references,
+            _count_cross_references_batch,
+        )
+
+        rng = random.Random(7)
+        vocab = [
+            "solar", "tariffs", "zambia", "lithium", "prices", "mining", "grid",
+            "storage", "battery", "policy", "regulation", "eskom", "demand",
+            "the", "of", "a", "investment", "generation", "capacity", "wind",
+        ]
+        sources = []
+        for i in range(60):
+            title = " ".join(rng.choice(vocab) for _ in range(rng.randint(0, 6)))
+            snippet = " ".join(rng.choice(vocab) for _ in range(rng.randint(0, 12)))
+            sources.append(_make_source(title, snippet=snippet, url=f"https://ex.com/{i}"))
+        # Duplicate ids must still be excluded from each other's counts.
+        sources.append(sources[3])
+
+        for threshold in (0.3, 0.5, 0.8):
+            expected = [_count_cross_references(s, sources, threshold) for s in sources]
+            self.assertEqual(_count_cross_references_batch(sources, threshold), expected)
+
+    def test_empty_keyword_source_counts_self_only(self):
+        from workflows.deep_research.reranker import _count_cross_references_batch
+
+        sources = [
+            _make_source("", snippet="", url="https://ex.com/empty"),
+            _make_source("solar tariffs zambia", url="https://ex.com/1"),
+            _make_source("zambia solar tariffs", url="https://ex.com/2"),
+        ]
+        self.assertEqual(_count_cross_references_batch(sources), [1, 2, 2])
+
+
+# ---------------------------------------------------------------------------
+# Memoized stemming and shared per-source token bag
+# ---------------------------------------------------------------------------
+class TestSourceTokenBag(unittest.TestCase):
+    def test_stem_is_memoized(self):
+        from workflows.deep_research.tokens import stem
+
+        stem.cache_clear()
+        stem("regulations")
+        stem("regulations")
+        info = stem.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+    def test_token_bag_built_once_and_shared_across_stages(self):
+        from workflows.deep_research import tokens
+        from workflows.deep_research.reranker import _count_cross_references_batch
+
+        sources = [
+            _make_source("Zambia solar tariffs", snippet="tariff reform", url="https://ex.com/1"),
+            _make_source("Solar tariffs in Zambia", snippet="tariff review", url="https://ex.com/2"),
+        ]
+        with patch.object(tokens, "_build_stems", wraps=tokens._build_stems) as build:
+            score_relevance("zambia solar tariffs", sources)
+            _count_cross_references_batch(sources)
+            _count_cross_references_batch(sources)
+        self.assertEqual(build.call_count, len(sources))
+
+    def test_token_bag_rebuilt_when_text_changes(self):
+        from workflows.deep_research.tokens import source_stems
+
+        src = _make_source("Lithium prices", url="https://ex.com/lith")
+        before = source_stems(src)
+        src.content_snippet = "cobalt supply"
+        after = source_stems(src)
+        self.assertNotEqual(before, after)
+        self.assertIn("cobalt", after)
+
+    def test_route_sources_reuses_token_bag(self):
+        from workflows.deep_research import synthesizer
+        from workflows.deep_research.synthesizer import OutlineSection, route_sources
+
+        sources = [
+            _make_source("Grid tariffs", snippet="tariff reform zambia", url="https://ex.com/a"),
+            _make_source("Battery storage", snippet="storage buildout", url="https://ex.com/b"),
+        ]
+        sections = [
+            OutlineSection(title="Tariff reform", bullets=["zambia tariff"]),
+            OutlineSection(title="Storage buildout", bullets=["battery storage"]),
+        ]
+        with patch.object(synthesizer, "_build_route_words", wraps=synthesizer._build_route_words) as build:
+            for section in sections:
+                route_sources(section, sources, max_sources=1)
+        self.assertEqual(build.call_count, len(sources))
+
+
+# ---------------------------------------------------------------------------
+# Yield-based early termination of variant aggregation
+# ---------------------------------------------------------------------------
+class TestYieldEarlyStop(unittest.TestCase):
+    QUERY = "zambia solar tariffs"
+
+    def _typed_source(self, source_type, n, variant="v1"):
+        src = _make_source(f"Zambia solar tariffs {variant} {n}", url=f"https://{source_type}.ex.com/{variant}/{n}")
+        src.source_type = source_type
+        return src
+
+    def _run(self, aggregate, variants=3, min_channels=3):
+        from concurrent.futures import ThreadPoolExecutor
+        from engine import deep_research_service as service
+
+        variant_queries = [f"{self.QUERY} v{i}" for i in range(1, variants + 1)]
+        tracker = service._IntentYield(
+            self.QUERY, variant_queries, target=3, min_channels=min_channels, min_score=0.25,
+        )
+        jobs = [(1, idx, variant, {}) for idx, variant in enumerate(variant_queries, 1)]
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            with patch.object(service, "aggregate_sources", side_effect=aggregate), \
+                 patch.object(service, "_get_aggregation_executor", return_value=executor):
+                results = service._aggregate_variants(jobs, 1, {1: variants}, yield_trackers={1: tracker})
+        finally:
+            executor.shutdown(wait=True)
+        return results, tracker
+
+    def test_remaining_variants_cancelled_once_yield_met(self):
+        import time
+
+        calls = []
+
+        def aggregate(variant, cancel_event=None, **kwargs):
+            calls.append(variant[-2:])
+            if cancel_event is None:
+                return [self._typed_source(t, i) for i, t in enumerate(("academic", "web", "newsroom"))]
+            cancel_event.wait(5)
+            return []
+
+        started = time.monotonic()
+        results, tracker = self._run(aggregate)
+
+        self.assertLess(time.monotonic() - started, 4)
+        self.assertTrue(tracker.stopped)
+        self.assertEqual(calls[0], "v1")
+        self.assertNotIn("v3", calls)
+        self.assertEqual(len(results[(1, 1)]), 3)
+        self.assertNotIn((1, 3), results)
+
+    def test_no_early_stop_without_channel_diversity(self):
+        calls = []
+
+        def aggregate(variant, cancel_event=None, **kwargs):
+            calls.append(variant[-2:])
+            return [self._typed_source("web", i, variant[-2:]) for i in range(5)]
+
+        results, tracker = self._run(aggregate)
+
+        self.assertFalse(tracker.stopped)
+        self.assertEqual(tracker.passing, 15)
+        self.assertEqual(sorted(calls), ["v1", "v2", "v3"])
+        self.assertEqual(sorted(results), [(1, 1), (1, 2), (1, 3)])
+
+    def test_yield_ignores_known_and_off_topic_sources(self):
+        from engine.deep_research_service import _IntentYield
+
+        known = self._typed_source("web", 0)
+        tracker = _IntentYield(
+            self.QUERY, [self.QUERY], target=2, min_channels=1, min_score=0.25,
+            known_source_keys={known.url},
+        )
+        off_topic = _make_source("Copper output in Chile", url="https://ex.com/copper")
+        tracker.add([known, off_topic, self._typed_source("web", 1), self._typed_source("web", 1)])
+
+        self.assertEqual(tracker.passing, 1)
+        self.assertFalse(tracker.satisfied)
+        tracker.add([self._typed_source("news", 2)])
+        self.assertTrue(tracker.satisfied)
+        self.assertEqual(tracker.channels, {"web", "news"})
+
+
+class TestParallelSectionExpansion(unittest.TestCase):
+    def _state_and_outline(self, titles):
+        from engine.models import Finding, ResearchState
+        from workflows.deep_research.synthesizer import OutlineResult, OutlineSection
+
+        src = _make_source("Grid Update", snippet="grid tariffs storage", relevance=0.6, url="https://example.com/grid")
+        state = ResearchState(original_query="power market impacts")
+        state.sources_checked = [src]
+        state.total_sources = 1
+        state.findings = [
+            Finding(claim="Grid tariffs rose.", sources=[src.source_id], confidence="medium", average_credibility=0.7)
+        ]
+        outline = OutlineResult(
+            executive_summary="Summary [Grid Update].",
+            sections=[OutlineSection(title=t, bullets=[t.lower()]) for t in titles],
+            is_comparison=False,
+            subjects=None,
+        )
+        return state, outline
+
+    def _run(self, titles, expand, concurrency):
+        import config
+        from workflows.deep_research.synthesizer import synthesize
+
+        state, outline = self._state_and_outline(titles)
+        settings = {**config.SYNTHESIS, "section_concurrency": concurrency}
+        with patch("workflows.deep_research.synthesizer.synthesize_outline", return_value=outline), \
+             patch("workflows.deep_research.synthesizer.synthesize_section", side_effect=expand), \
+             patch("workflows.deep_research.synthesizer._deterministic_section_paragraph",
+                   side_effect=lambda section, *a: f"Fallback for {section.title}."), \
+             patch("workflows.deep_research.synthesizer.config.SYNTHESIS", settings):
+            return state, synthesize(state)
+
+    def test_sections_expand_concurrently_and_keep_outline_order(self):
+        import threading
+        import time
+
+        titles = ["Alpha", "Beta", "Gamma", "Delta"]
+        lock = threading.Lock()
+        in_flight = {"now": 0, "peak": 0}
+
+        def expand(section, *args, **kwargs):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            # Earlier sections finish last, so completion order is reversed.
+            time.sleep(0.05 * (len(titles) - titles.index(section.title)))
+            with lock:
+                in_flight["now"] -= 1
+            return f"Body of {section.title} [Grid Update]."
+
+        started = time.perf_counter()
+        state, synthesis = self._run(titles, expand, concurrency=4)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(in_flight["peak"], 4)
+        self.assertLess(elapsed, 0.35)  # ~slowest section (0.2s), not the 0.5s sum
+        positions = [synthesis.index(f"## {t}\nBody of {t} [Grid Update].") for t in titles]
+        self.assertEqual(positions, sorted(positions))
+        self.assertEqual(state.synthesis_model, "reasoning")
+
+    def test_concurrency_limit_bounds_sections_in_flight(self):
+        import threading
+        import time
+
+        lock = threading.Lock()
+        in_flight = {"now": 0, "peak": 0}
+
+        def expand(section, *args, **kwargs):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            time.sleep(0.02)
+            with lock:
+                in_flight["now"] -= 1
+            return f"Body of {section.title} [Grid Update]."
+
+        self._run(["A", "B", "C", "D", "E"], expand, concurrency=2)
+        self.assertEqual(in_flight["peak"], 2)
+
+    def test_failed_section_falls_back_without_affecting_others(self):
+        def expand(section, *args, **kwargs):
+            if section.title == "Beta":
+                raise RuntimeError("endpoint timeout")
+            if section.title == "Gamma":
+                return None
+            return f"Body of {section.title} [Grid Update]."
+
+        state, synthesis = self._run(["Alpha", "Beta", "Gamma"], expand, concurrency=3)
+
+        self.assertIn("## Alpha\nBody of Alpha [Grid Update].", synthesis)
+        self.assertIn("## Beta\nFallback for Beta.", synthesis)
+        self.assertIn("## Gamma\nFallback for Gamma.", synthesis)
+        self.assertEqual(state.synthesis_model, "mixed")
+
+    def test_section_spans_recorded_from_worker_threads(self):
+        from engine.research_timing import ResearchTrace, activate
+
+        trace = ResearchTrace()
+        with activate(trace):
+            self._run(["Alpha", "Beta", "Gamma"], lambda section, *a, **k: None, concurrency=3)
+
+        spans = [s for s in trace.to_list() if s["stage"] == "section_expansion"]
+        self.assertEqual(sorted(s["meta"]["section"] for s in spans), [1, 2, 3])
+        self.assertTrue(all(s["meta"]["fallback"] for s in spans))
+
+
+class TestSectionStreaming(unittest.TestCase):
+    class _StreamingClient:
+        def __init__(self, drafts):
+            self.drafts = drafts
+            self.prompts = []
+
+        def chat_complete_stream(self, messages):
+            self.prompts.append(messages[-1]["content"])
+            draft = self.drafts.pop(0)
+            if isinstance(draft, Exception):
+                raise draft
+            for word in draft.split(" "):
+                yield word + " "
+
+    def _run(self, drafts, evaluate):
+        import config
+        from workflows.deep_research.synthesizer import OutlineResult, OutlineSection, synthesize
+        from engine.models import Finding, ResearchState
+
+        src = _make_source("Grid Update", snippet="grid tariffs", relevance=0.6, url="https://example.com/grid")
+        state = ResearchState(original_query="power market impacts")
+        state.sources_checked = [src]
+        state.findings = [
+            Finding(claim="Grid tariffs rose.", sources=[src.source_id], confidence="medium", average_credibility=0.7)
+        ]
+        outline = OutlineResult(
+            executive_summary="Summary [Grid Update].",
+            sections=[OutlineSection(title="Tariffs", bullets=["tariffs"])],
+            is_comparison=False,
+            subjects=None,
+        )
+        client = self._StreamingClient(list(drafts))
+        events = []
+        with patch("workflows.deep_research.synthesizer.synthesize_outline", return_value=outline), \
+             patch("tools.specialist.client.create_specialist_client", return_value=client), \
+             patch("workflows.deep_research.synthesizer._evaluate_section_candidate", side_effect=evaluate), \
+             patch("workflows.deep_research.synthesizer._deterministic_section_paragraph", return_value="Fallback."), \
+             patch("workflows.deep_research.synthesizer.config.SYNTHESIS", {**config.SYNTHESIS, "section_concurrency": 1}):
+            synthesis = synthesize(state, section_callback=lambda e, p: events.append((e, p)))
+        return synthesis, events, client
+
+    @staticmethod
+    def _streamed(events, attempt):
+        return "".join(p["delta"] for e, p in events if e == "section_delta" and p["attempt"] == attempt)
+
+    def test_section_text_streams_before_gated_final_event(self):
+        def evaluate(raw_output, **kwargs):
+            return raw_output.strip() + " [Grid Update]", ""
+
+        synthesis, events, _ = self._run(["Tariffs rose sharply in 2025."], evaluate)
+
+        names = [e for e, _ in events]
+        self.assertEqual(names[0], "outline")
+        self.assertEqual(events[0][1]["sections"], ["Tariffs"])
+        self.assertEqual(names[-1], "section")
+        self.assertGreater(names.count("section_delta"), 3)
+        self.assertEqual(self._streamed(events, 1), "Tariffs rose sharply in 2025. ")
+        final = events[-1][1]
+        self.assertEqual(final["text"], "Tariffs rose sharply in 2025. [Grid Update]")
+        self.assertFalse(final["fallback"])
+        self.assertIn(final["text"], synthesis)
+
+    def test_rejected_draft_streams_retry_then_falls_back(self):
+        synthesis, events, client = self._run(
+            ["Generic framing.", "Still generic."],
+            lambda raw_output, **kwargs: (None, "low_section_quality"),
+        )
+
+        self.assertEqual(len(client.prompts), 2)
+        self.assertEqual(self._streamed(events, 1), "Generic framing. ")
+        self.assertEqual(self._streamed(events, 2), "Still generic. ")
+        self.assertEqual(events[-1][1], {"index": 0, "title": "Tariffs", "text": "Fallback.", "fallback": True})
+        self.assertIn("Fallback.", synthesis)
+
+    def test_stream_failure_uses_blocking_call(self):
+        from workflows.deep_research.synthesizer import _stream_research_synthesis_model
+
+        client = self._StreamingClient([RuntimeError("stream dropped")])
+        chunks = []
+        with patch("tools.specialist.client.create_specialist_client", return_value=client), \
+             patch("workflows.deep_research.synthesizer._call_research_synthesis_model",
+                   return_value="Blocking answer") as blocking:
+            result = _stream_research_synthesis_model("prompt", chunks.append)
+
+        self.assertEqual(result, "Blocking answer")
+        self.assertEqual(chunks, [])
+        blocking.assert_called_once()
+
+    def test_progress_stream_forwards_section_events(self):
+        import json
+        import threading
+        import time
+        import ui.web.app as web_app
+
+        research_id = "section-stream-test"
+        web_app.research_progress[research_id] = {"status": "running", "message": "Expanding", "phase": "synthesis"}
+
+        def produce():
+            time.sleep(0.1)
+            with web_app.research_events_lock:
+                web_app.research_events.setdefault(research_id, []).append(
+                    {"event": "section_delta", "data": {"index": 0, "title": "Tariffs", "attempt": 1, "delta": "Tar"}}
+                )
+                web_app.research_events_lock.notify_all()
+            time.sleep(0.1)
+            web_app.research_progress[research_id] = {"status": "completed", "message": "done", "phase": "complete"}
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        try:
+            body = web_app.app.test_client().get(f"/api/research/{research_id}/progress").get_data(as_text=True)
+        finally:
+            producer.join()
+            web_app.research_progress.pop(research_id, None)
+
+        chunks = [c for c in body.split("\n\n") if c]
+        delta = next(c for c in chunks if c.startswith("event: section_delta\n"))
+        self.assertEqual(json.loads(delta.split("data: ", 1)[1])["delta"], "Tar")
+        self.assertEqual(json.loads(chunks[-1].split("data: ", 1)[1])["status"], "completed")
+
+
 if __name__ == "__main__":
     unittest.main()
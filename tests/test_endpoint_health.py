@@ -0,0 +1,154 @@
+"""Tests for LLM endpoint health tracking, circuit breakers and adaptive timeouts."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import config
+from llm_client import LLMClient
+from providers import endpoint_health
+from providers.endpoint_health import (
+    EndpointCircuitOpen,
+    EndpointHealth,
+    adaptive_timeout,
+    is_endpoint_failure,
+)
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def _response(text):
+    return {"choices": [{"message": {"role": "assistant", "content": text}, "finish_reason": "stop"}]}
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def health_enabled(monkeypatch):
+    monkeypatch.setattr(
+        config, "LLM_HEALTH",
+        {"enabled": True, "failure_threshold": 2, "open_seconds": 0.05, "max_open_seconds": 0.1, "min_samples": 3,
+         "timeout_multiplier": 2.0, "min_timeout": 1, "cold_start_seconds": 65, "retry_seconds": 8},
+        raising=False,
+    )
+    endpoint_health.reset_endpoint_health()
+    yield
+    endpoint_health.reset_endpoint_health()
+
+
+def test_only_endpoint_failures_count_against_health():
+    assert is_endpoint_failure(RuntimeError("503 SERVICE_UNAVAILABLE"))
+    assert is_endpoint_failure(RuntimeError("LLM API call timed out after 60s (tried 4 times)."))
+    assert is_endpoint_failure(RuntimeError("Could not connect to API at http://x (tried 4 times)."))
+    assert not is_endpoint_failure(RuntimeError("HTTP 400: max_tokens 1500 exceeds context"))
+    assert not is_endpoint_failure(EndpointCircuitOpen("503 circuit open"))
+
+
+def test_percentiles_drive_adaptive_timeout_and_retry_delay():
+    health = EndpointHealth("http://llm:80", min_samples=3, timeout_multiplier=2.0, min_timeout=1)
+    assert health.timeout_for(120) == 120
+    for seconds in (2.0, 3.0, 4.0, 5.0):
+        health.record_success(seconds)
+
+    assert health.percentile(50) in (3.0, 4.0)
+    assert health.timeout_for(120) == 10.0
+    assert health.timeout_for(6) == 6
+
+    assert health.retry_delay(1) == 65
+    health.record_failure(RuntimeError("503"))
+    health._failing_since -= 12
+    health.record_success(1.0)
+    assert 12 <= health.retry_delay(1) < 13
+    assert health.retry_delay(2) == 8
+
+
+def test_circuit_opens_fails_fast_and_closes_after_background_probe(health_enabled):
+    client = LLMClient(api_url="http://health.test/v1/chat/completions", model="m")
+    with patch.object(client.adapter, "chat_complete", side_effect=RuntimeError("503 SERVICE_UNAVAILABLE")) as call:
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                client.chat_complete(MESSAGES)
+        with pytest.raises(EndpointCircuitOpen):
+            client.chat_complete(MESSAGES)
+        assert call.call_count == 2
+
+    tracker = endpoint_health.get_endpoint_health(client.api_url)
+    assert tracker.stats()["state"] == "open" and tracker.times_opened == 1
+
+    # The endpoint recovers: the background probe closes the circuit without real traffic.
+    with patch.object(client.adapter, "chat_complete", return_value=_response("pong")) as call:
+        _wait_until(lambda: tracker.allow_request())
+        assert call.call_args[0][2] == client.temperature > 0 and call.call_args[0][3] == 1
+        assert client.extract_content(client.chat_complete(MESSAGES)) == "pong"
+    assert tracker.stats()["consecutive_failures"] == 0
+
+
+def test_short_calls_never_shorten_the_timeout_of_a_larger_call():
+    health = EndpointHealth("http://llm:80", min_samples=20, timeout_multiplier=3.0, min_timeout=30)
+    for _ in range(20):
+        health.record_success(0.5, max_tokens=256)
+
+    assert health.timeout_for(180, max_tokens=256) == 30
+    assert health.timeout_for(180, max_tokens=4000) == 180
+    assert health.percentile(95, max_tokens=4000) is None
+
+
+def test_adapters_use_adaptive_timeout(health_enabled):
+    from providers.openai_compatible_adapter import OpenAICompatibleAdapter
+
+    url = "http://timeouts.test/v1/chat/completions"
+    tracker = endpoint_health.get_endpoint_health(url)
+    for _ in range(3):
+        tracker.record_success(2.0, max_tokens=2048)
+    assert adaptive_timeout(url, 120, 2048) == 4.0
+
+    adapter = OpenAICompatibleAdapter(api_url=url, model="m", timeout=120, max_tokens=2048)
+    fake = MagicMock()
+    fake.json.return_value = _response("ok")
+    with patch("requests.Session.post", return_value=fake) as post:
+        adapter.chat_complete(MESSAGES)
+    assert post.call_args.kwargs["timeout"] == 4.0
+
+
+def test_synthesis_skips_cold_start_wait_when_circuit_open(health_enabled):
+    from workflows.deep_research import synthesizer
+
+    client = LLMClient(api_url="http://synth.test/v1/chat/completions", model="m")
+    tracker = endpoint_health.get_endpoint_health(client.api_url)
+    tracker.open_seconds = 60
+    tracker.record_failure(RuntimeError("503"))
+    tracker.record_failure(RuntimeError("503"))
+
+    with patch("tools.specialist.client.create_specialist_client", return_value=client), \
+            patch.object(client.adapter, "chat_complete") as call, \
+            patch.object(synthesizer.time, "sleep") as sleep, \
+            patch("tools.registry.TOOL_FUNCTIONS", {"use_reasoning_model": lambda prompt: "Fallback synthesis"}):
+        assert synthesizer._call_research_synthesis_model("Explain the tariff.") == "Fallback synthesis"
+
+    call.assert_not_called()
+    sleep.assert_not_called()
+
+
+def test_probe_rejected_for_a_bad_request_still_closes_circuit(health_enabled):
+    tracker = endpoint_health.get_endpoint_health("http://probe.test/v1/chat/completions")
+    probe = MagicMock(side_effect=RuntimeError("HTTP 422: temperature must be strictly positive"))
+    tracker.record_failure(RuntimeError("503"), probe=probe)
+    tracker.record_failure(RuntimeError("503"), probe=probe)
+    assert not tracker.allow_request()
+
+    _wait_until(tracker.allow_request)
+    assert probe.call_count == 1 and tracker.stats()["consecutive_failures"] == 0
+
+
+def test_ping_uses_a_positive_temperature():
+    client = LLMClient(api_url="http://ping.test/v1/chat/completions", model="m", temperature=0.0)
+    with patch.object(client.adapter, "chat_complete", return_value=_response("pong")) as call:
+        client.ping()
+    messages, tools, temperature, max_tokens = call.call_args[0]
+    assert tools is None and temperature > 0 and max_tokens == 1
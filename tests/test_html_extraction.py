@@ -0,0 +1,96 @@
+"""Parity tests for the HTML-to-text extraction backends.
+
+Backend timings are compared by ``scripts/benchmark_deep_research.py extraction``.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tools.utils import _html_text
+from tools.utils._content_extractor import ContentExtractor
+from tools.utils._html_text import html_to_text, resolve_backend
+
+FIXTURES = sorted((Path(__file__).parent / "fixtures" / "html").glob("*.html"))
+
+# Sentences each fixture's main content must keep, and boilerplate it must drop.
+EXPECTED = {
+    "news_article.html": (
+        ["Zambia’s Energy Regulation Board has approved a feed-in tariff",
+         "“The tariff gives lenders a number they can model,”"],
+        ["Most read", "Subscribe", "We use cookies", "All rights reserved", "dataLayer"],
+    ),
+    "report_page.html": (
+        ["Traded volumes on the regional day-ahead market rose 38%",
+         "to avoid repeating 2024's emergency imports", "Mozambique 1,820 35"],
+        ["Related reports", "Great summary", "About"],
+    ),
+    "plain_blog.html": (
+        ["Three of the last four utility tenders in Kenya",
+         "writing storage requirements into their next rounds."],
+        ["Blog home", "February 2025", "Comments are closed"],
+    ),
+}
+
+
+@pytest.fixture(params=[True, False], ids=["lxml", "html.parser"])
+def event_source(request):
+    """Run the streaming backend on lxml and on the stdlib fallback parser."""
+    if request.param and not _html_text.lxml_available():
+        pytest.skip("lxml not installed")
+    if request.param:
+        yield
+    else:
+        with patch.object(_html_text, "etree", None):
+            yield
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda p: p.name)
+def test_readability_parity_with_bs4(fixture, event_source):
+    html = fixture.read_bytes()
+    reference = html_to_text(html, backend="bs4")
+    text = html_to_text(html, backend="readability")
+    keep, drop = EXPECTED[fixture.name]
+
+    for sentence in keep:
+        assert sentence in reference
+        assert sentence in text
+    for boilerplate in drop:
+        assert boilerplate not in text
+    # Readability only ever removes text relative to bs4; it never invents any.
+    assert set(text.split()) <= set(reference.split())
+
+
+@pytest.mark.parametrize("name", ["news_article.html", "report_page.html"])
+def test_semantic_pages_keep_nearly_all_bs4_text(name, event_source):
+    html = (Path(__file__).parent / "fixtures" / "html" / name).read_bytes()
+    reference = set(html_to_text(html, backend="bs4").split())
+    text = set(html_to_text(html, backend="readability").split())
+    assert len(text & reference) / len(reference) >= 0.95
+
+
+def test_stdlib_parser_decodes_declared_charset_and_implied_tags():
+    html = (
+        b'<html><head><meta charset="windows-1252"></head><body><div>'
+        b"<p>Eskom\x92s tariff rose<p>Second paragraph with <b>bold</b><i>italic</i> words"
+        b"<table><tr><td>a<td>b<tr><td>c</table></div></body></html>"
+    )
+    with patch.object(_html_text, "etree", None):
+        text = html_to_text(html, backend="readability")
+    assert text == "Eskom’s tariff rose Second paragraph with bold italic words a b c"
+
+
+def test_auto_backend_falls_back_to_bs4_without_lxml():
+    with patch.object(_html_text, "etree", None):
+        assert resolve_backend("auto") == "bs4"
+        assert resolve_backend("no-such-backend") == "bs4"
+    assert resolve_backend("bs4") == "bs4"
+    assert html_to_text(b"   ") is None
+
+
+def test_content_extractor_uses_configured_backend():
+    extractor = ContentExtractor(enabled=True)
+    extractor.extraction_backend = "custom"
+    with patch.dict(_html_text._BACKENDS, {"custom": lambda html: "custom text"}):
+        assert extractor._html_to_text(b"<p>page</p>") == "custom text"
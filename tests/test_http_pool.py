@@ -0,0 +1,127 @@
+"""Tests for pooled keep-alive sessions shared by the LLM provider adapters."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from providers import http_pool
+from providers.http_pool import endpoint_key, get_session
+from providers.huggingface_adapter import HuggingFaceAdapter
+from providers.openai_compatible_adapter import OpenAICompatibleAdapter
+
+MESSAGES = [{"role": "user", "content": "hello"}]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        with self.lock:
+            self.connections.add(self.client_address)
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if payload.get("stream"):
+            body = (
+                b'data: {"choices": [{"delta": {"content": "hel"}}]}\n\n'
+                b'data: {"choices": [{"delta": {"content": "lo"}}]}\n\n'
+                b"data: [DONE]\n\n"
+            )
+            content_type = "text/event-stream"
+        elif "inputs" in payload:
+            body = json.dumps([{"generated_text": "hf reply"}]).encode()
+            content_type = "application/json"
+        else:
+            body = json.dumps({"choices": [{"message": {"role": "assistant", "content": "reply"}, "finish_reason": "stop"}]}).encode()
+            content_type = "application/json"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    _Handler.connections = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    http_pool.close_sessions()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    http_pool.close_sessions()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_sessions_are_shared_per_endpoint():
+    http_pool.close_sessions()
+    try:
+        chat = get_session("https://llm.example.com/v1/chat/completions")
+        assert get_session("https://LLM.example.com:443/v1/models") is chat
+        assert get_session("http://llm.example.com/v1/chat/completions") is not chat
+        assert endpoint_key("https://llm.example.com/v1/x") == "https://llm.example.com:443"
+        assert http_pool.pool_stats()["endpoints"] == 2
+    finally:
+        http_pool.close_sessions()
+    assert http_pool.pool_stats()["endpoints"] == 0
+
+
+def test_pool_size_comes_from_config(monkeypatch):
+    import config
+
+    monkeypatch.setattr(config, "LLM_HTTP", {"pool_maxsize": 3, "pool_block": True}, raising=False)
+    http_pool.close_sessions()
+    try:
+        adapter = get_session("https://pool.example.com/v1").get_adapter("https://pool.example.com/v1")
+        assert adapter._pool_maxsize == 3
+        assert adapter._pool_block is True
+    finally:
+        http_pool.close_sessions()
+
+
+def test_adapters_reuse_keep_alive_connections(server):
+    chat_url = f"{server}/v1/chat/completions"
+    adapter = OpenAICompatibleAdapter(api_url=chat_url, model="m", timeout=5)
+
+    for _ in range(3):
+        assert adapter.chat_complete(MESSAGES)["choices"][0]["message"]["content"] == "reply"
+    assert "".join(adapter.chat_complete_stream(MESSAGES)) == "hello"
+    assert adapter.chat_complete(MESSAGES)["choices"][0]["message"]["content"] == "reply"
+
+    hf = HuggingFaceAdapter(api_url=f"{server}/generate", model="m", auth_token="t", timeout=5)
+    assert hf.chat_complete(MESSAGES)["choices"][0]["message"]["content"] == "hf reply"
+
+    # Six calls across two adapters on one endpoint, one TCP connection.
+    assert len(_Handler.connections) == 1
+
+
+def test_concurrent_calls_share_one_bounded_pool(server):
+    chat_url = f"{server}/v1/chat/completions"
+    adapter = OpenAICompatibleAdapter(api_url=chat_url, model="m", timeout=5)
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(5):
+                adapter.chat_complete(MESSAGES)
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    with patch.object(http_pool, "_pool_settings", return_value={"pool_maxsize": 4, "pool_block": True}):
+        http_pool.close_sessions()
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert errors == []
+    assert len(_Handler.connections) <= 4
@@ -38,7 +38,7 @@ MESSAGES = [{"role": "user", "content": "hello"}]
 class TestStreamListResponse(unittest.TestCase):
     """HF Toolkit non-streaming fallback: response is a JSON list."""
 
-    @patch("providers.huggingface_adapter.requests.post")
+    @patch("requests.Session.post")
     def test_stream_list_response_yields_text(self, mock_post):
         """The original crash scenario — list response must yield generated_text."""
         mock_post.return_value = _mock_response([
@@ -48,7 +48,7 @@ class TestStreamListResponse(unittest.TestCase):
         chunks = list(adapter.chat_complete_stream(MESSAGES))
         self.assertEqual(chunks, ["hello world"])
 
-    @patch("providers.huggingface_adapter.requests.post")
+    @patch("requests.Session.post")
     def test_stream_list_response_empty_text_skipped(self, mock_post):
         """Empty generated_text should produce no output."""
         mock_post.return_value = _mock_response([
@@ -58,7 +58,7 @@ class TestStreamListResponse(unittest.TestCase):
         chunks = list(adapter.chat_complete_stream(MESSAGES))
         self.assertEqual(chunks, [])
 
-    @patch("providers.huggingface_adapter.requests.post")
+    @patch("requests.Session.post")
     def test_stream_list_response_multiple_items(self, mock_post):
         """Multiple items in the list each yield their generated_text."""
         mock_post.return_value = _mock_response([
@@ -72,7 +72,7 @@ class TestStreamListResponse(unittest.TestCase):
 class TestStreamTGIFormat(unittest.TestCase):
     """TGI streaming format: data: {"token": {"text": "..."}}"""
 
-    @patch("providers.huggingface_adapter.requests.post")
+    @patch("requests.Session.post")
     def test_stream_tgi_format_still_works(self, mock_post):
         """Regression guard — TGI token-by-token streaming must still work."""
         mock_post.return_value = _mock_response([
@@ -87,7 +87,7 @@ class TestStreamTGIFormat(unittest.TestCase):
 class TestStreamEdgeCases(unittest.TestCase):
     """Malformed input, tools, and timeout handling."""
 
-    @patch("providers.huggingface_adapter.requests.post")
+    @patch("requests.Session.post")
     def test_stream_json_decode_error_skipped(self, mock_post):
         """Malformed lines are silently skipped; valid lines still yield."""
         mock_post.return_value = _mock_response([
@@ -104,7 +104,7 @@ class TestStreamEdgeCases(unittest.TestCase):
         with self.assertRaises(ValueError):
             list(adapter.chat_complete_stream(MESSAGES, tools=[{}]))
 
-    @patch("providers.huggingface_adapter.requests.post")
+    @patch("requests.Session.post")
     def test_stream_timeout_raises_runtimeerror(self, mock_post):
         """requests.Timeout must surface as RuntimeError."""
         import requests
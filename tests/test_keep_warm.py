@@ -0,0 +1,94 @@
+"""Tests for the keep-warm pinger for scale-to-zero inference endpoints."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import config
+from workflows import keep_warm
+from workflows.background_threads import start_keep_warm_thread
+
+
+@pytest.fixture
+def warm_config(monkeypatch):
+    monkeypatch.setattr(config, "KEEP_WARM", {
+        "enabled": False, "roles": ["reasoning", "search"], "interval_seconds": 600,
+        "active_hours": [7, 19], "active_weekdays": [0, 1, 2, 3, 4],
+        "warm_on_enqueue": True, "min_interval_seconds": 60,
+    }, raising=False)
+    monkeypatch.setattr(config, "MODEL_ENDPOINTS", {"reasoning": "hf-synth", "search": "local", "codestral": "hf-off"}, raising=False)
+    monkeypatch.setattr(config, "HF_ENDPOINTS", {
+        "hf-synth": {"url": "https://synth.endpoints.example/v1/chat/completions", "model_name": "m", "enabled": True},
+        "hf-off": {"url": "https://off.endpoints.example", "model_name": "m", "enabled": False},
+    }, raising=False)
+    monkeypatch.setattr(keep_warm, "_LAST_PING", {})
+    monkeypatch.setattr(keep_warm, "_PING_STATS", {})
+
+
+@pytest.fixture
+def fake_client():
+    client = MagicMock()
+    with patch("tools.specialist.client.create_specialist_client", return_value=client):
+        yield client
+
+
+def test_targets_are_enabled_hf_endpoints_for_configured_roles(warm_config):
+    assert keep_warm.keep_warm_targets() == [("reasoning", "hf-synth")]
+
+    config.KEEP_WARM["roles"] = ["codestral"]
+    assert keep_warm.keep_warm_targets() == []
+
+
+def test_active_hours_and_weekdays(warm_config):
+    assert keep_warm.in_active_hours(datetime(2026, 10, 14, 9))       # Wednesday morning
+    assert not keep_warm.in_active_hours(datetime(2026, 10, 14, 19))
+    assert not keep_warm.in_active_hours(datetime(2026, 10, 17, 9))   # Saturday
+
+    config.KEEP_WARM.update(active_hours=[22, 6], active_weekdays=None)
+    assert keep_warm.in_active_hours(datetime(2026, 10, 17, 23))
+    assert keep_warm.in_active_hours(datetime(2026, 10, 18, 3))
+    assert not keep_warm.in_active_hours(datetime(2026, 10, 18, 12))
+
+
+def test_scheduled_cycle_pings_once_per_interval_in_active_hours(warm_config, fake_client):
+    assert keep_warm.run_keep_warm_cycle(datetime(2026, 10, 17, 9)) == 0
+    fake_client.ping.assert_not_called()
+
+    assert keep_warm.run_keep_warm_cycle(datetime(2026, 10, 14, 9)) == 1
+    assert keep_warm.run_keep_warm_cycle(datetime(2026, 10, 14, 9)) == 0
+    fake_client.ping.assert_called_once_with()
+    assert keep_warm.keep_warm_stats()["hf-synth"]["warm"] == 1
+
+
+def test_cold_endpoint_ping_is_counted_not_raised(warm_config, fake_client):
+    fake_client.ping.side_effect = RuntimeError("503 SERVICE_UNAVAILABLE")
+
+    assert keep_warm.ping_endpoint("reasoning", "hf-synth") is False
+    stats = keep_warm.keep_warm_stats()["hf-synth"]
+    assert (stats["pings"], stats["cold"]) == (1, 1)
+    assert "503" in stats["last_error"]
+
+
+def test_rejected_ping_from_a_warm_endpoint_is_not_cold(warm_config, fake_client):
+    fake_client.ping.side_effect = RuntimeError("HTTP 422: Input validation error: `temperature` must be strictly positive")
+
+    assert keep_warm.ping_endpoint("reasoning", "hf-synth") is True
+    stats = keep_warm.keep_warm_stats()["hf-synth"]
+    assert (stats["warm"], stats["cold"]) == (1, 0)
+    assert "422" in stats["last_error"]
+
+
+def test_research_start_warms_endpoints_without_blocking(warm_config, fake_client):
+    threads = keep_warm.warm_synthesis_endpoints()
+    for thread in threads:
+        thread.join(2)
+    assert len(threads) == 1
+    fake_client.ping.assert_called_once()
+
+    config.KEEP_WARM["warm_on_enqueue"] = False
+    assert keep_warm.warm_synthesis_endpoints() == []
+
+
+def test_scheduler_thread_is_optional(warm_config):
+    assert start_keep_warm_thread() is None
@@ -0,0 +1,131 @@
+"""Tests for priority-aware admission control on LLM endpoints."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+import config
+from llm_client import LLMClient
+from providers import admission
+from providers.admission import (
+    AdmissionRejected,
+    EndpointAdmission,
+    admission_stats,
+    current_priority,
+    llm_priority,
+    with_llm_priority,
+)
+
+
+def _response(text):
+    return {"choices": [{"message": {"role": "assistant", "content": text}, "finish_reason": "stop"}]}
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+def _queue_call(limiter, priority, order):
+    def run():
+        limiter.acquire(priority)
+        order.append(priority)
+        limiter.release()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_waiters_are_admitted_by_priority_then_fifo():
+    limiter = EndpointAdmission("http://llm:80", max_in_flight=1, interactive_reserve=0)
+    limiter.acquire("research")
+    order = []
+    threads = []
+    for priority in ("background", "research", "interactive", "research"):
+        threads.append(_queue_call(limiter, priority, order))
+        _wait_until(lambda n=len(threads): sum(limiter.stats()["priorities"][p]["queued_now"] for p in admission.PRIORITIES) == n)
+
+    limiter.release()
+    for thread in threads:
+        thread.join(2)
+
+    assert order == ["interactive", "research", "research", "background"]
+    stats = limiter.stats()["priorities"]
+    assert stats["background"]["queued"] == 1 and stats["background"]["max_queue_ms"] > 0
+
+
+def test_interactive_reserve_keeps_chat_fast_under_research_load():
+    limiter = EndpointAdmission("http://llm:80", max_in_flight=2, interactive_reserve=1)
+    assert limiter.acquire("research") == 0.0
+
+    order = []
+    waiter = _queue_call(limiter, "background", order)
+    _wait_until(lambda: limiter.stats()["priorities"]["background"]["queued_now"] == 1)
+
+    assert limiter.acquire("interactive") == 0.0
+    assert limiter.stats()["in_flight"] == 2
+    limiter.release()
+    limiter.release()
+    waiter.join(2)
+    assert order == ["background"]
+
+
+def test_full_queue_rejects_and_waits_time_out():
+    limiter = EndpointAdmission("http://llm:80", max_in_flight=1, interactive_reserve=0, max_queue=1, queue_timeout=0.05)
+    limiter.acquire("interactive")
+
+    with pytest.raises(AdmissionRejected):
+        limiter.acquire("research")
+    assert limiter.stats()["priorities"]["research"]["timeouts"] == 1
+
+    limiter.max_queue = 0
+    with pytest.raises(AdmissionRejected):
+        limiter.acquire("background")
+    stats = limiter.stats()
+    assert stats["priorities"]["background"]["rejected"] == 1
+    assert stats["in_flight"] == 1 and stats["priorities"]["research"]["queued_now"] == 0
+
+
+def test_priority_context_defaults_and_decorator(monkeypatch):
+    monkeypatch.setattr(config, "LLM_ADMISSION", {"enabled": True, "default_priority": "background"}, raising=False)
+    assert current_priority() == "background"
+
+    @with_llm_priority("interactive")
+    def turn():
+        return current_priority()
+
+    assert turn() == "interactive"
+    with llm_priority("research"):
+        assert current_priority() == "research"
+    with pytest.raises(ValueError):
+        with llm_priority("urgent"):
+            pass
+
+
+def test_llm_client_calls_go_through_endpoint_limiter(monkeypatch):
+    monkeypatch.setattr(
+        config, "LLM_ADMISSION",
+        {"enabled": True, "max_in_flight": 2, "interactive_reserve": 1, "endpoints": {"http://admit.test:80": 3}},
+        raising=False,
+    )
+    admission.reset_admission()
+    client = LLMClient(api_url="http://admit.test/v1/chat/completions", model="m")
+    try:
+        with patch.object(client.adapter, "chat_complete", return_value=_response("ok")), \
+                patch.object(client.adapter, "chat_complete_stream", return_value=iter(["o", "k"])):
+            with llm_priority("interactive"):
+                client.chat_complete([{"role": "user", "content": "hi"}])
+            with llm_priority("background"):
+                assert list(client.chat_complete_stream([{"role": "user", "content": "hi"}])) == ["o", "k"]
+
+        stats = admission_stats()["http://admit.test:80"]
+        assert stats["max_in_flight"] == 3 and stats["in_flight"] == 0
+        assert stats["priorities"]["interactive"]["admitted"] == 1
+        assert stats["priorities"]["background"]["admitted"] == 1
+    finally:
+        admission.reset_admission()
@@ -0,0 +1,210 @@
+"""Tests for the persistent LLM response cache and its LLMClient hook."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from llm_client import LLMClient
+from tools.utils import _llm_cache
+from tools.utils._llm_cache import LLMCacheMiss, LLMResponseCache, get_llm_cache, llm_cache_refresh, response_key
+
+MESSAGES = [
+    {"role": "system", "content": "You are an energy analyst."},
+    {"role": "user", "content": "Summarize Zambia's solar tariff."},
+]
+
+
+def _response(text):
+    return {"choices": [{"message": {"role": "assistant", "content": text}, "finish_reason": "stop"}]}
+
+
+@pytest.fixture
+def make_cache(tmp_path):
+    caches = []
+
+    def factory(**kwargs):
+        cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"), **kwargs)
+        caches.append(cache)
+        return cache
+
+    yield factory
+    for cache in caches:
+        cache.close()
+
+
+@pytest.fixture
+def client():
+    client = LLMClient(api_url="http://llm.test/v1/chat/completions", model="m", temperature=0.4, max_tokens=512)
+    client.cache_role = "reasoning"
+    return client
+
+
+def _use(cache):
+    return patch.object(_llm_cache, "get_llm_cache", return_value=cache)
+
+
+def test_response_key_is_canonical_and_covers_sampling_params():
+    reordered = [{"content": m["content"], "role": m["role"]} for m in MESSAGES]
+    base = response_key("http://a", "m", MESSAGES, {"temperature": 0.4, "max_tokens": 512})
+
+    assert base == response_key("http://a", "m", reordered, {"max_tokens": 512, "temperature": 0.4})
+    assert base != response_key("http://a", "m", MESSAGES, {"temperature": 0.2, "max_tokens": 512})
+    assert base != response_key("http://b", "m", MESSAGES, {"temperature": 0.4, "max_tokens": 512})
+    assert base != response_key("http://a", "m2", MESSAGES, {"temperature": 0.4, "max_tokens": 512})
+
+
+def test_identical_requests_hit_cache(make_cache, client):
+    cache = make_cache()
+    with _use(cache), patch.object(client.adapter, "chat_complete", return_value=_response("Tariff is 6.5c")) as call:
+        first = client.chat_complete(MESSAGES)
+        second = client.chat_complete(MESSAGES)
+        client.temperature = 0.9
+        client.chat_complete(MESSAGES)
+
+    assert first == second
+    assert call.call_count == 2
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["entries"] == 2
+
+
+def test_empty_responses_and_bypassed_calls_are_not_cached(make_cache, client):
+    cache = make_cache()
+    with _use(cache), patch.object(client.adapter, "chat_complete", return_value=_response("  ")) as call:
+        client.chat_complete(MESSAGES)
+        client.chat_complete(MESSAGES)
+        client.chat_complete(MESSAGES, tools=[{"type": "function", "function": {"name": "f"}}])
+        client.cache_role = None
+        client.chat_complete(MESSAGES)
+
+    assert call.call_count == 4
+    assert cache.stats()["entries"] == 0
+
+
+def test_role_ttl_expires_entries(make_cache):
+    cache = make_cache(ttl_seconds=3600, role_ttl_seconds={"intent_detector": 60})
+    key = response_key("e", "m", MESSAGES)
+    cache.set(key, _response("cached"), role="intent_detector")
+    cache.conn.execute("UPDATE llm_responses SET created_at = ?", (time.time() - 120,))
+    cache.conn.commit()
+
+    assert cache.get(key, role="intent_detector") is None
+    assert cache.get(key, role="reasoning") == _response("cached")
+
+
+def test_record_mode_always_calls_and_overwrites(make_cache, client):
+    make_cache().set(
+        response_key(client.api_url, client.model, MESSAGES, {"temperature": 0.4, "max_tokens": 512}),
+        _response("old"),
+    )
+    cache = make_cache(mode="record")
+    with _use(cache), patch.object(client.adapter, "chat_complete", return_value=_response("new")) as call:
+        assert client.extract_content(client.chat_complete(MESSAGES)) == "new"
+
+    assert call.call_count == 1
+    assert make_cache().get(
+        response_key(client.api_url, client.model, MESSAGES, {"temperature": 0.4, "max_tokens": 512})
+    ) == _response("new")
+
+
+def test_replay_mode_serves_expired_entries_and_never_calls_endpoint(make_cache, client):
+    with _use(make_cache()), patch.object(client.adapter, "chat_complete", return_value=_response("recorded")):
+        client.chat_complete(MESSAGES)
+
+    cache = make_cache(mode="replay", ttl_seconds=1)
+    cache.conn.execute("UPDATE llm_responses SET created_at = 0")
+    cache.conn.commit()
+    with _use(cache), patch.object(client.adapter, "chat_complete") as call:
+        assert client.extract_content(client.chat_complete(MESSAGES)) == "recorded"
+        with pytest.raises(LLMCacheMiss):
+            client.chat_complete(MESSAGES + [{"role": "user", "content": "And Kenya?"}])
+
+    call.assert_not_called()
+    assert cache.stats()["replay_misses"] == 1
+
+
+def test_get_llm_cache_respects_config_and_env(tmp_path, monkeypatch):
+    import config
+
+    monkeypatch.setattr(_llm_cache, "_CACHE", None)
+    monkeypatch.delenv("ZORORA_LLM_CACHE_MODE", raising=False)
+    monkeypatch.setattr(config, "LLM_CACHE", {"enabled": False, "db_path": str(tmp_path / "c.db")}, raising=False)
+    assert get_llm_cache() is None
+
+    monkeypatch.setenv("ZORORA_LLM_CACHE_MODE", "replay")
+    cache = get_llm_cache()
+    assert cache is not None and cache.mode == "replay"
+    cache.close()
+
+
+def test_specialist_clients_share_cache_across_call_paths(make_cache):
+    from tools.specialist.client import create_specialist_client
+    from workflows.deep_research import synthesizer
+
+    assert create_specialist_client("reasoning", {"model": "m", "max_tokens": 64, "temperature": 0.1, "timeout": 5}).cache_role == "reasoning"
+
+    cache = make_cache()
+    with _use(cache), patch(
+        "providers.openai_compatible_adapter.OpenAICompatibleAdapter.chat_complete",
+        return_value=_response("Solar tariffs rose."),
+    ) as call:
+        first = synthesizer._call_research_synthesis_model("Explain the tariff.")
+        second = synthesizer._call_research_synthesis_model("Explain the tariff.")
+
+    assert first == second == "Solar tariffs rose."
+    assert call.call_count == 1
+
+
+def test_streamed_completions_share_cache_with_blocking_calls(make_cache, client):
+    cache = make_cache()
+    with _use(cache), patch.object(client.adapter, "chat_complete_stream", return_value=iter(["Tariff ", "is ", "6.5c"])) as stream:
+        assert list(client.chat_complete_stream(MESSAGES)) == ["Tariff ", "is ", "6.5c"]
+        assert list(client.chat_complete_stream(MESSAGES)) == ["Tariff is 6.5c"]
+    with _use(cache), patch.object(client.adapter, "chat_complete") as blocking:
+        assert client.extract_content(client.chat_complete(MESSAGES)) == "Tariff is 6.5c"
+
+    assert stream.call_count == 1
+    blocking.assert_not_called()
+
+
+def test_refresh_skips_cached_answer_and_replaces_it(make_cache, client):
+    cache = make_cache()
+    with _use(cache), patch.object(client.adapter, "chat_complete", side_effect=[_response("bad"), _response("good")]) as call:
+        client.chat_complete(MESSAGES)
+        with llm_cache_refresh():
+            assert client.extract_content(client.chat_complete(MESSAGES)) == "good"
+        assert client.extract_content(client.chat_complete(MESSAGES)) == "good"
+
+    assert call.call_count == 2
+
+    replay = make_cache(mode="replay")
+    with _use(replay), patch.object(client.adapter, "chat_complete") as call, llm_cache_refresh():
+        assert client.extract_content(client.chat_complete(MESSAGES)) == "good"
+    call.assert_not_called()
+
+
+def test_only_configured_roles_are_cached_in_read_write_mode(make_cache, client):
+    cache = make_cache(roles=["intent_detector"])
+    assert cache.caches("intent_detector") and not cache.caches("reasoning")
+    with _use(cache), patch.object(client.adapter, "chat_complete", return_value=_response("Tariff is 6.5c")) as call:
+        client.chat_complete(MESSAGES)
+        client.chat_complete(MESSAGES)
+
+    assert call.call_count == 2
+    assert cache.stats()["entries"] == 0
+    assert make_cache(mode="replay", roles=["intent_detector"]).caches("reasoning")
+
+
+def test_synthesis_call_path_honours_refresh(make_cache):
+    from workflows.deep_research import synthesizer
+
+    cache = make_cache()
+    with _use(cache), patch(
+        "providers.openai_compatible_adapter.OpenAICompatibleAdapter.chat_complete",
+        return_value=_response("Solar tariffs rose."),
+    ) as call:
+        synthesizer._call_research_synthesis_model("Explain the tariff.")
+        with llm_cache_refresh():
+            synthesizer._call_research_synthesis_model("Explain the tariff.")
+
+    assert call.call_count == 2
@@ -29,8 +29,12 @@ class TestMarketContextImportAndBuild(unittest.TestCase):
         from engine.models import ResearchState, Finding
         from workflows.deep_research.synthesizer import synthesize, OutlineResult, OutlineSection
 
+        from workflows.market_workflow import MarketSnapshot
+
         wf = MagicMock()
-        wf.compute_summary.return_value = {"DGS10": {"current": 4.2}}
+        wf.read_summary_snapshot.return_value = MarketSnapshot(
+            summaries={"DGS10": {"current": 4.2}}, data_fetched_at="2025-01-01T00:00:00+00:00", stale=True,
+        )
         mock_market_workflow_cls.return_value = wf
         mock_build_context.return_value = "[Market Data Context]"
 
@@ -64,9 +68,82 @@ class TestMarketContextImportAndBuild(unittest.TestCase):
         _ = synthesize(state)
 
         self.assertTrue(mock_build_context.called)
+        wf.update_all.assert_not_called()
         self.assertTrue(mock_synth_section.called)
         passed_market_context = mock_synth_section.call_args.kwargs.get("market_context", "")
         self.assertIn("[Market Data Context]", passed_market_context)
+        self.assertTrue(state.market_snapshot["stale"])
+
+
+class TestMarketSummarySnapshot(unittest.TestCase):
+    def setUp(self):
+        from tempfile import TemporaryDirectory
+        from tools.market.store import MarketDataStore
+        from workflows.market_workflow import MarketWorkflow
+
+        self._tmp = TemporaryDirectory()
+        self.store = MarketDataStore(db_path=f"{self._tmp.name}/market.db")
+        self.workflow = MarketWorkflow(store=self.store)
+
+    def tearDown(self):
+        self.store.close()
+        self._tmp.cleanup()
+
+    def _seed(self, series_id="DGS10"):
+        self.store.upsert_observations(series_id, [("2025-01-01", 4.0), ("2025-01-02", 4.2)])
+
+    def test_update_maintains_snapshot_and_read_never_fetches(self):
+        self._seed()
+        with patch.object(self.workflow, "_update_series", side_effect=lambda sid, force=False: sid == "DGS10"):
+            self.workflow.update_all()
+
+        with patch.object(self.workflow, "_update_series") as fetch, \
+             patch.object(self.workflow, "compute_summary") as compute:
+            snapshot = self.workflow.read_summary_snapshot()
+        fetch.assert_not_called()
+        compute.assert_not_called()
+
+        self.assertAlmostEqual(snapshot.summaries["DGS10"]["current"], 4.2)
+        self.assertFalse(snapshot.stale)
+        self.assertLess(snapshot.age_hours, 1)
+        self.assertEqual(snapshot.metadata()["series_count"], 1)
+
+    def test_missing_snapshot_is_built_from_stored_data(self):
+        self._seed()
+        with patch.object(self.workflow, "_update_series") as fetch:
+            snapshot = self.workflow.read_summary_snapshot()
+        fetch.assert_not_called()
+        self.assertIn("DGS10", snapshot.summaries)
+        self.assertIsNotNone(self.store.get_summary_snapshot())
+
+    def test_old_provider_data_is_reported_stale(self):
+        self._seed()
+        self.workflow.refresh_summary_snapshot()
+        self.store.conn.execute("UPDATE fetch_metadata SET last_fetched_at = '2020-01-01T00:00:00+00:00'")
+        self.store.conn.commit()
+
+        snapshot = self.workflow.read_summary_snapshot()
+        self.assertTrue(snapshot.stale)
+        self.assertEqual(snapshot.data_fetched_at, "2020-01-01T00:00:00+00:00")
+
+    def test_service_exposes_snapshot_metadata_in_payload(self):
+        from engine import deep_research_service as service
+        from engine.models import ResearchState
+
+        self._seed()
+        with patch.object(service, "MarketWorkflow", return_value=self.workflow), \
+             patch.object(service, "detect_market_intent", return_value=True):
+            market = service._build_market_context_for_query("oil price outlook")
+        context, summaries = market
+        self.assertIn("DGS10", summaries)
+        self.assertTrue(context)
+
+        state = ResearchState(original_query="oil price outlook")
+        state.market_snapshot = market.snapshot
+        restored = ResearchState.from_dict(state.to_dict())
+        payload = service.build_results_payload(restored, "oil price outlook")
+        self.assertEqual(payload["market_snapshot"]["series_count"], 1)
+        self.assertIn("stale", payload["market_snapshot"])
 
 
 if __name__ == "__main__":
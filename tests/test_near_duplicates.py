@@ -0,0 +1,105 @@
+"""Tests for near-duplicate source collapse (workflows/deep_research/dedupe.py)."""
+
+from unittest.mock import patch
+
+from engine.models import ResearchState, Source
+from workflows.deep_research.dedupe import collapse_near_duplicates, minhash_signature, source_features
+
+WIRE_TITLE = "EU imposes provisional tariffs on Chinese solar panel imports"
+WIRE_SNIPPET = (
+    "The European Commission announced provisional anti-dumping duties of up to 30 percent "
+    "on photovoltaic modules manufactured in China, citing unfair pricing by state-backed producers."
+)
+
+
+def _source(name, source_type, title=WIRE_TITLE, snippet=WIRE_SNIPPET, **kwargs):
+    url = f"https://{name}.example.com/story"
+    return Source(
+        source_id=Source.generate_id(url),
+        url=url,
+        title=title,
+        content_snippet=snippet,
+        source_type=source_type,
+        **kwargs,
+    )
+
+
+def test_wire_copies_collapse_into_most_authoritative_channel():
+    news = _source("wire", "news", cited_by_count=0)
+    web = _source("blog", "web", title="EU imposes provisional tariffs on Chinese solar panel imports - Blog")
+    newsroom = _source("newsroom", "newsroom", publication_date="")
+    newsroom_copy_date = "2025-03-01"
+    news.publication_date = newsroom_copy_date
+
+    collapsed = collapse_near_duplicates([news, web, newsroom])
+
+    assert collapsed == [newsroom]
+    assert set(newsroom.alternate_urls) == {news.url, web.url}
+    assert newsroom.publication_date == newsroom_copy_date
+
+
+def test_rewritten_headline_still_collapses():
+    original = _source("a", "newsroom")
+    rewrite = _source(
+        "b",
+        "news",
+        title="Brussels hits Chinese solar panel imports with provisional tariffs",
+    )
+    assert collapse_near_duplicates([rewrite, original]) == [original]
+    assert original.alternate_urls == [rewrite.url]
+
+
+def test_unrelated_stories_are_kept_in_input_order():
+    tariffs = _source("a", "news")
+    mining = _source(
+        "b",
+        "news",
+        title="Copper miners expand output in Zambia as prices climb",
+        snippet="Zambian copper production rose sharply this quarter as new smelters came online "
+                "and global demand from grid investment pushed prices to record highs.",
+    )
+    other_tariffs = _source(
+        "c",
+        "web",
+        title="US extends steel tariffs on Canadian aluminium",
+        snippet="Washington renewed Section 232 duties on aluminium shipments from Canada after "
+                "talks over quotas stalled, affecting automakers and beverage can producers.",
+    )
+    assert collapse_near_duplicates([tariffs, mining, other_tariffs]) == [tariffs, mining, other_tariffs]
+    assert not tariffs.alternate_urls
+
+
+def test_short_texts_are_never_collapsed():
+    a = _source("a", "news", title="Solar tariffs", snippet="")
+    b = _source("b", "news", title="Solar tariffs", snippet="")
+    assert collapse_near_duplicates([a, b]) == [a, b]
+
+
+def test_minhash_signature_is_deterministic():
+    features = source_features(_source("a", "news"))
+    assert minhash_signature(features) == minhash_signature(set(features))
+    assert len(minhash_signature(features)) == 64
+
+
+def test_research_state_roundtrips_alternate_urls():
+    src = _source("a", "academic")
+    src.alternate_urls = ["https://mirror.example.com/story"]
+    state = ResearchState(original_query="solar tariffs")
+    state.sources_checked = [src]
+    restored = ResearchState.from_dict(state.to_dict())
+    assert restored.sources_checked[0].alternate_urls == ["https://mirror.example.com/story"]
+
+
+def test_service_dedupe_collapses_when_enabled():
+    from engine import deep_research_service as service
+
+    sources = [_source("wire", "news"), _source("newsroom", "newsroom"), _source("wire", "news")]
+    enabled = {"near_duplicates": {"enabled": True, "jaccard_threshold": 0.7, "min_features": 8}}
+    with patch.object(service.config, "DEEP_RESEARCH", enabled, create=True):
+        unique = service._deduplicate_sources(sources)
+    assert [s.source_type for s in unique] == ["newsroom"]
+
+    disabled = {"near_duplicates": {"enabled": False}}
+    with patch.object(service.config, "DEEP_RESEARCH", disabled, create=True):
+        fresh = [_source("wire", "news"), _source("newsroom", "newsroom")]
+        assert len(service._deduplicate_sources(fresh)) == 2
@@ -201,7 +201,7 @@ class TestWorldBankRaw(unittest.TestCase):
         "total": 1,
     }
 
-    @patch("tools.research.worldbank_search.requests.get")
+    @patch("tools.utils._async_http.requests.get")
     def test_worldbank_raw_parsing(self, mock_get):
         mock_get.return_value = _mock_response(self.SAMPLE_RESPONSE)
         from tools.research.worldbank_search import _worldbank_document_search_raw
@@ -211,7 +211,7 @@ class TestWorldBankRaw(unittest.TestCase):
         self.assertEqual(results[0]["title"], "Africa Development Report 2023")
         self.assertIn("Economic growth", results[0]["description"])
 
-    @patch("tools.research.worldbank_search.requests.get")
+    @patch("tools.utils._async_http.requests.get")
     def test_worldbank_uses_provider_sanitized_query(self, mock_get):
         mock_get.return_value = _mock_response({"documents": {}, "total": 0})
         from tools.research.worldbank_search import _worldbank_document_search_raw
@@ -225,7 +225,7 @@ class TestWorldBankRaw(unittest.TestCase):
         self.assertNotIn("|", sent)
         self.assertNotIn("geography:", sent.lower())
 
-    @patch("tools.research.worldbank_search.requests.get")
+    @patch("tools.utils._async_http.requests.get")
     def test_worldbank_sources_conversion(self, mock_get):
         mock_get.return_value = _mock_response(self.SAMPLE_RESPONSE)
         from tools.research.worldbank_search import worldbank_search_sources
@@ -235,7 +235,7 @@ class TestWorldBankRaw(unittest.TestCase):
         self.assertTrue(all(isinstance(s, Source) for s in sources))
         self.assertEqual(sources[0].source_type, "world_bank")
 
-    @patch("tools.research.worldbank_search.requests.get")
+    @patch("tools.utils._async_http.requests.get")
     def test_worldbank_skips_facet_key(self, mock_get):
         mock_get.return_value = _mock_response(self.SAMPLE_RESPONSE)
         from tools.research.worldbank_search import _worldbank_document_search_raw
@@ -290,7 +290,7 @@ class TestPolicySearchRaw(unittest.TestCase):
         ]
     }
 
-    @patch("tools.research.policy_search.requests.get")
+    @patch("tools.utils._async_http.requests.get")
     @patch("tools.research.policy_search.config.CONGRESS_GOV", {"enabled": True, "endpoint": "https://api.congress.gov/v3/bill", "timeout": 15, "api_key": "test-dummy-key"})
     def test_congress_raw_parsing(self, mock_get):
         mock_get.return_value = _mock_response(self.CONGRESS_RESPONSE)
@@ -301,7 +301,7 @@ class TestPolicySearchRaw(unittest.TestCase):
         self.assertEqual(results[0]["title"], "Clean Energy Act")
         self.assertEqual(results[0]["source"], "Congress.gov")
 
-    @patch("tools.research.policy_search.requests.get")
+    @patch("tools.utils._async_http.requests.get")
     @patch("tools.research.policy_search.config.CONGRESS_GOV", {"enabled": True, "endpoint": "https://api.congress.gov/v3/bill", "timeout": 15, "api_key": "test-dummy-key"})
     def test_policy_queries_are_sanitized(self, mock_get):
         mock_get.return_value = _mock_response({"bills": []})
@@ -313,7 +313,7 @@ class TestPolicySearchRaw(unittest.TestCase):
         self.assertNotIn("|", sent)
         self.assertNotIn("scope:", sent.lower())
 
-    @patch("tools.research.policy_search.requests.get")
+    @patch("tools.utils._async_http.requests.get")
     def test_govtrack_raw_parsing(self, mock_get):
         mock_get.return_value = _mock_response(self.GOVTRACK_RESPONSE)
         from tools.research.policy_search import _govtrack_search_raw
@@ -323,7 +323,7 @@ class TestPolicySearchRaw(unittest.TestCase):
         self.assertEqual(results[0]["title"], "Federal Carbon Tax Act")
         self.assertEqual(results[0]["source"], "GovTrack")
 
-    @patch("tools.research.policy_search.requests.get")
+    @patch("tools.utils._async_http.requests.get")
     def test_federal_register_raw_parsing(self, mock_get):
         mock_get.return_value = _mock_response(self.FEDERAL_REGISTER_RESPONSE)
         from tools.research.policy_search import _federal_register_search_raw
@@ -333,7 +333,7 @@ class TestPolicySearchRaw(unittest.TestCase):
         self.assertEqual(results[0]["title"], "EPA Clean Air Rule")
         self.assertEqual(results[0]["source"], "FederalRegister")
 
-    @patch("tools.research.policy_search.requests.get")
+    @patch("tools.utils._async_http.requests.get")
     def test_policy_sources_conversion(self, mock_get):
         # Return different data per call: congress, govtrack, federal register
         mock_get.side_effect = [
@@ -371,7 +371,7 @@ class TestSECEdgarRaw(unittest.TestCase):
         }
     }
 
-    @patch("tools.research.sec_search.requests.get")
+    @patch("tools.utils._async_http.requests.get")
     def test_sec_raw_parsing(self, mock_get):
         mock_get.return_value = _mock_response(self.SAMPLE_RESPONSE)
         from tools.research.sec_search import _sec_edgar_search_raw
@@ -381,7 +381,7 @@ class TestSECEdgarRaw(unittest.TestCase):
         self.assertIn("Tesla", results[0]["title"])
         self.assertEqual(results[0]["source"], "SEC_EDGAR")
 
-    @patch("tools.research.sec_search.requests.get")
+    @patch("tools.utils._async_http.requests.get")
     def test_sec_query_is_sanitized(self, mock_get):
         mock_get.return_value = _mock_response({"hits": {"hits": []}})
         from tools.research.sec_search import _sec_edgar_search_raw
@@ -392,7 +392,7 @@ class TestSECEdgarRaw(unittest.TestCase):
         self.assertNotIn("|", sent)
         self.assertNotIn("scope:", sent.lower())
 
-    @patch("tools.research.sec_search.requests.get")
+    @patch("tools.utils._async_http.requests.get")
     def test_sec_sources_conversion(self, mock_get):
         mock_get.return_value = _mock_response(self.SAMPLE_RESPONSE)
         from tools.research.sec_search import sec_search_sources
@@ -487,6 +487,79 @@ class TestAggregatorChannels(unittest.TestCase):
         sec_mock.assert_not_called()
 
 
+class TestAggregatorChannelDeadlines(unittest.TestCase):
+    @patch("workflows.deep_research.aggregator.worldbank_search_sources", return_value=[])
+    @patch("workflows.deep_research.aggregator.academic_search_sources", return_value=[])
+    @patch("workflows.deep_research.aggregator.fetch_newsroom_api", return_value=[])
+    @patch("workflows.deep_research.aggregator.web_search_sources")
+    def test_hung_channel_returns_partial_results(self, mock_web, *mocks):
+        import threading
+        import time
+        from workflows.deep_research.aggregator import aggregate_sources
+
+        release = threading.Event()
+
+        def hung_web(query, max_results=10):
+            release.wait(5)
+            return [Source(source_id="late", url="https://late.example", title="Late")]
+
+        mock_web.side_effect = hung_web
+        mocks[1].return_value = [
+            Source(source_id="a1", url="https://openalex.org/W1", title="Solar paper")
+        ]
+        try:
+            started = time.monotonic()
+            result = aggregate_sources(
+                "solar energy efficiency",
+                max_results_per_source=5,
+                channel_timeouts={"web": 0.2},
+            )
+            elapsed = time.monotonic() - started
+        finally:
+            release.set()
+
+        self.assertLess(elapsed, 2.0)
+        self.assertEqual([s.source_id for s in result], ["a1"])
+        self.assertEqual(result.timed_out_channels, ["web"])
+        self.assertEqual(result.channel_counts.get("academic"), 1)
+        self.assertNotIn("web", result.channel_counts)
+
+    @patch("workflows.deep_research.aggregator.worldbank_search_sources", return_value=[])
+    @patch("workflows.deep_research.aggregator.web_search_sources", return_value=[])
+    @patch("workflows.deep_research.aggregator.academic_search_sources", return_value=[])
+    @patch("workflows.deep_research.aggregator.fetch_newsroom_api", return_value=[])
+    def test_no_timeouts_when_channels_finish(self, *mocks):
+        from workflows.deep_research.aggregator import aggregate_sources
+
+        result = aggregate_sources("solar energy efficiency", max_results_per_source=5)
+        self.assertIsInstance(result, list)
+        self.assertEqual(result.timed_out_channels, [])
+        self.assertEqual(
+            set(result.channel_counts), {"academic", "web", "newsroom", "world_bank"}
+        )
+
+    @patch("workflows.deep_research.aggregator.worldbank_search_sources", return_value=[])
+    @patch("workflows.deep_research.aggregator.web_search_sources")
+    @patch("workflows.deep_research.aggregator.academic_search_sources")
+    @patch("workflows.deep_research.aggregator.fetch_newsroom_api", return_value=[])
+    def test_on_channel_complete_reports_each_nonempty_channel(self, _news, mock_academic, mock_web, _wb):
+        from workflows.deep_research.aggregator import aggregate_sources
+
+        mock_academic.return_value = [Source(source_id="a1", url="https://openalex.org/W1", title="Paper")]
+        mock_web.return_value = [Source(source_id="w1", url="https://example.com/w", title="Web")]
+        completed = []
+
+        aggregate_sources(
+            "solar energy efficiency",
+            max_results_per_source=5,
+            on_channel_complete=lambda channel, sources: completed.append(
+                (channel, [s.source_id for s in sources])
+            ),
+        )
+
+        self.assertEqual(sorted(completed), [("academic", ["a1"]), ("web", ["w1"])])
+
+
 # ---------------------------------------------------------------------------
 # Credibility baselines for new domains
 # ---------------------------------------------------------------------------
@@ -0,0 +1,137 @@
+"""Tests for the cross-encoder singleton and persistent rerank score cache."""
+
+import threading
+import time
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock, patch
+
+from engine.models import Source
+from tools.utils._rerank_cache import RerankScoreCache, query_hash
+from workflows.deep_research import reranker
+
+
+def _source(n: int) -> Source:
+    url = f"https://example.com/{n}"
+    return Source(
+        source_id=Source.generate_id(url),
+        url=url,
+        title=f"Result {n}",
+        source_type="web",
+        content_snippet=f"snippet {n}",
+    )
+
+
+class _FakeModel:
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, pairs, batch_size=32):
+        self.calls.append((list(pairs), batch_size))
+        return [float(len(passage)) + i for i, (_, passage) in enumerate(pairs)]
+
+
+class TestRerankScoreCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.db_path = str(Path(self._tmp.name) / "rerank_cache.db")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_roundtrip_and_stats(self):
+        cache = RerankScoreCache(db_path=self.db_path)
+        qhash = query_hash("model", "solar tariffs")
+        self.assertEqual(cache.get_many(qhash, ["a", "b"]), {})
+        cache.set_many(qhash, {"a": 0.5, "b": -1.25})
+
+        self.assertEqual(cache.get_many(qhash, ["a", "b", "c"]), {"a": 0.5, "b": -1.25})
+        stats = cache.stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 3)
+
+    def test_query_hash_is_model_scoped_and_whitespace_insensitive(self):
+        self.assertEqual(query_hash("m", "Solar  Tariffs"), query_hash("m", "solar tariffs"))
+        self.assertNotEqual(query_hash("m1", "solar"), query_hash("m2", "solar"))
+
+    def test_expired_scores_are_misses(self):
+        cache = RerankScoreCache(db_path=self.db_path, ttl_seconds=60)
+        cache.set_many("q", {"a": 1.0})
+        with patch("tools.utils._rerank_cache.time.time", return_value=time.time() + 120):
+            self.assertEqual(cache.get_many("q", ["a"]), {})
+
+    def test_eviction_respects_max_entries(self):
+        cache = RerankScoreCache(db_path=self.db_path, max_entries=2)
+        cache.set_many("q", {"a": 1.0, "b": 2.0, "c": 3.0})
+        self.assertEqual(cache.stats()["entries"], 2)
+
+
+class TestCrossEncoderScoring(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.cache = RerankScoreCache(db_path=str(Path(self._tmp.name) / "rerank.db"))
+        self.model = _FakeModel()
+        patches = [
+            patch.object(reranker, "_get_cross_encoder", return_value=self.model),
+            patch.object(reranker, "get_rerank_cache", return_value=self.cache),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_scores_batched_and_reused_across_runs(self):
+        sources = [_source(1), _source(22), _source(333)]
+        ranked = reranker._cross_encoder_score("solar", list(sources))
+        self.assertEqual(len(self.model.calls), 1)
+        self.assertEqual(len(self.model.calls[0][0]), 3)
+        first_scores = {s.source_id: s.relevance_score for s in ranked}
+        self.assertEqual(ranked[0].relevance_score, max(first_scores.values()))
+
+        # Follow-up run: cached sources skip inference, only the new one is scored.
+        rerun = [_source(1), _source(22), _source(333), _source(4)]
+        reranker._cross_encoder_score("solar", rerun)
+        self.assertEqual(len(self.model.calls), 2)
+        self.assertEqual([p for _, p in self.model.calls[1][0]], ["Result 4 snippet 4"])
+        for s in rerun[:3]:
+            self.assertEqual(s.relevance_score, first_scores[s.source_id])
+
+    def test_duplicate_source_ids_scored_once(self):
+        sources = [_source(1), _source(1)]
+        reranker._cross_encoder_score("solar", sources)
+        self.assertEqual(len(self.model.calls[0][0]), 1)
+        self.assertEqual(sources[0].relevance_score, sources[1].relevance_score)
+
+    def test_runs_without_cache(self):
+        with patch.object(reranker, "get_rerank_cache", return_value=None):
+            ranked = reranker._cross_encoder_score("solar", [_source(1), _source(2)])
+        self.assertEqual(len(ranked), 2)
+        self.assertEqual(len(self.model.calls), 1)
+
+
+class TestCrossEncoderSingleton(unittest.TestCase):
+    def test_model_loaded_once_across_threads(self):
+        fake_module = MagicMock()
+        fake_module.CrossEncoder.return_value = _FakeModel()
+        with patch.dict("sys.modules", {"sentence_transformers": fake_module}), \
+                patch.object(reranker, "_CROSS_ENCODER", None):
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(reranker._get_cross_encoder()))
+                for _ in range(8)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        fake_module.CrossEncoder.assert_called_once()
+        self.assertTrue(all(r is results[0] for r in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,250 @@
+"""Tests for coalescing, reuse and incremental refresh of stored research runs."""
+
+import importlib
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from engine.models import Finding, ResearchState, Source
+from engine.research_jobs import ResearchJobRegistry, research_job_key
+from engine.storage import LocalStorage
+
+
+def _state(query="Zambia solar tariffs", depth=1):
+    state = ResearchState(original_query=query, max_depth=depth, research_type="trend_analysis")
+    src = Source(
+        source_id="s1",
+        url="https://example.com/a",
+        title="Tariff review",
+        credibility_score=0.7,
+        relevance_score=0.5,
+        content_snippet="snippet",
+    )
+    state.add_source(src)
+    state.findings = [Finding(claim="Tariffs rose", sources=["s1"], confidence="medium", average_credibility=0.7)]
+    state.synthesis = "Tariffs rose [1]."
+    state.completed_at = datetime.now()
+    return state
+
+
+def test_job_key_normalizes_query_but_separates_depth_and_mode():
+    base = research_job_key("Zambia solar tariffs?", 1, research_type="trend_analysis")
+    assert base == research_job_key("  zambia   SOLAR tariffs ", 1, research_type="Trend_Analysis")
+    assert base != research_job_key("zambia solar tariffs", 2, research_type="trend_analysis")
+    assert base != research_job_key("zambia solar tariffs", 1, research_type="comparative")
+    assert base != research_job_key(
+        "zambia solar tariffs", 1, research_type="trend_analysis", asset_metadata={"name": "X"}
+    )
+
+
+def test_job_key_is_scoped_to_the_users_who_may_see_the_run():
+    alice = research_job_key("Zambia solar tariffs", 1, owner_ids=["alice"])
+    assert alice != research_job_key("Zambia solar tariffs", 1, owner_ids=["bob"])
+    assert alice != research_job_key("Zambia solar tariffs", 1)
+    team = research_job_key("Zambia solar tariffs", 1, owner_ids=["alice", "bob"])
+    assert team == research_job_key("Zambia solar tariffs", 1, owner_ids=["bob", "alice"])
+
+
+def test_registry_attaches_duplicates_to_leader_until_finished():
+    registry = ResearchJobRegistry()
+    assert registry.attach("k", "r1", user_id="u1") is None
+    assert registry.attach("k", "r2", user_id="u2") == "r1"
+    assert [p.research_id for p in registry.participants("k")] == ["r1", "r2"]
+
+    finished = registry.finish("k")
+    assert [(p.research_id, p.user_id) for p in finished] == [("r1", "u1"), ("r2", "u2")]
+    assert registry.attach("k", "r3") is None
+    assert registry.stats()["coalesced_total"] == 1
+
+
+def test_registry_elects_single_leader_under_contention():
+    registry = ResearchJobRegistry()
+    leaders = []
+    barrier = threading.Barrier(16)
+
+    def attach(i):
+        barrier.wait()
+        if registry.attach("k", f"r{i}") is None:
+            leaders.append(i)
+
+    threads = [threading.Thread(target=attach, args=(i,)) for i in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(leaders) == 1
+    assert len(registry.participants("k")) == 16
+
+
+def test_research_state_from_dict_roundtrip():
+    state = _state()
+    restored = ResearchState.from_dict(state.to_dict())
+    assert restored.original_query == state.original_query
+    assert restored.research_type == "trend_analysis"
+    assert restored.max_depth == 1
+    assert [s.source_id for s in restored.sources_checked] == ["s1"]
+    assert restored.sources_checked[0].relevance_score == 0.5
+    assert restored.findings[0].claim == "Tariffs rose"
+    assert restored.completed_at == state.completed_at
+    assert restored.total_sources == 1
+
+
+def test_storage_finds_recent_research_by_job_key(tmp_path):
+    storage = LocalStorage(db_path=tmp_path / "zorora.db")
+    state = _state()
+    state.job_key = "key-1"
+    research_id = storage.save_research(state)
+
+    assert storage.find_recent_research("key-1", 60)["research_id"] == research_id
+    assert storage.find_recent_research("key-2", 60) is None
+    assert storage.find_recent_research("key-1", 0) is None
+
+    with patch("engine.storage.datetime") as mock_dt:
+        mock_dt.now.return_value = datetime.now() + timedelta(seconds=120)
+        assert storage.find_recent_research("key-1", 60) is None
+    storage.close()
+
+
+def test_storage_recent_research_lookup_is_limited_to_accessible_users(tmp_path):
+    storage = LocalStorage(db_path=tmp_path / "zorora.db")
+    state = _state()
+    state.job_key = "key-1"
+    state.user_id = "alice"
+    research_id = storage.save_research(state)
+
+    assert storage.find_recent_research("key-1", 60, user_ids=["bob"]) is None
+    assert storage.find_recent_research("key-1", 60) is None
+    assert storage.find_recent_research("key-1", 60, user_ids=["bob", "alice"])["research_id"] == research_id
+    storage.close()
+
+
+def test_storage_disambiguates_same_second_research_ids(tmp_path):
+    storage = LocalStorage(db_path=tmp_path / "zorora.db")
+    state = _state()
+    first = storage.save_research(state)
+    state.user_id = "other-user"
+    second = storage.save_research(state)
+    assert first != second
+    assert storage.load_research(second, user_id="other-user")["original_query"] == state.original_query
+    storage.close()
+
+
+class TestResearchEndpointCoalescing:
+    @pytest.fixture
+    def web_app(self, tmp_path):
+        mod = importlib.import_module("ui.web.app")
+        storage = LocalStorage(db_path=tmp_path / "zorora.db")
+        settings = {**mod.config.DEEP_RESEARCH, "coalescing": {"enabled": True, "reuse_window_seconds": 600}}
+        with patch.object(mod.research_engine, "storage", storage), \
+                patch.object(mod, "research_jobs", ResearchJobRegistry()), \
+                patch.object(mod.config, "DEEP_RESEARCH", settings):
+            yield mod
+        storage.close()
+
+    def test_concurrent_duplicates_share_one_pipeline_run(self, web_app):
+        client = web_app.app.test_client()
+        release = threading.Event()
+        calls = []
+
+        def fake_pipeline(**kwargs):
+            calls.append(kwargs["query"])
+            kwargs["progress_callback"]("running", "aggregation", "Searching...")
+            release.wait(5)
+            return _state(query=kwargs["query"])
+
+        threads = []
+        real_thread = threading.Thread
+
+        def capture_thread(*args, **kwargs):
+            t = real_thread(*args, **kwargs)
+            threads.append(t)
+            return t
+
+        with patch.object(web_app, "run_deep_research", side_effect=fake_pipeline), \
+                patch.object(web_app.threading, "Thread", side_effect=capture_thread):
+            first = client.post("/api/research", json={"query": "Coalesce me please", "depth": 1}).get_json()
+            second = client.post("/api/research", json={"query": "coalesce  me please?", "depth": 1}).get_json()
+            release.set()
+            for t in threads:
+                t.join(5)
+
+        assert len(calls) == 1
+        assert second["coalesced_with"] == first["research_id"]
+        for rid in (first["research_id"], second["research_id"]):
+            progress = web_app.research_progress[rid]
+            assert progress["status"] == "completed"
+            assert progress["results"]["total_sources"] == 1
+        assert web_app.research_jobs.stats()["in_flight"] == 0
+
+    def test_recent_completed_research_is_reused(self, web_app):
+        client = web_app.app.test_client()
+        state = _state(query="Reuse me")
+        state.job_key = research_job_key("Reuse me", 1, research_type="trend_analysis")
+        web_app.research_engine.storage.save_research(state)
+
+        with patch.object(web_app, "run_deep_research") as pipeline:
+            body = client.post(
+                "/api/research",
+                json={"query": "reuse me", "depth": 1, "research_type": "trend_analysis"},
+            ).get_json()
+
+        pipeline.assert_not_called()
+        assert body["reused"] is True
+        progress = web_app.research_progress[body["research_id"]]
+        assert progress["status"] == "completed"
+        assert progress["results"]["synthesis"] == "Tariffs rose [1]."
+
+
+    def test_another_users_research_is_not_reused(self, web_app):
+        state = _state(query="Private query")
+        state.user_id = "alice"
+        state.job_key = research_job_key("Private query", 1, owner_ids=["alice"])
+        web_app.research_engine.storage.save_research(state)
+
+        # Even a colliding key must not hand bob alice's run.
+        assert not web_app._reuse_recent_research("r-bob", state.job_key, "Private query", 1,
+                                                  user_id="bob", user_ids=["bob"])
+        assert "r-bob" not in web_app.research_progress
+        assert web_app.research_engine.storage.search_research(user_id="bob") == []
+
+        # A teammate may reuse it and gets their own copy.
+        assert web_app._reuse_recent_research("r-team", state.job_key, "Private query", 1,
+                                              user_id="bob", user_ids=["bob", "alice"])
+        assert len(web_app.research_engine.storage.search_research(user_id="bob")) == 1
+
+
+class TestResearchRefreshEndpoint:
+    @pytest.fixture
+    def web_app(self, tmp_path):
+        mod = importlib.import_module("ui.web.app")
+        storage = LocalStorage(db_path=tmp_path / "zorora.db")
+        with patch.object(mod.research_engine, "storage", storage):
+            yield mod
+        storage.close()
+
+    def test_refresh_runs_incremental_pipeline_and_saves_new_entry(self, web_app):
+        client = web_app.app.test_client()
+        stored_id = web_app.research_engine.storage.save_research(_state(query="Refresh me"))
+        refreshed = _state(query="Refresh me")
+        summary = {"new_sources": 2, "regenerated_sections": ["Storage"], "full_synthesis": False}
+
+        with patch.object(web_app, "refresh_deep_research", return_value=(refreshed, summary)) as refresh, \
+                patch.object(web_app.threading, "Thread") as thread_cls:
+            body = client.post(f"/api/research/{stored_id}/refresh").get_json()
+            target = thread_cls.call_args.kwargs["target"]
+            target(*thread_cls.call_args.kwargs["args"], **thread_cls.call_args.kwargs["kwargs"])
+
+        assert body["refreshed_from"] == stored_id
+        prior = refresh.call_args[0][0]
+        assert prior.original_query == "Refresh me"
+        assert [s.source_id for s in prior.sources_checked] == ["s1"]
+        progress = web_app.research_progress[body["research_id"]]
+        assert progress["status"] == "completed"
+        assert progress["results"]["refresh"] == summary
+        assert progress["results"]["research_id"] != stored_id
+
+    def test_refresh_unknown_research_returns_404(self, web_app):
+        client = web_app.app.test_client()
+        assert client.post("/api/research/does-not-exist/refresh").status_code == 404
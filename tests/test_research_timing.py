@@ -0,0 +1,161 @@
+"""Tests for per-stage research timing spans, persistence and the timings API."""
+
+import importlib
+import threading
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from engine.models import ResearchState, Source
+from engine.research_timing import ResearchTrace, activate, current_trace, stage, traced_research
+from engine.storage import LocalStorage
+from workflows.deep_research.aggregator import AggregatedSources
+
+
+def _source(name):
+    url = f"https://example.com/{name}"
+    src = Source(source_id=Source.generate_id(url), url=url, title=f"Solar tariffs {name}", content_snippet="solar tariffs")
+    src.relevance_score = 0.8
+    return src
+
+
+def test_stage_is_noop_without_active_trace():
+    with stage("relevance", items=3) as span:
+        span.items = 4
+    assert current_trace() is None
+
+
+def test_trace_records_nested_spans_and_totals():
+    trace = ResearchTrace()
+    with activate(trace):
+        with stage("relevance", items=2, intent=1):
+            pass
+        with stage("relevance", items=1, intent=2) as span:
+            span.meta["fallback"] = True
+        trace.record("aggregation.channel", 12.5, items=4, channel="web")
+    assert current_trace() is None
+
+    spans = trace.to_list()
+    assert [s["stage"] for s in spans].count("relevance") == 2
+    fallback = [s for s in spans if s["meta"].get("fallback")]
+    assert fallback[0]["meta"] == {"intent": 2, "fallback": True}
+    totals = trace.totals()
+    assert totals["aggregation.channel"] == 12.5
+    assert set(totals) == {"relevance", "aggregation.channel"}
+
+
+def test_failed_stage_is_recorded_with_error_flag():
+    trace = ResearchTrace()
+    with activate(trace), pytest.raises(RuntimeError):
+        with stage("clustering"):
+            raise RuntimeError("boom")
+    assert trace.to_list()[0]["meta"] == {"error": True}
+
+
+def test_traced_research_attaches_trace_to_tuple_results():
+    @traced_research
+    def run():
+        with stage("decomposition", items=1):
+            pass
+        return ResearchState(original_query="q"), {"new_sources": 0}
+
+    state, _ = run()
+    assert [s["stage"] for s in state.timings.to_list()] == ["decomposition"]
+
+
+def test_concurrent_runs_keep_separate_traces():
+    @traced_research
+    def run(name):
+        with stage(name):
+            pass
+        return ResearchState(original_query=name)
+
+    results = {}
+    threads = [threading.Thread(target=lambda n=n: results.__setitem__(n, run(n))) for n in ("a", "b", "c")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for name, state in results.items():
+        assert [s["stage"] for s in state.timings.to_list()] == [name]
+
+
+@patch("engine.deep_research_service._build_market_context_for_query", return_value=("", {}))
+@patch("engine.deep_research_service.synthesize", return_value="Test synthesis")
+@patch("engine.deep_research_service._cluster_findings", return_value=[])
+@patch("engine.deep_research_service.filter_relevant", side_effect=lambda srcs, **kw: srcs)
+@patch("engine.deep_research_service.score_relevance", side_effect=lambda q, srcs, **kw: srcs)
+@patch("engine.deep_research_service.score_source_credibility", return_value={"score": 0.6, "category": "Standard"})
+@patch("engine.deep_research_service._count_cross_references_batch", side_effect=lambda srcs: [1] * len(srcs))
+@patch("engine.deep_research_service.aggregate_sources")
+@patch("engine.deep_research_service._generate_query_variants", side_effect=lambda q, n: [q])
+@patch("engine.deep_research_service.decompose_query")
+def test_run_deep_research_records_pipeline_stages(mock_decompose, mock_variants, mock_agg, *_):
+    from engine.deep_research_service import run_deep_research
+    from engine.query_refiner import SearchIntent
+
+    mock_decompose.return_value = [SearchIntent(intent_query="solar tariffs", parent_query="q", is_primary=True)]
+    mock_agg.return_value = AggregatedSources(
+        [_source("a"), _source("b")],
+        timed_out_channels=["web"],
+        channel_counts={"academic": 2},
+        channel_durations={"academic": 40.0, "web": 3000.0},
+    )
+
+    state = run_deep_research("solar tariffs", depth=1)
+
+    spans = state.timings.to_list()
+    stages = {s["stage"] for s in spans}
+    assert {
+        "decomposition", "query_variants", "aggregation", "aggregation.channel",
+        "dedupe", "relevance", "credibility", "market_context", "clustering", "synthesis",
+    } <= stages
+    channels = {s["meta"]["channel"]: s for s in spans if s["stage"] == "aggregation.channel"}
+    assert channels["academic"]["items"] == 2
+    assert channels["academic"]["duration_ms"] == 40.0
+    assert channels["web"]["meta"]["timed_out"] is True
+    assert next(s for s in spans if s["stage"] == "credibility")["items"] == 2
+
+
+def test_storage_roundtrips_timings_with_ownership(tmp_path):
+    storage = LocalStorage(db_path=tmp_path / "zorora.db")
+    state = ResearchState(original_query="timed run")
+    state.completed_at = datetime.now()
+    state.user_id = "u1"
+    state.timings = ResearchTrace()
+    state.timings.record("outline", 5.0, items=3, start_ms=1.0)
+    state.timings.record("section_expansion", 7.5, items=2, start_ms=6.0, section=1)
+    research_id = storage.save_research(state)
+
+    spans = storage.get_timings(research_id, user_id="u1")
+    assert [(s["stage"], s["items"]) for s in spans] == [("outline", 3), ("section_expansion", 2)]
+    assert spans[1]["meta"] == {"section": 1}
+    assert storage.get_timings(research_id, user_id="u2") is None
+
+    untimed = ResearchState(original_query="untimed run")
+    untimed.user_id = "u1"
+    assert storage.get_timings(storage.save_research(untimed), user_id="u1") == []
+    storage.close()
+
+
+def test_timings_endpoint_returns_spans_and_stage_totals(tmp_path):
+    web_app = importlib.import_module("ui.web.app")
+    storage = LocalStorage(db_path=tmp_path / "zorora.db")
+    state = ResearchState(original_query="timed endpoint run")
+    state.timings = ResearchTrace()
+    state.timings.record("relevance", 10.0, items=4, start_ms=0.0, intent=1)
+    state.timings.record("relevance", 5.0, items=2, start_ms=10.0, intent=2)
+    state.timings.record("synthesis", 30.0, items=6, start_ms=15.0)
+
+    with patch.object(web_app.research_engine, "storage", storage):
+        research_id = storage.save_research(state)
+        client = web_app.app.test_client()
+        body = client.get(f"/api/research/{research_id}/timings").get_json()
+        missing = client.get("/api/research/unknown/timings")
+    storage.close()
+
+    assert len(body["spans"]) == 3
+    assert body["stages"]["relevance"] == {"count": 2, "duration_ms": 15.0, "items": 6}
+    assert body["wall_ms"] == 45.0
+    assert missing.status_code == 404
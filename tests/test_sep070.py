@@ -110,8 +110,10 @@ class TestBuildMarketContextForQueryForceParam:
                 return_value=fake_context,
             ),
         ):
+            from workflows.market_workflow import MarketSnapshot
+
             mock_wf = mock_wf_cls.return_value
-            mock_wf.compute_summary.return_value = {"oil": 75.0}
+            mock_wf.read_summary_snapshot.return_value = MarketSnapshot(summaries={"oil": {"current": 75.0}})
 
             result = fn("Southern Africa renewable opportunity", force=True)
 
@@ -153,7 +155,7 @@ class TestBuildMarketContextForQueryForceParam:
         )
 
     def test_force_true_calls_market_workflow(self):
-        """When force=True, the market workflow must be invoked even without intent."""
+        """When force=True, the market snapshot must be read even without intent."""
         fn = self._import_fn()
 
         with (
@@ -167,20 +169,21 @@ class TestBuildMarketContextForQueryForceParam:
                 return_value="ctx",
             ),
         ):
+            from workflows.market_workflow import MarketSnapshot
+
             mock_wf = mock_wf_cls.return_value
-            mock_wf.compute_summary.return_value = {"oil": 75.0}
+            mock_wf.read_summary_snapshot.return_value = MarketSnapshot(summaries={"oil": {"current": 75.0}})
 
             fn("Southern Africa renewable opportunity", force=True)
 
-            mock_wf.update_all.assert_called_once(), (
-                "MarketWorkflow.update_all() must be called when force=True."
-            )
-            mock_wf.compute_summary.assert_called_once(), (
-                "MarketWorkflow.compute_summary() must be called when force=True."
+            mock_wf.read_summary_snapshot.assert_called_once(), (
+                "The market summary snapshot must be read when force=True."
             )
+            # Synthesis reads the background-maintained snapshot; providers are never refreshed inline.
+            mock_wf.update_all.assert_not_called()
 
     def test_force_true_with_empty_summary_returns_empty(self):
-        """If compute_summary returns nothing, force=True still returns '' gracefully."""
+        """If the market snapshot is empty, force=True still returns '' gracefully."""
         fn = self._import_fn()
 
         with (
@@ -194,14 +197,16 @@ class TestBuildMarketContextForQueryForceParam:
                 return_value="",
             ),
         ):
+            from workflows.market_workflow import MarketSnapshot
+
             mock_wf = mock_wf_cls.return_value
-            mock_wf.compute_summary.return_value = {}
+            mock_wf.read_summary_snapshot.return_value = MarketSnapshot(summaries={})
 
             result = fn("some query", force=True)
 
         # Either "" or the result of build_market_context("") — both falsy is fine.
         assert result == "", (
-            "When compute_summary returns nothing, force=True must still return '' "
+            "When the market snapshot is empty, force=True must still return '' "
             "without raising an exception."
         )
 
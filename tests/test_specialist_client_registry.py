@@ -0,0 +1,99 @@
+"""Tests for the shared specialist client registry."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+import config
+from tools.specialist.client import (
+    create_specialist_client,
+    invalidate_specialist_clients,
+    specialist_client_stats,
+)
+
+MODEL_CONFIG = {"model": "m", "max_tokens": 64, "temperature": 0.1, "timeout": 5}
+
+
+def _response(text):
+    return {"choices": [{"message": {"role": "assistant", "content": text}, "finish_reason": "stop"}]}
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch):
+    monkeypatch.setattr(config, "MODEL_ENDPOINTS", {"reasoning": "local", "search": "local"}, raising=False)
+    invalidate_specialist_clients()
+    yield
+    invalidate_specialist_clients()
+
+
+def test_same_role_and_settings_share_one_client():
+    before = specialist_client_stats()
+    first = create_specialist_client("reasoning", MODEL_CONFIG)
+
+    assert create_specialist_client("reasoning", dict(MODEL_CONFIG)) is first
+    assert create_specialist_client("search", MODEL_CONFIG) is not first
+    assert create_specialist_client("reasoning", {**MODEL_CONFIG, "max_tokens": 128}) is not first
+
+    stats = specialist_client_stats()
+    assert stats["hits"] - before["hits"] == 1
+    assert stats["misses"] - before["misses"] == 3
+    assert len(stats["clients"]) == 3
+
+
+def test_endpoint_changes_build_a_new_client(monkeypatch):
+    first = create_specialist_client("reasoning", MODEL_CONFIG)
+    monkeypatch.setattr(config, "API_URL", "http://other-host:1234/v1/chat/completions")
+
+    second = create_specialist_client("reasoning", MODEL_CONFIG)
+
+    assert second is not first
+    assert second.api_url == "http://other-host:1234/v1/chat/completions"
+
+
+def test_concurrent_callers_get_the_same_client():
+    misses = specialist_client_stats()["misses"]
+    results = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        results.append(create_specialist_client("reasoning", MODEL_CONFIG))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(c) for c in results}) == 1
+    assert specialist_client_stats()["misses"] == misses + 1
+
+
+def test_config_manager_write_invalidates_registry(tmp_path):
+    from ui.web.config_manager import ConfigManager
+
+    first = create_specialist_client("reasoning", MODEL_CONFIG)
+    invalidations = specialist_client_stats()["invalidations"]
+    manager = ConfigManager(config_path=str(tmp_path / "config.py"))
+    with patch.object(manager, "_write_config_file"), patch.object(manager, "_validate_config", return_value=None):
+        assert manager.write_config({"model_endpoints": {"reasoning": "local"}})["success"]
+
+    assert create_specialist_client("reasoning", MODEL_CONFIG) is not first
+    assert specialist_client_stats()["invalidations"] == invalidations + 1
+
+
+def test_calls_record_latency_and_errors():
+    client = create_specialist_client("reasoning", MODEL_CONFIG)
+    with patch("tools.utils._llm_cache.get_llm_cache", return_value=None), patch.object(
+        client.adapter, "chat_complete", side_effect=[_response("ok"), RuntimeError("boom")]
+    ):
+        client.chat_complete([{"role": "user", "content": "hi"}])
+        with pytest.raises(RuntimeError):
+            client.chat_complete([{"role": "user", "content": "hi"}])
+
+    (entry,) = specialist_client_stats()["clients"]
+    assert entry["role"] == "reasoning" and entry["endpoint"] == "local"
+    assert (entry["calls"], entry["errors"]) == (2, 1)
+    assert entry["max_latency_ms"] >= entry["avg_latency_ms"] >= 0
+    assert "endpoints" in specialist_client_stats()["pools"]
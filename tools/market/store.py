@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import shutil
 import sqlite3
@@ -86,6 +87,13 @@ class MarketDataStore:
                 PRIMARY KEY (provider, series_id)
             )
         """)
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS summary_snapshot (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                summaries TEXT NOT NULL,
+                computed_at TEXT NOT NULL
+            )
+        """)
         conn.commit()
 
     def _migrate_schema(self):
@@ -160,8 +168,36 @@ class MarketDataStore:
         conn.commit()
         logger.debug("Upserted %d obs for %s/%s (last=%s)", len(observations), provider, series_id, last_date)
 
+    def save_summary_snapshot(self, summaries: Dict[str, dict]) -> str:
+        """Replace the precomputed per-series summary snapshot; returns its timestamp."""
+        computed_at = datetime.now(timezone.utc).isoformat()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO summary_snapshot (id, summaries, computed_at) VALUES (1, ?, ?)",
+            (json.dumps(summaries, default=float), computed_at),
+        )
+        self.conn.commit()
+        return computed_at
+
     # -- reads ----------------------------------------------------------------
 
+    def get_summary_snapshot(self) -> Optional[dict]:
+        """Return ``{summaries, computed_at, data_fetched_at}`` or None if never computed.
+
+        ``data_fetched_at`` is the most recent provider fetch across all series.
+        """
+        cur = self.conn.cursor()
+        cur.execute("SELECT summaries, computed_at FROM summary_snapshot WHERE id = 1")
+        row = cur.fetchone()
+        if not row:
+            return None
+        cur.execute("SELECT MAX(last_fetched_at) AS fetched FROM fetch_metadata")
+        fetched = cur.fetchone()
+        return {
+            "summaries": json.loads(row["summaries"]),
+            "computed_at": row["computed_at"],
+            "data_fetched_at": fetched["fetched"] if fetched else None,
+        }
+
     def get_last_observation_date(self, series_id: str, provider: str = "fred") -> Optional[str]:
         """Return the most recent observation date stored, or None."""
         cur = self.conn.cursor()
@@ -1,5 +1,6 @@
 """Academic search tool - searches 7 academic sources in parallel."""
 
+import asyncio
 import logging
 import re
 from typing import List, Dict, Any, Optional
@@ -13,6 +14,15 @@ import threading
 import requests
 import config
 from engine.models import Source
+from tools.utils._async_http import (
+    HTTPRequest,
+    Pause,
+    async_variant,
+    blocking_lane,
+    drive_async,
+    drive_sync,
+    run_blocking,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +56,7 @@ _PROVIDER_DEFAULT_BACKOFF = {
 }
 _PROVIDER_STATE_LOCK = threading.Lock()
 _PROVIDER_COOLDOWN_UNTIL: Dict[str, float] = {}
+_SCIHUB_MAX_CONCURRENT_CHECKS = 10
 
 
 def _sanitize_provider_query(raw_query: str, provider: str) -> str:
@@ -85,16 +96,6 @@ def _sanitize_provider_query(raw_query: str, provider: str) -> str:
     return normalized
 
 
-def _respect_provider_cooldown(provider: str) -> None:
-    """Sleep only if provider is currently in cooldown due to prior 429."""
-    with _PROVIDER_STATE_LOCK:
-        now = time.monotonic()
-        until = _PROVIDER_COOLDOWN_UNTIL.get(provider, 0.0)
-        wait = max(0.0, until - now)
-    if wait > 0:
-        time.sleep(wait)
-
-
 def _provider_cooldown_remaining(provider: str) -> float:
     with _PROVIDER_STATE_LOCK:
         now = time.monotonic()
@@ -253,9 +254,9 @@ def _pubmed_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]
     return results
 
 
-def _core_api_search(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+def _core_api_search_plan(query: str, max_results: int = 5):
     """
-    Search CORE API for open access academic papers.
+    Search CORE API for open access academic papers (request plan, see ``_async_http``).
     
     Args:
         query: Search query
@@ -286,8 +287,10 @@ def _core_api_search(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
     }
 
     try:
-        _respect_provider_cooldown("core")
-        response = requests.get(endpoint, headers=headers, params=params, timeout=10)
+        wait = _provider_cooldown_remaining("core")
+        if wait > 0:
+            yield Pause(wait)
+        response = yield HTTPRequest(endpoint, params=params, headers=headers, timeout=10)
         if response.status_code == 429:
             delay = _parse_retry_after_seconds(
                 response, _PROVIDER_DEFAULT_BACKOFF["core"]
@@ -347,8 +350,8 @@ def _core_api_search(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
         return []
 
 
-def _crossref_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
-    """Search CrossRef for academic works with DOIs, abstracts, and citation counts."""
+def _crossref_search_plan(query: str, max_results: int = 5):
+    """Search CrossRef for academic works with DOIs, abstracts, and citation counts (request plan)."""
     crossref_config = getattr(config, 'CROSSREF', {})
     if not crossref_config.get("enabled", True):
         return []
@@ -369,7 +372,7 @@ def _crossref_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any
         params["mailto"] = email
 
     try:
-        response = requests.get(endpoint, params=params, timeout=timeout)
+        response = yield HTTPRequest(endpoint, params=params, timeout=timeout)
         response.raise_for_status()
         data = response.json()
     except Exception as e:
@@ -434,8 +437,8 @@ def _crossref_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any
     return results
 
 
-def _arxiv_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
-    """Search arXiv using the native Atom XML API."""
+def _arxiv_search_plan(query: str, max_results: int = 5):
+    """Search arXiv using the native Atom XML API (request plan)."""
     import xml.etree.ElementTree as ET
 
     arxiv_config = getattr(config, 'ARXIV', {})
@@ -456,7 +459,7 @@ def _arxiv_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
     }
 
     try:
-        response = requests.get(endpoint, params=params, timeout=timeout)
+        response = yield HTTPRequest(endpoint, params=params, timeout=timeout)
         response.raise_for_status()
         root = ET.fromstring(response.text)
     except Exception as e:
@@ -594,8 +597,8 @@ def _reconstruct_abstract(inverted_index: dict) -> str:
     return " ".join(word for _, word in pairs)
 
 
-def _openalex_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
-    """Search OpenAlex for academic works.
+def _openalex_search_plan(query: str, max_results: int = 5):
+    """Search OpenAlex for academic works (request plan, see ``_async_http``).
 
     Uses the polite pool (mailto parameter) for higher rate limits.
     """
@@ -625,8 +628,10 @@ def _openalex_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any
             params["mailto"] = email
 
         try:
-            _respect_provider_cooldown("openalex")
-            response = requests.get(endpoint, params=params, timeout=timeout)
+            wait = _provider_cooldown_remaining("openalex")
+            if wait > 0:
+                yield Pause(wait)
+            response = yield HTTPRequest(endpoint, params=params, timeout=timeout)
             if response.status_code == 400 and attempt == 0:
                 fallback_query = _sanitize_provider_query(active_query, "openalex_fallback")
                 if fallback_query and fallback_query != active_query:
@@ -703,8 +708,8 @@ def _openalex_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any
     return []
 
 
-def _semantic_scholar_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
-    """Search Semantic Scholar for academic papers.
+def _semantic_scholar_search_plan(query: str, max_results: int = 5):
+    """Search Semantic Scholar for academic papers (request plan, see ``_async_http``).
 
     Includes exponential backoff on 429 rate limit responses.
     """
@@ -734,8 +739,10 @@ def _semantic_scholar_search_raw(query: str, max_results: int = 5) -> List[Dict[
     # Provider-specific backoff for rate limiting.
     for attempt in range(3):
         try:
-            _respect_provider_cooldown("semantic_scholar")
-            response = requests.get(endpoint, params=params, headers=headers, timeout=timeout)
+            wait = _provider_cooldown_remaining("semantic_scholar")
+            if wait > 0:
+                yield Pause(wait)
+            response = yield HTTPRequest(endpoint, params=params, headers=headers, timeout=timeout)
             if response.status_code == 400 and attempt == 0:
                 fallback_query = _sanitize_provider_query(active_query, "semantic_scholar_fallback")
                 if fallback_query and fallback_query != active_query:
@@ -808,9 +815,9 @@ def _semantic_scholar_search_raw(query: str, max_results: int = 5) -> List[Dict[
     return []
 
 
-def _check_scihub_availability(doi: Optional[str] = None, title: Optional[str] = None) -> Optional[str]:
+def _check_scihub_availability_plan(doi: Optional[str] = None, title: Optional[str] = None):
     """
-    Check if a paper is available on Sci-Hub and return PDF URL.
+    Check if a paper is available on Sci-Hub and return PDF URL (request plan).
     
     Args:
         doi: DOI of the paper
@@ -838,7 +845,7 @@ def _check_scihub_availability(doi: Optional[str] = None, title: Optional[str] =
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             }
             
-            response = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
+            response = yield HTTPRequest(url, headers=headers, timeout=10, allow_redirects=True)
             
             if response.status_code == 200:
                 try:
@@ -889,6 +896,30 @@ def _check_scihub_availability(doi: Optional[str] = None, title: Optional[str] =
     return None
 
 
+def _core_api_search(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+    return drive_sync(_core_api_search_plan(query, max_results))
+
+
+def _crossref_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+    return drive_sync(_crossref_search_plan(query, max_results))
+
+
+def _arxiv_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+    return drive_sync(_arxiv_search_plan(query, max_results))
+
+
+def _openalex_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+    return drive_sync(_openalex_search_plan(query, max_results))
+
+
+def _semantic_scholar_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+    return drive_sync(_semantic_scholar_search_plan(query, max_results))
+
+
+def _check_scihub_availability(doi: Optional[str] = None, title: Optional[str] = None) -> Optional[str]:
+    return drive_sync(_check_scihub_availability_plan(doi=doi, title=title))
+
+
 def academic_search_sources(query: str, max_results: int = 10) -> List[Source]:
     """
     Search multiple academic sources and return structured Source objects.
@@ -958,18 +989,12 @@ def academic_search_sources(query: str, max_results: int = 10) -> List[Source]:
         title = result.get("title")
 
         if doi or title:
-            scihub_url = _check_scihub_availability(doi=doi, title=title)
-            if scihub_url:
-                result["scihub_url"] = scihub_url
-                result["full_text_available"] = True
-                desc = result.get("description", "")
-                if "[Full Text Available]" not in desc:
-                    result["description"] = f"{desc} [Full Text Available]"
+            _mark_full_text(result, _check_scihub_availability(doi=doi, title=title))
         return result
 
     if all_results:
         try:
-            with ThreadPoolExecutor(max_workers=min(10, len(all_results))) as executor:
+            with ThreadPoolExecutor(max_workers=min(_SCIHUB_MAX_CONCURRENT_CHECKS, len(all_results))) as executor:
                 futures = [executor.submit(check_scihub_for_result, result) for result in all_results]
                 for future in as_completed(futures):
                     try:
@@ -983,6 +1008,80 @@ def academic_search_sources(query: str, max_results: int = 10) -> List[Source]:
             logger.info("Sci-Hub checking interrupted by user")
             raise
 
+    return _academic_results_to_sources(all_results, max_results)
+
+
+@async_variant(academic_search_sources)
+async def academic_search_sources_async(query: str, max_results: int = 10) -> List[Source]:
+    """Async form of ``academic_search_sources``.
+
+    The API providers and Sci-Hub checks share the pooled async HTTP client;
+    only the DuckDuckGo-backed providers still need worker threads, and they
+    share web search's ``duckduckgo`` lane of the blocking pool so calls
+    abandoned at the channel deadline cannot fill it.
+    """
+    logger.info(f"Academic search (async): {query[:100]}...")
+
+    academic_config = getattr(config, 'ACADEMIC_SEARCH', {})
+    academic_max = academic_config.get("default_max_results", 10)
+    max_results = min(max_results, academic_max)
+
+    ddg = blocking_lane("duckduckgo")
+    providers = {
+        "Scholar": run_blocking(_scholar_search_raw, query, max_results // 2, executor=ddg),
+        "PubMed": run_blocking(_pubmed_search_raw, query, max_results // 2, executor=ddg),
+        "CORE": drive_async(_core_api_search_plan(query, max_results // 2)),
+        "arXiv": drive_async(_arxiv_search_plan(query, max_results // 4)),
+        "bioRxiv": run_blocking(_biorxiv_search_raw, query, max_results // 6, executor=ddg),
+        "medRxiv": run_blocking(_medrxiv_search_raw, query, max_results // 6, executor=ddg),
+        "PMC": run_blocking(_pmc_search_raw, query, max_results // 4, executor=ddg),
+        "OpenAlex": drive_async(_openalex_search_plan(query, max_results // 2)),
+        "SemanticScholar": drive_async(_semantic_scholar_search_plan(query, max_results // 2)),
+        "CrossRef": drive_async(_crossref_search_plan(query, max_results // 2)),
+    }
+    outcomes = await asyncio.gather(*providers.values(), return_exceptions=True)
+
+    all_results = []
+    for source, results in zip(providers, outcomes):
+        if isinstance(results, BaseException):
+            logger.warning(f"Academic search: {source} failed: {results}")
+        elif results:
+            all_results.extend(results)
+            logger.info(f"Academic search: {source} returned {len(results)} results")
+
+    if not all_results:
+        return []
+
+    logger.info(f"Checking Sci-Hub availability for {len(all_results)} papers...")
+    checked = [result for result in all_results if result.get("doi") or result.get("title")]
+    scihub_slots = asyncio.Semaphore(_SCIHUB_MAX_CONCURRENT_CHECKS)
+
+    async def check(result: Dict[str, Any]) -> Optional[str]:
+        async with scihub_slots:
+            return await drive_async(
+                _check_scihub_availability_plan(doi=result.get("doi"), title=result.get("title"))
+            )
+
+    scihub_urls = await asyncio.gather(*(check(r) for r in checked), return_exceptions=True)
+    for result, scihub_url in zip(checked, scihub_urls):
+        if not isinstance(scihub_url, BaseException):
+            _mark_full_text(result, scihub_url)
+
+    return _academic_results_to_sources(all_results, max_results)
+
+
+def _mark_full_text(result: Dict[str, Any], scihub_url: Optional[str]) -> None:
+    """Record a Sci-Hub full-text link on a raw result."""
+    if scihub_url:
+        result["scihub_url"] = scihub_url
+        result["full_text_available"] = True
+        desc = result.get("description", "")
+        if "[Full Text Available]" not in desc:
+            result["description"] = f"{desc} [Full Text Available]"
+
+
+def _academic_results_to_sources(all_results: List[Dict[str, Any]], max_results: int) -> List[Source]:
+    """Deduplicate raw provider results and convert them to Source objects."""
     # Deduplicate by title/DOI
     seen = set()
     unique_results = []
@@ -1,19 +1,20 @@
 """Policy search — Congress.gov, GovTrack, and Federal Register APIs."""
 
 import logging
+import asyncio
 from typing import List, Dict, Any
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import requests
 import config
 from engine.models import Source
 from tools.research.academic_search import _sanitize_provider_query
+from tools.utils._async_http import HTTPRequest, async_variant, drive_async, drive_sync
 
 logger = logging.getLogger(__name__)
 
 
-def _congress_gov_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
-    """Search Congress.gov bill API."""
+def _congress_gov_search_plan(query: str, max_results: int = 5):
+    """Search Congress.gov bill API (request plan, see ``_async_http``)."""
     cg_config = getattr(config, 'CONGRESS_GOV', {})
     if not cg_config.get("enabled", True):
         return []
@@ -38,7 +39,7 @@ def _congress_gov_search_raw(query: str, max_results: int = 5) -> List[Dict[str,
     }
 
     try:
-        response = requests.get(endpoint, params=params, timeout=timeout)
+        response = yield HTTPRequest(endpoint, params=params, timeout=timeout)
         response.raise_for_status()
         data = response.json()
 
@@ -74,8 +75,8 @@ def _congress_gov_search_raw(query: str, max_results: int = 5) -> List[Dict[str,
         return []
 
 
-def _govtrack_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
-    """Search GovTrack bill API."""
+def _govtrack_search_plan(query: str, max_results: int = 5):
+    """Search GovTrack bill API (request plan, see ``_async_http``)."""
     gt_config = getattr(config, 'GOVTRACK', {})
     if not gt_config.get("enabled", True):
         return []
@@ -94,7 +95,7 @@ def _govtrack_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any
     }
 
     try:
-        response = requests.get(endpoint, params=params, timeout=timeout)
+        response = yield HTTPRequest(endpoint, params=params, timeout=timeout)
         response.raise_for_status()
         data = response.json()
 
@@ -127,8 +128,8 @@ def _govtrack_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any
         return []
 
 
-def _federal_register_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
-    """Search Federal Register documents API."""
+def _federal_register_search_plan(query: str, max_results: int = 5):
+    """Search Federal Register documents API (request plan, see ``_async_http``)."""
     fr_config = getattr(config, 'FEDERAL_REGISTER', {})
     if not fr_config.get("enabled", True):
         return []
@@ -147,7 +148,7 @@ def _federal_register_search_raw(query: str, max_results: int = 5) -> List[Dict[
     }
 
     try:
-        response = requests.get(endpoint, params=params, timeout=timeout)
+        response = yield HTTPRequest(endpoint, params=params, timeout=timeout)
         response.raise_for_status()
         data = response.json()
 
@@ -184,6 +185,18 @@ def _federal_register_search_raw(query: str, max_results: int = 5) -> List[Dict[
         return []
 
 
+def _congress_gov_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+    return drive_sync(_congress_gov_search_plan(query, max_results))
+
+
+def _govtrack_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+    return drive_sync(_govtrack_search_plan(query, max_results))
+
+
+def _federal_register_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+    return drive_sync(_federal_register_search_plan(query, max_results))
+
+
 def policy_search_sources(query: str, max_results: int = 10) -> List[Source]:
     """Search all policy sources in parallel and return Source objects."""
     all_results = []
@@ -206,7 +219,32 @@ def policy_search_sources(query: str, max_results: int = 10) -> List[Source]:
             except Exception as e:
                 logger.warning(f"Policy: {source_name} failed: {e}")
 
-    # Convert to Source objects
+    return _to_sources(all_results, max_results)
+
+
+@async_variant(policy_search_sources)
+async def policy_search_sources_async(query: str, max_results: int = 10) -> List[Source]:
+    """Async form of ``policy_search_sources``: all three APIs share the HTTP pool."""
+    per_source = max(max_results // 3, 3)
+    plans = {
+        "Congress.gov": _congress_gov_search_plan(query, per_source),
+        "GovTrack": _govtrack_search_plan(query, per_source),
+        "FederalRegister": _federal_register_search_plan(query, per_source),
+    }
+    outcomes = await asyncio.gather(*(drive_async(plan) for plan in plans.values()), return_exceptions=True)
+
+    all_results = []
+    for source_name, results in zip(plans, outcomes):
+        if isinstance(results, BaseException):
+            logger.warning(f"Policy: {source_name} failed: {results}")
+        elif results:
+            all_results.extend(results)
+            logger.info(f"Policy: {source_name} returned {len(results)} results")
+    return _to_sources(all_results, max_results)
+
+
+def _to_sources(all_results: List[Dict[str, Any]], max_results: int) -> List[Source]:
+    """Convert raw policy results to Source objects."""
     sources = []
     tag_pattern_prefixes = ["[Congress.gov] ", "[GovTrack] ", "[FederalRegister] "]
 
@@ -3,16 +3,16 @@
 import logging
 from typing import List, Dict, Any
 
-import requests
 import config
 from engine.models import Source
 from tools.research.academic_search import _sanitize_provider_query
+from tools.utils._async_http import HTTPRequest, async_variant, drive_async, drive_sync
 
 logger = logging.getLogger(__name__)
 
 
-def _sec_edgar_search_raw(query: str, max_results: int = 10) -> List[Dict[str, Any]]:
-    """Search SEC EDGAR full-text search index.
+def _sec_edgar_search_plan(query: str, max_results: int = 10):
+    """Search SEC EDGAR full-text search index (request plan, see ``_async_http``).
 
     Requires User-Agent header per SEC fair access policy.
     """
@@ -40,7 +40,7 @@ def _sec_edgar_search_raw(query: str, max_results: int = 10) -> List[Dict[str, A
     }
 
     try:
-        response = requests.get(endpoint, params=params, headers=headers, timeout=timeout)
+        response = yield HTTPRequest(endpoint, params=params, headers=headers, timeout=timeout)
         response.raise_for_status()
         data = response.json()
 
@@ -90,10 +90,26 @@ def _sec_edgar_search_raw(query: str, max_results: int = 10) -> List[Dict[str, A
         return []
 
 
+def _sec_edgar_search_raw(query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+    return drive_sync(_sec_edgar_search_plan(query, max_results))
+
+
+async def _sec_edgar_search_raw_async(query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+    return await drive_async(_sec_edgar_search_plan(query, max_results))
+
+
 def sec_search_sources(query: str, max_results: int = 10) -> List[Source]:
     """Search SEC EDGAR and return Source objects."""
-    raw_results = _sec_edgar_search_raw(query, max_results)
+    return _to_sources(_sec_edgar_search_raw(query, max_results))
+
+
+@async_variant(sec_search_sources)
+async def sec_search_sources_async(query: str, max_results: int = 10) -> List[Source]:
+    """Async form of ``sec_search_sources`` on the shared HTTP pool."""
+    return _to_sources(await _sec_edgar_search_raw_async(query, max_results))
+
 
+def _to_sources(raw_results: List[Dict[str, Any]]) -> List[Source]:
     sources = []
     for result in raw_results:
         url = result.get("url", "")
@@ -1,5 +1,6 @@
 """Web search tool - searches web using Brave Search API with DuckDuckGo fallback."""
 
+import asyncio
 import logging
 import re
 from typing import List, Dict, Any
@@ -9,6 +10,7 @@ from urllib.parse import urlparse
 import requests
 import config
 from engine.models import Source
+from tools.utils._async_http import HTTPRequest, async_variant, blocking_lane, drive_async, drive_sync, run_blocking
 
 # Import shared functions from academic_search
 from tools.research.academic_search import (
@@ -20,9 +22,9 @@ from tools.research.academic_search import (
 logger = logging.getLogger(__name__)
 
 
-def _brave_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+def _brave_search_plan(query: str, max_results: int = 5):
     """
-    Search using Brave Search API and return raw results (not formatted).
+    Search using Brave Search API and return raw results (request plan, see ``_async_http``).
     
     Args:
         query: Search query
@@ -47,11 +49,11 @@ def _brave_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
     }
 
     try:
-        response = requests.get(
+        response = yield HTTPRequest(
             config.BRAVE_SEARCH["endpoint"],
-            headers=headers,
             params=params,
-            timeout=config.BRAVE_SEARCH["timeout"]
+            headers=headers,
+            timeout=config.BRAVE_SEARCH["timeout"],
         )
         response.raise_for_status()
 
@@ -81,6 +83,10 @@ def _brave_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
         raise
 
 
+def _brave_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+    return drive_sync(_brave_search_plan(query, max_results))
+
+
 def _parallel_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
     """
     Search multiple sources in parallel and return raw results.
@@ -128,6 +134,11 @@ def _parallel_search_raw(query: str, max_results: int = 5) -> List[Dict[str, Any
             except Exception as e:
                 logger.warning(f"Parallel search: {source} failed: {e}")
     
+    return _merge_result_sets(result_sets, query, max_results)
+
+
+def _merge_result_sets(result_sets: List[List[Dict[str, Any]]], query: str, max_results: int) -> List[Dict[str, Any]]:
+    """Merge per-engine result sets from a parallel search."""
     if not result_sets:
         logger.warning("Parallel search: No result sets collected")
         return []
@@ -402,7 +413,84 @@ def web_search_sources(query: str, max_results: int = 5) -> List[Source]:
     if not query or not isinstance(query, str):
         return []
 
-    # Clean meta-language from query (reuse existing regex cleaning block)
+    query = _clean_web_query(query)
+    if not query:
+        return []
+
+    # Get raw web results
+    parallel_enabled = config.WEB_SEARCH.get("parallel_enabled", False)
+    brave_available = config.BRAVE_SEARCH.get("enabled") and config.BRAVE_SEARCH.get("api_key")
+    raw_results = None
+
+    if parallel_enabled and brave_available:
+        raw_results = _parallel_search_raw(query, max_results)
+    else:
+        if brave_available:
+            try:
+                raw_results = _brave_search_raw(query, max_results)
+            except Exception as e:
+                logger.warning(f"Brave Search failed: {e}, falling back to DuckDuckGo")
+
+        if raw_results is None:
+            try:
+                raw_results = _duckduckgo_search_raw(query, max_results)
+            except Exception as e:
+                logger.error(f"DuckDuckGo search failed: {e}")
+                return []
+
+    return _web_results_to_sources(raw_results, query, max_results)
+
+
+@async_variant(web_search_sources)
+async def web_search_sources_async(query: str, max_results: int = 5) -> List[Source]:
+    """Async form of ``web_search_sources``.
+
+    Brave runs on the shared HTTP pool; DuckDuckGo, a blocking client
+    library, runs on the bounded worker pool.
+    """
+    if not query or not isinstance(query, str):
+        return []
+    query = _clean_web_query(query)
+    if not query:
+        return []
+
+    parallel_enabled = config.WEB_SEARCH.get("parallel_enabled", False)
+    brave_available = config.BRAVE_SEARCH.get("enabled") and config.BRAVE_SEARCH.get("api_key")
+    raw_results = None
+
+    if parallel_enabled and brave_available:
+        outcomes = await asyncio.gather(
+            drive_async(_brave_search_plan(query, max_results)),
+            run_blocking(_duckduckgo_search_raw, query, max_results, executor=blocking_lane("duckduckgo")),
+            return_exceptions=True,
+        )
+        result_sets = []
+        for source, results in zip(("brave", "duckduckgo"), outcomes):
+            if isinstance(results, BaseException):
+                logger.warning(f"Parallel search: {source} failed: {results}")
+            elif results:
+                result_sets.append(results)
+                logger.info(f"Parallel search: {source} returned {len(results)} results")
+        raw_results = _merge_result_sets(result_sets, query, max_results)
+    else:
+        if brave_available:
+            try:
+                raw_results = await drive_async(_brave_search_plan(query, max_results))
+            except Exception as e:
+                logger.warning(f"Brave Search failed: {e}, falling back to DuckDuckGo")
+
+        if raw_results is None:
+            try:
+                raw_results = await run_blocking(_duckduckgo_search_raw, query, max_results, executor=blocking_lane("duckduckgo"))
+            except Exception as e:
+                logger.error(f"DuckDuckGo search failed: {e}")
+                return []
+
+    return _web_results_to_sources(raw_results, query, max_results)
+
+
+def _clean_web_query(query: str) -> str:
+    """Strip conversational meta-language ("search for ...") from a query."""
     query = query.strip()
 
     meta_prefixes = [
@@ -429,30 +517,11 @@ def web_search_sources(query: str, max_results: int = 5) -> List[Source]:
     query = re.sub(r'\bthe\s+context\s+(behind|around|for|of)\s+', '', query, flags=re.IGNORECASE).strip()
     query = re.sub(r'^(behind|about|regarding)\s+', '', query, flags=re.IGNORECASE).strip()
 
-    if not query:
-        return []
-
-    # Get raw web results
-    parallel_enabled = config.WEB_SEARCH.get("parallel_enabled", False)
-    brave_available = config.BRAVE_SEARCH.get("enabled") and config.BRAVE_SEARCH.get("api_key")
-    raw_results = None
+    return query
 
-    if parallel_enabled and brave_available:
-        raw_results = _parallel_search_raw(query, max_results)
-    else:
-        if brave_available:
-            try:
-                raw_results = _brave_search_raw(query, max_results)
-            except Exception as e:
-                logger.warning(f"Brave Search failed: {e}, falling back to DuckDuckGo")
-
-        if raw_results is None:
-            try:
-                raw_results = _duckduckgo_search_raw(query, max_results)
-            except Exception as e:
-                logger.error(f"DuckDuckGo search failed: {e}")
-                return []
 
+def _web_results_to_sources(raw_results: List[Dict[str, Any]], query: str, max_results: int) -> List[Source]:
+    """Process/dedup raw web results and convert them to Source objects."""
     if not raw_results:
         return []
 
@@ -3,16 +3,16 @@
 import logging
 from typing import List, Dict, Any
 
-import requests
 import config
 from engine.models import Source
 from tools.research.academic_search import _sanitize_provider_query
+from tools.utils._async_http import HTTPRequest, async_variant, drive_async, drive_sync
 
 logger = logging.getLogger(__name__)
 
 
-def _worldbank_document_search_raw(query: str, max_results: int = 10) -> List[Dict[str, Any]]:
-    """Search World Bank document repository.
+def _worldbank_document_search_plan(query: str, max_results: int = 10):
+    """Search World Bank document repository (request plan, see ``_async_http``).
 
     Response is a dict keyed by document ID strings (not a list).
     The 'facet' key and other non-dict values must be skipped.
@@ -35,7 +35,7 @@ def _worldbank_document_search_raw(query: str, max_results: int = 10) -> List[Di
     }
 
     try:
-        response = requests.get(endpoint, params=params, timeout=timeout)
+        response = yield HTTPRequest(endpoint, params=params, timeout=timeout)
         response.raise_for_status()
         data = response.json()
 
@@ -79,10 +79,26 @@ def _worldbank_document_search_raw(query: str, max_results: int = 10) -> List[Di
         return []
 
 
+def _worldbank_document_search_raw(query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+    return drive_sync(_worldbank_document_search_plan(query, max_results))
+
+
+async def _worldbank_document_search_raw_async(query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+    return await drive_async(_worldbank_document_search_plan(query, max_results))
+
+
 def worldbank_search_sources(query: str, max_results: int = 10) -> List[Source]:
     """Search World Bank and return Source objects."""
-    raw_results = _worldbank_document_search_raw(query, max_results)
+    return _to_sources(_worldbank_document_search_raw(query, max_results))
+
+
+@async_variant(worldbank_search_sources)
+async def worldbank_search_sources_async(query: str, max_results: int = 10) -> List[Source]:
+    """Async form of ``worldbank_search_sources`` on the shared HTTP pool."""
+    return _to_sources(await _worldbank_document_search_raw_async(query, max_results))
+
 
+def _to_sources(raw_results: List[Dict[str, Any]]) -> List[Source]:
     sources = []
     for result in raw_results:
         url = result.get("url", "")
@@ -1,20 +1,68 @@
 """
 Specialist LLM client factory.
 
-Creates configured LLMClient instances for different specialist roles.
+Creates configured LLMClient instances for different specialist roles and
+keeps them in a process-wide registry so callers reuse one long-lived client
+(and its pooled HTTP session) per role and endpoint.
 """
 
+import json
 import logging
 import os
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+class ClientCallStats:
+    """Thread-safe call counters and latency for one registered client."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.last_seconds = 0.0
+
+    def record(self, seconds: float, ok: bool = True) -> None:
+        with self._lock:
+            self.calls += 1
+            if not ok:
+                self.errors += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            self.last_seconds = seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            avg = self.total_seconds / self.calls if self.calls else 0.0
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "avg_latency_ms": round(avg * 1000, 1),
+                "max_latency_ms": round(self.max_seconds * 1000, 1),
+                "last_latency_ms": round(self.last_seconds * 1000, 1),
+            }
+
+
+_CLIENTS: Dict[Tuple, Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+_REGISTRY_STATS = {"hits": 0, "misses": 0, "invalidations": 0}
+
+
 def create_specialist_client(role: str, model_config: Dict[str, Any]):
     """
     Create an LLMClient for a specialist role, using local, HF, OpenAI, or Anthropic endpoint.
 
+    Clients are shared: repeated calls with the same role, resolved endpoint
+    settings and model config return the same instance until
+    ``invalidate_specialist_clients`` runs (ConfigManager does this after
+    writing new settings). Tool-free completions from the returned client are
+    served through the persistent LLM response cache (see ``LLM_CACHE`` in
+    config).
+
     Args:
         role: Role name (e.g., "codestral", "reasoning", "search", "intent_detector")
         model_config: Model configuration dict from SPECIALIZED_MODELS
@@ -22,6 +70,86 @@ def create_specialist_client(role: str, model_config: Dict[str, Any]):
     Returns:
         LLMClient instance configured for the role
     """
+    key = _registry_key(role, model_config)
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is not None:
+            _REGISTRY_STATS["hits"] += 1
+            return client
+        _REGISTRY_STATS["misses"] += 1
+        client = _build_specialist_client(role, model_config)
+        client.cache_role = role
+        client.call_stats = ClientCallStats()
+        _CLIENTS[key] = client
+        return client
+
+
+def invalidate_specialist_clients() -> int:
+    """Drop every registered client so the next call rebuilds from config.
+
+    Returns:
+        Number of clients dropped
+    """
+    with _CLIENTS_LOCK:
+        dropped = len(_CLIENTS)
+        _CLIENTS.clear()
+        _REGISTRY_STATS["invalidations"] += 1
+    if dropped:
+        logger.info(f"Invalidated {dropped} cached specialist client(s)")
+    return dropped
+
+
+def specialist_client_stats() -> Dict[str, Any]:
+    """Return registry hit/miss counters, HTTP pool, admission and endpoint health stats, and per-client latency."""
+    from providers.admission import admission_stats
+    from providers.endpoint_health import endpoint_health_stats
+    from providers.http_pool import pool_stats
+
+    with _CLIENTS_LOCK:
+        counters = dict(_REGISTRY_STATS)
+        entries = list(_CLIENTS.items())
+    clients = []
+    for key, client in entries:
+        stats = getattr(client, "call_stats", None)
+        clients.append({
+            "role": key[0],
+            "endpoint": key[1],
+            "model": getattr(client, "model", ""),
+            "api_url": getattr(client, "api_url", ""),
+            **(stats.snapshot() if stats is not None else {}),
+        })
+    return {
+        **counters,
+        "clients": clients,
+        "pools": pool_stats(),
+        "admission": admission_stats(),
+        "health": endpoint_health_stats(),
+    }
+
+
+def _registry_key(role: str, model_config: Dict[str, Any]) -> Tuple:
+    """Key a client by role, endpoint name and the settings it is built from.
+
+    The endpoint's own config entry and the role's model config are part of
+    the key, so an edited URL, model or timeout never reuses a stale client.
+    """
+    import config
+
+    endpoint_key = "local"
+    if hasattr(config, 'MODEL_ENDPOINTS') and role in config.MODEL_ENDPOINTS:
+        endpoint_key = config.MODEL_ENDPOINTS[role]
+
+    endpoint_settings: Any = getattr(config, "API_URL", "")
+    for table in ("OPENAI_ENDPOINTS", "ANTHROPIC_ENDPOINTS", "HF_ENDPOINTS"):
+        endpoints = getattr(config, table, None) or {}
+        if endpoint_key != "local" and endpoint_key in endpoints:
+            endpoint_settings = (table, endpoints[endpoint_key])
+            break
+    frozen = json.dumps([endpoint_settings, model_config], sort_keys=True, default=str)
+    return (role, endpoint_key, model_config.get("model", ""), frozen)
+
+
+def _build_specialist_client(role: str, model_config: Dict[str, Any]):
     from llm_client import LLMClient
     import config
 
@@ -0,0 +1,417 @@
+"""Shared asyncio I/O core for the research search channels.
+
+All async channel I/O runs on one background event loop thread and goes
+through one connection-pooled HTTP client, so concurrent research jobs share
+a bounded set of connections instead of each spinning up its own threads.
+
+Provider requests are written once as *plans*: generators that yield
+``HTTPRequest`` (or ``Pause``) steps, receive the response, and ``return``
+their parsed results. ``drive_sync`` executes a plan with ``requests.get``
+(the existing blocking call path); ``drive_async`` executes the same plan on
+the pooled async client. Sync callers reach async code through ``run_sync``.
+
+The async client uses ``httpx`` when it is installed. Without it, requests
+run on a pooled ``requests.Session`` whose worker count equals the connection
+limit, so concurrency is still bounded by connections rather than callers.
+"""
+
+import asyncio
+import contextvars
+import inspect
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Generator, NamedTuple, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import config
+
+try:  # optional dependency: native async HTTP with connection pooling
+    import httpx
+except ImportError:  # pragma: no cover - exercised when httpx is absent
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HTTP_POOL = {
+    "max_connections": 64,
+    "max_keepalive_connections": 20,
+    "keepalive_expiry": 30,
+    "blocking_workers": 16,
+    "blocking_share": 8,
+}
+
+
+class HTTPRequest(NamedTuple):
+    """A GET request step yielded by a provider plan."""
+
+    url: str
+    params: Optional[Dict[str, Any]] = None
+    headers: Optional[Dict[str, str]] = None
+    timeout: Optional[float] = None
+    allow_redirects: Optional[bool] = None
+
+    def kwargs(self) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {}
+        if self.params is not None:
+            kwargs["params"] = self.params
+        if self.headers is not None:
+            kwargs["headers"] = self.headers
+        kwargs["timeout"] = self.timeout
+        if self.allow_redirects is not None:
+            kwargs["allow_redirects"] = self.allow_redirects
+        return kwargs
+
+
+class Pause(NamedTuple):
+    """A sleep step yielded by a provider plan (e.g. a rate-limit cooldown)."""
+
+    seconds: float
+
+
+Plan = Generator[Any, Any, Any]
+
+
+class AsyncResponse:
+    """The subset of ``requests.Response`` provider plans rely on."""
+
+    def __init__(self, url: str, status_code: int, headers, content: bytes, encoding: Optional[str] = None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self) -> Any:
+        import json
+
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if 400 <= self.status_code < 600:
+            kind = "Client" if self.status_code < 500 else "Server"
+            raise requests.HTTPError(f"{self.status_code} {kind} Error for url: {self.url}", response=self)
+
+
+def _pool_settings() -> Dict[str, Any]:
+    settings = getattr(config, "DEEP_RESEARCH", {}).get("http_pool", {})
+    return {**DEFAULT_HTTP_POOL, **settings}
+
+
+class AsyncHTTPClient:
+    """Connection-pooled async GET client shared by every channel.
+
+    Must be used from the shared I/O loop (``get_io_loop``); ``run_sync`` is
+    how blocking code submits work to it.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 64,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30,
+    ):
+        self.max_connections = max(1, int(max_connections))
+        self.backend = "httpx" if httpx is not None else "requests"
+        self._client = None
+        self._session: Optional[requests.Session] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if httpx is not None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=max(0, int(max_keepalive_connections)),
+                    keepalive_expiry=keepalive_expiry,
+                ),
+            )
+        else:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.max_connections, pool_maxsize=self.max_connections)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_connections,
+                thread_name_prefix="async-http",
+            )
+
+    async def get(self, request: HTTPRequest) -> AsyncResponse:
+        """Perform a GET; transport errors surface as ``requests`` exceptions."""
+        if self._client is not None:
+            try:
+                response = await self._client.get(
+                    request.url,
+                    params=request.params,
+                    headers=request.headers,
+                    timeout=request.timeout,
+                    follow_redirects=request.allow_redirects is not False,
+                )
+            except httpx.TimeoutException as e:
+                raise requests.Timeout(str(e)) from e
+            except httpx.HTTPError as e:
+                raise requests.ConnectionError(str(e)) from e
+            return AsyncResponse(
+                str(response.url), response.status_code, response.headers, response.content, response.encoding
+            )
+
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            self._executor, partial(self._session.get, request.url, **request.kwargs())
+        )
+        return AsyncResponse(
+            response.url, response.status_code, response.headers, response.content, response.encoding
+        )
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        if self._session is not None:
+            self._session.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+
+class _IOLoop:
+    """A daemon thread running the shared event loop."""
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="research-io-loop", daemon=True)
+        self.thread.start()
+        self._ready.wait()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+        self.loop.run_forever()
+
+
+_IO_LOOP: Optional[_IOLoop] = None
+_HTTP_CLIENT: Optional[AsyncHTTPClient] = None
+_BLOCKING_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_STATE_LOCK = threading.Lock()
+_ASYNC_VARIANTS: Dict[Callable, Callable] = {}
+_BLOCKING_LANES: Dict[str, "BoundedLane"] = {}
+
+
+def _reset_after_fork() -> None:
+    global _IO_LOOP, _HTTP_CLIENT, _BLOCKING_EXECUTOR
+    _IO_LOOP = None
+    _HTTP_CLIENT = None
+    _BLOCKING_EXECUTOR = None
+    _BLOCKING_LANES.clear()
+
+
+def get_io_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared I/O event loop, starting its thread on first use."""
+    global _IO_LOOP
+    with _STATE_LOCK:
+        if _IO_LOOP is not None and _IO_LOOP.pid != os.getpid():
+            _reset_after_fork()  # threads do not survive fork (gunicorn preload)
+        if _IO_LOOP is None:
+            _IO_LOOP = _IOLoop()
+        return _IO_LOOP.loop
+
+
+def get_async_http() -> AsyncHTTPClient:
+    """Return the process-wide pooled async HTTP client."""
+    global _HTTP_CLIENT
+    get_io_loop()
+    with _STATE_LOCK:
+        if _HTTP_CLIENT is None:
+            settings = _pool_settings()
+            _HTTP_CLIENT = AsyncHTTPClient(
+                max_connections=settings["max_connections"],
+                max_keepalive_connections=settings["max_keepalive_connections"],
+                keepalive_expiry=settings["keepalive_expiry"],
+            )
+            logger.info(
+                f"Async HTTP client ready ({_HTTP_CLIENT.backend}, max {_HTTP_CLIENT.max_connections} connections)"
+            )
+        return _HTTP_CLIENT
+
+
+def _get_blocking_executor() -> ThreadPoolExecutor:
+    global _BLOCKING_EXECUTOR
+    with _STATE_LOCK:
+        if _BLOCKING_EXECUTOR is None:
+            _BLOCKING_EXECUTOR = ThreadPoolExecutor(
+                max_workers=max(1, int(_pool_settings()["blocking_workers"])),
+                thread_name_prefix="research-blocking",
+            )
+        return _BLOCKING_EXECUTOR
+
+
+class BoundedLane(Executor):
+    """A slice of a shared thread pool that one caller may occupy at most ``slots`` of.
+
+    Work beyond ``slots`` waits in the lane rather than in the pool, so a
+    hung provider whose abandoned calls never return holds at most ``slots``
+    workers and the rest of the pool stays available. Work cancelled while
+    still waiting in the lane never reaches the pool.
+    """
+
+    def __init__(self, pool: Executor, slots: int):
+        self._pool = pool
+        self.slots = max(1, int(slots))
+        self._lock = threading.Lock()
+        self._queue: deque = deque()
+        self._running = 0
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        with self._lock:
+            self._queue.append((future, fn, args, kwargs))
+            self._dispatch_locked()
+        return future
+
+    def _dispatch_locked(self) -> None:
+        while self._running < self.slots and self._queue:
+            future, fn, args, kwargs = self._queue.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            self._running += 1
+            self._pool.submit(self._run, future, fn, args, kwargs)
+
+    def _run(self, future: Future, fn, args, kwargs) -> None:
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._dispatch_locked()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"slots": self.slots, "running": self._running, "queued": len(self._queue)}
+
+
+def blocking_lane(name: str) -> BoundedLane:
+    """Return the ``name`` lane of the blocking pool (``http_pool["blocking_share"]`` workers)."""
+    pool = _get_blocking_executor()
+    with _STATE_LOCK:
+        lane = _BLOCKING_LANES.get(name)
+        if lane is None:
+            lane = _BLOCKING_LANES[name] = BoundedLane(pool, _pool_settings()["blocking_share"])
+        return lane
+
+
+def run_sync(coro, timeout: Optional[float] = None):
+    """Run a coroutine on the shared I/O loop and block until it finishes.
+
+    The caller's context variables (e.g. the active research trace) are
+    visible inside the coroutine.
+    """
+    loop = get_io_loop()
+    if _IO_LOOP is not None and threading.current_thread() is _IO_LOOP.thread:
+        coro.close()
+        raise RuntimeError("run_sync() cannot be called from the research I/O loop; await instead")
+
+    ctx = contextvars.copy_context()
+    result: Future = Future()
+
+    def start() -> None:
+        task = ctx.run(loop.create_task, coro)
+
+        def finish(done: "asyncio.Task") -> None:
+            if done.cancelled():
+                result.cancel()
+            elif done.exception() is not None:
+                result.set_exception(done.exception())
+            else:
+                result.set_result(done.result())
+
+        task.add_done_callback(finish)
+
+    loop.call_soon_threadsafe(start)
+    return result.result(timeout)
+
+
+async def run_blocking(fn: Callable, *args, executor: Optional[Executor] = None, **kwargs):
+    """Await a blocking callable on a bounded worker pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor or _get_blocking_executor(), partial(fn, *args, **kwargs))
+
+
+def drive_sync(plan: Plan):
+    """Execute a provider plan with blocking ``requests.get`` calls."""
+    try:
+        step = next(plan)
+        while True:
+            if isinstance(step, Pause):
+                time.sleep(step.seconds)
+                step = plan.send(None)
+                continue
+            try:
+                response = requests.get(step.url, **step.kwargs())
+            except Exception as e:
+                step = plan.throw(e)
+                continue
+            step = plan.send(response)
+    except StopIteration as done:
+        return done.value
+
+
+async def drive_async(plan: Plan):
+    """Execute a provider plan on the shared pooled async client."""
+    client = get_async_http()
+    try:
+        step = next(plan)
+        while True:
+            if isinstance(step, Pause):
+                await asyncio.sleep(step.seconds)
+                step = plan.send(None)
+                continue
+            try:
+                response = await client.get(step)
+            except asyncio.CancelledError:
+                plan.close()
+                raise
+            except Exception as e:
+                step = plan.throw(e)
+                continue
+            step = plan.send(response)
+    except StopIteration as done:
+        return done.value
+
+
+def async_variant(sync_fn: Callable) -> Callable[[Callable], Callable]:
+    """Register the decorated coroutine function as ``sync_fn``'s async form."""
+
+    def register(coro_fn: Callable) -> Callable:
+        _ASYNC_VARIANTS[sync_fn] = coro_fn
+        return coro_fn
+
+    return register
+
+
+def async_counterpart(fn: Callable) -> Optional[Callable]:
+    """Return the registered async form of ``fn`` (None for blocking-only callables)."""
+    try:
+        coro_fn = _ASYNC_VARIANTS.get(fn)
+    except TypeError:  # unhashable callables
+        return None
+    return coro_fn if coro_fn is not None and inspect.iscoroutinefunction(coro_fn) else None
+
+
+async def call_channel(fn: Callable, *args, executor: Optional[Executor] = None, **kwargs):
+    """Await a channel function: natively when it has an async form, else on a worker pool."""
+    coro_fn = async_counterpart(fn)
+    if coro_fn is not None:
+        return await coro_fn(*args, **kwargs)
+    return await run_blocking(fn, *args, executor=executor, **kwargs)
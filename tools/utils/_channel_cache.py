@@ -0,0 +1,262 @@
+"""Persistent SQLite cache for deep research source-channel results."""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import config
+from engine.models import Source
+
+logger = logging.getLogger(__name__)
+
+# Channel TTLs (seconds) used when DEEP_RESEARCH["channel_cache"] has no override.
+DEFAULT_CHANNEL_TTLS = {
+    "academic": 7 * 86400,
+    "web": 6 * 3600,
+    "world_bank": 7 * 86400,
+    "brave_news": 3600,
+    "policy": 86400,
+    "sec_edgar": 86400,
+}
+
+_SOURCE_FIELDS = {f.name for f in dataclasses.fields(Source)}
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query so near-repeats share a cache key.
+
+    Lowercases, drops punctuation, and sorts unique terms so that
+    "Zambia solar tariffs?" and "solar tariffs zambia" map to the same key.
+    """
+    terms = re.findall(r"[a-z0-9]+(?:[.\-][a-z0-9]+)*", (query or "").lower())
+    return " ".join(sorted(set(terms)))
+
+
+class ChannelResultCache:
+    """SQLite-backed cache of channel results shared across processes.
+
+    Entries are keyed by (channel, normalized query, max_results), expire after a
+    per-channel TTL, and are evicted least-recently-used once ``max_entries`` is
+    exceeded. WAL mode lets several gunicorn workers share one database file.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        ttl_seconds: Optional[Dict[str, int]] = None,
+        default_ttl_seconds: int = 6 * 3600,
+        max_entries: int = 5000,
+    ):
+        self.db_path = Path(db_path or (Path.home() / ".zorora" / "channel_cache.db"))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = {**DEFAULT_CHANNEL_TTLS, **(ttl_seconds or {})}
+        self.default_ttl_seconds = default_ttl_seconds
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._init_schema()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if not hasattr(self._local, "conn"):
+            self._local.conn = sqlite3.connect(
+                str(self.db_path),
+                check_same_thread=False,
+                timeout=30,
+            )
+            self._local.conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn.row_factory = sqlite3.Row
+        return self._local.conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        return self._get_connection()
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            try:
+                conn.close()
+            finally:
+                delattr(self._local, "conn")
+
+    def _init_schema(self):
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS channel_results (
+                cache_key TEXT PRIMARY KEY,
+                channel TEXT NOT NULL,
+                normalized_query TEXT NOT NULL,
+                max_results INTEGER NOT NULL,
+                sources_json TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL,
+                hit_count INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_channel_results_accessed ON channel_results(last_accessed)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def _make_key(channel: str, normalized_query: str, max_results: int) -> str:
+        return hashlib.sha256(f"{channel}|{normalized_query}|{int(max_results)}".encode()).hexdigest()
+
+    def _ttl_for(self, channel: str) -> int:
+        return int(self.ttl_seconds.get(channel, self.default_ttl_seconds))
+
+    def _count(self, counter: Dict[str, int], channel: str) -> None:
+        with self._stats_lock:
+            counter[channel] = counter.get(channel, 0) + 1
+
+    def get(self, channel: str, query: str, max_results: int) -> Optional[List[Source]]:
+        """Return cached sources for a channel query, or None on miss/expiry."""
+        key = self._make_key(channel, normalize_query(query), max_results)
+        now = time.time()
+        try:
+            row = self.conn.execute(
+                "SELECT sources_json, created_at FROM channel_results WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or now - row["created_at"] > self._ttl_for(channel):
+                if row is not None:
+                    self.conn.execute("DELETE FROM channel_results WHERE cache_key = ?", (key,))
+                    self.conn.commit()
+                self._count(self._misses, channel)
+                return None
+            self.conn.execute(
+                "UPDATE channel_results SET last_accessed = ?, hit_count = hit_count + 1 WHERE cache_key = ?",
+                (now, key),
+            )
+            self.conn.commit()
+            sources = [
+                Source(**{k: v for k, v in item.items() if k in _SOURCE_FIELDS})
+                for item in json.loads(row["sources_json"])
+            ]
+        except (sqlite3.Error, ValueError, TypeError) as e:
+            logger.warning(f"Channel cache read failed for {channel}: {e}")
+            self._count(self._misses, channel)
+            return None
+
+        self._count(self._hits, channel)
+        logger.debug(f"Channel cache hit: {channel} '{query[:50]}' ({len(sources)} sources)")
+        return sources
+
+    def set(self, channel: str, query: str, max_results: int, sources: List[Source]) -> None:
+        """Store channel results and evict least-recently-used entries past the bound."""
+        normalized = normalize_query(query)
+        key = self._make_key(channel, normalized, max_results)
+        now = time.time()
+        try:
+            payload = json.dumps([dataclasses.asdict(s) for s in sources])
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO channel_results
+                (cache_key, channel, normalized_query, max_results, sources_json, created_at, last_accessed, hit_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+                """,
+                (key, channel, normalized, int(max_results), payload, now, now),
+            )
+            self._evict()
+            self.conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Channel cache write failed for {channel}: {e}")
+
+    def _evict(self) -> None:
+        if self.max_entries <= 0:
+            return
+        (count,) = self.conn.execute("SELECT COUNT(*) FROM channel_results").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self.conn.execute(
+                """
+                DELETE FROM channel_results WHERE cache_key IN (
+                    SELECT cache_key FROM channel_results ORDER BY last_accessed ASC LIMIT ?
+                )
+                """,
+                (overflow,),
+            )
+            logger.debug(f"Channel cache evicted {overflow} entries (max {self.max_entries})")
+
+    def get_or_fetch(
+        self,
+        channel: str,
+        query: str,
+        max_results: int,
+        fetch: Callable[[], List[Source]],
+    ) -> List[Source]:
+        """Serve a channel query from cache, calling ``fetch`` on a miss.
+
+        Empty results are not cached — channel helpers return [] on upstream
+        errors, and caching those would pin a transient outage for a full TTL.
+        """
+        cached = self.get(channel, query, max_results)
+        if cached is not None:
+            return cached
+        sources = fetch()
+        if sources:
+            self.set(channel, query, max_results, sources)
+        return sources
+
+    def clear(self) -> None:
+        """Remove every cached entry and reset counters."""
+        self.conn.execute("DELETE FROM channel_results")
+        self.conn.commit()
+        with self._stats_lock:
+            self._hits.clear()
+            self._misses.clear()
+
+    def stats(self) -> Dict[str, object]:
+        """Return entry count plus process-local hit/miss counters per channel."""
+        (entries,) = self.conn.execute("SELECT COUNT(*) FROM channel_results").fetchone()
+        with self._stats_lock:
+            hits = dict(self._hits)
+            misses = dict(self._misses)
+        total_hits = sum(hits.values())
+        total_lookups = total_hits + sum(misses.values())
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": total_hits,
+            "misses": total_lookups - total_hits,
+            "hit_rate": round(total_hits / total_lookups, 3) if total_lookups else 0.0,
+            "per_channel": {
+                channel: {"hits": hits.get(channel, 0), "misses": misses.get(channel, 0)}
+                for channel in sorted(set(hits) | set(misses))
+            },
+        }
+
+
+_CACHE: Optional[ChannelResultCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_channel_cache() -> Optional[ChannelResultCache]:
+    """Return the process-wide channel cache, or None when disabled in config."""
+    global _CACHE
+    settings = getattr(config, "DEEP_RESEARCH", {}).get("channel_cache", {})
+    if not settings.get("enabled", False):
+        return None
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            try:
+                _CACHE = ChannelResultCache(
+                    db_path=settings.get("db_path") or None,
+                    ttl_seconds=settings.get("ttl_seconds", {}),
+                    default_ttl_seconds=settings.get("default_ttl_seconds", 6 * 3600),
+                    max_entries=settings.get("max_entries", 5000),
+                )
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Channel cache unavailable: {e}")
+                return None
+        return _CACHE
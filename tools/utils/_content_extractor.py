@@ -1,11 +1,94 @@
-"""Content extraction utilities for web search results."""
+"""Content extraction utilities for web search results.
+
+Pages are fetched through one pooled ``requests.Session`` with a cap on
+concurrent requests per host, streamed up to a byte limit, and their
+extracted text is kept in a persistent cache (``_page_cache``) that is
+revalidated with conditional GETs. HTML-to-text conversion is delegated to
+the configured ``_html_text`` backend.
+"""
 
 import logging
+import threading
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit
 import re
 
+import config
+
 logger = logging.getLogger(__name__)
 
+_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+_CHUNK_SIZE = 64 * 1024
+
+DEFAULT_FETCH_SETTINGS = {
+    "max_bytes": 2_000_000,
+    "per_host_limit": 2,
+    "pool_maxsize": 32,
+    "extraction_backend": "auto",
+}
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+_HOST_SLOTS: Dict[str, threading.BoundedSemaphore] = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+
+def _fetch_settings() -> Dict[str, Any]:
+    settings = getattr(config, "CONTENT_FETCH", {})
+    return {key: settings.get(key, default) for key, default in DEFAULT_FETCH_SETTINGS.items()}
+
+
+def _get_session():
+    """Return the process-wide keep-alive session used for page fetches."""
+    global _SESSION
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            pool_size = max(1, int(_fetch_settings()["pool_maxsize"]))
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["User-Agent"] = _USER_AGENT
+            _SESSION = session
+        return _SESSION
+
+
+@contextmanager
+def _host_slot(url: str, timeout: float):
+    """Hold one of the host's concurrent-request slots (yields False if none freed up)."""
+    host = (urlsplit(url).hostname or "").lower()
+    with _HOST_SLOTS_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = threading.BoundedSemaphore(max(1, int(_fetch_settings()["per_host_limit"])))
+            _HOST_SLOTS[host] = slot
+    acquired = slot.acquire(timeout=timeout)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            slot.release()
+
+
+def _read_capped(response, max_bytes: int) -> bytes:
+    """Read a streamed response body, stopping once ``max_bytes`` have arrived."""
+    chunks = []
+    received = 0
+    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+        if not chunk:
+            continue
+        chunks.append(chunk)
+        received += len(chunk)
+        if max_bytes and received >= max_bytes:
+            logger.debug(f"Truncated {response.url} at {max_bytes} bytes")
+            break
+    body = b"".join(chunks)
+    return body[:max_bytes] if max_bytes else body
+
 
 class ContentExtractor:
     """Extract and clean content from web pages."""
@@ -22,6 +105,9 @@ class ContentExtractor:
         self.enabled = enabled
         self.extract_top_n = extract_top_n
         self.max_content_length = max_content_length
+        self.timeout = 10
+        self.max_bytes = int(_fetch_settings()["max_bytes"])
+        self.extraction_backend = _fetch_settings()["extraction_backend"]
         self._bs4_available = False
         
         # Try to import BeautifulSoup
@@ -79,6 +165,9 @@ class ContentExtractor:
         """
         Extract main content from a URL.
         
+        Serves the cached extraction when it is fresh, revalidates stale
+        entries with a conditional GET, and otherwise fetches the page.
+        
         Args:
             url: URL to extract content from
             query: Original search query (for context)
@@ -86,71 +175,71 @@ class ContentExtractor:
         Returns:
             Extracted content string or None
         """
+        from tools.utils._page_cache import get_page_cache
+
+        cache = get_page_cache()
+        cached = cache.get(url) if cache is not None else None
+        if cached is not None and cached.fresh:
+            return self._truncate(cached.text)
+
+        text = self._fetch_page_text(url, cache, cached)
+        return self._truncate(text) if text else None
+
+    def _fetch_page_text(self, url: str, cache, cached) -> Optional[str]:
+        """Fetch and extract ``url``, updating ``cache``; falls back to stale ``cached`` text on errors."""
         import requests
-        from bs4 import BeautifulSoup
-        
+
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
         try:
-            # Fetch page with timeout
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "header", "footer", "aside"]):
-                script.decompose()
-            
-            # Try to find main content
-            # Strategy 1: Look for common content selectors
-            content_selectors = [
-                'article',
-                'main',
-                '[role="main"]',
-                '.content',
-                '.post-content',
-                '.entry-content',
-                '#content',
-                '#main-content'
-            ]
-            
-            content = None
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    # Use the largest element (likely main content)
-                    content = max(elements, key=lambda e: len(e.get_text()))
-                    break
-            
-            # Strategy 2: If no specific content found, use body
-            if not content:
-                content = soup.find('body')
-            
-            if not content:
-                return None
-            
-            # Extract text
-            text = content.get_text(separator=' ', strip=True)
-            
-            # Clean up text
-            text = self._clean_text(text)
-            
-            # Truncate if too long (max_content_length=0 means no limit)
-            if self.max_content_length and len(text) > self.max_content_length:
-                text = text[:self.max_content_length] + "..."
-            
-            return text
-            
+            with _host_slot(url, self.timeout) as acquired:
+                if not acquired:
+                    logger.debug(f"No free connection slot for {url} within {self.timeout}s")
+                    return cached.text if cached is not None else None
+                response = _get_session().get(url, headers=headers, timeout=self.timeout, stream=True)
+                try:
+                    if response.status_code == 304 and cached is not None:
+                        cache.mark_revalidated(url)
+                        return cached.text
+                    response.raise_for_status()
+                    body = _read_capped(response, self.max_bytes)
+                finally:
+                    response.close()
         except requests.RequestException as e:
             logger.debug(f"Failed to fetch {url}: {e}")
-            return None
+            return cached.text if cached is not None else None
+
+        try:
+            text = self._html_to_text(body)
         except Exception as e:
             logger.debug(f"Failed to parse {url}: {e}")
             return None
+
+        if text and cache is not None:
+            cache.set(
+                url,
+                text,
+                etag=response.headers.get("ETag", ""),
+                last_modified=response.headers.get("Last-Modified", ""),
+            )
+        return text
+
+    def _html_to_text(self, html: bytes) -> Optional[str]:
+        """Strip boilerplate from an HTML document and return its cleaned main text."""
+        from tools.utils._html_text import html_to_text
+
+        return html_to_text(html, backend=self.extraction_backend)
+
+    def _truncate(self, text: str) -> str:
+        # max_content_length=0 means no limit
+        if self.max_content_length and len(text) > self.max_content_length:
+            return text[:self.max_content_length] + "..."
+        return text
     
     def _clean_text(self, text: str) -> str:
         """
@@ -225,7 +314,9 @@ class ContentExtractor:
 
         # Save and override instance settings for full extraction
         original_max_len = self.max_content_length
+        original_timeout = self.timeout
         self.max_content_length = 0  # no limit
+        self.timeout = timeout_per_url
 
         success_count = 0
 
@@ -251,6 +342,7 @@ class ContentExtractor:
                         logger.debug(f"Content fetch future error: {e}")
         finally:
             self.max_content_length = original_max_len
+            self.timeout = original_timeout
 
         logger.info(f"Fetched full content for {success_count}/{len(fetchable)} sources")
         return success_count
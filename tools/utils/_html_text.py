@@ -0,0 +1,369 @@
+"""HTML-to-text extraction backends for content fetching.
+
+``html_to_text`` turns a fetched page into its cleaned main text using one of
+the registered backends:
+
+- ``bs4``: BeautifulSoup with the pure-Python ``html.parser``; boilerplate tags
+  are decomposed and the largest of a fixed list of content selectors wins.
+- ``readability``: a single streaming pass that never builds a DOM. Parser
+  events (from lxml's C parser when installed, else the stdlib ``HTMLParser``)
+  are grouped into text blocks that remember their ancestor containers. The
+  main content is the best semantic container (``article``, ``main``...) when
+  the page has one, otherwise the container with the highest readability
+  score. Link-heavy blocks (menus, "related" lists) are dropped.
+
+``auto`` picks ``readability`` when lxml is available and ``bs4`` otherwise.
+"""
+
+import logging
+import re
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+try:  # optional dependency: C-accelerated HTML parsing
+    from lxml import etree
+except ImportError:  # pragma: no cover - exercised when lxml is absent
+    etree = None
+
+logger = logging.getLogger(__name__)
+
+# Removed before extraction by every backend.
+BOILERPLATE_TAGS = ("script", "style", "nav", "header", "footer", "aside")
+
+# Content selectors in priority order (the bs4 backend's CSS selectors).
+CONTENT_SELECTORS = [
+    'article',
+    'main',
+    '[role="main"]',
+    '.content',
+    '.post-content',
+    '.entry-content',
+    '#content',
+    '#main-content'
+]
+
+_SKIP_TAGS = frozenset(BOILERPLATE_TAGS) | {"noscript", "template", "title", "svg"}
+_VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+    "meta", "param", "source", "track", "wbr",
+})
+_BLOCK_TAGS = frozenset({
+    "address", "article", "blockquote", "body", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "h1", "h2", "h3", "h4", "h5", "h6", "li", "main",
+    "ol", "p", "pre", "section", "table", "tbody", "td", "th", "tr", "ul",
+})
+# Start tags that implicitly close an open element (html.parser does not do this for us).
+_IMPLIED_END = {
+    "p": _BLOCK_TAGS,
+    "li": frozenset({"li"}),
+    "dt": frozenset({"dt", "dd"}),
+    "dd": frozenset({"dt", "dd"}),
+    "td": frozenset({"td", "th", "tr"}),
+    "th": frozenset({"td", "th", "tr"}),
+    "tr": frozenset({"tr"}),
+}
+_CLASS_SELECTOR_RANKS = {"content": 3, "post-content": 4, "entry-content": 5}
+_ID_SELECTOR_RANKS = {"content": 6, "main-content": 7}
+
+# Readability scoring: blocks shorter than this do not vote for a container.
+_MIN_SCORED_CHARS = 25
+_MAX_LINK_DENSITY = 0.5
+
+_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([A-Za-z0-9_\-]+)""", re.IGNORECASE)
+
+
+def _clean(text: str) -> str:
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def _decode(html: bytes) -> str:
+    """Decode page bytes using a ``<meta charset>`` declaration, else UTF-8."""
+    match = _CHARSET_RE.search(html[:4096])
+    encoding = match.group(1).decode("ascii") if match else "utf-8"
+    try:
+        return html.decode(encoding, errors="replace")
+    except LookupError:
+        return html.decode("utf-8", errors="replace")
+
+
+# ---------------------------------------------------------------------------
+# bs4 backend (DOM)
+# ---------------------------------------------------------------------------
+
+def _bs4_text(html: bytes) -> Optional[str]:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+
+    for element in soup(list(BOILERPLATE_TAGS)):
+        element.decompose()
+
+    # Strategy 1: the largest element matching the first content selector that matches
+    content = None
+    for selector in CONTENT_SELECTORS:
+        elements = soup.select(selector)
+        if elements:
+            content = max(elements, key=lambda e: len(e.get_text()))
+            break
+
+    # Strategy 2: If no specific content found, use body
+    if not content:
+        content = soup.find('body')
+
+    if not content:
+        return None
+
+    return _clean(content.get_text(separator=' ', strip=True))
+
+
+# ---------------------------------------------------------------------------
+# readability backend (streaming, no DOM)
+# ---------------------------------------------------------------------------
+
+class _Block(NamedTuple):
+    text: str
+    link_chars: int
+    ancestors: Tuple[int, ...]        # ids of enclosing block containers, outermost first
+    selectors: Tuple[Tuple[int, int], ...]  # (selector rank, container id) of enclosing selector matches
+
+
+def _selector_rank(tag: str, attrs: Dict[str, str]) -> Optional[int]:
+    ranks = []
+    if tag == "article":
+        ranks.append(0)
+    elif tag == "main":
+        ranks.append(1)
+    if (attrs.get("role") or "").lower() == "main":
+        ranks.append(2)
+    for cls in (attrs.get("class") or "").split():
+        if cls in _CLASS_SELECTOR_RANKS:
+            ranks.append(_CLASS_SELECTOR_RANKS[cls])
+    if attrs.get("id") in _ID_SELECTOR_RANKS:
+        ranks.append(_ID_SELECTOR_RANKS[attrs["id"]])
+    return min(ranks) if ranks else None
+
+
+class _ReadabilityTarget:
+    """Parser target (lxml target interface) that collects scored text blocks."""
+
+    def __init__(self):
+        # Open elements: (tag, container id or None, is_skip, selector rank or None)
+        self._stack: List[Tuple[str, Optional[int], bool, Optional[int]]] = []
+        self._skip_depth = 0
+        self._anchor_depth = 0
+        self._next_id = 0
+        self._ancestors: Tuple[int, ...] = ()
+        self._selectors: Tuple[Tuple[int, int], ...] = ()
+        self._parts: List[str] = []
+        self._link_chars = 0
+        self.blocks: List[_Block] = []
+
+    def _flush(self) -> None:
+        if self._parts:
+            text = _clean("".join(self._parts))
+            if text:
+                self.blocks.append(_Block(text, self._link_chars, self._ancestors, self._selectors))
+        self._parts = []
+        self._link_chars = 0
+
+    def _refresh_context(self) -> None:
+        self._ancestors = tuple(cid for _tag, cid, _skip, _rank in self._stack if cid is not None)
+        self._selectors = tuple(
+            (rank, cid) for _tag, cid, _skip, rank in self._stack if rank is not None and cid is not None
+        )
+
+    def start(self, tag, attrib) -> None:
+        tag = tag.lower() if isinstance(tag, str) else ""
+        if tag in _VOID_TAGS:
+            if tag == "br":
+                self._parts.append(" ")
+            return
+        self._close_implied(tag)
+        is_skip = tag in _SKIP_TAGS
+        is_block = tag in _BLOCK_TAGS
+        if not is_block:
+            self._parts.append(" ")
+        rank = _selector_rank(tag, dict(attrib)) if not is_skip else None
+        if is_block or rank is not None:
+            self._flush()
+        cid = None
+        if is_block or rank is not None:
+            cid = self._next_id
+            self._next_id += 1
+        self._stack.append((tag, cid, is_skip, rank))
+        if is_skip:
+            self._skip_depth += 1
+        if tag == "a":
+            self._anchor_depth += 1
+        if cid is not None:
+            self._refresh_context()
+
+    def _close_implied(self, tag: str) -> None:
+        for depth in range(len(self._stack) - 1, -1, -1):
+            open_tag = self._stack[depth][0]
+            if open_tag in _IMPLIED_END and tag in _IMPLIED_END[open_tag]:
+                self.end(open_tag)
+                self._close_implied(tag)  # e.g. <tr> closes the open <td>, then the open <tr>
+                return
+            if open_tag in _BLOCK_TAGS:
+                return
+
+    def end(self, tag) -> None:
+        tag = tag.lower() if isinstance(tag, str) else ""
+        if tag in _VOID_TAGS:
+            return
+        # Close up to the most recent matching open tag (tolerates unclosed <p>/<li>).
+        for depth in range(len(self._stack) - 1, -1, -1):
+            if self._stack[depth][0] == tag:
+                break
+        else:
+            return
+        closed = self._stack[depth:]
+        if any(cid is not None for _tag, cid, _skip, _rank in closed):
+            self._flush()
+        else:
+            self._parts.append(" ")
+        del self._stack[depth:]
+        for closed_tag, _cid, is_skip, _rank in closed:
+            if is_skip:
+                self._skip_depth -= 1
+            if closed_tag == "a":
+                self._anchor_depth -= 1
+        self._refresh_context()
+
+    def data(self, data) -> None:
+        if self._skip_depth or not data:
+            return
+        self._parts.append(data)
+        if self._anchor_depth:
+            self._link_chars += len(data.strip())
+
+    def comment(self, text) -> None:
+        pass
+
+    def close(self) -> List[_Block]:
+        self._flush()
+        return self.blocks
+
+
+class _StdlibEventParser(HTMLParser):
+    """Feeds stdlib ``HTMLParser`` events to a ``_ReadabilityTarget``."""
+
+    def __init__(self, target: _ReadabilityTarget):
+        super().__init__(convert_charrefs=True)
+        self.target = target
+
+    def handle_starttag(self, tag, attrs):
+        self.target.start(tag, {k: v or "" for k, v in attrs})
+
+    def handle_startendtag(self, tag, attrs):
+        self.target.start(tag, {k: v or "" for k, v in attrs})
+        self.target.end(tag)
+
+    def handle_endtag(self, tag):
+        self.target.end(tag)
+
+    def handle_data(self, data):
+        self.target.data(data)
+
+
+def _parse_blocks(html: bytes) -> List[_Block]:
+    if etree is not None:
+        target = _ReadabilityTarget()
+        try:
+            parser = etree.HTMLParser(target=target, remove_comments=True)
+            parser.feed(html)
+            return parser.close()
+        except etree.Error as e:
+            logger.debug(f"lxml could not parse page, using html.parser: {e}")
+    target = _ReadabilityTarget()
+    parser = _StdlibEventParser(target)
+    parser.feed(_decode(html))
+    parser.close()
+    return target.close()
+
+
+def _link_density(block: _Block) -> float:
+    return block.link_chars / max(1, len(block.text))
+
+
+def _main_container(blocks: List[_Block]) -> Optional[int]:
+    """Container id of the page's main content, or None to keep the whole body."""
+    # Semantic containers first, with the bs4 backend's selector precedence.
+    selector_text: Dict[Tuple[int, int], int] = {}
+    for block in blocks:
+        for rank, cid in block.selectors:
+            selector_text[(rank, cid)] = selector_text.get((rank, cid), 0) + len(block.text)
+    if selector_text:
+        best_rank = min(rank for rank, _cid in selector_text)
+        return max(
+            (cid for rank, cid in selector_text if rank == best_rank),
+            key=lambda cid: selector_text[(best_rank, cid)],
+        )
+
+    # Readability scoring: paragraphs vote for their parent (full) and grandparent (half).
+    # A block's last ancestor is the element holding its text, i.e. the paragraph itself.
+    scores: Dict[int, float] = {}
+    for block in blocks:
+        if len(block.text) < _MIN_SCORED_CHARS or not block.ancestors:
+            continue
+        score = (1 + block.text.count(",") + min(len(block.text) // 100, 3)) * (1 - _link_density(block))
+        parents = block.ancestors[-3:-1] or block.ancestors[-1:]
+        for weight, container in zip((1.0, 0.5), reversed(parents)):
+            scores[container] = scores.get(container, 0.0) + score * weight
+    if not scores:
+        return None
+    return max(scores, key=scores.get)
+
+
+def _readability_text(html: bytes) -> Optional[str]:
+    blocks = _parse_blocks(html)
+    if not blocks:
+        return None
+    container = _main_container(blocks)
+    kept = [
+        block.text
+        for block in blocks
+        if (container is None or container in block.ancestors) and _link_density(block) <= _MAX_LINK_DENSITY
+    ]
+    text = _clean(" ".join(kept))
+    return text or None
+
+
+# ---------------------------------------------------------------------------
+# Backend registry
+# ---------------------------------------------------------------------------
+
+ExtractionBackend = Callable[[bytes], Optional[str]]
+
+_BACKENDS: Dict[str, ExtractionBackend] = {
+    "bs4": _bs4_text,
+    "readability": _readability_text,
+}
+
+
+def register_backend(name: str, backend: ExtractionBackend) -> None:
+    """Register an extraction backend: a callable from page bytes to cleaned text."""
+    _BACKENDS[name] = backend
+
+
+def lxml_available() -> bool:
+    return etree is not None
+
+
+def resolve_backend(name: str = "auto") -> str:
+    """Map ``auto`` (or an unknown name) to a registered backend."""
+    if name in _BACKENDS:
+        return name
+    if name != "auto":
+        logger.warning(f"Unknown HTML extraction backend {name!r}; using auto")
+    return "readability" if lxml_available() else "bs4"
+
+
+def html_to_text(html: bytes, backend: str = "auto") -> Optional[str]:
+    """Return the cleaned main text of an HTML page (None when it has none)."""
+    if isinstance(html, str):
+        html = html.encode("utf-8")
+    if not html or not html.strip():
+        return None
+    return _BACKENDS[resolve_backend(backend)](html)
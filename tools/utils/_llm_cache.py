@@ -0,0 +1,359 @@
+"""Persistent content-addressed SQLite cache of LLM chat completions."""
+
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+MODES = ("read_write", "record", "replay")
+
+
+class LLMCacheMiss(RuntimeError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+_REFRESH: contextvars.ContextVar[bool] = contextvars.ContextVar("llm_cache_refresh", default=False)
+
+
+@contextmanager
+def llm_cache_refresh() -> Iterator[None]:
+    """Skip cached responses for calls made in the block (read_write mode).
+
+    Used for retries: the endpoint is called again and its fresh response
+    replaces the stored one, so a rejected or failed answer is not replayed.
+    Replay mode still serves recorded responses.
+    """
+    token = _REFRESH.set(True)
+    try:
+        yield
+    finally:
+        _REFRESH.reset(token)
+
+
+def response_key(
+    endpoint: str,
+    model: str,
+    messages: List[Dict[str, Any]],
+    params: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Hash (endpoint, model, messages, sampling params) into a cache key.
+
+    Messages and params are serialized as canonical JSON (sorted keys, no
+    whitespace), so the key depends only on request content.
+    """
+    payload = json.dumps(
+        {
+            "endpoint": endpoint or "",
+            "model": model or "",
+            "messages": messages,
+            "params": params or {},
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _has_content(response: Dict[str, Any]) -> bool:
+    try:
+        message = response["choices"][0]["message"]
+    except (KeyError, IndexError, TypeError):
+        return False
+    return bool(str(message.get("content") or "").strip() or message.get("tool_calls"))
+
+
+class LLMResponseCache:
+    """SQLite-backed store of chat completion responses keyed by request hash.
+
+    Modes:
+        ``read_write``: serve unexpired entries, call the endpoint on a miss
+            and store the response.
+        ``record``: always call the endpoint and overwrite the stored response.
+        ``replay``: serve stored responses regardless of age and raise
+            ``LLMCacheMiss`` instead of calling the endpoint, so recorded runs
+            can be replayed deterministically offline.
+
+    Entries older than their role's TTL are ignored outside replay mode and
+    evicted least-recently-used beyond ``max_entries``. Responses without
+    content are never stored, and calls inside ``llm_cache_refresh()`` skip
+    the lookup, so callers' retries still reach the endpoint. In read_write
+    mode only ``roles`` are cached (every role when None); record and replay
+    cover every role so a whole run can be replayed offline.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        mode: str = "read_write",
+        ttl_seconds: int = 7 * 86400,
+        role_ttl_seconds: Optional[Dict[str, int]] = None,
+        max_entries: int = 50000,
+        roles: Optional[Iterable[str]] = None,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown LLM cache mode '{mode}' (expected one of {', '.join(MODES)})")
+        self.db_path = Path(db_path or (Path.home() / ".zorora" / "llm_cache.db"))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds
+        self.role_ttl_seconds = dict(role_ttl_seconds or {})
+        self.max_entries = max_entries
+        self.roles = frozenset(roles) if roles is not None else None
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._replay_misses = 0
+        self._init_schema()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if not hasattr(self._local, "conn"):
+            self._local.conn = sqlite3.connect(
+                str(self.db_path),
+                check_same_thread=False,
+                timeout=30,
+            )
+            self._local.conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn.row_factory = sqlite3.Row
+        return self._local.conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        return self._get_connection()
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            try:
+                conn.close()
+            finally:
+                delattr(self._local, "conn")
+
+    def _init_schema(self):
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                request_key TEXT PRIMARY KEY,
+                role TEXT NOT NULL DEFAULT '',
+                endpoint TEXT NOT NULL DEFAULT '',
+                model TEXT NOT NULL DEFAULT '',
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            )
+            """
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_accessed ON llm_responses(last_accessed)"
+        )
+        self.conn.commit()
+
+    def caches(self, role: str) -> bool:
+        """Return True when calls made for ``role`` go through the cache."""
+        return self.mode != "read_write" or self.roles is None or role in self.roles
+
+    def _serves_cached(self) -> bool:
+        return self.mode == "replay" or (self.mode == "read_write" and not _REFRESH.get())
+
+    def ttl_for(self, role: str) -> int:
+        return int(self.role_ttl_seconds.get(role, self.ttl_seconds))
+
+    def get(self, key: str, role: str = "") -> Optional[Dict[str, Any]]:
+        """Return the stored response for ``key``, or None when absent or expired."""
+        now = time.time()
+        min_created = 0.0 if self.mode == "replay" else now - self.ttl_for(role)
+        try:
+            row = self.conn.execute(
+                "SELECT response FROM llm_responses WHERE request_key = ? AND created_at >= ?",
+                (key, min_created),
+            ).fetchone()
+            if row is not None:
+                self.conn.execute(
+                    "UPDATE llm_responses SET last_accessed = ? WHERE request_key = ?", (now, key)
+                )
+                self.conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            row = None
+
+        with self._stats_lock:
+            if row is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return json.loads(row["response"]) if row is not None else None
+
+    def set(
+        self,
+        key: str,
+        response: Dict[str, Any],
+        role: str = "",
+        endpoint: str = "",
+        model: str = "",
+    ) -> None:
+        """Store ``response`` under ``key``."""
+        now = time.time()
+        try:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_responses
+                (request_key, role, endpoint, model, response, created_at, last_accessed)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, role or "", endpoint or "", model or "", json.dumps(response), now, now),
+            )
+            self._evict()
+            self.conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"LLM cache write failed: {e}")
+            return
+        with self._stats_lock:
+            self._writes += 1
+
+    def complete(
+        self,
+        call: Callable[[], Dict[str, Any]],
+        endpoint: str,
+        model: str,
+        messages: List[Dict[str, Any]],
+        params: Optional[Dict[str, Any]] = None,
+        role: str = "",
+    ) -> Dict[str, Any]:
+        """Return a cached response for the request, calling ``call`` per the cache mode."""
+        key = response_key(endpoint, model, messages, params)
+        if self._serves_cached():
+            cached = self.get(key, role=role)
+            if cached is not None:
+                return cached
+            if self.mode == "replay":
+                with self._stats_lock:
+                    self._replay_misses += 1
+                raise LLMCacheMiss(f"No recorded response for {role or model} request {key[:12]}")
+
+        response = call()
+        if _has_content(response):
+            self.set(key, response, role=role, endpoint=endpoint, model=model)
+        return response
+
+    def stream(
+        self,
+        call: Callable[[], Iterator[str]],
+        endpoint: str,
+        model: str,
+        messages: List[Dict[str, Any]],
+        params: Optional[Dict[str, Any]] = None,
+        role: str = "",
+    ) -> Iterator[str]:
+        """Streaming counterpart of ``complete``.
+
+        A stored response is yielded as a single chunk; otherwise chunks from
+        ``call`` are passed through and the assembled text is stored once the
+        stream finishes, under the same key a blocking call would use.
+        """
+        key = response_key(endpoint, model, messages, params)
+        if self._serves_cached():
+            cached = self.get(key, role=role)
+            if cached is not None and _has_content(cached):
+                yield str(cached["choices"][0]["message"].get("content") or "")
+                return
+            if self.mode == "replay":
+                with self._stats_lock:
+                    self._replay_misses += 1
+                raise LLMCacheMiss(f"No recorded response for {role or model} request {key[:12]}")
+
+        parts: List[str] = []
+        for chunk in call():
+            parts.append(chunk)
+            yield chunk
+        response = {
+            "choices": [{"message": {"role": "assistant", "content": "".join(parts)}, "finish_reason": "stop"}]
+        }
+        if _has_content(response):
+            self.set(key, response, role=role, endpoint=endpoint, model=model)
+
+    def _evict(self) -> None:
+        if self.max_entries <= 0:
+            return
+        (count,) = self.conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self.conn.execute(
+                """
+                DELETE FROM llm_responses WHERE rowid IN (
+                    SELECT rowid FROM llm_responses ORDER BY last_accessed ASC LIMIT ?
+                )
+                """,
+                (overflow,),
+            )
+            logger.debug(f"LLM cache evicted {overflow} entries (max {self.max_entries})")
+
+    def clear(self) -> None:
+        """Remove every stored response and reset counters."""
+        self.conn.execute("DELETE FROM llm_responses")
+        self.conn.commit()
+        with self._stats_lock:
+            self._hits = 0
+            self._misses = 0
+            self._writes = 0
+            self._replay_misses = 0
+
+    def stats(self) -> Dict[str, object]:
+        """Return entry count, mode and process-local hit/miss/write counters."""
+        (entries,) = self.conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()
+        with self._stats_lock:
+            hits, misses, writes, replay_misses = self._hits, self._misses, self._writes, self._replay_misses
+        return {
+            "mode": self.mode,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "writes": writes,
+            "replay_misses": replay_misses,
+        }
+
+
+_CACHE: Optional[LLMResponseCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Return the process-wide LLM response cache, or None when disabled.
+
+    ``ZORORA_LLM_CACHE_MODE`` overrides the configured mode (and enables the
+    cache), so a benchmark can be recorded once and replayed offline.
+    """
+    global _CACHE
+    settings = getattr(config, "LLM_CACHE", {})
+    mode = os.environ.get("ZORORA_LLM_CACHE_MODE") or settings.get("mode", "read_write")
+    if not (settings.get("enabled", False) or os.environ.get("ZORORA_LLM_CACHE_MODE")):
+        return None
+    with _CACHE_LOCK:
+        if _CACHE is None or _CACHE.mode != mode:
+            try:
+                _CACHE = LLMResponseCache(
+                    db_path=settings.get("db_path") or None,
+                    mode=mode,
+                    ttl_seconds=settings.get("ttl_seconds", 7 * 86400),
+                    role_ttl_seconds=settings.get("role_ttl_seconds"),
+                    max_entries=settings.get("max_entries", 50000),
+                    roles=settings.get("roles"),
+                )
+            except (sqlite3.Error, OSError, ValueError) as e:
+                logger.warning(f"LLM cache unavailable: {e}")
+                return None
+        return _CACHE
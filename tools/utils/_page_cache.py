@@ -0,0 +1,243 @@
+"""Persistent SQLite cache of extracted page text for content fetching."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import config
+
+logger = logging.getLogger(__name__)
+
+_TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src"}
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL so trivially different links share a cache key.
+
+    Lowercases scheme and host, drops default ports, fragments, tracking
+    parameters (``utm_*``, ``fbclid``...) and a trailing path slash, and sorts
+    the remaining query parameters.
+    """
+    parts = urlsplit((url or "").strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path.rstrip("/") or "/"
+    params = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, path, urlencode(params), ""))
+
+
+def url_key(url: str) -> str:
+    return hashlib.sha256(normalize_url(url).encode()).hexdigest()
+
+
+class CachedPage(NamedTuple):
+    """A cached extraction plus the validators needed to revalidate it."""
+
+    text: str
+    etag: str
+    last_modified: str
+    fetched_at: float
+    fresh: bool
+
+
+class PageTextCache:
+    """SQLite-backed cache of extracted page text keyed by normalized URL.
+
+    Entries younger than ``fresh_seconds`` are served without touching the
+    network; older ones are revalidated with a conditional GET using the stored
+    ``ETag``/``Last-Modified`` validators. Entries are dropped after
+    ``ttl_seconds`` and evicted least-recently-used beyond ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        fresh_seconds: int = 86400,
+        ttl_seconds: int = 30 * 86400,
+        max_entries: int = 20000,
+    ):
+        self.db_path = Path(db_path or (Path.home() / ".zorora" / "page_cache.db"))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fresh_seconds = fresh_seconds
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._revalidated = 0
+        self._misses = 0
+        self._init_schema()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if not hasattr(self._local, "conn"):
+            self._local.conn = sqlite3.connect(
+                str(self.db_path),
+                check_same_thread=False,
+                timeout=30,
+            )
+            self._local.conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn.row_factory = sqlite3.Row
+        return self._local.conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        return self._get_connection()
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            try:
+                conn.close()
+            finally:
+                delattr(self._local, "conn")
+
+    def _init_schema(self):
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS page_text (
+                url_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                text TEXT NOT NULL,
+                etag TEXT NOT NULL DEFAULT '',
+                last_modified TEXT NOT NULL DEFAULT '',
+                fetched_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            )
+            """
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_page_text_accessed ON page_text(last_accessed)"
+        )
+        self.conn.commit()
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Return the cached page for ``url``, or None when absent or expired."""
+        now = time.time()
+        key = url_key(url)
+        try:
+            row = self.conn.execute(
+                "SELECT text, etag, last_modified, fetched_at FROM page_text WHERE url_key = ? AND fetched_at >= ?",
+                (key, now - self.ttl_seconds),
+            ).fetchone()
+            if row is not None:
+                self.conn.execute("UPDATE page_text SET last_accessed = ? WHERE url_key = ?", (now, key))
+                self.conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Page cache read failed: {e}")
+            row = None
+
+        if row is None:
+            with self._stats_lock:
+                self._misses += 1
+            return None
+        fresh = now - row["fetched_at"] < self.fresh_seconds
+        if fresh:
+            with self._stats_lock:
+                self._hits += 1
+        return CachedPage(row["text"], row["etag"], row["last_modified"], row["fetched_at"], fresh)
+
+    def set(self, url: str, text: str, etag: str = "", last_modified: str = "") -> None:
+        """Store extracted text and validators for ``url``."""
+        now = time.time()
+        try:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO page_text
+                (url_key, url, text, etag, last_modified, fetched_at, last_accessed)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (url_key(url), url, text, etag or "", last_modified or "", now, now),
+            )
+            self._evict()
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Page cache write failed: {e}")
+
+    def mark_revalidated(self, url: str) -> None:
+        """Restart the freshness window after a ``304 Not Modified``."""
+        now = time.time()
+        try:
+            self.conn.execute(
+                "UPDATE page_text SET fetched_at = ?, last_accessed = ? WHERE url_key = ?",
+                (now, now, url_key(url)),
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Page cache write failed: {e}")
+        with self._stats_lock:
+            self._revalidated += 1
+
+    def _evict(self) -> None:
+        if self.max_entries <= 0:
+            return
+        (count,) = self.conn.execute("SELECT COUNT(*) FROM page_text").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self.conn.execute(
+                """
+                DELETE FROM page_text WHERE rowid IN (
+                    SELECT rowid FROM page_text ORDER BY last_accessed ASC LIMIT ?
+                )
+                """,
+                (overflow,),
+            )
+            logger.debug(f"Page cache evicted {overflow} entries (max {self.max_entries})")
+
+    def clear(self) -> None:
+        """Remove every cached page and reset counters."""
+        self.conn.execute("DELETE FROM page_text")
+        self.conn.commit()
+        with self._stats_lock:
+            self._hits = 0
+            self._revalidated = 0
+            self._misses = 0
+
+    def stats(self) -> Dict[str, object]:
+        """Return entry count plus process-local hit/revalidation/miss counters."""
+        (entries,) = self.conn.execute("SELECT COUNT(*) FROM page_text").fetchone()
+        with self._stats_lock:
+            hits, revalidated, misses = self._hits, self._revalidated, self._misses
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "revalidated": revalidated,
+            "misses": misses,
+        }
+
+
+_CACHE: Optional[PageTextCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_page_cache() -> Optional[PageTextCache]:
+    """Return the process-wide page text cache, or None when disabled in config."""
+    global _CACHE
+    settings = getattr(config, "CONTENT_FETCH", {}).get("cache", {})
+    if not settings.get("enabled", False):
+        return None
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            try:
+                _CACHE = PageTextCache(
+                    db_path=settings.get("db_path") or None,
+                    fresh_seconds=settings.get("fresh_seconds", 86400),
+                    ttl_seconds=settings.get("ttl_seconds", 30 * 86400),
+                    max_entries=settings.get("max_entries", 20000),
+                )
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Page cache unavailable: {e}")
+                return None
+        return _CACHE
@@ -0,0 +1,201 @@
+"""Persistent SQLite cache for deep research cross-encoder relevance scores."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def query_hash(model_name: str, query: str) -> str:
+    """Hash a (model, query) pair; scores are only comparable within one model."""
+    normalized = " ".join((query or "").lower().split())
+    return hashlib.sha256(f"{model_name}|{normalized}".encode()).hexdigest()
+
+
+class RerankScoreCache:
+    """SQLite-backed cache of cross-encoder scores keyed by query hash and source id.
+
+    Reruns and follow-up research over the same query reuse stored scores
+    instead of paying inference again. Entries expire after ``ttl_seconds``
+    and are evicted least-recently-used once ``max_entries`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        ttl_seconds: int = 30 * 86400,
+        max_entries: int = 200000,
+    ):
+        self.db_path = Path(db_path or (Path.home() / ".zorora" / "rerank_cache.db"))
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._init_schema()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if not hasattr(self._local, "conn"):
+            self._local.conn = sqlite3.connect(
+                str(self.db_path),
+                check_same_thread=False,
+                timeout=30,
+            )
+            self._local.conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn.row_factory = sqlite3.Row
+        return self._local.conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        return self._get_connection()
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            try:
+                conn.close()
+            finally:
+                delattr(self._local, "conn")
+
+    def _init_schema(self):
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rerank_scores (
+                query_hash TEXT NOT NULL,
+                source_id TEXT NOT NULL,
+                score REAL NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL,
+                PRIMARY KEY (query_hash, source_id)
+            )
+            """
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rerank_scores_accessed ON rerank_scores(last_accessed)"
+        )
+        self.conn.commit()
+
+    def get_many(self, qhash: str, source_ids: Iterable[str]) -> Dict[str, float]:
+        """Return cached scores for ``source_ids`` under ``qhash`` (misses omitted)."""
+        ids = list(dict.fromkeys(source_ids))
+        if not ids:
+            return {}
+        now = time.time()
+        found: Dict[str, float] = {}
+        try:
+            # Stay well under SQLite's bound-parameter limit.
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self.conn.execute(
+                    f"""
+                    SELECT source_id, score FROM rerank_scores
+                    WHERE query_hash = ? AND created_at >= ? AND source_id IN ({placeholders})
+                    """,
+                    (qhash, now - self.ttl_seconds, *chunk),
+                ).fetchall()
+                found.update({row["source_id"]: float(row["score"]) for row in rows})
+            if found:
+                self.conn.executemany(
+                    "UPDATE rerank_scores SET last_accessed = ? WHERE query_hash = ? AND source_id = ?",
+                    [(now, qhash, sid) for sid in found],
+                )
+                self.conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Rerank cache read failed: {e}")
+            found = {}
+
+        with self._stats_lock:
+            self._hits += len(found)
+            self._misses += len(ids) - len(found)
+        return found
+
+    def set_many(self, qhash: str, scores: Dict[str, float]) -> None:
+        """Store scores for one query hash and evict past the size bound."""
+        if not scores:
+            return
+        now = time.time()
+        try:
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO rerank_scores
+                (query_hash, source_id, score, created_at, last_accessed)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [(qhash, sid, float(score), now, now) for sid, score in scores.items()],
+            )
+            self._evict()
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Rerank cache write failed: {e}")
+
+    def _evict(self) -> None:
+        if self.max_entries <= 0:
+            return
+        (count,) = self.conn.execute("SELECT COUNT(*) FROM rerank_scores").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self.conn.execute(
+                """
+                DELETE FROM rerank_scores WHERE rowid IN (
+                    SELECT rowid FROM rerank_scores ORDER BY last_accessed ASC LIMIT ?
+                )
+                """,
+                (overflow,),
+            )
+            logger.debug(f"Rerank cache evicted {overflow} entries (max {self.max_entries})")
+
+    def clear(self) -> None:
+        """Remove every cached score and reset counters."""
+        self.conn.execute("DELETE FROM rerank_scores")
+        self.conn.commit()
+        with self._stats_lock:
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> Dict[str, object]:
+        """Return entry count plus process-local hit/miss counters."""
+        (entries,) = self.conn.execute("SELECT COUNT(*) FROM rerank_scores").fetchone()
+        with self._stats_lock:
+            hits, misses = self._hits, self._misses
+        lookups = hits + misses
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+_CACHE: Optional[RerankScoreCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_rerank_cache() -> Optional[RerankScoreCache]:
+    """Return the process-wide rerank score cache, or None when disabled in config."""
+    global _CACHE
+    settings = getattr(config, "DEEP_RESEARCH", {}).get("rerank_cache", {})
+    if not settings.get("enabled", False):
+        return None
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            try:
+                _CACHE = RerankScoreCache(
+                    db_path=settings.get("db_path") or None,
+                    ttl_seconds=settings.get("ttl_seconds", 30 * 86400),
+                    max_entries=settings.get("max_entries", 200000),
+                )
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Rerank cache unavailable: {e}")
+                return None
+        return _CACHE
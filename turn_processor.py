@@ -9,6 +9,7 @@ from pathlib import Path
 
 from conversation import ConversationManager
 from llm_client import LLMClient
+from providers.admission import with_llm_priority
 from tool_executor import ToolExecutor
 from tools.registry import ToolRegistry, SPECIALIST_TOOLS, edit_file
 from tools.specialist.client import create_specialist_client
@@ -542,6 +543,7 @@ NEW_CODE:
         logger.info(f"Auto-injected context from {len(context_parts)} source(s) into {tool_name}")
         return arguments
 
+    @with_llm_priority("interactive")
     def process(self, user_input: str, forced_workflow: str = None) -> tuple[str, float]:
         """
         Process a single user turn to completion.
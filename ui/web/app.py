@@ -4,6 +4,7 @@
 import logging
 import os
 import threading
+import time
 import uuid
 import json
 from datetime import date, datetime, timedelta, timezone
@@ -19,9 +20,13 @@ from flask import (
 from engine.research_engine import ResearchEngine
 from engine.storage import LocalStorage
 from engine.deep_research_service import run_deep_research, build_results_payload
+from engine.deep_research_service import refresh_deep_research
+from engine.models import ResearchState
+from engine.research_jobs import ResearchJobRegistry, research_job_key
 from engine.query_refiner import refine_query, infer_research_type
 from ui.web.config_manager import ConfigManager, ModelFetcher
 from tools.research.newsroom import fetch_newsroom_cached
+from providers.admission import llm_priority
 from tools.specialist.client import create_specialist_client
 from tools.market.store import MarketDataStore
 from tools.market.series import SERIES_CATALOG
@@ -72,6 +77,12 @@ _local_storage = LocalStorage()
 
 # Progress tracking for research workflows
 research_progress = {}  # {research_id: {"status": str, "message": str, "phase": str}}
+research_events = {}  # {research_id: [{"event": str, "data": dict}]} incremental source/score/section events
+research_events_lock = threading.Condition()  # Notified when events are appended
+research_events_expiry = {}  # {research_id: monotonic time after which a finished run's events are dropped}
+research_events_read = {}  # {research_id: furthest event index any SSE reader has drained}
+_RESEARCH_EVENTS_GRACE_SECONDS = 300  # Keep a finished run's events this long for late SSE readers
+research_jobs = ResearchJobRegistry()  # single-flight coalescing of identical research runs
 chat_threads = {}  # lightweight in-memory thread store keyed by context id
 newsroom_api_warning = None
 _market_latest_cache = None  # (timestamp, response_list)
@@ -223,16 +234,17 @@ def _compose_chat_reply(
     try:
         model_config = config.SPECIALIZED_MODELS["reasoning"]
         client = create_specialist_client("reasoning", model_config)
-        response = client.chat_complete(
-            [
-                {
-                    "role": "system",
-                    "content": "You provide grounded follow-up analysis with clear citations.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            tools=None,
-        )
+        with llm_priority("interactive"):
+            response = client.chat_complete(
+                [
+                    {
+                        "role": "system",
+                        "content": "You provide grounded follow-up analysis with clear citations.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                tools=None,
+            )
         content = client.extract_content(response)
         if content and content.strip():
             return content.strip()
@@ -436,6 +448,76 @@ def auth_signup():
     )
 
 
+def _research_targets(research_id: str, job_key: str = None) -> list:
+    """Research IDs that should receive updates from this run (coalesced duplicates included)."""
+    if job_key:
+        participants = research_jobs.participants(job_key)
+        if participants:
+            return [p.research_id for p in participants]
+    return [research_id]
+
+
+def _buffer_research_event(research_id: str, event: str, payload: dict) -> None:
+    """Append an event to ``research_id``'s buffer; caller holds ``research_events_lock``.
+
+    Streamed ``section_delta`` text that no reader has drained yet is merged
+    into the section's pending delta, and a final ``section`` (or a newer
+    attempt) drops the drafts it supersedes, so the buffer grows with the
+    number of sections rather than the number of streamed tokens.
+    """
+    events = research_events.setdefault(research_id, [])
+    unread = research_events_read.get(research_id, 0)
+    index = payload.get("index") if event in ("section_delta", "section") else None
+    if index is not None:
+        attempt = payload.get("attempt") if event == "section_delta" else None
+        for pos in range(len(events) - 1, unread - 1, -1):
+            item = events[pos]
+            if item["event"] != "section_delta" or item["data"].get("index") != index:
+                continue
+            if attempt is not None and item["data"].get("attempt") == attempt:
+                # New dicts: coalesced runs share event dicts copied from the leader's buffer.
+                merged = {**item["data"], "delta": item["data"]["delta"] + payload["delta"]}
+                events[pos] = {"event": event, "data": merged}
+                return
+            del events[pos]
+    events.append({"event": event, "data": payload})
+
+
+def _expire_research_events(research_ids=()) -> None:
+    """Schedule finished runs' buffered events for eviction and drop any whose grace period is over.
+
+    Late SSE readers can still drain a run's events for
+    ``_RESEARCH_EVENTS_GRACE_SECONDS``; the sweep runs whenever a research
+    run starts or finishes, so no one has to be watching.
+    """
+    now = time.monotonic()
+    with research_events_lock:
+        for target_id in research_ids:
+            research_events_expiry[target_id] = now + _RESEARCH_EVENTS_GRACE_SECONDS
+        for target_id, expires in list(research_events_expiry.items()):
+            if expires <= now:
+                research_events.pop(target_id, None)
+                research_events_read.pop(target_id, None)
+                research_events_expiry.pop(target_id, None)
+
+
+def _save_for_participants(state, participants, leader_user_id, leader_research_id) -> dict:
+    """Map each coalesced request to a research_id visible to its own user.
+
+    Participants sharing the leader's user reuse the leader's saved research;
+    other users get their own copy so history and ownership checks work.
+    """
+    saved = {leader_user_id: leader_research_id}
+    research_ids = {}
+    for participant in participants:
+        if participant.user_id not in saved:
+            state.user_id = participant.user_id
+            saved[participant.user_id] = research_engine.save_research(state)
+        research_ids[participant.research_id] = saved[participant.user_id]
+    state.user_id = leader_user_id
+    return research_ids
+
+
 def _run_research_with_progress(
     research_id: str,
     query: str,
@@ -444,16 +526,29 @@ def _run_research_with_progress(
     research_type: str = None,
     asset_metadata: dict = None,
     user_id: str = None,
+    job_key: str = None,
 ):
-    """Run research workflow in background thread and emit progress updates."""
+    """Run research workflow in background thread and emit progress updates.
+
+    When ``job_key`` is set, requests coalesced onto this run (see
+    ``research_jobs``) receive the same progress, source events and results.
+    """
     try:
 
         def on_progress(status: str, phase: str, message: str):
-            research_progress[research_id] = {
+            update = {
                 "status": status,
                 "message": message,
                 "phase": phase,
             }
+            for target_id in _research_targets(research_id, job_key):
+                research_progress[target_id] = dict(update)
+
+        def on_source_event(event: str, payload: dict):
+            with research_events_lock:
+                for target_id in _research_targets(research_id, job_key):
+                    _buffer_research_event(target_id, event, payload)
+                research_events_lock.notify_all()
 
         profile = config.DEPTH_PROFILES.get(depth, config.DEPTH_PROFILES[1])
 
@@ -462,6 +557,7 @@ def _run_research_with_progress(
             depth=depth,
             max_results_per_source=profile["max_results_per_source"],
             progress_callback=on_progress,
+            source_callback=on_source_event,
             refined_query=refined_query,
             research_type=research_type,
             asset_metadata=asset_metadata,
@@ -470,28 +566,137 @@ def _run_research_with_progress(
         # Set user_id on state before saving (for user-specific research history)
         if user_id:
             state.user_id = user_id
+        if job_key:
+            state.job_key = job_key
 
         research_id_actual = research_engine.save_research(state)
 
-        research_progress[research_id] = {
+        participants = research_jobs.finish(job_key) if job_key else []
+        saved_ids = _save_for_participants(state, participants, user_id, research_id_actual)
+        target_ids = [research_id] + [p.research_id for p in participants if p.research_id != research_id]
+        for target_id in target_ids:
+            research_progress[target_id] = {
+                "status": "completed",
+                "message": f"Research complete! Found {state.total_sources} sources.",
+                "phase": "complete",
+                "results": build_results_payload(
+                    state,
+                    query,
+                    research_id=saved_ids.get(target_id, research_id_actual),
+                    max_sources=profile["max_sources"],
+                ),
+            }
+        _expire_research_events(target_ids)
+
+    except Exception as e:
+        logger.error(f"Research error: {e}", exc_info=True)
+        participants = research_jobs.finish(job_key) if job_key else []
+        target_ids = {research_id, *(p.research_id for p in participants)}
+        for target_id in target_ids:
+            research_progress[target_id] = {
+                "status": "error",
+                "message": f"Error: {str(e)}",
+                "phase": "error",
+            }
+        _expire_research_events(target_ids)
+
+
+def _reuse_recent_research(
+    research_id: str, job_key: str, query: str, depth: int, user_id: str = None, user_ids: list = None
+) -> bool:
+    """Serve a recently completed identical run from storage instead of recomputing.
+
+    Only runs owned by ``user_ids`` (the requester's accessible users) are
+    reused. Returns True when ``research_progress[research_id]`` was populated
+    with completed results from a stored run inside the configured reuse window.
+    """
+    settings = getattr(config, "DEEP_RESEARCH", {}).get("coalescing", {})
+    window = float(settings.get("reuse_window_seconds", 0) or 0)
+    if window <= 0:
+        return False
+
+    storage = research_engine.storage
+    row = storage.find_recent_research(job_key, window, user_ids=user_ids)
+    if not row:
+        return False
+    data = storage.load_research(row["research_id"], user_ids=user_ids)
+    if not data:
+        return False
+
+    state = ResearchState.from_dict(data)
+    reused_id = row["research_id"]
+    if row.get("user_id") != user_id:
+        # A teammate's run: give the requesting user their own copy for their history.
+        state.user_id = user_id
+        state.job_key = job_key
+        reused_id = research_engine.save_research(state)
+
+    profile = config.DEPTH_PROFILES.get(depth, config.DEPTH_PROFILES[1])
+    research_progress[research_id] = {
+        "status": "completed",
+        "message": f"Reused research completed {row['completed_at']}. Found {state.total_sources} sources.",
+        "phase": "complete",
+        "reused": True,
+        "results": build_results_payload(
+            state, query, research_id=reused_id, max_sources=profile["max_sources"]
+        ),
+    }
+    logger.info(f"Reusing research {row['research_id']} for {research_id} (job_key={job_key[:12]})")
+    return True
+
+
+def _run_refresh_with_progress(progress_id: str, prior_state: ResearchState, user_id: str = None):
+    """Run an incremental refresh in a background thread and emit progress updates."""
+    try:
+
+        def on_progress(status: str, phase: str, message: str):
+            research_progress[progress_id] = {
+                "status": status,
+                "message": message,
+                "phase": phase,
+            }
+
+        def on_source_event(event: str, payload: dict):
+            with research_events_lock:
+                _buffer_research_event(progress_id, event, payload)
+                research_events_lock.notify_all()
+
+        state, summary = refresh_deep_research(
+            prior_state,
+            progress_callback=on_progress,
+            source_callback=on_source_event,
+        )
+        if user_id:
+            state.user_id = user_id
+        research_id_actual = research_engine.save_research(state)
+
+        profile = config.DEPTH_PROFILES.get(state.max_depth, config.DEPTH_PROFILES[1])
+        results = build_results_payload(
+            state,
+            state.original_query,
+            research_id=research_id_actual,
+            max_sources=profile["max_sources"],
+        )
+        results["refresh"] = summary
+        research_progress[progress_id] = {
             "status": "completed",
-            "message": f"Research complete! Found {state.total_sources} sources.",
-            "phase": "complete",
-            "results": build_results_payload(
-                state,
-                query,
-                research_id=research_id_actual,
-                max_sources=profile["max_sources"],
+            "message": (
+                f"Refresh complete! {summary['new_sources']} new sources, "
+                f"{len(summary['regenerated_sections'])} section(s) updated."
             ),
+            "phase": "complete",
+            "results": results,
         }
 
     except Exception as e:
-        logger.error(f"Research error: {e}", exc_info=True)
-        research_progress[research_id] = {
+        logger.error(f"Research refresh error: {e}", exc_info=True)
+        research_progress[progress_id] = {
             "status": "error",
             "message": f"Error: {str(e)}",
             "phase": "error",
         }
+    finally:
+        _expire_research_events([progress_id])
 
 
 @app.route("/api/research/refine", methods=["POST"])
@@ -559,6 +764,53 @@ def start_research():
         # Generate unique research ID for progress tracking
         research_id = str(uuid.uuid4())
 
+        # Get user_id from request (set by @require_research_quota decorator)
+        user_id = request.user.get("user_id") if hasattr(request, "user") else None
+
+        response = {
+            "research_id": research_id,
+            "status": "started",
+            "query": query,
+            "retrieved_at": datetime.now(timezone.utc).isoformat(),
+            "strict_citations_default": False,
+        }
+
+        job_key = None
+        if getattr(config, "DEEP_RESEARCH", {}).get("coalescing", {}).get("enabled", False):
+            from ui.web.auth import get_accessible_user_ids
+
+            # Only coalesce with or reuse runs the requester could open from history.
+            accessible_user_ids = get_accessible_user_ids(user_id) if user_id else None
+            job_key = research_job_key(
+                query,
+                depth,
+                research_type=research_type,
+                refined_query=refined_query,
+                asset_metadata=asset_metadata,
+                owner_ids=accessible_user_ids,
+            )
+            try:
+                if _reuse_recent_research(
+                    research_id, job_key, query, depth, user_id=user_id, user_ids=accessible_user_ids
+                ):
+                    return jsonify({**response, "reused": True})
+            except Exception as e:
+                logger.warning(f"Research reuse lookup failed (non-fatal): {e}")
+
+            leader_id = research_jobs.attach(job_key, research_id, user_id=user_id)
+            if leader_id is not None:
+                # Attach to the identical in-flight run instead of starting another.
+                research_progress[research_id] = dict(
+                    research_progress.get(leader_id)
+                    or {"status": "starting", "message": "Initializing research workflow...", "phase": "init"}
+                )
+                with research_events_lock:
+                    research_events[research_id] = list(research_events.get(leader_id, []))
+                logger.info(f"Coalesced research {research_id} onto in-flight {leader_id}")
+                return jsonify({**response, "coalesced_with": leader_id})
+
+        _expire_research_events()
+
         # Initialize progress
         research_progress[research_id] = {
             "status": "starting",
@@ -566,9 +818,6 @@ def start_research():
             "phase": "init",
         }
 
-        # Get user_id from request (set by @require_research_quota decorator)
-        user_id = request.user.get("user_id") if hasattr(request, "user") else None
-
         # Start research in background thread
         thread = threading.Thread(
             target=_run_research_with_progress,
@@ -578,20 +827,18 @@ def start_research():
                 "research_type": research_type,
                 "asset_metadata": asset_metadata,
                 "user_id": user_id,
+                "job_key": job_key,
             },
             daemon=True,
         )
-        thread.start()
+        try:
+            thread.start()
+        except Exception:
+            if job_key:
+                research_jobs.finish(job_key)
+            raise
 
-        return jsonify(
-            {
-                "research_id": research_id,
-                "status": "started",
-                "query": query,
-                "retrieved_at": datetime.now(timezone.utc).isoformat(),
-                "strict_citations_default": False,
-            }
-        )
+        return jsonify(response)
 
     except Exception as e:
         logger.error(f"Research error: {e}", exc_info=True)
@@ -604,15 +851,32 @@ def get_research_progress(research_id):
     Get progress updates for research (Server-Sent Events).
 
     Returns:
-    SSE stream with progress updates
+    SSE stream with progress updates. Sources are streamed as named
+    ``sources`` events as each aggregation channel finishes, and their
+    scores are patched in later via ``scores`` events. During synthesis the
+    ``outline``, ``section_delta`` (streamed draft text) and ``section``
+    (final, quality-gated text) events let the report render as it is written.
     """
 
+    def drain_events(cursor: int):
+        with research_events_lock:
+            pending = research_events.get(research_id, [])[cursor:]
+            if pending:
+                # Drained events are final: later deltas are no longer merged into them.
+                research_events_read[research_id] = max(research_events_read.get(research_id, 0), cursor + len(pending))
+        return pending, cursor + len(pending)
+
+    def wait_for_events(cursor: int, timeout: float) -> None:
+        # Wake early for new events so streamed section text is not held to the poll interval.
+        with research_events_lock:
+            if len(research_events.get(research_id, [])) <= cursor:
+                research_events_lock.wait(timeout)
+
     def generate():
         """Generate SSE events for progress updates."""
-        import time
-
         last_status = None
         last_message = None
+        event_cursor = 0
 
         while True:
             if research_id not in research_progress:
@@ -623,6 +887,10 @@ def get_research_progress(research_id):
             status = progress.get("status")
             message = progress.get("message")
 
+            events, event_cursor = drain_events(event_cursor)
+            for item in events:
+                yield f"event: {item['event']}\ndata: {json.dumps(item['data'])}\n\n"
+
             # Send update if status or message changed
             if status != last_status or message != last_message:
                 yield f"data: {json.dumps(progress)}\n\n"
@@ -631,9 +899,13 @@ def get_research_progress(research_id):
 
                 # Close connection if completed or error
                 if status in ["completed", "error"]:
+                    with research_events_lock:
+                        research_events.pop(research_id, None)
+                        research_events_read.pop(research_id, None)
+                        research_events_expiry.pop(research_id, None)
                     break
 
-            time.sleep(0.5)  # Poll every 500ms
+            wait_for_events(event_cursor, 0.5)  # Poll every 500ms, sooner when events arrive
 
     return Response(
         stream_with_context(generate()),
@@ -677,6 +949,110 @@ def get_research(research_id):
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/research/<research_id>/refresh", methods=["POST"])
+@require_research_quota
+def refresh_research(research_id):
+    """
+    Incrementally refresh a stored research run (async with progress tracking).
+
+    Only sources not already in the stored run are scored and fetched, and
+    only sections whose supporting evidence changed are regenerated. The
+    refreshed run is saved as a new research entry.
+
+    Returns:
+    {
+        "research_id": str,      # progress id for /api/research/<id>/progress
+        "status": "started",
+        "refreshed_from": str
+    }
+    """
+    try:
+        user_id = request.user.get("user_id") if hasattr(request, "user") else None
+        from ui.web.auth import get_accessible_user_ids
+
+        accessible_user_ids = get_accessible_user_ids(user_id) if user_id else None
+        research_data = research_engine.storage.load_research(research_id, user_ids=accessible_user_ids)
+        if not research_data:
+            return jsonify({"error": "Research data not found or unauthorized"}), 404
+
+        prior_state = ResearchState.from_dict(research_data)
+        if prior_state.research_type == "diligence":
+            return jsonify({"error": "Diligence research cannot be refreshed incrementally"}), 400
+
+        progress_id = str(uuid.uuid4())
+        research_progress[progress_id] = {
+            "status": "starting",
+            "message": "Preparing incremental refresh...",
+            "phase": "init",
+        }
+        thread = threading.Thread(
+            target=_run_refresh_with_progress,
+            args=(progress_id, prior_state),
+            kwargs={"user_id": user_id},
+            daemon=True,
+        )
+        thread.start()
+
+        return jsonify(
+            {
+                "research_id": progress_id,
+                "status": "started",
+                "query": prior_state.original_query,
+                "refreshed_from": research_id,
+                "retrieved_at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+
+    except Exception as e:
+        logger.error(f"Research refresh error: {e}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/api/research/<research_id>/timings", methods=["GET"])
+@require_auth
+def get_research_timings(research_id):
+    """
+    Per-stage timing spans recorded for a research run.
+
+    Returns:
+    {
+        "research_id": str,
+        "spans": [{"stage", "start_ms", "duration_ms", "items", "meta"}, ...],
+        "stages": {stage: {"count": int, "duration_ms": float, "items": int}},
+        "wall_ms": float
+    }
+    """
+    try:
+        user_id = request.user.get("user_id") if hasattr(request, "user") else None
+        from ui.web.auth import get_accessible_user_ids
+
+        accessible_user_ids = get_accessible_user_ids(user_id) if user_id else None
+        spans = research_engine.storage.get_timings(research_id, user_ids=accessible_user_ids)
+        if spans is None:
+            return jsonify({"error": "Research data not found or unauthorized"}), 404
+
+        stages = {}
+        for span in spans:
+            entry = stages.setdefault(span["stage"], {"count": 0, "duration_ms": 0.0, "items": 0})
+            entry["count"] += 1
+            entry["duration_ms"] = round(entry["duration_ms"] + span["duration_ms"], 3)
+            entry["items"] += span["items"] or 0
+        wall_ms = max((span["start_ms"] + span["duration_ms"] for span in spans), default=0.0)
+
+        return jsonify(
+            {
+                "research_id": research_id,
+                "spans": spans,
+                "stages": stages,
+                "wall_ms": round(wall_ms, 3),
+            }
+        )
+
+    except Exception as e:
+        logger.error(f"Get research timings error: {e}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+
 @app.route("/api/research/<research_id>/chat", methods=["POST"])
 @require_auth
 def research_chat(research_id):
@@ -125,6 +125,10 @@ class ConfigManager:
             
             # Write config file
             self._write_config_file(merged)
+
+            # Drop long-lived specialist clients built from the old settings
+            from tools.specialist.client import invalidate_specialist_clients
+            invalidate_specialist_clients()
             
             return {"success": True, "error": None}
             
@@ -1,4 +1,5 @@
-"""Shared background refresh threads for market, regulatory, and alert data.
+"""Shared background refresh threads for market, regulatory, and alert data,
+plus the optional LLM endpoint keep-warm pinger.
 
 Used by both main.py (REPL) and web_main.py (Flask) to keep data current.
 """
@@ -9,11 +10,14 @@ import logging
 import threading
 import time
 
+from providers.admission import with_llm_priority
+
 logger = logging.getLogger(__name__)
 
 
 def start_market_refresh_thread():
     """Start a daemon thread that incrementally updates stale market series."""
+    @with_llm_priority("background")
     def _refresh_loop():
         import config
         from workflows.market_workflow import MarketWorkflow
@@ -35,6 +39,7 @@ def start_market_refresh_thread():
 
 def start_regulatory_refresh_thread():
     """Start a daemon thread that incrementally updates stale regulatory sources."""
+    @with_llm_priority("background")
     def _refresh_loop():
         import config
         from workflows.regulatory_workflow import RegulatoryWorkflow
@@ -56,6 +61,7 @@ def start_regulatory_refresh_thread():
 
 def start_alert_check_thread():
     """Start a daemon thread that checks and executes due alerts."""
+    @with_llm_priority("background")
     def _alert_loop():
         from tools.alerts.store import AlertStore
         from workflows.alert_runner import execute_alert
@@ -81,6 +87,7 @@ def start_alert_check_thread():
 
 def start_newsroom_refresh_thread():
     """Start a daemon thread that periodically refreshes the newsroom cache."""
+    @with_llm_priority("background")
     def _refresh_loop():
         from tools.research.newsroom import fetch_newsroom_cached
         while True:
@@ -99,9 +106,36 @@ def start_newsroom_refresh_thread():
     return t
 
 
+def start_keep_warm_thread():
+    """Start a daemon thread that pings scale-to-zero LLM endpoints during active hours.
+
+    Returns None without starting anything unless ``KEEP_WARM["enabled"]``.
+    """
+    import config
+
+    if not getattr(config, "KEEP_WARM", {}).get("enabled", False):
+        return None
+
+    @with_llm_priority("background")
+    def _keep_warm_loop():
+        from workflows.keep_warm import run_keep_warm_cycle
+
+        while True:
+            try:
+                run_keep_warm_cycle()
+            except Exception as e:
+                logger.debug("Keep-warm cycle failed: %s", e)
+            time.sleep(config.KEEP_WARM.get("interval_seconds", 600))
+
+    t = threading.Thread(target=_keep_warm_loop, daemon=True, name="keep-warm")
+    t.start()
+    return t
+
+
 def start_all_background_threads():
     """Start all background refresh threads. Safe to call from any entry point."""
     start_market_refresh_thread()
     start_regulatory_refresh_thread()
     start_alert_check_thread()
     start_newsroom_refresh_thread()
+    start_keep_warm_thread()
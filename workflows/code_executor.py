@@ -1,10 +1,12 @@
 """Code execution using Codestral to implement planned changes."""
 
 import logging
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, List
 import json
 
+from tools.utils._llm_cache import llm_cache_refresh
 from workflows.code_tools import write_file, edit_file, lint_file, install_dependencies
 
 logger = logging.getLogger(__name__)
@@ -186,10 +188,11 @@ class CodeExecutor:
                         attempt=attempt
                     )
 
-                # Generate edit
-                result = self.tool_executor.execute("use_coding_agent", {
-                    "code_context": edit_prompt
-                })
+                # Generate edit (retries must reach the model, not a cached answer)
+                with llm_cache_refresh() if attempt > 0 else nullcontext():
+                    result = self.tool_executor.execute("use_coding_agent", {
+                        "code_context": edit_prompt
+                    })
 
                 # Extract instructions
                 edit_instructions = self._extract_edit_instructions(result, current_content)
@@ -1,12 +1,13 @@
 """Source aggregator - collects sources from academic, web, and newsroom."""
 
+import asyncio
 import logging
-from typing import List, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from typing import Callable, List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
-import requests
-
 import config
 from engine.models import Source
 from tools.research.academic_search import academic_search_sources
@@ -16,6 +17,18 @@ from tools.research.worldbank_search import worldbank_search_sources
 from tools.research.policy_search import policy_search_sources
 from tools.research.sec_search import sec_search_sources
 from tools.research.local_sme_corpus import load_local_sme_sources
+from tools.utils._async_http import (
+    BoundedLane,
+    HTTPRequest,
+    async_counterpart,
+    async_variant,
+    call_channel,
+    drive_async,
+    drive_sync,
+    run_blocking,
+    run_sync,
+)
+from tools.utils._channel_cache import get_channel_cache
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +47,95 @@ SEC_KEYWORDS = {
 }
 
 
+# Per-channel latency budgets (seconds) used when DEEP_RESEARCH has no override.
+DEFAULT_CHANNEL_TIMEOUTS = {
+    "academic": 25,
+    "web": 15,
+    "newsroom": 30,
+    "world_bank": 20,
+    "brave_news": 12,
+    "policy": 20,
+    "sec_edgar": 20,
+    "local_sme": 60,
+}
+
+_CHANNEL_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_CHANNEL_LANES: Dict[str, BoundedLane] = {}
+_CHANNEL_EXECUTOR_LOCK = threading.Lock()
+
+# How often a running aggregation checks its cancel_event (seconds).
+_CANCEL_POLL_SECONDS = 0.1
+
+
+class AggregatedSources(list):
+    """List of aggregated Source objects plus per-channel outcome metadata.
+
+    Behaves exactly like the plain list ``aggregate_sources`` always returned;
+    ``timed_out_channels`` names channels abandoned at their deadline,
+    ``channel_counts`` maps each finished channel to its result count and
+    ``channel_durations`` maps each channel to its wall time in milliseconds
+    (the budget, for timed-out channels). ``cancelled_channels`` names channels
+    abandoned because the caller set ``cancel_event``.
+    """
+
+    def __init__(
+        self,
+        sources=(),
+        timed_out_channels=None,
+        channel_counts=None,
+        channel_durations=None,
+        cancelled_channels=None,
+    ):
+        super().__init__(sources)
+        self.timed_out_channels: List[str] = list(timed_out_channels or [])
+        self.channel_counts: Dict[str, int] = dict(channel_counts or {})
+        self.channel_durations: Dict[str, float] = dict(channel_durations or {})
+        self.cancelled_channels: List[str] = list(cancelled_channels or [])
+
+
+def _get_channel_executor() -> ThreadPoolExecutor:
+    """Return the shared pool that runs blocking (non-async) channel fetches."""
+    global _CHANNEL_EXECUTOR
+    with _CHANNEL_EXECUTOR_LOCK:
+        if _CHANNEL_EXECUTOR is None:
+            settings = getattr(config, "DEEP_RESEARCH", {})
+            max_workers = max(1, int(settings.get("channel_concurrency", 32)))
+            _CHANNEL_EXECUTOR = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="deep-research-channel",
+            )
+        return _CHANNEL_EXECUTOR
+
+
+def _channel_lane(channel: str) -> BoundedLane:
+    """Return ``channel``'s share of the channel pool (``DEEP_RESEARCH["channel_pool_share"]`` workers).
+
+    Calls abandoned at their deadline keep their worker until they return;
+    the lane keeps one hung provider from filling the pool shared by every
+    other channel and research job.
+    """
+    pool = _get_channel_executor()
+    with _CHANNEL_EXECUTOR_LOCK:
+        lane = _CHANNEL_LANES.get(channel)
+        if lane is None:
+            share = getattr(config, "DEEP_RESEARCH", {}).get("channel_pool_share", 8)
+            lane = _CHANNEL_LANES[channel] = BoundedLane(pool, share)
+        return lane
+
+
+def _channel_budget(channel: str, overrides: Optional[Dict[str, float]] = None) -> Optional[float]:
+    """Resolve a channel's latency budget in seconds (None means no deadline)."""
+    if overrides and channel in overrides:
+        budget = overrides[channel]
+    else:
+        settings = getattr(config, "DEEP_RESEARCH", {})
+        budgets = {**DEFAULT_CHANNEL_TIMEOUTS, **settings.get("channel_timeouts", {})}
+        budget = budgets.get(channel, settings.get("channel_timeout_default", 30))
+    if budget is None or float(budget) <= 0:
+        return None
+    return float(budget)
+
+
 def _query_matches_keywords(query: str, keywords: set) -> bool:
     """Check if query contains any of the given keywords (case-insensitive)."""
     query_lower = query.lower()
@@ -190,6 +292,111 @@ def scouting_knowledge_sources(query: str, imaging_store) -> List[Source]:
         return []
 
 
+def _brave_news_plan(query: str, max_results: int = 10):
+    """Fetch past-week results from the Brave News API (request plan, see ``_async_http``)."""
+    news_endpoint = config.BRAVE_SEARCH.get(
+        "news_endpoint", "https://api.search.brave.com/res/v1/news/search"
+    )
+    headers = {
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip",
+        "X-Subscription-Token": config.BRAVE_SEARCH["api_key"],
+    }
+    params = {
+        "q": query,
+        "count": min(max_results, 20),
+        "search_lang": "en",
+        "freshness": "pw",  # Past week
+    }
+
+    response = yield HTTPRequest(
+        news_endpoint,
+        params=params,
+        headers=headers,
+        timeout=config.BRAVE_SEARCH.get("timeout", 10),
+    )
+    response.raise_for_status()
+
+    news_results = response.json().get("results", [])
+    sources = []
+    for item in news_results:
+        url = item.get("url", "")
+        title = item.get("title", "No title")
+        description = item.get("description", "")
+        source_id = Source.generate_id(url) if url else Source.generate_id(title)
+
+        # Extract source domain
+        source_name = ""
+        if url:
+            try:
+                source_name = urlparse(url).netloc.replace("www.", "")
+            except Exception:
+                pass
+
+        snippet_parts = []
+        if source_name:
+            snippet_parts.append(f"Source: {source_name}")
+        if description:
+            snippet_parts.append(description[:300])
+
+        source = Source(
+            source_id=source_id,
+            url=url,
+            title=title,
+            source_type="news",
+            content_snippet=" | ".join(snippet_parts),
+            publication_date=item.get("age", ""),
+        )
+        sources.append(source)
+
+    logger.info(f"Brave News returned {len(sources)} results")
+    return sources
+
+
+def brave_news_sources(query: str, max_results: int = 10) -> List[Source]:
+    """Fetch past-week results from the Brave News API as Source objects."""
+    return drive_sync(_brave_news_plan(query, max_results))
+
+
+@async_variant(brave_news_sources)
+async def brave_news_sources_async(query: str, max_results: int = 10) -> List[Source]:
+    """Async form of ``brave_news_sources`` on the shared HTTP pool."""
+    return await drive_async(_brave_news_plan(query, max_results))
+
+
+async def _cached_channel(
+    channel: str,
+    query: str,
+    max_results: int,
+    fetch,
+    on_start: Optional[Callable[[], None]] = None,
+) -> List[Source]:
+    """Serve a channel query through the persistent channel cache when enabled.
+
+    ``fetch`` is a zero-argument coroutine function. Cache reads and writes
+    (SQLite) run on the channel's lane of the channel pool so they never
+    stall the I/O loop; ``on_start`` is called when a worker picks up the
+    cache read. Empty results are not cached (see ``ChannelResultCache.get_or_fetch``).
+    """
+    cache = get_channel_cache()
+    if cache is None:
+        return await fetch()
+    executor = _channel_lane(channel)
+
+    def read():
+        if on_start is not None:
+            on_start()
+        return cache.get(channel, query, max_results)
+
+    cached = await run_blocking(read, executor=executor)
+    if cached is not None:
+        return cached
+    sources = await fetch()
+    if sources:
+        await run_blocking(cache.set, channel, query, max_results, sources, executor=executor)
+    return sources
+
+
 def parse_newsroom_results(articles: List[Dict[str, Any]], query: str) -> List[Source]:
     """Parse newsroom API articles into Source objects, filtering by query relevance."""
     keywords = _extract_keywords(query) if query else []
@@ -243,40 +450,126 @@ def aggregate_sources(
     sme_intent_domain: str = "",
     asset_metadata: dict = None,
     imaging_store=None,
+    channel_timeouts: Optional[Dict[str, float]] = None,
+    on_channel_complete: Optional[Callable[[str, List[Source]], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
 ) -> List[Source]:
     """
     Aggregate sources from academic, web, newsroom, and optionally Brave News in parallel.
 
+    Sync shim over ``aggregate_sources_async``: the channels run on the shared
+    research I/O loop while the calling thread waits.
+
+    Each channel runs against its own latency budget (``DEEP_RESEARCH["channel_timeouts"]``,
+    overridable per call), timed from when its work starts: a blocking channel waiting for a
+    worker is not charged for the wait, but is dropped if it is still waiting after a full
+    budget. Channels still running at their deadline are abandoned and the sources from
+    channels that did finish are returned.
+
     Args:
         query: Research query
         max_results_per_source: Max results per source type
         include_brave_news: Whether to include Brave News API results (depth 3)
         force_policy: Force-include policy channel even when query has no policy keywords
         suppress_policy: Force-exclude policy channel regardless of query keywords
+        channel_timeouts: Optional per-channel budget overrides in seconds (<= 0 disables)
+        on_channel_complete: Optional ``(channel, sources)`` hook invoked as each channel
+            finishes, so callers can surface results before the slowest channel returns
+        cancel_event: Optional event; once set, channels still running are abandoned and
+            the sources gathered so far are returned (used for early termination)
 
     Returns:
-        List of Source objects
+        AggregatedSources (a list of Source objects) recording any timed-out channels
+    """
+    return run_sync(
+        aggregate_sources_async(
+            query,
+            max_results_per_source=max_results_per_source,
+            include_brave_news=include_brave_news,
+            force_policy=force_policy,
+            suppress_policy=suppress_policy,
+            include_local_sme=include_local_sme,
+            sme_intent_domain=sme_intent_domain,
+            asset_metadata=asset_metadata,
+            imaging_store=imaging_store,
+            channel_timeouts=channel_timeouts,
+            on_channel_complete=on_channel_complete,
+            cancel_event=cancel_event,
+        )
+    )
+
+
+async def aggregate_sources_async(
+    query: str,
+    max_results_per_source: int = 10,
+    include_brave_news: bool = False,
+    force_policy: bool = False,
+    suppress_policy: bool = False,
+    include_local_sme: bool = False,
+    sme_intent_domain: str = "",
+    asset_metadata: dict = None,
+    imaging_store=None,
+    channel_timeouts: Optional[Dict[str, float]] = None,
+    on_channel_complete: Optional[Callable[[str, List[Source]], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> List[Source]:
+    """Async form of ``aggregate_sources`` (same arguments and result).
+
+    Channels with a registered async form (``async_variant``) run natively on
+    the pooled HTTP client and are cancelled at their deadline; blocking-only
+    channels (newsroom, local SME corpus) run on their lane of the shared
+    channel pool (see ``_channel_lane``).
     """
+    if cancel_event is not None and cancel_event.is_set():
+        logger.info(f"Aggregation cancelled before start: {query[:60]}...")
+        return AggregatedSources()
+
     logger.info(f"Aggregating sources for: {query[:60]}... (brave_news={include_brave_news})")
     all_sources = []
+    # When each channel's work actually started (async call or worker pickup);
+    # deadlines run from here, so queue time on the channel pool is not charged.
+    picked_up: Dict[str, float] = {}
+
+    def mark_started(channel: str) -> None:
+        picked_up.setdefault(channel, time.monotonic())
+
+    def channel_call(channel, fn, *args, **kwargs):
+        if async_counterpart(fn) is not None:
+            mark_started(channel)
+            return call_channel(fn, *args, **kwargs)
 
-    def fetch_academic():
+        def run():
+            mark_started(channel)
+            return fn(*args, **kwargs)
+
+        return run_blocking(run, executor=_channel_lane(channel))
+
+    def cached(channel, fn):
+        return _cached_channel(
+            channel, query, max_results_per_source,
+            lambda: channel_call(channel, fn, query, max_results=max_results_per_source),
+            on_start=lambda: mark_started(channel),
+        )
+
+    async def fetch_academic():
         try:
-            return academic_search_sources(query, max_results=max_results_per_source)
+            return await cached("academic", academic_search_sources)
         except Exception as e:
             logger.warning(f"Academic search failed: {e}")
             return []
 
-    def fetch_web():
+    async def fetch_web():
         try:
-            return web_search_sources(query, max_results=max_results_per_source)
+            return await cached("web", web_search_sources)
         except Exception as e:
             logger.warning(f"Web search failed: {e}")
             return []
 
-    def fetch_newsroom():
+    async def fetch_newsroom():
         try:
-            articles = fetch_newsroom_api(
+            articles = await channel_call(
+                "newsroom",
+                fetch_newsroom_api,
                 query,
                 days_back=90,
                 max_results=max_results_per_source,
@@ -287,99 +580,43 @@ def aggregate_sources(
             logger.warning(f"Newsroom fetch failed: {e}")
             return []
 
-    def fetch_brave_news():
+    async def fetch_brave_news():
         """Fetch news results from Brave News API."""
         try:
             if not config.BRAVE_SEARCH.get("enabled") or not config.BRAVE_SEARCH.get("api_key"):
                 logger.warning("Brave News skipped: API not configured")
                 return []
-
-            news_endpoint = config.BRAVE_SEARCH.get(
-                "news_endpoint", "https://api.search.brave.com/res/v1/news/search"
-            )
-            headers = {
-                "Accept": "application/json",
-                "Accept-Encoding": "gzip",
-                "X-Subscription-Token": config.BRAVE_SEARCH["api_key"],
-            }
-            params = {
-                "q": query,
-                "count": min(max_results_per_source, 20),
-                "search_lang": "en",
-                "freshness": "pw",  # Past week
-            }
-
-            response = requests.get(
-                news_endpoint,
-                headers=headers,
-                params=params,
-                timeout=config.BRAVE_SEARCH.get("timeout", 10),
-            )
-            response.raise_for_status()
-
-            news_results = response.json().get("results", [])
-            sources = []
-            for item in news_results:
-                url = item.get("url", "")
-                title = item.get("title", "No title")
-                description = item.get("description", "")
-                source_id = Source.generate_id(url) if url else Source.generate_id(title)
-
-                # Extract source domain
-                source_name = ""
-                if url:
-                    try:
-                        source_name = urlparse(url).netloc.replace("www.", "")
-                    except Exception:
-                        pass
-
-                snippet_parts = []
-                if source_name:
-                    snippet_parts.append(f"Source: {source_name}")
-                if description:
-                    snippet_parts.append(description[:300])
-
-                source = Source(
-                    source_id=source_id,
-                    url=url,
-                    title=title,
-                    source_type="news",
-                    content_snippet=" | ".join(snippet_parts),
-                    publication_date=item.get("age", ""),
-                )
-                sources.append(source)
-
-            logger.info(f"Brave News returned {len(sources)} results")
-            return sources
-
+            return await cached("brave_news", brave_news_sources)
         except Exception as e:
             logger.warning(f"Brave News fetch failed: {e}")
             return []
 
-    def fetch_worldbank():
+    async def fetch_worldbank():
         try:
-            return worldbank_search_sources(query, max_results=max_results_per_source)
+            return await cached("world_bank", worldbank_search_sources)
         except Exception as e:
             logger.warning(f"World Bank search failed: {e}")
             return []
 
-    def fetch_policy():
+    async def fetch_policy():
         try:
-            return policy_search_sources(query, max_results=max_results_per_source)
+            return await cached("policy", policy_search_sources)
         except Exception as e:
             logger.warning(f"Policy search failed: {e}")
             return []
 
-    def fetch_sec():
+    async def fetch_sec():
         try:
-            return sec_search_sources(query, max_results=max_results_per_source)
+            return await cached("sec_edgar", sec_search_sources)
         except Exception as e:
             logger.warning(f"SEC EDGAR search failed: {e}")
             return []
 
-    def fetch_local_sme():
+    async def fetch_local_sme():
         try:
-            return load_local_sme_sources(
+            return await channel_call(
+                "local_sme",
+                load_local_sme_sources,
                 query=query,
                 intent_domain=sme_intent_domain,
                 asset_metadata=asset_metadata,
@@ -398,39 +635,115 @@ def aggregate_sources(
         include_policy = _query_matches_keywords(query, POLICY_KEYWORDS)
     include_sec = _query_matches_keywords(query, SEC_KEYWORDS)
 
-    # Fetch in parallel
-    max_workers = 4 + (1 if include_brave_news else 0) + 1 + (1 if include_policy else 0) + (1 if include_sec else 0) + (1 if include_local_sme else 0)
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(fetch_academic): "academic",
-            executor.submit(fetch_web): "web",
-            executor.submit(fetch_newsroom): "newsroom",
-            executor.submit(fetch_worldbank): "world_bank",
-        }
-        if include_brave_news:
-            futures[executor.submit(fetch_brave_news)] = "brave_news"
-        if include_policy:
-            futures[executor.submit(fetch_policy)] = "policy"
-        if include_sec:
-            futures[executor.submit(fetch_sec)] = "sec_edgar"
-        if include_local_sme:
-            futures[executor.submit(fetch_local_sme)] = "local_sme"
-
-        for future in as_completed(futures):
-            source_type = futures[future]
-            try:
-                sources = future.result()
-                all_sources.extend(sources)
-                logger.info(f"✓ {source_type}: {len(sources)} sources")
-            except Exception as e:
-                logger.warning(f"{source_type} aggregation failed: {e}")
+    channels = {
+        "academic": fetch_academic,
+        "web": fetch_web,
+        "newsroom": fetch_newsroom,
+        "world_bank": fetch_worldbank,
+    }
+    if include_brave_news:
+        channels["brave_news"] = fetch_brave_news
+    if include_policy:
+        channels["policy"] = fetch_policy
+    if include_sec:
+        channels["sec_edgar"] = fetch_sec
+    if include_local_sme:
+        channels["local_sme"] = fetch_local_sme
+
+    channel_durations: Dict[str, float] = {}
+
+    async def timed(source_type, fetch):
+        t0 = time.monotonic()
+        try:
+            return await fetch()
+        finally:
+            # setdefault: a channel cancelled at its deadline keeps the budget as its duration
+            channel_durations.setdefault(source_type, round((time.monotonic() - t0) * 1000.0, 1))
+
+    # Fetch concurrently, each channel bounded by its own deadline
+    started = time.monotonic()
+    tasks = {
+        asyncio.ensure_future(timed(source_type, fetch)): source_type
+        for source_type, fetch in channels.items()
+    }
+    budgets = {task: _channel_budget(source_type, channel_timeouts) for task, source_type in tasks.items()}
+
+    def deadline(task) -> Optional[float]:
+        # A channel still queued for a worker expires one budget after the start.
+        if budgets[task] is None:
+            return None
+        return picked_up.get(tasks[task], started) + budgets[task]
+
+    channel_counts: Dict[str, int] = {}
+    timed_out: List[str] = []
+    cancelled: List[str] = []
+    pending = set(tasks)
+    try:
+        while pending:
+            now = time.monotonic()
+            if cancel_event is not None and cancel_event.is_set():
+                for task in pending:
+                    task.cancel()
+                    cancelled.append(tasks[task])
+                    channel_durations[tasks[task]] = round((now - started) * 1000.0, 1)
+                logger.info(f"Aggregation cancelled by caller; abandoning: {', '.join(sorted(cancelled))}")
+                pending = set()
+                break
+
+            expired = {t for t in pending if deadline(t) is not None and deadline(t) <= now}
+            for task in expired:
+                task.cancel()
+                timed_out.append(tasks[task])
+                channel_durations[tasks[task]] = round(budgets[task] * 1000.0, 1)
+                if tasks[task] in picked_up:
+                    logger.warning(f"✗ {tasks[task]}: no response within {budgets[task]:.0f}s budget, skipping")
+                else:
+                    logger.warning(
+                        f"✗ {tasks[task]}: still waiting for a channel worker after {budgets[task]:.0f}s, skipping"
+                    )
+            pending -= expired
+            if not pending:
+                break
+
+            open_deadlines = [deadline(t) for t in pending if deadline(t) is not None]
+            wait_for = max(0.0, min(open_deadlines) - now) if open_deadlines else None
+            if cancel_event is not None:
+                wait_for = _CANCEL_POLL_SECONDS if wait_for is None else min(wait_for, _CANCEL_POLL_SECONDS)
+            done, pending = await asyncio.wait(pending, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                source_type = tasks[task]
+                try:
+                    sources = task.result()
+                    all_sources.extend(sources)
+                    channel_counts[source_type] = len(sources)
+                    logger.info(f"✓ {source_type}: {len(sources)} sources")
+                except Exception as e:
+                    logger.warning(f"{source_type} aggregation failed: {e}")
+                    continue
+                if on_channel_complete and sources:
+                    try:
+                        on_channel_complete(source_type, sources)
+                    except Exception as e:
+                        logger.warning(f"on_channel_complete hook failed for {source_type}: {e}")
+    finally:
+        for task in pending:
+            task.cancel()
 
     # SEP-059: inject scouting internal sources when an imaging store is provided
     if imaging_store is not None:
-        internal = scouting_knowledge_sources(query=query, imaging_store=imaging_store)
+        internal = await channel_call("scouting", scouting_knowledge_sources, query=query, imaging_store=imaging_store)
         if internal:
             all_sources.extend(internal)
             logger.info(f"Scouting internal sources added: {len(internal)}")
 
-    logger.info(f"Total sources aggregated: {len(all_sources)}")
-    return all_sources
+    if timed_out:
+        logger.info(f"Total sources aggregated: {len(all_sources)} (timed out: {', '.join(timed_out)})")
+    else:
+        logger.info(f"Total sources aggregated: {len(all_sources)}")
+    return AggregatedSources(
+        all_sources,
+        timed_out_channels=timed_out,
+        channel_counts=channel_counts,
+        channel_durations={channel: channel_durations[channel] for channel in tasks.values() if channel in channel_durations},
+        cancelled_channels=cancelled,
+    )
@@ -0,0 +1,161 @@
+"""Near-duplicate collapse for aggregated deep research sources.
+
+The same wire story or preprint often arrives from several channels under
+different URLs. Each source's title + snippet is reduced to a set of stemmed
+words and summarized by a MinHash signature; LSH banding over the signatures
+proposes candidate pairs, and candidates whose exact Jaccard similarity
+reaches the threshold are collapsed into one canonical ``Source`` that keeps
+the other copies' URLs in ``alternate_urls``.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from engine.models import Source
+from workflows.deep_research.tokens import source_tokens, stem
+
+NUM_PERM = 64
+LSH_BANDS = 16            # 16 bands x 4 rows: candidate S-curve midpoint near Jaccard 0.5
+_ROWS = NUM_PERM // LSH_BANDS
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed (a, b) pairs for the universal hash family h(x) = (a*x + b) mod p.
+_PERMUTATIONS = tuple(
+    (
+        int.from_bytes(hashlib.blake2b(f"a{i}".encode(), digest_size=8).digest(), "big") % (_MERSENNE_PRIME - 1) + 1,
+        int.from_bytes(hashlib.blake2b(f"b{i}".encode(), digest_size=8).digest(), "big") % _MERSENNE_PRIME,
+    )
+    for i in range(NUM_PERM)
+)
+
+# Lower rank wins when picking the canonical copy of a duplicate group.
+_CHANNEL_RANK = {
+    "academic": 0,
+    "newsroom": 1,
+    "world_bank": 2,
+    "policy": 2,
+    "sec_edgar": 2,
+    "web": 3,
+    "news": 4,
+    "brave_news": 4,
+}
+_DEFAULT_RANK = 5
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "of", "to", "in", "on", "for", "from", "with",
+    "by", "as", "is", "are", "was", "were", "be", "been", "that", "this", "it",
+    "its", "at", "into", "has", "have", "had", "not", "will", "says", "said",
+})
+
+
+@lru_cache(maxsize=131072)
+def _feature_hashes(feature: str) -> Tuple[int, ...]:
+    """The feature's value under every permutation (cached: features repeat across sources)."""
+    x = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+    return tuple(((a * x + b) % _MERSENNE_PRIME) & _MAX_HASH for a, b in _PERMUTATIONS)
+
+
+def _build_features(source: Source) -> set:
+    return {
+        stem(w)
+        for w in _WORD_RE.findall(f"{source.title} {source.content_snippet}".lower())
+        if w not in _STOP_WORDS and len(w) > 1
+    }
+
+
+def source_features(source: Source) -> frozenset:
+    """Stemmed content words of title + snippet used for near-duplicate matching."""
+    return source_tokens(source).view("dedupe_features", _build_features, source)
+
+
+def minhash_signature(features) -> Tuple[int, ...]:
+    """MinHash signature (``NUM_PERM`` values) of a set of string features."""
+    columns = [_feature_hashes(feature) for feature in features]
+    if not columns:
+        return (_MAX_HASH,) * NUM_PERM
+    return tuple(min(values) for values in zip(*columns))
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _merge_into(canonical: Source, duplicate: Source) -> None:
+    """Record ``duplicate``'s URLs on ``canonical`` and fill missing metadata."""
+    for url in [duplicate.url, *duplicate.alternate_urls]:
+        if url and url != canonical.url and url not in canonical.alternate_urls:
+            canonical.alternate_urls.append(url)
+    canonical.cited_by_count = max(canonical.cited_by_count or 0, duplicate.cited_by_count or 0)
+    if not canonical.publication_date and duplicate.publication_date:
+        canonical.publication_date = duplicate.publication_date
+    if not canonical.content_full and duplicate.content_full:
+        canonical.content_full = duplicate.content_full
+
+
+def collapse_near_duplicates(
+    sources: List[Source],
+    threshold: float = 0.7,
+    min_features: int = 8,
+) -> List[Source]:
+    """Collapse near-duplicate sources into canonical copies.
+
+    Two sources are duplicates when the Jaccard similarity of their
+    title + snippet word sets is at least ``threshold``. The canonical copy of
+    each group comes from the most authoritative channel (academic, then
+    newsroom, institutional, web, news), earliest first on ties; output keeps
+    the input order of each group's first member. Sources with fewer than
+    ``min_features`` words are too short to judge and are never collapsed.
+    """
+    if len(sources) < 2:
+        return list(sources)
+
+    order = sorted(
+        range(len(sources)),
+        key=lambda i: (_CHANNEL_RANK.get(sources[i].source_type or "", _DEFAULT_RANK), i),
+    )
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    canonical_of: Dict[int, int] = {}
+
+    for idx in order:
+        features = source_features(sources[idx])
+        if len(features) < min_features:
+            canonical_of[idx] = idx
+            continue
+        signature = minhash_signature(features)
+        keys = [(band, signature[band * _ROWS:(band + 1) * _ROWS]) for band in range(LSH_BANDS)]
+
+        match: Optional[int] = None
+        checked = set()
+        for key in keys:
+            for candidate in buckets.get(key, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                if jaccard(features, source_features(sources[candidate])) >= threshold:
+                    match = candidate
+                    break
+            if match is not None:
+                break
+
+        if match is None:
+            canonical_of[idx] = idx
+            for key in keys:
+                buckets.setdefault(key, []).append(idx)
+        else:
+            canonical_of[idx] = match
+            _merge_into(sources[match], sources[idx])
+
+    emitted = set()
+    collapsed: List[Source] = []
+    for idx in range(len(sources)):
+        canonical = canonical_of[idx]
+        if canonical not in emitted:
+            emitted.add(canonical)
+            collapsed.append(sources[canonical])
+    return collapsed
@@ -7,13 +7,21 @@ for semantic relevance.
 
 import logging
 import re
+import threading
 from typing import List
 
 import config
 from engine.models import Source
+from tools.utils._rerank_cache import get_rerank_cache, query_hash
+from workflows.deep_research.tokens import source_stems, source_tokens, stem
 
 logger = logging.getLogger(__name__)
 
+CROSS_ENCODER_MODEL = 'cross-encoder/ms-marco-MiniLM-L-6-v2'
+
+_CROSS_ENCODER = None
+_CROSS_ENCODER_LOCK = threading.Lock()
+
 STOP_WORDS = frozenset({
     'why', 'did', 'does', 'how', 'what', 'when', 'where', 'who',
     'the', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'of', 'and',
@@ -23,34 +31,11 @@ STOP_WORDS = frozenset({
 
 
 def _stem(word: str) -> str:
-    """Lightweight stemmer — nltk PorterStemmer if available, else suffix rules."""
-    try:
-        from nltk.stem import PorterStemmer
-        _stem._stemmer = getattr(_stem, '_stemmer', None) or PorterStemmer()
-        return _stem._stemmer.stem(word)
-    except ImportError:
-        pass
-    # Fallback: simple suffix stripping (covers ~80% of English cases)
-    w = word.lower()
-    if len(w) <= 3:
-        return w
-    if w.endswith("tion") or w.endswith("sion"):
-        return w[:-3]
-    if w.endswith("ment"):
-        return w[:-4] if len(w) > 6 else w
-    if w.endswith("ies") and len(w) > 4:
-        return w[:-3] + "y"
-    if w.endswith("ing") and len(w) > 5:
-        return w[:-3]
-    if w.endswith("ed") and len(w) > 4:
-        return w[:-2]
-    if w.endswith("ly") and len(w) > 4:
-        return w[:-2]
-    if w.endswith("es") and len(w) > 4:
-        return w[:-2]
-    if w.endswith("s") and not w.endswith("ss") and len(w) > 3:
-        return w[:-1]
-    return w
+    """Lightweight stemmer — nltk PorterStemmer if available, else suffix rules.
+
+    Delegates to the process-wide memoized stemmer in ``tokens``.
+    """
+    return stem(word)
 
 
 def _freshness_bonus(pub_date: str) -> float:
@@ -98,9 +83,7 @@ def score_relevance(query: str, sources: List[Source],
     Primary: keyword overlap between query and source title + snippet.
     Upgrade: cross-encoder scoring if sentence-transformers installed.
     """
-    keywords = extract_keywords(query)
-    if extra_keywords:
-        keywords = list(set(keywords) | {_stem(k) for k in extra_keywords})
+    keywords = relevance_keywords(query, extra_keywords)
     if not keywords:
         return sources
 
@@ -116,22 +99,37 @@ def score_relevance(query: str, sources: List[Source],
 
     # Fallback: keyword overlap scoring (with stemming)
     for source in sources:
-        haystack_words = {_stem(w) for w in f"{source.title} {source.content_snippet}".lower().split()}
-        matches = sum(1 for kw in keywords if kw in haystack_words)
-        source.relevance_score = matches / len(keywords)
-
-        # Freshness bonus
-        if source.publication_date:
-            source.relevance_score += _freshness_bonus(source.publication_date)
-
-        # Newsroom boost: +0.10 for curated Ona articles
-        if getattr(source, "source_type", None) == "newsroom":
-            source.relevance_score += 0.10
+        source.relevance_score = keyword_relevance(keywords, source)
 
     sources.sort(key=lambda s: s.relevance_score, reverse=True)
     return sources
 
 
+def relevance_keywords(query: str, extra_keywords: List[str] = None) -> List[str]:
+    """Stemmed keyword set ``score_relevance`` uses for ``query``."""
+    keywords = extract_keywords(query)
+    if extra_keywords:
+        keywords = list(set(keywords) | {_stem(k) for k in extra_keywords})
+    return keywords
+
+
+def keyword_relevance(keywords: List[str], source: Source) -> float:
+    """Keyword-overlap relevance of one source (without mutating it)."""
+    if not keywords:
+        return 0.0
+    haystack_words = source_stems(source)
+    score = sum(1 for kw in keywords if kw in haystack_words) / len(keywords)
+
+    # Freshness bonus
+    if source.publication_date:
+        score += _freshness_bonus(source.publication_date)
+
+    # Newsroom boost: +0.10 for curated Ona articles
+    if getattr(source, "source_type", None) == "newsroom":
+        score += 0.10
+    return score
+
+
 def filter_relevant(sources: List[Source], min_score: float = 0.40,
                     max_sources: int = 60) -> List[Source]:
     """Filter to sources above minimum relevance, capped at max_sources.
@@ -147,6 +145,15 @@ def filter_relevant(sources: List[Source], min_score: float = 0.40,
     return relevant[:max_sources]
 
 
+def _build_keywords(source: Source) -> set:
+    return {w for w in source_stems(source) if w not in STOP_WORDS and len(w) > 1}
+
+
+def _source_keywords(source: Source) -> frozenset:
+    """Stemmed title+snippet keywords used for cross-reference overlap."""
+    return source_tokens(source).view("keywords", _build_keywords, source)
+
+
 def _count_cross_references(source: Source, all_sources: List[Source],
                             overlap_threshold: float = 0.5) -> int:
     """Count cross-references via stemmed keyword overlap between sources.
@@ -155,8 +162,7 @@ def _count_cross_references(source: Source, all_sources: List[Source],
     its stemmed title+snippet keywords overlap with the target source's.
     Returns at least 1 (self-reference).
     """
-    src_words = {_stem(w) for w in f"{source.title} {source.content_snippet}".lower().split()}
-    src_keywords = {w for w in src_words if w not in STOP_WORDS and len(w) > 1}
+    src_keywords = _source_keywords(source)
     if not src_keywords:
         return 1
 
@@ -164,8 +170,7 @@ def _count_cross_references(source: Source, all_sources: List[Source],
     for other in all_sources:
         if other.source_id == source.source_id:
             continue
-        other_words = {_stem(w) for w in f"{other.title} {other.content_snippet}".lower().split()}
-        other_keywords = {w for w in other_words if w not in STOP_WORDS and len(w) > 1}
+        other_keywords = _source_keywords(other)
         if not other_keywords:
             continue
         overlap = len(src_keywords & other_keywords) / len(src_keywords)
@@ -174,14 +179,88 @@ def _count_cross_references(source: Source, all_sources: List[Source],
     return count
 
 
+def _count_cross_references_batch(sources: List[Source],
+                                  overlap_threshold: float = 0.5) -> List[int]:
+    """Cross-reference counts for every source in one pass.
+
+    Same semantics as :func:`_count_cross_references`, but each source is
+    tokenized once into an inverted index of stemmed terms and overlaps come
+    from posting-list intersections, avoiding the all-pairs re-stemming.
+    Returns one count per input source, in order.
+    """
+    keyword_sets = [_source_keywords(s) for s in sources]
+    postings: dict = {}
+    for idx, keywords in enumerate(keyword_sets):
+        for term in keywords:
+            postings.setdefault(term, []).append(idx)
+
+    counts = []
+    for idx, keywords in enumerate(keyword_sets):
+        if not keywords:
+            counts.append(1)
+            continue
+        overlaps: dict = {}
+        for term in keywords:
+            for other_idx in postings[term]:
+                overlaps[other_idx] = overlaps.get(other_idx, 0) + 1
+
+        source_id = sources[idx].source_id
+        count = 1  # self-reference
+        for other_idx, shared in overlaps.items():
+            if sources[other_idx].source_id == source_id:
+                continue
+            if shared / len(keywords) >= overlap_threshold:
+                count += 1
+        counts.append(count)
+    return counts
+
+
+def _get_cross_encoder():
+    """Load the cross-encoder once per process (lazy, thread-safe).
+
+    Raises ImportError when sentence-transformers is not installed.
+    """
+    global _CROSS_ENCODER
+    if _CROSS_ENCODER is None:
+        with _CROSS_ENCODER_LOCK:
+            if _CROSS_ENCODER is None:
+                from sentence_transformers import CrossEncoder
+                _CROSS_ENCODER = CrossEncoder(CROSS_ENCODER_MODEL, max_length=512)
+                logger.info(f"Loaded cross-encoder {CROSS_ENCODER_MODEL}")
+    return _CROSS_ENCODER
+
+
 def _cross_encoder_score(query: str, sources: List[Source]) -> List[Source]:
-    """Cross-encoder scoring via sentence-transformers (optional upgrade)."""
-    from sentence_transformers import CrossEncoder
-    model = CrossEncoder('cross-encoder/ms-marco-MiniLM-L-6-v2', max_length=512)
-    pairs = [(query, f"{s.title} {s.content_snippet}"[:512]) for s in sources]
-    scores = model.predict(pairs)
-    for source, score in zip(sources, scores):
-        source.relevance_score = float(score)
+    """Cross-encoder scoring via sentence-transformers (optional upgrade).
+
+    Scores already in the on-disk rerank cache are reused; only the remaining
+    (query, passage) pairs are sent to the model, in batches.
+    """
+    cache = get_rerank_cache()
+    qhash = query_hash(CROSS_ENCODER_MODEL, query)
+    scores = cache.get_many(qhash, (s.source_id for s in sources)) if cache else {}
+
+    pending = []
+    seen = set(scores)
+    for source in sources:
+        if source.source_id not in seen:
+            seen.add(source.source_id)
+            pending.append(source)
+    if pending:
+        model = _get_cross_encoder()
+        batch_size = int(getattr(config, "DEEP_RESEARCH", {}).get("cross_encoder_batch_size", 32))
+        pairs = [(query, f"{s.title} {s.content_snippet}"[:512]) for s in pending]
+        predicted = model.predict(pairs, batch_size=max(1, batch_size))
+        fresh = {source.source_id: float(score) for source, score in zip(pending, predicted)}
+        scores.update(fresh)
+        if cache:
+            cache.set_many(qhash, fresh)
+
+    for source in sources:
+        source.relevance_score = scores[source.source_id]
     sources.sort(key=lambda s: s.relevance_score, reverse=True)
-    logger.info("Using cross-encoder relevance scoring (sentence-transformers)")
+    logger.info(
+        f"Using cross-encoder relevance scoring (sentence-transformers): "
+        f"{len(pending)} scored, {len(scores) - len(pending)} from cache"
+    )
     return sources
@@ -1,15 +1,23 @@
 """Synthesizer for deep research output assembly and quality gating."""
 
+import contextvars
 import logging
 import re
 import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import date
-from typing import List, Optional, Tuple
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, Tuple
 
 import config
 from engine.models import Finding, ResearchState, Source
+from engine.research_timing import stage
+from providers.endpoint_health import EndpointCircuitOpen, get_endpoint_health
+from tools.utils._llm_cache import llm_cache_refresh
+from workflows.deep_research.tokens import source_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -192,6 +200,12 @@ _DILIGENCE_ANALYST_SYSTEM_PROMPT = (
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Waits before the 2nd and 3rd synthesis attempts when endpoint health
+# tracking is disabled (LLM_HEALTH["enabled"] = False).
+_COLD_START_RETRY_DELAYS = (65, 8)
+_SYNTHESIS_MAX_ATTEMPTS = len(_COLD_START_RETRY_DELAYS) + 1
+
+
 def _emit_progress(callback, phase: str, message: str):
     if callback:
         callback("running", phase, message)
@@ -221,28 +235,38 @@ def _call_research_synthesis_model(
             {"role": "system", "content": analyst_system_prompt},
             {"role": "user", "content": prompt},
         ]
-        # Cold-start-aware retries for hosted inference endpoints.
-        delays = [0, 65, 8]
-        for attempt, delay in enumerate(delays, start=1):
-            if delay:
-                time.sleep(delay)
+        # Cold-start-aware retries for hosted inference endpoints. With health
+        # tracking the first wait follows the endpoint's observed recovery time,
+        # and an open circuit skips the retries (the client fails fast) so the
+        # call goes straight to the fallback below.
+        health = get_endpoint_health(getattr(client, "api_url", None))
+        for attempt in range(1, _SYNTHESIS_MAX_ATTEMPTS + 1):
             try:
-                response = client.chat_complete(messages, tools=None)
+                # Retries must reach the endpoint rather than a cached answer.
+                with llm_cache_refresh() if attempt > 1 else nullcontext():
+                    response = client.chat_complete(messages, tools=None)
                 content = client.extract_content(response)
                 if content and str(content).strip():
                     return str(content).strip()
                 logger.warning("Research synthesis client returned empty content")
                 break
             except Exception as exc:
-                if _is_service_unavailable(exc) and attempt < len(delays):
-                    logger.warning(
-                        "Research synthesis endpoint unavailable (attempt %d/%d); retrying after %ss",
-                        attempt,
-                        len(delays),
-                        delays[attempt],
-                    )
-                    continue
-                raise
+                retry = (
+                    _is_service_unavailable(exc)
+                    and not isinstance(exc, EndpointCircuitOpen)
+                    and attempt < _SYNTHESIS_MAX_ATTEMPTS
+                    and (health is None or health.allow_request())
+                )
+                if not retry:
+                    raise
+                delay = health.retry_delay(attempt) if health is not None else _COLD_START_RETRY_DELAYS[attempt - 1]
+                logger.warning(
+                    "Research synthesis endpoint unavailable (attempt %d/%d); retrying after %ss",
+                    attempt,
+                    _SYNTHESIS_MAX_ATTEMPTS,
+                    delay,
+                )
+                time.sleep(delay)
     except Exception as exc:
         logger.warning("Research synthesis client failed, trying tool fallback: %s", exc)
 
@@ -261,6 +285,44 @@ def _call_research_synthesis_model(
     return None
 
 
+def _stream_research_synthesis_model(
+    prompt: str,
+    on_delta: Callable[[str], None],
+    system_prompt: Optional[str] = None,
+) -> Optional[str]:
+    """Stream a synthesis completion, passing each text chunk to ``on_delta``.
+
+    Falls back to the blocking ``_call_research_synthesis_model`` (with its
+    unavailable-endpoint retries) when the stream fails or yields nothing.
+    """
+    if not prompt or not prompt.strip():
+        return None
+
+    try:
+        from tools.specialist.client import create_specialist_client
+
+        client = create_specialist_client("reasoning", config.SPECIALIZED_MODELS["reasoning"])
+        messages = [
+            {"role": "system", "content": system_prompt or _RESEARCH_ANALYST_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ]
+        parts: List[str] = []
+        for chunk in client.chat_complete_stream(messages):
+            if not chunk:
+                continue
+            parts.append(chunk)
+            on_delta(chunk)
+        content = "".join(parts).strip()
+        if content:
+            return content
+        logger.warning("Research synthesis stream returned empty content")
+    except Exception as exc:
+        logger.warning("Research synthesis stream failed, falling back to blocking call: %s", exc)
+
+    return _call_research_synthesis_model(prompt, system_prompt=system_prompt)
+
+
+@lru_cache(maxsize=65536)
 def _normalize_word(word: str) -> str:
     """Lightweight stemmer to reduce false grounding misses on morphology."""
     w = (word or "").strip().lower()
@@ -300,6 +362,15 @@ def _extract_words(text: str) -> set:
     return normalized
 
 
+def _build_route_words(source: Source) -> set:
+    return _extract_words(f"{source.title or ''} {source.content_snippet or ''} {source.content_full or ''}")
+
+
+def _source_route_words(source: Source) -> frozenset:
+    """Routing word set over a source's full text, cached in its token bag."""
+    return source_tokens(source).view("route_words", _build_route_words, source)
+
+
 def _normalize_sentence(text: str, max_chars: int = 240) -> str:
     cleaned = re.sub(r"\s+", " ", (text or "").strip())
     if len(cleaned) > max_chars:
@@ -1502,7 +1573,8 @@ def synthesize_outline(state: ResearchState) -> Optional[OutlineResult]:
             rejected_output=raw,
             failure_reason="outline_quality_or_parse_failure",
         )
-        retry_raw = _call_research_synthesis_model(retry_prompt)
+        with llm_cache_refresh():
+            retry_raw = _call_research_synthesis_model(retry_prompt)
         if not retry_raw:
             return None
         retry_raw = _normalize_outline_headers(retry_raw)
@@ -1538,8 +1610,7 @@ def route_sources(
 
     scored: List[Tuple[Tuple[float, float, float], Source]] = []
     for source in sources:
-        source_text = f"{source.title or ''} {source.content_snippet or ''} {source.content_full or ''}"
-        source_words = _extract_words(source_text)
+        source_words = _source_route_words(source)
         overlap_count = len(section_words & source_words)
         overlap_ratio = overlap_count / max(len(section_words), 1)
         score = (
@@ -1804,10 +1875,22 @@ def synthesize_section(
     subjects: Optional[List[str]],
     source_lookup: Optional[dict] = None,
     market_context: str = "",
+    on_delta: Optional[Callable[[str, int], None]] = None,
 ) -> Optional[str]:
-    """Stage 2: Expand a single section via reasoning model."""
+    """Stage 2: Expand a single section via reasoning model.
+
+    With ``on_delta``, drafts are streamed and each chunk is passed on as
+    ``on_delta(chunk, attempt)``; attempt 2 is the constrained retry, whose
+    draft replaces the first. Quality gates still run on the complete draft.
+    """
     today = date.today().isoformat()
 
+    def call_model(section_prompt: str, attempt: int) -> Optional[str]:
+        with llm_cache_refresh() if attempt > 1 else nullcontext():
+            if on_delta is None:
+                return _call_research_synthesis_model(section_prompt)
+            return _stream_research_synthesis_model(section_prompt, lambda chunk: on_delta(chunk, attempt))
+
     if is_comparison and subjects:
         prompt = _build_comparison_section_prompt(
             section,
@@ -1831,7 +1914,7 @@ def synthesize_section(
         )
 
     try:
-        raw = _call_research_synthesis_model(prompt)
+        raw = call_model(prompt, 1)
         if not raw:
             return None
         paragraph, reason = _evaluate_section_candidate(
@@ -1850,7 +1933,7 @@ def synthesize_section(
             rejected_output=raw,
             failure_reason=reason or "quality_repair",
         )
-        retry_raw = _call_research_synthesis_model(retry_prompt)
+        retry_raw = call_model(retry_prompt, 2)
         if not retry_raw:
             return None
         retry_paragraph, _ = _evaluate_section_candidate(
@@ -1867,6 +1950,129 @@ def synthesize_section(
         return None
 
 
+def _section_concurrency() -> int:
+    return max(1, int(config.SYNTHESIS.get("section_concurrency", 4) or 1))
+
+
+def _emit_section_event(section_callback, event: str, payload: dict) -> None:
+    """Best-effort section streaming event; a failing consumer never breaks synthesis."""
+    if section_callback:
+        try:
+            section_callback(event, payload)
+        except Exception as e:
+            logger.warning("Section event '%s' callback failed: %s", event, e)
+
+
+def _emit_section_delta(section_callback, index: int, title: str, chunk: str, attempt: int) -> None:
+    _emit_section_event(section_callback, "section_delta", {
+        "index": index, "title": title, "attempt": attempt, "delta": chunk,
+    })
+
+
+def _expand_one_section(
+    index: int,
+    section: OutlineSection,
+    routed_src: List[Source],
+    routed_fnd: List[Finding],
+    state: ResearchState,
+    outline: OutlineResult,
+    source_lookup: dict,
+    market_context: str,
+    section_callback=None,
+) -> Tuple[str, bool]:
+    """Expand one section, falling back to deterministic text; returns (paragraph, from_model).
+
+    With ``section_callback``, draft text is streamed as ``section_delta``
+    events and the gated final text is sent as a ``section`` event.
+    """
+    on_delta = partial(_emit_section_delta, section_callback, index, section.title) if section_callback else None
+    with stage("section_expansion", items=len(routed_src), section=index + 1, title=section.title) as span:
+        try:
+            paragraph = synthesize_section(
+                section, routed_src, routed_fnd, state,
+                outline.is_comparison, outline.subjects,
+                source_lookup=source_lookup,
+                market_context=market_context,
+                on_delta=on_delta,
+            )
+        except Exception as e:
+            logger.error("Section expansion failed for '%s': %s", section.title, e)
+            paragraph = None
+        from_model = bool(paragraph)
+        if not from_model:
+            span.meta["fallback"] = True
+            paragraph = _deterministic_section_paragraph(section, routed_src, routed_fnd, source_lookup)
+    _emit_section_event(section_callback, "section", {
+        "index": index, "title": section.title, "text": paragraph, "fallback": not from_model,
+    })
+    return paragraph, from_model
+
+
+def _expand_sections(
+    jobs: List[Tuple[int, List[Source], List[Finding]]],
+    state: ResearchState,
+    outline: OutlineResult,
+    source_lookup: dict,
+    market_context: str = "",
+    progress_callback=None,
+    verb: str = "Expanding",
+    section_callback=None,
+) -> Dict[int, Tuple[str, bool]]:
+    """Expand outline sections concurrently, keyed by section index.
+
+    ``jobs`` holds ``(index, routed_sources, routed_findings)`` per section.
+    At most ``SYNTHESIS["section_concurrency"]`` sections are in flight at
+    once; each one falls back to deterministic text on its own, so one slow
+    or failed section never holds back the others' results. Callers
+    reassemble by index, keeping outline order regardless of completion order.
+    ``section_callback`` (called from worker threads) receives streamed
+    section events; see ``_expand_one_section``.
+    """
+    total = len(outline.sections)
+    workers = min(_section_concurrency(), len(jobs))
+    results: Dict[int, Tuple[str, bool]] = {}
+    if workers <= 1:
+        for index, routed_src, routed_fnd in jobs:
+            section = outline.sections[index]
+            _emit_progress(progress_callback, "synthesis", f"{verb} section {index + 1}/{total}: {section.title}")
+            results[index] = _expand_one_section(
+                index, section, routed_src, routed_fnd, state, outline, source_lookup, market_context,
+                section_callback=section_callback,
+            )
+        return results
+
+    _emit_progress(
+        progress_callback, "synthesis",
+        f"{verb} {len(jobs)} sections ({workers} at a time)...",
+    )
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="synthesis-section") as executor:
+        # Each worker runs in a copy of this context so stage() spans land on the active trace.
+        futures = {
+            executor.submit(
+                contextvars.copy_context().run, _expand_one_section,
+                index, outline.sections[index], routed_src, routed_fnd,
+                state, outline, source_lookup, market_context, section_callback,
+            ): (index, routed_src, routed_fnd)
+            for index, routed_src, routed_fnd in jobs
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            index, routed_src, routed_fnd = futures[future]
+            section = outline.sections[index]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                logger.error("Section expansion failed for '%s': %s", section.title, e)
+                results[index] = (
+                    _deterministic_section_paragraph(section, routed_src, routed_fnd, source_lookup),
+                    False,
+                )
+            _emit_progress(
+                progress_callback, "synthesis",
+                f"{verb} sections: {done}/{len(jobs)} done ({section.title})",
+            )
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Assembly
 # ---------------------------------------------------------------------------
@@ -3471,7 +3677,8 @@ def synthesize_direct(
             rejected_output=normalized,
             failure_reason="direct_synthesis_quality_failure",
         )
-        retry_raw = _call_research_synthesis_model(retry_prompt, system_prompt=system_prompt)
+        with llm_cache_refresh():
+            retry_raw = _call_research_synthesis_model(retry_prompt, system_prompt=system_prompt)
         if retry_raw:
             normalized = _normalize_outline_headers(retry_raw).strip()
             normalized = _normalize_direct_citation_labels(normalized)
@@ -3496,7 +3703,9 @@ def synthesize_direct(
     # Insert diligence charts into the appropriate sections
     if is_diligence:
         try:
-            charts = generate_diligence_charts(asset_metadata, diligence_context)
+            with stage("chart_rendering") as span:
+                charts = generate_diligence_charts(asset_metadata, diligence_context)
+                span.items = len(charts)
             for chart_title, data_uri in charts:
                 img_md = f"\n\n![{chart_title}]({data_uri})\n"
                 if "Revenue" in chart_title:
@@ -3515,20 +3724,30 @@ def synthesize_direct(
 # Main entry point
 # ---------------------------------------------------------------------------
 
-def synthesize(state: ResearchState, progress_callback=None, market_context: str = "", market_summaries: dict = None) -> str:
+def synthesize(
+    state: ResearchState,
+    progress_callback=None,
+    market_context: str = "",
+    market_summaries: dict = None,
+    section_callback=None,
+) -> str:
     """
     Two-stage synthesis pipeline: outline → per-section expansion → assembly.
 
     Args:
         state: ResearchState with findings and sources
         progress_callback: Optional callback(status, phase, message)
+        section_callback: Optional callback(event, payload) receiving an
+            ``outline`` event, streamed ``section_delta`` chunks and a final
+            ``section`` event per section (from worker threads)
 
     Returns:
         Synthesis text
     """
     logger.info("Synthesizing findings (two-stage pipeline)...")
 
-    # Build market context if query involves financial topics and none was passed in
+    # Build market context if query involves financial topics and none was passed in.
+    # Reads the background-maintained snapshot; never refreshes providers inline.
     if not market_context:
         try:
             from engine.query_refiner import detect_market_intent
@@ -3536,23 +3755,28 @@ def synthesize(state: ResearchState, progress_callback=None, market_context: str
                 logger.info("Market intent detected — injecting FRED context")
                 from workflows.market_workflow import MarketWorkflow
                 from tools.market.context import build_market_context
-                wf = MarketWorkflow()
-                wf.update_all()
-                summaries = wf.compute_summary()
-                if summaries:
-                    market_context = build_market_context(summaries)
+                snapshot = MarketWorkflow().read_summary_snapshot()
+                if snapshot.summaries:
+                    market_context = build_market_context(snapshot.summaries)
+                if getattr(state, "market_snapshot", None) is None:
+                    state.market_snapshot = snapshot.metadata()
         except Exception as exc:
             logger.warning("Market context build failed (non-fatal): %s", exc)
 
     # Stage 1: Outline
     _emit_progress(progress_callback, "synthesis", "Generating outline from findings...")
-    outline = synthesize_outline(state)
+    with stage("outline") as span:
+        outline = synthesize_outline(state)
+        used_outline_fallback = outline is None
+        if used_outline_fallback:
+            logger.warning("Outline generation failed; using deterministic evidence outline fallback")
+            outline = _build_evidence_outline_fallback(state)
+            span.meta["fallback"] = True
+        span.items = len(outline.sections) if outline else 0
     if outline is None:
-        logger.warning("Outline generation failed; using deterministic evidence outline fallback")
-        outline = _build_evidence_outline_fallback(state)
-        if outline is None:
-            logger.warning("Deterministic outline fallback unavailable; using deterministic evidence synthesis")
-            return _deterministic_evidence_synthesis(state, reason="outline_unavailable")
+        logger.warning("Deterministic outline fallback unavailable; using deterministic evidence synthesis")
+        return _deterministic_evidence_synthesis(state, reason="outline_unavailable")
+    if used_outline_fallback:
         _emit_progress(
             progress_callback,
             "synthesis",
@@ -3567,34 +3791,26 @@ def synthesize(state: ResearchState, progress_callback=None, market_context: str
             f"Outline ready: {len(outline.sections)} sections. Expanding...",
         )
 
-    # Stage 2: Per-section expansion
-    expanded_sections: List[Optional[str]] = []
-    model_section_count = 0
-    deterministic_section_count = 0
-    source_lookup = _build_source_lookup(state.sources_checked)
-
-    for i, section in enumerate(outline.sections):
-        _emit_progress(
-            progress_callback, "synthesis",
-            f"Expanding section {i + 1}/{len(outline.sections)}: {section.title}",
-        )
-
-        routed_src = route_sources(section, state.sources_checked)
-        routed_fnd = route_findings(section, state.findings)
+    _emit_section_event(section_callback, "outline", {
+        "executive_summary": outline.executive_summary,
+        "sections": [section.title for section in outline.sections],
+    })
 
-        paragraph = synthesize_section(
-            section, routed_src, routed_fnd, state,
-            outline.is_comparison, outline.subjects,
-            source_lookup=source_lookup,
-            market_context=market_context,
-        )
-        if paragraph:
-            model_section_count += 1
-        else:
-            paragraph = _deterministic_section_paragraph(section, routed_src, routed_fnd, source_lookup)
-            deterministic_section_count += 1
-
-        expanded_sections.append(paragraph)
+    # Stage 2: Per-section expansion (bounded concurrency, reassembled in outline order)
+    source_lookup = _build_source_lookup(state.sources_checked)
+    jobs = [
+        (i, route_sources(section, state.sources_checked), route_findings(section, state.findings))
+        for i, section in enumerate(outline.sections)
+    ]
+    results = _expand_sections(
+        jobs, state, outline, source_lookup,
+        market_context=market_context,
+        progress_callback=progress_callback,
+        section_callback=section_callback,
+    )
+    expanded_sections: List[Optional[str]] = [results[i][0] for i in range(len(outline.sections))]
+    model_section_count = sum(1 for _, from_model in results.values() if from_model)
+    deterministic_section_count = len(results) - model_section_count
 
     if model_section_count == 0:
         logger.warning(
@@ -3606,12 +3822,7 @@ def synthesize(state: ResearchState, progress_callback=None, market_context: str
     synthesis = assemble_synthesis(outline, expanded_sections)
 
     state.synthesis = synthesis
-    if model_section_count == 0 and deterministic_section_count > 0:
-        state.synthesis_model = "deterministic"
-    elif deterministic_section_count > 0:
-        state.synthesis_model = "mixed"
-    else:
-        state.synthesis_model = "reasoning"
+    state.synthesis_model = _synthesis_model_label(model_section_count, deterministic_section_count)
     logger.info(
         "Synthesis complete (%d model sections, %d deterministic fallback sections, total=%d)",
         model_section_count,
@@ -3621,6 +3832,130 @@ def synthesize(state: ResearchState, progress_callback=None, market_context: str
     return synthesis
 
 
+def _synthesis_model_label(model_sections: int, deterministic_sections: int) -> str:
+    """Label a synthesis by how its sections were produced."""
+    if model_sections == 0 and deterministic_sections > 0:
+        return "deterministic"
+    if deterministic_sections > 0:
+        return "mixed"
+    return "reasoning"
+
+
+_SECTION_STUB_MARKER = "*[Section could not be fully expanded"
+_GAPS_LINE_PREFIX = "**Gaps:**"
+
+
+def _section_evidence(
+    section: OutlineSection,
+    sources: List[Source],
+    findings: List[Finding],
+) -> Tuple[tuple, List[Source], List[Finding]]:
+    """Route evidence to a section and return (signature, sources, findings)."""
+    routed_src = route_sources(section, sources)
+    routed_fnd = route_findings(section, findings)
+    signature = (
+        tuple(s.source_id for s in routed_src),
+        tuple(f.claim for f in routed_fnd),
+    )
+    return signature, routed_src, routed_fnd
+
+
+def refresh_synthesis(
+    prior_state: ResearchState,
+    state: ResearchState,
+    progress_callback=None,
+    market_context: str = "",
+    section_callback=None,
+) -> Optional[Tuple[str, List[str], str]]:
+    """Re-expand only the sections whose routed evidence changed.
+
+    Rebuilds the outline from the section headers of ``prior_state.synthesis``
+    and routes sources/findings for each section under both the prior and the
+    refreshed state. Sections routed to the same sources and findings keep
+    their prior text; the rest (and any stub sections) are expanded again.
+    The executive summary is kept. ``section_callback`` streams the
+    regenerated sections as in ``synthesize``.
+
+    Returns:
+        ``(synthesis, regenerated_section_titles, synthesis_model)``, or None
+        when the prior synthesis is not a two-stage outline document and a
+        full ``synthesize`` run is needed instead. ``synthesis_model`` is
+        labelled as in ``synthesize``, with kept sections counted under
+        ``prior_state.synthesis_model``.
+    """
+    parsed = _parse_markdown_sections(prior_state.synthesis or "")
+    if len(parsed) < 2 or parsed[0][0].strip().lower() != "executive summary":
+        return None
+
+    sections: List[OutlineSection] = []
+    prior_bodies: List[str] = []
+    for title, body in parsed[1:]:
+        body = "\n".join(
+            line for line in body.splitlines() if not line.strip().startswith(_GAPS_LINE_PREFIX)
+        ).strip()
+        bullets = []
+        if body.startswith(_SECTION_STUB_MARKER):
+            bullets = [line.strip()[2:] for line in body.splitlines() if line.strip().startswith("- ")]
+            body = ""
+        sections.append(OutlineSection(title=title, bullets=bullets))
+        prior_bodies.append(body)
+
+    from engine.query_refiner import detect_comparison
+    comparison = detect_comparison(state.refined_query or state.original_query)
+    is_comparison = comparison["is_comparative"] and len(comparison["subjects"]) >= 2
+    outline = OutlineResult(
+        executive_summary=parsed[0][1],
+        sections=sections,
+        is_comparison=is_comparison,
+        subjects=list(comparison["subjects"]) if is_comparison else None,
+    )
+
+    source_lookup = _build_source_lookup(state.sources_checked)
+    expanded_sections: List[Optional[str]] = list(prior_bodies)
+    jobs = []
+    for i, section in enumerate(outline.sections):
+        prior_signature, _, _ = _section_evidence(section, prior_state.sources_checked, prior_state.findings)
+        signature, routed_src, routed_fnd = _section_evidence(section, state.sources_checked, state.findings)
+        if prior_bodies[i] and signature == prior_signature:
+            continue
+        jobs.append((i, routed_src, routed_fnd))
+
+    results = _expand_sections(
+        jobs, state, outline, source_lookup,
+        market_context=market_context,
+        progress_callback=progress_callback,
+        verb="Refreshing",
+        section_callback=section_callback,
+    )
+    regenerated_from_model = 0
+    for i, (paragraph, from_model) in results.items():
+        expanded_sections[i] = paragraph
+        regenerated_from_model += from_model
+    regenerated = [outline.sections[i].title for i, _, _ in jobs]
+
+    # Kept sections carry the prior label; a "mixed" prior contributes both kinds.
+    model_section_count = regenerated_from_model
+    deterministic_section_count = len(results) - regenerated_from_model
+    kept = len(outline.sections) - len(results)
+    if kept:
+        if prior_state.synthesis_model != "deterministic":
+            model_section_count += kept
+        if prior_state.synthesis_model in ("deterministic", "mixed"):
+            deterministic_section_count += kept
+
+    logger.info(
+        "Refresh synthesis: %d/%d sections regenerated (%d from model)",
+        len(regenerated),
+        len(outline.sections),
+        regenerated_from_model,
+    )
+    return (
+        assemble_synthesis(outline, expanded_sections),
+        regenerated,
+        _synthesis_model_label(model_section_count, deterministic_section_count),
+    )
+
+
 def _fallback_synthesis(state: ResearchState) -> str:
     """Final minimal fallback only when no useful evidence is available."""
     lines = [
@@ -0,0 +1,106 @@
+"""Shared tokenization helpers for deep research scoring stages.
+
+Relevance scoring, cross-reference counting and section routing all derive
+word sets from the same source text. ``stem`` memoizes stemming process-wide
+and ``source_tokens`` keeps one lazily-built token bag per ``Source`` so each
+stage tokenizes a source at most once.
+"""
+
+import threading
+from functools import lru_cache
+from typing import Callable, Optional
+
+from engine.models import Source
+
+_STEMMER = None
+_STEMMER_LOADED = False
+_STEMMER_LOCK = threading.Lock()
+
+
+def _load_stemmer():
+    """Import nltk's PorterStemmer once; None when nltk is unavailable."""
+    global _STEMMER, _STEMMER_LOADED
+    if not _STEMMER_LOADED:
+        with _STEMMER_LOCK:
+            if not _STEMMER_LOADED:
+                try:
+                    from nltk.stem import PorterStemmer
+                    _STEMMER = PorterStemmer()
+                except ImportError:
+                    _STEMMER = None
+                _STEMMER_LOADED = True
+    return _STEMMER
+
+
+def _suffix_stem(word: str) -> str:
+    """Simple suffix stripping (covers ~80% of English cases)."""
+    w = word.lower()
+    if len(w) <= 3:
+        return w
+    if w.endswith("tion") or w.endswith("sion"):
+        return w[:-3]
+    if w.endswith("ment"):
+        return w[:-4] if len(w) > 6 else w
+    if w.endswith("ies") and len(w) > 4:
+        return w[:-3] + "y"
+    if w.endswith("ing") and len(w) > 5:
+        return w[:-3]
+    if w.endswith("ed") and len(w) > 4:
+        return w[:-2]
+    if w.endswith("ly") and len(w) > 4:
+        return w[:-2]
+    if w.endswith("es") and len(w) > 4:
+        return w[:-2]
+    if w.endswith("s") and not w.endswith("ss") and len(w) > 3:
+        return w[:-1]
+    return w
+
+
+@lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    """Stem a word with nltk PorterStemmer if available, else suffix rules."""
+    stemmer = _load_stemmer()
+    if stemmer is not None:
+        return stemmer.stem(word)
+    return _suffix_stem(word)
+
+
+class SourceTokens:
+    """Lazily-computed, named token views for one source's text.
+
+    Views are built on first use and reused by later stages. The bag is tied
+    to the source's title/snippet/full text; if any of them change (e.g. after
+    content fetching fills ``content_full``) a fresh bag is created.
+    """
+
+    __slots__ = ("fingerprint", "_views")
+
+    def __init__(self, fingerprint: tuple):
+        self.fingerprint = fingerprint
+        self._views: dict = {}
+
+    def view(self, name: str, build: Callable[[Source], frozenset], source: Source) -> frozenset:
+        cached: Optional[frozenset] = self._views.get(name)
+        if cached is None:
+            cached = frozenset(build(source))
+            self._views[name] = cached
+        return cached
+
+
+def source_tokens(source: Source) -> SourceTokens:
+    """Return the token bag cached on ``source``, rebuilding it if its text changed."""
+    fingerprint = (source.title, source.content_snippet, source.content_full)
+    bag = source.__dict__.get("_token_bag")
+    if bag is None or bag.fingerprint != fingerprint:
+        bag = SourceTokens(fingerprint)
+        source.__dict__["_token_bag"] = bag
+    return bag
+
+
+def _build_stems(source: Source) -> set:
+    return {stem(w) for w in f"{source.title} {source.content_snippet}".lower().split()}
+
+
+def source_stems(source: Source) -> frozenset:
+    """Stemmed whitespace tokens of title + snippet (relevance scoring)."""
+    return source_tokens(source).view("stems", _build_stems, source)
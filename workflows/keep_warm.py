@@ -0,0 +1,147 @@
+"""Keep scale-to-zero inference endpoints warm.
+
+Hosted HF endpoints scale to zero when idle, and the first synthesis call
+after that waits out a cold start. ``KEEP_WARM`` configures two ways to
+avoid paying it on the critical path:
+
+- a scheduled ping of the endpoints behind ``KEEP_WARM["roles"]`` every
+  ``interval_seconds`` during active hours (``start_keep_warm_thread`` in
+  ``workflows.background_threads``; off unless ``enabled``);
+- ``warm_synthesis_endpoints()`` when a research run starts, so the model
+  boots while sources are aggregated (``warm_on_enqueue``).
+
+A ping is ``LLMClient.ping()``, a one-token completion sent straight to the
+role's adapter: it bypasses the response cache, admission control and health
+tracking. A 503 from a booting endpoint is expected, not an error; any error
+``is_endpoint_failure`` does not recognise means the endpoint answered.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import config
+from providers.endpoint_health import is_endpoint_failure
+
+logger = logging.getLogger(__name__)
+
+_LAST_PING: Dict[str, float] = {}
+_PING_STATS: Dict[str, Dict[str, Any]] = {}
+_PING_LOCK = threading.Lock()
+
+
+def _settings() -> Dict[str, Any]:
+    return getattr(config, "KEEP_WARM", {})
+
+
+def keep_warm_targets() -> List[Tuple[str, str]]:
+    """Return ``(role, endpoint_key)`` for each configured role served by an enabled HF endpoint."""
+    endpoints = getattr(config, "HF_ENDPOINTS", {}) or {}
+    model_endpoints = getattr(config, "MODEL_ENDPOINTS", {}) or {}
+    targets = []
+    seen = set()
+    for role in _settings().get("roles", ["reasoning"]):
+        endpoint_key = model_endpoints.get(role)
+        endpoint = endpoints.get(endpoint_key) if endpoint_key else None
+        if not endpoint or not endpoint.get("enabled", True) or endpoint_key in seen:
+            continue
+        seen.add(endpoint_key)
+        targets.append((role, endpoint_key))
+    return targets
+
+
+def in_active_hours(now: Optional[datetime] = None) -> bool:
+    """Return True when ``now`` (local time) falls in ``KEEP_WARM`` active hours and weekdays.
+
+    ``active_hours`` is ``[start_hour, end_hour)``; a start after the end
+    wraps past midnight (e.g. ``[22, 6]``).
+    """
+    settings = _settings()
+    now = now or datetime.now()
+    weekdays = settings.get("active_weekdays")
+    if weekdays is not None and now.weekday() not in weekdays:
+        return False
+    start, end = settings.get("active_hours", [0, 24])
+    if start <= end:
+        return start <= now.hour < end
+    return now.hour >= start or now.hour < end
+
+
+def ping_endpoint(role: str, endpoint_key: str) -> bool:
+    """Send a one-token completion to ``role``'s endpoint; return True if it answered.
+
+    Pings to the same endpoint within ``min_interval_seconds`` of the last
+    one are skipped (returning False), so research runs starting together
+    and the scheduler do not pile onto a booting endpoint.
+    """
+    now = time.monotonic()
+    min_interval = _settings().get("min_interval_seconds", 60)
+    with _PING_LOCK:
+        last = _LAST_PING.get(endpoint_key)
+        if last is not None and now - last < min_interval:
+            return False
+        _LAST_PING[endpoint_key] = now
+        stats = _PING_STATS.setdefault(endpoint_key, {"pings": 0, "warm": 0, "cold": 0, "last_error": ""})
+        stats["pings"] += 1
+
+    started = time.monotonic()
+    try:
+        from tools.specialist.client import create_specialist_client
+
+        client = create_specialist_client(role, config.SPECIALIZED_MODELS[role])
+        client.ping()
+    except Exception as e:
+        cold = is_endpoint_failure(e)
+        with _PING_LOCK:
+            stats["last_error"] = str(e)[:300]
+            if cold:
+                stats["cold"] += 1
+        if cold:
+            # A scaled-to-zero endpoint answers 503 while it boots; the ping has still woken it.
+            logger.info(f"Keep-warm ping to {endpoint_key} ({role}) not ready yet: {e}")
+            return False
+        logger.warning(f"Keep-warm ping to {endpoint_key} ({role}) rejected by a warm endpoint: {e}")
+
+    elapsed = time.monotonic() - started
+    with _PING_LOCK:
+        stats["warm"] += 1
+        stats["last_latency_ms"] = round(elapsed * 1000, 1)
+    logger.debug(f"Keep-warm ping to {endpoint_key} ({role}) answered in {elapsed:.1f}s")
+    return True
+
+
+def warm_synthesis_endpoints() -> List[threading.Thread]:
+    """Ping keep-warm targets in background threads without waiting for them.
+
+    Called when a research run starts; a no-op unless ``warm_on_enqueue``.
+    """
+    if not _settings().get("warm_on_enqueue", False):
+        return []
+    threads = []
+    for role, endpoint_key in keep_warm_targets():
+        thread = threading.Thread(
+            target=ping_endpoint,
+            args=(role, endpoint_key),
+            daemon=True,
+            name=f"keep-warm-{endpoint_key}",
+        )
+        thread.start()
+        threads.append(thread)
+    return threads
+
+
+def run_keep_warm_cycle(now: Optional[datetime] = None) -> int:
+    """Ping every target if ``now`` is within active hours; return the number answered."""
+    if not in_active_hours(now):
+        return 0
+    return sum(1 for role, endpoint_key in keep_warm_targets() if ping_endpoint(role, endpoint_key))
+
+
+def keep_warm_stats() -> Dict[str, Dict[str, Any]]:
+    """Return per-endpoint ping counts (pings/warm/cold), last latency and last error."""
+    with _PING_LOCK:
+        return {key: dict(stats) for key, stats in _PING_STATS.items()}
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -27,6 +28,36 @@ from tools.market.context import build_market_context
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class MarketSnapshot:
+    """Precomputed per-series summaries plus how fresh they are."""
+
+    summaries: Dict[str, dict]
+    computed_at: Optional[str] = None
+    data_fetched_at: Optional[str] = None
+    age_hours: Optional[float] = None
+    stale: bool = True
+
+    def metadata(self) -> dict:
+        """Staleness fields for API payloads (no series values)."""
+        return {
+            "computed_at": self.computed_at,
+            "data_fetched_at": self.data_fetched_at,
+            "age_hours": round(self.age_hours, 2) if self.age_hours is not None else None,
+            "stale": self.stale,
+            "series_count": len(self.summaries),
+        }
+
+
+def _hours_since(timestamp: Optional[str]) -> Optional[float]:
+    if not timestamp:
+        return None
+    moment = datetime.fromisoformat(timestamp)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (datetime.now(timezone.utc) - moment).total_seconds() / 3600.0
+
+
 class MarketWorkflow:
     """Orchestrates market data fetch, charting, and LLM analysis."""
 
@@ -47,6 +78,7 @@ class MarketWorkflow:
         for sid in get_all_series_ids():
             if self._update_series(sid, force):
                 count += 1
+        self._maintain_snapshot(count)
         return count
 
     def update_group(self, group: str, force: bool = False) -> int:
@@ -55,8 +87,45 @@ class MarketWorkflow:
         for s in get_series_by_group(group):
             if self._update_series(s.series_id, force):
                 count += 1
+        self._maintain_snapshot(count)
         return count
 
+    # ------------------------------------------------------------------
+    # Summary snapshot (read by deep research without refreshing)
+    # ------------------------------------------------------------------
+
+    def _maintain_snapshot(self, updated: int) -> None:
+        try:
+            if updated or self.store.get_summary_snapshot() is None:
+                self.refresh_summary_snapshot()
+        except Exception as e:
+            logger.warning("Market summary snapshot refresh failed: %s", e)
+
+    def refresh_summary_snapshot(self) -> Dict[str, dict]:
+        """Recompute summaries from stored observations and persist them as the snapshot."""
+        summaries = self.compute_summary()
+        self.store.save_summary_snapshot(summaries)
+        return summaries
+
+    def read_summary_snapshot(self) -> MarketSnapshot:
+        """Return the precomputed summary snapshot without fetching from any provider.
+
+        When no snapshot exists yet it is computed once from the stored
+        observations (a local read) and saved.
+        """
+        snapshot = self.store.get_summary_snapshot()
+        if snapshot is None:
+            self.refresh_summary_snapshot()
+            snapshot = self.store.get_summary_snapshot() or {"summaries": {}}
+        age_hours = _hours_since(snapshot.get("data_fetched_at"))
+        return MarketSnapshot(
+            summaries=snapshot.get("summaries") or {},
+            computed_at=snapshot.get("computed_at"),
+            data_fetched_at=snapshot.get("data_fetched_at"),
+            age_hours=age_hours,
+            stale=age_hours is None or age_hours > self.stale_hours,
+        )
+
     def _update_series(self, series_id: str, force: bool = False) -> bool:
         """Fetch a single series (incremental unless force). Returns True if fetched."""
         series = SERIES_CATALOG.get(series_id)